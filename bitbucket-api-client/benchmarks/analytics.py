@@ -0,0 +1,92 @@
+"""Measure how long per-branch step statistics take to compute over many pipeline steps.
+
+Compares a straightforward computation over a list of ``PipelineStep`` models with ``StepTable.aggregate``, in pure
+Python and with NumPy when it is installed:
+
+    python benchmarks/analytics.py [--steps 50000]
+"""
+import argparse
+import collections
+import datetime
+import random
+import statistics
+import sys
+import timeit
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bitbucket_api_client.analytics import StepTable, _import_numpy  # noqa: E402
+from bitbucket_api_client.models import PipelineStep  # noqa: E402
+
+BRANCHES = ["main", "develop"] + [f"feature/{number}" for number in range(20)]
+RESULTS = ["SUCCESSFUL"] * 8 + ["FAILED", "STOPPED"]
+
+
+def make_steps(count: int) -> List[Tuple[Dict[str, Any], PipelineStep]]:
+    rng = random.Random(0)
+    start = datetime.datetime(2022, 1, 1, tzinfo=datetime.timezone.utc)
+    steps = []
+    for number in range(count):
+        created_on = start + datetime.timedelta(minutes=number)
+        started_on = created_on + datetime.timedelta(seconds=rng.randint(5, 120))
+        completed_on = started_on + datetime.timedelta(seconds=rng.randint(30, 1800))
+        pipeline = {"uuid": f"{{{number // 3}}}", "created_on": created_on.isoformat(), "target": {}}
+        pipeline["target"]["ref_name"] = rng.choice(BRANCHES)
+        result = rng.choice(RESULTS)
+        step = PipelineStep.from_dict(
+            {
+                "type": "pipeline_step",
+                "name": f"step {number % 3}",
+                "started_on": started_on.isoformat(),
+                "completed_on": completed_on.isoformat(),
+                "state": {
+                    "type": "pipeline_step_state_completed",
+                    "result": {"type": f"pipeline_step_state_completed_{result.lower()}", "name": result},
+                },
+            }
+        )
+        steps.append((pipeline, step))
+    return steps
+
+
+def aggregate_models(steps: List[Tuple[Dict[str, Any], PipelineStep]]) -> Dict[Any, Any]:
+    groups: Dict[Any, List[Tuple[Dict[str, Any], PipelineStep]]] = collections.defaultdict(list)
+    for pipeline, step in steps:
+        groups[pipeline["target"]["ref_name"]].append((pipeline, step))
+    stats = {}
+    for branch, group in groups.items():
+        durations = [(step.completed_on - step.started_on).total_seconds() for _, step in group]
+        results = [step.state.result.name.value for _, step in group]
+        rated = [result for result in results if result != "STOPPED"]
+        stats[branch] = (
+            statistics.quantiles(durations, n=100, method="inclusive"),
+            sum(result == "FAILED" for result in rated) / len(rated),
+        )
+    return stats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--steps", type=int, default=50_000)
+    args = parser.parse_args()
+
+    steps = make_steps(args.steps)
+    print(f"{args.steps} steps, {len(BRANCHES)} branches")
+    seconds = min(timeit.repeat(lambda: aggregate_models(steps), number=1, repeat=3))
+    print(f"    {'list of models':<24} {seconds * 1e3:8.1f} ms")
+
+    backends = [False] + ([True] if _import_numpy() is not None else [])
+    for use_numpy in backends:
+        table = StepTable(use_numpy=use_numpy)
+        for pipeline, step in steps:
+            table.add_step(step, pipeline)
+        seconds = min(timeit.repeat(lambda: table.aggregate("branch"), number=1, repeat=3))
+        print(f"    {'StepTable (NumPy)' if use_numpy else 'StepTable (Python)':<24} {seconds * 1e3:8.1f} ms")
+    if len(backends) == 1:
+        print("    (install NumPy to compare its backend)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+"""Measure how long models take to parse their payloads with ``from_dict``, and the garbage they leave behind.
+
+Parses realistic payloads for a few models (see ``model_memory.py``), then sweeps every model of the client with an
+empty payload and with one unknown key, which isolates the fixed cost of ``from_dict`` (copies, additional
+properties). The garbage is the memory allocated while parsing which is freed once the model is built, as seen by
+tracemalloc; unlike timings it does not depend on how busy the machine is. As a baseline, ``PipelineVariable`` and
+``PipelineStep`` are also parsed with the ``from_dict`` generated before, which copied the payload and popped the known
+keys off the copy, leaving the rest as the additional properties:
+
+    python benchmarks/from_dict.py [--number 20000]
+"""
+import argparse
+import sys
+import timeit
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Union
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from model_memory import MODELS, PAYLOADS  # noqa: E402
+
+from bitbucket_api_client import models  # noqa: E402
+from bitbucket_api_client.dates import parse_datetime  # noqa: E402
+from bitbucket_api_client.models import (  # noqa: E402
+    PipelineCommand,
+    PipelineImage,
+    PipelineStep,
+    PipelineStepState,
+    PipelineVariable,
+)
+from bitbucket_api_client.types import UNSET, Unset  # noqa: E402
+
+# the steps returned by the API carry more keys than the model declares, which end up in additional_properties
+API_STEP = {
+    **PAYLOADS["PipelineStep"],
+    "name": "Test",
+    "trigger": {"type": "pipeline_step_trigger_automatic"},
+    "max_time": 120,
+    "duration_in_seconds": 525,
+    "build_seconds_used": 525,
+    "run_number": 1,
+    "pipeline": {"type": "pipeline", "uuid": "{9a8b7c6d-5e4f-4a3b-2c1d-0e9f8a7b6c5d}"},
+    "teardown_commands": [],
+}
+
+
+def copy_and_pop_pipeline_variable(src_dict: Dict[str, Any]) -> PipelineVariable:
+    d = src_dict.copy()
+    type = d.pop("type", UNSET)
+
+    uuid = d.pop("uuid", UNSET)
+
+    key = d.pop("key", UNSET)
+
+    value = d.pop("value", UNSET)
+
+    secured = d.pop("secured", UNSET)
+
+    pipeline_variable = PipelineVariable(
+        type=type,
+        uuid=uuid,
+        key=key,
+        value=value,
+        secured=secured,
+    )
+
+    pipeline_variable.additional_properties = d
+    return pipeline_variable
+
+
+def copy_and_pop_pipeline_step(src_dict: Dict[str, Any]) -> PipelineStep:
+    d = src_dict.copy()
+    type = d.pop("type", UNSET)
+
+    uuid = d.pop("uuid", UNSET)
+
+    _started_on = d.pop("started_on", UNSET)
+    started_on: Union[Unset, Any]
+    if isinstance(_started_on, Unset):
+        started_on = UNSET
+    else:
+        started_on = parse_datetime(_started_on)
+
+    _completed_on = d.pop("completed_on", UNSET)
+    completed_on: Union[Unset, Any]
+    if isinstance(_completed_on, Unset):
+        completed_on = UNSET
+    else:
+        completed_on = parse_datetime(_completed_on)
+
+    _state = d.pop("state", UNSET)
+    state: Union[Unset, Any]
+    if isinstance(_state, Unset):
+        state = UNSET
+    else:
+        state = PipelineStepState.from_dict_by_type(_state)
+
+    _image = d.pop("image", UNSET)
+    image: Union[Unset, PipelineImage]
+    if isinstance(_image, Unset):
+        image = UNSET
+    else:
+        image = PipelineImage.from_dict(_image)
+
+    setup_commands: List[PipelineCommand] = []
+    _setup_commands = d.pop("setup_commands", UNSET)
+    for setup_commands_item_data in _setup_commands or []:
+        setup_commands.append(PipelineCommand.from_dict(setup_commands_item_data))
+
+    script_commands: List[PipelineCommand] = []
+    _script_commands = d.pop("script_commands", UNSET)
+    for script_commands_item_data in _script_commands or []:
+        script_commands.append(PipelineCommand.from_dict(script_commands_item_data))
+
+    pipeline_step = PipelineStep(
+        type=type,
+        uuid=uuid,
+        started_on=started_on,
+        completed_on=completed_on,
+        state=state,
+        image=image,
+        setup_commands=setup_commands,
+        script_commands=script_commands,
+    )
+
+    pipeline_step.additional_properties = d
+    return pipeline_step
+
+
+# the nested models are parsed by the current from_dict, so that only the copy and the pops differ
+COPY_AND_POP: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    "PipelineVariable": copy_and_pop_pipeline_variable,
+    "PipelineStep": copy_and_pop_pipeline_step,
+}
+
+
+def time_from_dict(from_dict: Callable[[Dict[str, Any]], Any], payload: Dict[str, Any], number: int) -> float:
+    return min(timeit.repeat(lambda: from_dict(payload), number=number, repeat=5)) / number
+
+
+def garbage(from_dict: Callable[[Dict[str, Any]], Any], payload: Dict[str, Any]) -> int:
+    from_dict(payload)
+    tracemalloc.start()
+    model = from_dict(payload)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del model
+    return peak - current
+
+
+def parses(from_dict: Callable[[Dict[str, Any]], Any], payload: Dict[str, Any]) -> bool:
+    try:
+        from_dict(payload)
+    except (KeyError, ValueError):  # required enums
+        return False
+    return True
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=20_000)
+    args = parser.parse_args()
+
+    cases = [(name, name, PAYLOADS[name]) for name in MODELS]
+    cases.append(("PipelineStep (API response)", "PipelineStep", API_STEP))
+    for name, model, payload in cases:
+        implementations = [(name, MODELS[model])]
+        if model in COPY_AND_POP:
+            implementations.append(("  copy-and-pop baseline", COPY_AND_POP[model]))
+        for label, from_dict in implementations:
+            seconds = time_from_dict(from_dict, payload, args.number)
+            print(f"{label:<28} {seconds * 1e6:8.2f} us {garbage(from_dict, payload):6d} bytes of garbage per model")
+
+    all_models = [getattr(models, name) for name in models.__all__]
+    parsers = [model.from_dict for model in all_models if hasattr(model, "from_dict")]
+    number = max(args.number // 10, 1)
+    for label, payload in (("empty payload", {}), ("unknown key", {"unknown": 1})):
+        swept = [from_dict for from_dict in parsers if parses(from_dict, payload)]
+        seconds = sum(time_from_dict(from_dict, payload, number) for from_dict in swept)
+        waste = sum(garbage(from_dict, payload) for from_dict in swept)
+        print(f"{len(swept)} models, {label:<18} {seconds * 1e6:8.2f} us {waste:6d} bytes of garbage per sweep")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Measure how long a fresh interpreter takes to import the client.
+
+Each scenario runs in its own subprocess, so nothing is cached between runs:
+
+    python benchmarks/import_time.py [--runs 20]
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+SCENARIOS = {
+    "baseline (interpreter only)": "pass",
+    "client": "import bitbucket_api_client",
+    "one endpoint": "import bitbucket_api_client.api.pipelines.get_pipeline_steps_for_repository",
+    "one model": "from bitbucket_api_client.models import PipelineStep",
+    "every model": "from bitbucket_api_client.models import *",
+}
+
+
+def time_import(statement: str, runs: int) -> float:
+    timings = []
+    for _ in range(runs):
+        started_at = time.perf_counter()
+        subprocess.run([sys.executable, "-c", statement], cwd=ROOT, check=True)
+        timings.append(time.perf_counter() - started_at)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    for name, statement in SCENARIOS.items():
+        print(f"{name:<30} {time_import(statement, args.runs) * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Measure the memory held by parsed models.
+
+Parses a batch of realistic payloads with ``from_dict`` and reports the memory retained per model, as seen by
+tracemalloc (nested models, lists and datetimes included). As a baseline, the same models are also measured as
+they were before they had slots: instances of plain classes holding their attributes in a ``__dict__``, each with
+its own ``additional_properties`` dict:
+
+    python benchmarks/model_memory.py [--count 100000]
+"""
+import argparse
+import functools
+import gc
+import sys
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+import attr
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bitbucket_api_client.models import PaginatedPipelineVariables, PipelineStep, PipelineVariable  # noqa: E402
+
+PAYLOADS: Dict[str, Dict[str, Any]] = {
+    "PipelineStep": {
+        "type": "pipeline_step",
+        "uuid": "{2f1c3a0e-5b6d-4c8e-9f7a-0b1c2d3e4f5a}",
+        "started_on": "2022-10-07T08:33:12.123456Z",
+        "completed_on": "2022-10-07T08:41:57.654321Z",
+        "state": {
+            "type": "pipeline_step_state_completed",
+            "name": "COMPLETED",
+            "result": {"type": "pipeline_step_state_completed_successful", "name": "SUCCESSFUL"},
+        },
+        "image": {"name": "python:3.10"},
+        "setup_commands": [{"name": "Clone", "command": "git clone"}],
+        "script_commands": [{"name": "pytest", "command": "pytest -q"}],
+    },
+    "PipelineVariable": {
+        "type": "pipeline_variable",
+        "uuid": "{7d9e1b2c-3a4f-4e5d-8c6b-1a2b3c4d5e6f}",
+        "key": "AWS_REGION",
+        "value": "eu-west-1",
+        "secured": False,
+    },
+}
+PAYLOADS["PaginatedPipelineVariables"] = {
+    "page": 1,
+    "size": 3,
+    "pagelen": 10,
+    "values": [PAYLOADS["PipelineVariable"]] * 3,
+}
+
+MODELS: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    "PipelineStep": PipelineStep.from_dict,
+    "PipelineVariable": PipelineVariable.from_dict,
+    "PaginatedPipelineVariables": PaginatedPipelineVariables.from_dict,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _unslotted_class(cls: type) -> type:
+    return type(cls.__name__, (), {})
+
+
+def unslotted(value: Any) -> Any:
+    """Copy a parsed model, and the models nested in it, into instances of plain classes with a ``__dict__``"""
+    if isinstance(value, dict):
+        # each model had its own additional_properties before the empty one was shared
+        return dict(value)
+    if isinstance(value, list):
+        return [unslotted(item) for item in value]
+    if not attr.has(type(value)):
+        return value
+    copy = _unslotted_class(type(value))()
+    for field in attr.fields(type(value)):
+        setattr(copy, field.name, unslotted(getattr(value, field.name)))
+    return copy
+
+
+def measure(from_dict: Callable[[Dict[str, Any]], Any], payload: Dict[str, Any], count: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    models: List[Any] = [from_dict(payload) for _ in range(count)]
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del models
+    return (after - before) / count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(f"{'':<28} {'slots':>8} {'__dict__':>8} {'saving':>8}  (bytes per model)")
+    for name, from_dict in MODELS.items():
+        slotted = measure(from_dict, PAYLOADS[name], args.count)
+        baseline = measure(lambda payload: unslotted(from_dict(payload)), PAYLOADS[name], args.count)
+        print(f"{name:<28} {slotted:8.0f} {baseline:8.0f} {baseline - slotted:8.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Measure how long the timestamps sent by the API take to parse.
+
+Compares ``dateutil.parser.isoparse``, used by the models before, with ``parse_datetime`` on a cold cache (every
+timestamp is new) and on a warm cache (every timestamp was seen before):
+
+    python benchmarks/parse_datetime.py [--number 100000]
+"""
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+from dateutil.parser import isoparse
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bitbucket_api_client.dates import parse_datetime  # noqa: E402
+
+TIMESTAMPS = [
+    "2022-10-07T08:33:12.123456+00:00",
+    "2022-10-07T08:33:12.123Z",
+    "2022-10-07T08:33:12Z",
+    "2022-10-07T10:33:12+02:00",
+]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=100_000)
+    args = parser.parse_args()
+
+    parsers = {
+        "isoparse": isoparse,
+        "parse_datetime (cold cache)": parse_datetime.__wrapped__,  # type: ignore[attr-defined]
+        "parse_datetime (warm cache)": parse_datetime,
+    }
+    for timestamp in TIMESTAMPS:
+        assert len({parse(timestamp) for parse in parsers.values()}) == 1, timestamp
+        print(timestamp)
+        for name, parse in parsers.items():
+            seconds = min(timeit.repeat(lambda: parse(timestamp), number=args.number, repeat=5)) / args.number
+            print(f"    {name:<28} {seconds * 1e6:6.2f} us")
+
+
+if __name__ == "__main__":
+    main()
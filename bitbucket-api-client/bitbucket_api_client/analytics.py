@@ -0,0 +1,568 @@
+""" Contains a columnar table of pipeline steps, to compute duration, queue and failure statistics over many builds """
+import asyncio
+import bisect
+import collections
+import functools
+import math
+from array import array
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, AsyncIterable, Deque, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+import attr
+
+from .api.pipelines import get_pipeline_steps_for_repository
+from .client import Client
+from .dates import parse_datetime
+from .models.pipeline_step_state import PipelineStepState
+from .models.pipeline_step_state_completed import PipelineStepStateCompleted
+from .pagination import aiterate, iterate
+from .types import UNSET, Unset
+
+NUMERIC_COLUMNS = ("started_on", "completed_on", "duration", "queue")
+LABEL_COLUMNS = ("pipeline_uuid", "branch", "name", "result")
+DEFAULT_PERCENTILES = (50.0, 90.0, 95.0, 99.0)
+
+# the results which count towards the failure rate; stopped, expired and skipped steps are left out of it
+FAILED_RESULTS = frozenset({"FAILED", "ERROR"})
+_RATED_RESULTS = FAILED_RESULTS | {"SUCCESSFUL"}
+_COMPLETED_TYPE = "pipeline_step_state_completed"
+# the commands and image of the steps are not needed to compute statistics, and make up most of their size
+_STEP_FIELDS = "-values.setup_commands,-values.script_commands,-values.image"
+
+LabelKey = Tuple[Optional[str], ...]
+
+
+@functools.lru_cache(maxsize=None)
+def _import_numpy() -> Any:
+    try:
+        import numpy  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return None
+    return numpy
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class StepStats:
+    """Statistics over a group of pipeline steps
+
+    Attributes:
+        count: The number of steps
+        rated: The number of steps which succeeded or failed
+        failed: The number of steps which failed (a ``FAILED`` or ``ERROR`` result)
+        failure_rate: ``failed / rated``, NaN when no step was rated
+        duration: The percentiles of the duration of the steps in seconds, by percentile
+        queue: The percentiles of the time between the creation of the pipeline and the start of the steps, by
+            percentile
+    """
+
+    count: int
+    rated: int
+    failed: int
+    failure_rate: float
+    duration: Dict[float, float]
+    queue: Dict[float, float]
+
+
+class _Labels:
+    """A column of strings stored as integer codes into the list of its distinct labels, -1 standing for None"""
+
+    __slots__ = ("labels", "codes", "_index")
+
+    def __init__(self, labels: Optional[List[str]] = None) -> None:
+        self.labels: List[str] = [] if labels is None else list(labels)
+        self.codes = array("i")
+        self._index = {label: code for code, label in enumerate(self.labels)}
+
+    def append(self, label: Optional[str]) -> None:
+        if label is None:
+            self.codes.append(-1)
+            return
+        code = self._index.get(label)
+        if code is None:
+            code = self._index[label] = len(self.labels)
+            self.labels.append(label)
+        self.codes.append(code)
+
+    def label(self, code: int) -> Optional[str]:
+        return None if code < 0 else self.labels[code]
+
+    def get_codes(self, labels: Iterable[str]) -> List[int]:
+        return [self._index[label] for label in labels if label in self._index]
+
+
+def _get(item: Any, key: str) -> Any:
+    if isinstance(item, Mapping):
+        return item.get(key)
+    value = getattr(item, key, None)
+    if value is None and hasattr(item, "additional_properties"):
+        value = item.additional_properties.get(key)
+    return None if isinstance(value, Unset) else value
+
+
+def _timestamp(value: Any) -> float:
+    if value is None:
+        return math.nan
+    if isinstance(value, str):
+        value = parse_datetime(value)
+    return value.timestamp()
+
+
+def _get_result(state: Any) -> Optional[str]:
+    if isinstance(state, Mapping):
+        state = PipelineStepState.from_dict_by_type(dict(state))
+    if not isinstance(state, PipelineStepStateCompleted) or isinstance(state.result, Unset):
+        return None
+    name = getattr(state.result, "name", UNSET)
+    if not isinstance(name, Unset):
+        return name.value
+    if "name" in state.result:
+        # a result of a type unknown to the models
+        return state.result["name"]
+    if isinstance(state.result.type, str) and state.result.type.startswith(_COMPLETED_TYPE + "_"):
+        # e.g. pipeline_step_state_completed_failed, for a projection without the name of the result
+        return state.result.type[len(_COMPLETED_TYPE) + 1 :].upper()
+    return None
+
+
+def _interpolate(ordered: Sequence[float], percentile: float) -> float:
+    """Compute a percentile of sorted values with linear interpolation between the closest ranks, like NumPy"""
+    position = (len(ordered) - 1) * percentile / 100
+    low = int(position)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+
+
+def _percentiles(values: Sequence[float], percentiles: Sequence[float]) -> Dict[float, float]:
+    ordered = sorted(value for value in values if not math.isnan(value))
+    if not ordered:
+        return {percentile: math.nan for percentile in percentiles}
+    return {percentile: _interpolate(ordered, percentile) for percentile in percentiles}
+
+
+class StepTable:
+    """A columnar table of pipeline steps
+
+    Each attribute of the steps is stored in its own array rather than as thousands of models: timestamps and
+    durations as ``array("d")`` of seconds (NaN when unknown), strings as integer codes into their distinct labels.
+    Statistics are computed column by column, with NumPy when it is installed (the ``numpy`` extra) and in pure
+    Python otherwise.
+
+    The numeric columns are ``started_on`` and ``completed_on`` (POSIX timestamps), ``duration`` and ``queue``, the
+    time between the creation of the pipeline and the start of the step. The label columns are ``pipeline_uuid``,
+    ``branch`` (of the pipeline), ``name`` and ``result`` (``SUCCESSFUL``, ``FAILED``, ``STOPPED``...).
+
+    Args:
+        use_numpy: Whether to compute with NumPy, by default whenever it is installed
+    """
+
+    def __init__(self, *, use_numpy: Optional[bool] = None) -> None:
+        numpy = _import_numpy()
+        if use_numpy and numpy is None:
+            raise ImportError("NumPy is not installed, install the numpy extra")
+        self._numpy = numpy if use_numpy is not False else None
+        self._numeric: Dict[str, "array[float]"] = {column: array("d") for column in NUMERIC_COLUMNS}
+        self._labels: Dict[str, _Labels] = {column: _Labels() for column in LABEL_COLUMNS}
+
+    def __len__(self) -> int:
+        return len(self._numeric["duration"])
+
+    def add_step(self, step: Any, pipeline: Optional[Mapping[str, Any]] = None) -> None:
+        """Add a step, a ``PipelineStep`` or a dictionary, optionally along with the pipeline it belongs to
+
+        ``pipeline`` is a dictionary as returned by ``get_pipelines_for_repository``, which gives the branch, the
+        UUID and the creation time of the pipeline to the step.
+        """
+        started_on = _timestamp(_get(step, "started_on"))
+        completed_on = _timestamp(_get(step, "completed_on"))
+        created_on = math.nan
+        pipeline_uuid = branch = None
+        if pipeline is not None:
+            created_on = _timestamp(pipeline.get("created_on"))
+            pipeline_uuid = pipeline.get("uuid")
+            branch = (pipeline.get("target") or {}).get("ref_name")
+        self._numeric["started_on"].append(started_on)
+        self._numeric["completed_on"].append(completed_on)
+        self._numeric["duration"].append(completed_on - started_on)
+        self._numeric["queue"].append(started_on - created_on)
+        self._labels["pipeline_uuid"].append(pipeline_uuid)
+        self._labels["branch"].append(branch)
+        self._labels["name"].append(_get(step, "name"))
+        self._labels["result"].append(_get_result(_get(step, "state")))
+
+    def add_steps(self, steps: Iterable[Any], pipeline: Optional[Mapping[str, Any]] = None) -> None:
+        """Add the steps of a pipeline, see ``add_step``"""
+        for step in steps:
+            self.add_step(step, pipeline)
+
+    def column(self, name: str) -> Sequence[float]:
+        """Get a copy of a numeric column, as a NumPy array when NumPy is used and as an ``array("d")`` otherwise"""
+        if self._numpy is not None:
+            return self._view(name).copy()
+        return array("d", self._numeric[name])
+
+    def _view(self, name: str) -> Any:
+        """Get a numeric column as a NumPy array sharing its buffer, which must not outlive the call using it
+
+        The ``array("d")`` cannot grow while the view exists, so ``add_step`` would fail if it leaked to the caller.
+        """
+        return self._numpy.frombuffer(self._numeric[name], dtype=self._numpy.float64)
+
+    def labels(self, name: str) -> List[Optional[str]]:
+        """Get a label column as a list of strings"""
+        labels = self._labels[name]
+        return [labels.label(code) for code in labels.codes]
+
+    def percentiles(
+        self, column: str = "duration", percentiles: Sequence[float] = DEFAULT_PERCENTILES
+    ) -> Dict[float, float]:
+        """Compute percentiles of a numeric column, ignoring unknown (NaN) values
+
+        Returns:
+            The value of each percentile, NaN when the column has no known value
+        """
+        if self._numpy is None:
+            return _percentiles(self._numeric[column], percentiles)
+        values = self._view(column)
+        values = values[~self._numpy.isnan(values)]
+        if not len(values):
+            return {percentile: math.nan for percentile in percentiles}
+        return dict(zip(percentiles, self._numpy.percentile(values, percentiles).tolist()))
+
+    def failure_counts(self) -> Tuple[int, int]:
+        """Count the steps which succeeded or failed, and those which failed"""
+        results = self._labels["result"]
+        rated_codes = results.get_codes(_RATED_RESULTS)
+        failed_codes = results.get_codes(FAILED_RESULTS)
+        if self._numpy is None:
+            counts = collections.Counter(results.codes)
+            return sum(counts[code] for code in rated_codes), sum(counts[code] for code in failed_codes)
+        codes = self._numpy.frombuffer(results.codes, dtype=self._numpy.intc)
+        return int(self._numpy.isin(codes, rated_codes).sum()), int(self._numpy.isin(codes, failed_codes).sum())
+
+    def failure_rate(self) -> float:
+        """Get the share of the steps which failed among those which succeeded or failed, NaN if there are none"""
+        rated, failed = self.failure_counts()
+        return failed / rated if rated else math.nan
+
+    def rolling(
+        self,
+        column: str = "duration",
+        window: int = 50,
+        percentile: float = 50.0,
+        order_by: str = "completed_on",
+    ) -> Tuple[Sequence[float], Sequence[float]]:
+        """Compute a percentile of a numeric column over a window sliding across the steps, e.g. a rolling median
+
+        The steps with a known value are ordered by ``order_by``, and the percentile is computed over each run of
+        ``window`` consecutive steps.
+
+        Returns:
+            The ``order_by`` value of the last step of each window, and the percentile over that window
+        """
+        if self._numpy is not None:
+            numpy = self._numpy
+            values, keys = self._view(column), self._view(order_by)
+            known = ~(numpy.isnan(values) | numpy.isnan(keys))
+            values, keys = values[known], keys[known]
+            # order ties by value, as the sorted (key, value) rows below
+            order = numpy.lexsort((values, keys))
+            values, keys = values[order], keys[order]
+            if len(values) < window:
+                return keys[:0], values[:0]
+            windows = numpy.lib.stride_tricks.sliding_window_view(values, window)
+            return keys[window - 1 :], numpy.percentile(windows, percentile, axis=1)
+
+        rows = sorted(
+            (key, value)
+            for key, value in zip(self._numeric[order_by], self._numeric[column])
+            if not math.isnan(key) and not math.isnan(value)
+        )
+        ends, results = array("d"), array("d")
+        current: List[float] = []
+        for index, (key, value) in enumerate(rows):
+            bisect.insort(current, value)
+            if index >= window:
+                del current[bisect.bisect_left(current, rows[index - window][1])]
+            if index >= window - 1:
+                ends.append(key)
+                results.append(_interpolate(current, percentile))
+        return ends, results
+
+    def take(self, indices: Sequence[int]) -> "StepTable":
+        """Get a new table with the steps at ``indices``"""
+        table = StepTable(use_numpy=self._numpy is not None)
+        if self._numpy is not None:
+            indices = self._numpy.asarray(indices, dtype=self._numpy.intp)
+            for name in NUMERIC_COLUMNS:
+                table._numeric[name].frombytes(self._view(name)[indices].tobytes())
+            for name, labels in self._labels.items():
+                table._labels[name] = _Labels(labels.labels)
+                codes = self._numpy.frombuffer(labels.codes, dtype=self._numpy.intc)
+                table._labels[name].codes.frombytes(codes[indices].tobytes())
+            return table
+        for name, values in self._numeric.items():
+            table._numeric[name].extend(values[index] for index in indices)
+        for name, labels in self._labels.items():
+            table._labels[name] = _Labels(labels.labels)
+            table._labels[name].codes.extend(labels.codes[index] for index in indices)
+        return table
+
+    def _group(self, columns: Sequence[str]) -> Tuple[List[LabelKey], Sequence[int]]:
+        """Number the combinations of labels of ``columns``, getting the labels of each group and the group of each
+        step"""
+        labels = [self._labels[column] for column in columns]
+        if self._numpy is not None:
+            numpy = self._numpy
+            keys = numpy.zeros(len(self), dtype=numpy.int64)
+            for column in labels:
+                # shift the codes so that None (-1) gets a slot of its own
+                keys = keys * (len(column.labels) + 1) + numpy.frombuffer(column.codes, dtype=numpy.intc) + 1
+            _, firsts, groups = numpy.unique(keys, return_index=True, return_inverse=True)
+            keys_labels = [tuple(column.label(column.codes[first]) for column in labels) for first in firsts.tolist()]
+            return keys_labels, groups.reshape(-1)
+        numbers: Dict[LabelKey, int] = {}
+        group_ids = array("i")
+        for codes in zip(*(column.codes for column in labels)) if labels else ((),) * len(self):
+            key = tuple(column.label(code) for column, code in zip(labels, codes))
+            group_ids.append(numbers.setdefault(key, len(numbers)))
+        return list(numbers), group_ids
+
+    def _grouped_percentiles(
+        self, column: str, groups: Sequence[int], count: int, percentiles: Sequence[float]
+    ) -> List[Dict[float, float]]:
+        if self._numpy is None:
+            values: List[List[float]] = [[] for _ in range(count)]
+            for group, value in zip(groups, self._numeric[column]):
+                values[group].append(value)
+            return [_percentiles(group_values, percentiles) for group_values in values]
+
+        # sort the values by group then value, so that each percentile of every group is found by index arithmetic
+        numpy = self._numpy
+        all_values = self._view(column)
+        known = ~numpy.isnan(all_values)
+        values, groups = all_values[known], numpy.asarray(groups)[known]
+        order = numpy.lexsort((values, groups))
+        values = values[order]
+        sizes = numpy.bincount(groups, minlength=count)
+        starts = numpy.cumsum(sizes) - sizes
+        lasts = numpy.maximum(starts + sizes - 1, 0)
+        columns = []
+        for percentile in percentiles:
+            positions = starts + (sizes - 1) * percentile / 100
+            # an empty group points past its neighbours: keep its indices in range, its result is masked below
+            lows = numpy.clip(numpy.floor(positions).astype(numpy.intp), 0, lasts)
+            highs = numpy.minimum(lows + 1, lasts)
+            if len(values):
+                result = values[lows] + (values[highs] - values[lows]) * (positions - lows)
+            else:
+                result = numpy.zeros(count)
+            columns.append(numpy.where(sizes > 0, result, math.nan).tolist())
+        return [dict(zip(percentiles, group_values)) for group_values in zip(*columns)]
+
+    def _grouped_failure_counts(self, groups: Sequence[int], count: int) -> Tuple[List[int], List[int]]:
+        results = self._labels["result"]
+        rated_codes = results.get_codes(_RATED_RESULTS)
+        failed_codes = results.get_codes(FAILED_RESULTS)
+        if self._numpy is None:
+            rated, failed = [0] * count, [0] * count
+            rated_set, failed_set = set(rated_codes), set(failed_codes)
+            for group, code in zip(groups, results.codes):
+                if code in rated_set:
+                    rated[group] += 1
+                    if code in failed_set:
+                        failed[group] += 1
+            return rated, failed
+        numpy = self._numpy
+        codes = numpy.frombuffer(results.codes, dtype=numpy.intc)
+        groups = numpy.asarray(groups)
+        rated_counts = numpy.bincount(groups[numpy.isin(codes, rated_codes)], minlength=count)
+        failed_counts = numpy.bincount(groups[numpy.isin(codes, failed_codes)], minlength=count)
+        return rated_counts.tolist(), failed_counts.tolist()
+
+    def group_by(self, *columns: str) -> Dict[LabelKey, "StepTable"]:
+        """Split the table by the values of label columns, e.g. ``group_by("branch", "name")``
+
+        Returns:
+            A table for each combination of labels found, keyed by the tuple of its labels
+        """
+        if not len(self):
+            return {}
+        keys, groups = self._group(columns)
+        if self._numpy is not None:
+            order = self._numpy.argsort(groups, kind="stable")
+            boundaries = self._numpy.flatnonzero(self._numpy.diff(groups[order])) + 1
+            return {
+                keys[int(groups[indices[0]])]: self.take(indices) for indices in self._numpy.split(order, boundaries)
+            }
+        indices: List[List[int]] = [[] for _ in keys]
+        for index, group in enumerate(groups):
+            indices[group].append(index)
+        return {key: self.take(group_indices) for key, group_indices in zip(keys, indices)}
+
+    def aggregate(self, *by: str, percentiles: Sequence[float] = DEFAULT_PERCENTILES) -> Dict[LabelKey, StepStats]:
+        """Compute the statistics of each group of steps, e.g. ``aggregate("branch")`` or ``aggregate("name")``
+
+        The statistics of all of the groups are computed at once, column by column, without splitting the table.
+
+        Returns:
+            The statistics of each combination of labels found, keyed by the tuple of its labels
+        """
+        keys, groups = self._group(by)
+        if not keys:
+            return {}
+        count = len(keys)
+        rated, failed = self._grouped_failure_counts(groups, count)
+        durations = self._grouped_percentiles("duration", groups, count, percentiles)
+        queues = self._grouped_percentiles("queue", groups, count, percentiles)
+        if self._numpy is None:
+            sizes = collections.Counter(groups)
+            counts = [sizes[group] for group in range(count)]
+        else:
+            counts = self._numpy.bincount(groups, minlength=count).tolist()
+        return {
+            key: StepStats(
+                count=counts[group],
+                rated=rated[group],
+                failed=failed[group],
+                failure_rate=failed[group] / rated[group] if rated[group] else math.nan,
+                duration=durations[group],
+                queue=queues[group],
+            )
+            for group, key in enumerate(keys)
+        }
+
+    def stats(self, percentiles: Sequence[float] = DEFAULT_PERCENTILES) -> StepStats:
+        """Compute the statistics of the whole table"""
+        rated, failed = self.failure_counts()
+        return StepStats(
+            count=len(self),
+            rated=rated,
+            failed=failed,
+            failure_rate=failed / rated if rated else math.nan,
+            duration=self.percentiles("duration", percentiles),
+            queue=self.percentiles("queue", percentiles),
+        )
+
+
+def _list_steps(workspace: str, repo_slug: str, pipeline: Mapping[str, Any], client: Client) -> List[Any]:
+    return list(
+        iterate(
+            get_pipeline_steps_for_repository,
+            workspace,
+            repo_slug,
+            pipeline["uuid"],
+            client=client,
+            pagelen=100,
+            prefetch=False,
+            fields=_STEP_FIELDS,
+        )
+    )
+
+
+def load_steps(
+    workspace: str,
+    repo_slug: str,
+    pipelines: Iterable[Mapping[str, Any]],
+    *,
+    client: Client,
+    workers: int = 4,
+    table: Optional[StepTable] = None,
+) -> StepTable:
+    """Fetch the steps of pipelines into a ``StepTable``
+
+    The steps of up to ``workers`` pipelines are fetched concurrently, in threads, and added to the table as soon as
+    they are received: only the columns of the steps are kept, not their models.
+
+    Args:
+        workspace: The workspace of the repository
+        repo_slug: The slug of the repository
+        pipelines: The pipelines, as dictionaries with at least their ``uuid``, e.g. from
+            ``iterate(get_pipelines_for_repository, workspace, repo_slug, client=client, max_items=5000)``
+        client: The client used for every request
+        workers: The maximum number of pipelines whose steps are fetched concurrently
+        table: The table to add the steps to, a new one by default
+
+    Raises:
+        UnexpectedStatus: If a page of steps is not answered with a 200
+
+    Returns:
+        The table
+    """
+    table = StepTable() if table is None else table
+    pending: Deque[Tuple[Mapping[str, Any], "Future[List[Any]]"]] = collections.deque()
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+        try:
+            for pipeline in pipelines:
+                pending.append((pipeline, executor.submit(_list_steps, workspace, repo_slug, pipeline, client)))
+                if len(pending) >= workers:
+                    done, steps = pending.popleft()
+                    table.add_steps(steps.result(), done)
+            while pending:
+                done, steps = pending.popleft()
+                table.add_steps(steps.result(), done)
+        finally:
+            for _, steps in pending:
+                steps.cancel()
+    return table
+
+
+async def _alist_steps(workspace: str, repo_slug: str, pipeline: Mapping[str, Any], client: Client) -> List[Any]:
+    steps = aiterate(
+        get_pipeline_steps_for_repository,
+        workspace,
+        repo_slug,
+        pipeline["uuid"],
+        client=client,
+        pagelen=100,
+        prefetch=False,
+        fields=_STEP_FIELDS,
+    )
+    return [step async for step in steps]
+
+
+async def aload_steps(
+    workspace: str,
+    repo_slug: str,
+    pipelines: Union[Iterable[Mapping[str, Any]], AsyncIterable[Mapping[str, Any]]],
+    *,
+    client: Client,
+    workers: int = 4,
+    table: Optional[StepTable] = None,
+) -> StepTable:
+    """Like ``load_steps`` but async, fetching in tasks instead of threads. ``pipelines`` may be an async iterable,
+    e.g. from ``aiterate``."""
+    table = StepTable() if table is None else table
+    pending: Deque[Tuple[Mapping[str, Any], "asyncio.Future[List[Any]]"]] = collections.deque()
+
+    async def add(pipeline: Mapping[str, Any]) -> None:
+        pending.append((pipeline, asyncio.ensure_future(_alist_steps(workspace, repo_slug, pipeline, client))))
+        if len(pending) >= workers:
+            done, steps = pending.popleft()
+            table.add_steps(await steps, done)
+
+    try:
+        if isinstance(pipelines, AsyncIterable):
+            async for pipeline in pipelines:
+                await add(pipeline)
+        else:
+            for pipeline in pipelines:
+                await add(pipeline)
+        while pending:
+            done, steps = pending.popleft()
+            table.add_steps(await steps, done)
+    finally:
+        for _, steps in pending:
+            steps.cancel()
+    return table
+
+
+__all__ = [
+    "DEFAULT_PERCENTILES",
+    "FAILED_RESULTS",
+    "LABEL_COLUMNS",
+    "NUMERIC_COLUMNS",
+    "StepStats",
+    "StepTable",
+    "aload_steps",
+    "load_steps",
+]
@@ -2,56 +2,67 @@ from typing import Any, Dict, Optional, Union, cast
 
 import httpx
 
+from ...cache import parse_cached
 from ...client import AuthenticatedClient
 from ...models.error import Error
-from ...types import Response
+from ...types import UNSET, Response, Unset
 
 
 def _get_kwargs(
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Dict[str, Any]:
     url = "{}/addon".format(client.base_url)
 
     headers: Dict[str, str] = client.get_headers()
     cookies: Dict[str, Any] = client.get_cookies()
 
+    params: Dict[str, Any] = {}
+    params["fields"] = fields
+
+    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+
     return {
         "method": "delete",
         "url": url,
         "headers": headers,
         "cookies": cookies,
         "timeout": client.get_timeout(),
+        "params": params,
     }
 
 
-def _parse_response(*, response: httpx.Response) -> Optional[Union[Any, Error]]:
+def _parse_response(*, client: AuthenticatedClient, response: httpx.Response) -> Optional[Union[Any, Error]]:
     if response.status_code == 204:
         response_204 = cast(Any, None)
         return response_204
     if response.status_code == 401:
-        response_401 = Error.from_dict(response.json())
+        response_401 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_401
     if response.status_code == 403:
-        response_403 = Error.from_dict(response.json())
+        response_403 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_403
     return None
 
 
-def _build_response(*, response: httpx.Response) -> Response[Union[Any, Error]]:
+def _build_response(*, client: AuthenticatedClient, response: httpx.Response) -> Response[Union[Any, Error]]:
     return Response(
         status_code=response.status_code,
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(response=response),
+        parse=lambda: parse_cached(_parse_response, client, response),
+        lazy=client.lazy_parsing,
+        keep_content=client.keep_content,
     )
 
 
 def sync_detailed(
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Any, Error]]:
     """Delete an app
 
@@ -70,25 +81,30 @@ def sync_detailed(
       -H \"Authorization: JWT <JWT Token>\"
     ```
 
+    Args:
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
+
     Returns:
         Response[Union[Any, Error]]
     """
 
     kwargs = _get_kwargs(
         client=client,
+        fields=fields,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 def sync(
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Any, Error]]:
     """Delete an app
 
@@ -107,18 +123,24 @@ def sync(
       -H \"Authorization: JWT <JWT Token>\"
     ```
 
+    Args:
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
+
     Returns:
         Response[Union[Any, Error]]
     """
 
     return sync_detailed(
         client=client,
+        fields=fields,
     ).parsed
 
 
 async def asyncio_detailed(
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Any, Error]]:
     """Delete an app
 
@@ -137,23 +159,28 @@ async def asyncio_detailed(
       -H \"Authorization: JWT <JWT Token>\"
     ```
 
+    Args:
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
+
     Returns:
         Response[Union[Any, Error]]
     """
 
     kwargs = _get_kwargs(
         client=client,
+        fields=fields,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 async def asyncio(
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Any, Error]]:
     """Delete an app
 
@@ -172,6 +199,10 @@ async def asyncio(
       -H \"Authorization: JWT <JWT Token>\"
     ```
 
+    Args:
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
+
     Returns:
         Response[Union[Any, Error]]
     """
@@ -179,5 +210,6 @@ async def asyncio(
     return (
         await asyncio_detailed(
             client=client,
+            fields=fields,
         )
     ).parsed
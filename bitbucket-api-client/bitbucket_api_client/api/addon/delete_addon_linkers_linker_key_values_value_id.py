@@ -2,9 +2,10 @@ from typing import Any, Dict, Optional, Union, cast
 
 import httpx
 
+from ...cache import parse_cached
 from ...client import AuthenticatedClient
 from ...models.error import Error
-from ...types import Response
+from ...types import UNSET, Response, Unset
 
 
 def _get_kwargs(
@@ -12,6 +13,7 @@ def _get_kwargs(
     value_id: int,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Dict[str, Any]:
     url = "{}/addon/linkers/{linker_key}/values/{value_id}".format(
         client.base_url, linker_key=linker_key, value_id=value_id
@@ -20,36 +22,44 @@ def _get_kwargs(
     headers: Dict[str, str] = client.get_headers()
     cookies: Dict[str, Any] = client.get_cookies()
 
+    params: Dict[str, Any] = {}
+    params["fields"] = fields
+
+    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+
     return {
         "method": "delete",
         "url": url,
         "headers": headers,
         "cookies": cookies,
         "timeout": client.get_timeout(),
+        "params": params,
     }
 
 
-def _parse_response(*, response: httpx.Response) -> Optional[Union[Any, Error]]:
+def _parse_response(*, client: AuthenticatedClient, response: httpx.Response) -> Optional[Union[Any, Error]]:
     if response.status_code == 204:
         response_204 = cast(Any, None)
         return response_204
     if response.status_code == 401:
-        response_401 = Error.from_dict(response.json())
+        response_401 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_401
     if response.status_code == 404:
-        response_404 = Error.from_dict(response.json())
+        response_404 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_404
     return None
 
 
-def _build_response(*, response: httpx.Response) -> Response[Union[Any, Error]]:
+def _build_response(*, client: AuthenticatedClient, response: httpx.Response) -> Response[Union[Any, Error]]:
     return Response(
         status_code=response.status_code,
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(response=response),
+        parse=lambda: parse_cached(_parse_response, client, response),
+        lazy=client.lazy_parsing,
+        keep_content=client.keep_content,
     )
 
 
@@ -58,6 +68,7 @@ def sync_detailed(
     value_id: int,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Any, Error]]:
     """Delete a linker value
 
@@ -67,6 +78,8 @@ def sync_detailed(
     Args:
         linker_key (str):
         value_id (int):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Any, Error]]
@@ -76,14 +89,14 @@ def sync_detailed(
         linker_key=linker_key,
         value_id=value_id,
         client=client,
+        fields=fields,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 def sync(
@@ -91,6 +104,7 @@ def sync(
     value_id: int,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Any, Error]]:
     """Delete a linker value
 
@@ -100,6 +114,8 @@ def sync(
     Args:
         linker_key (str):
         value_id (int):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Any, Error]]
@@ -109,6 +125,7 @@ def sync(
         linker_key=linker_key,
         value_id=value_id,
         client=client,
+        fields=fields,
     ).parsed
 
 
@@ -117,6 +134,7 @@ async def asyncio_detailed(
     value_id: int,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Any, Error]]:
     """Delete a linker value
 
@@ -126,6 +144,8 @@ async def asyncio_detailed(
     Args:
         linker_key (str):
         value_id (int):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Any, Error]]
@@ -135,12 +155,12 @@ async def asyncio_detailed(
         linker_key=linker_key,
         value_id=value_id,
         client=client,
+        fields=fields,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 async def asyncio(
@@ -148,6 +168,7 @@ async def asyncio(
     value_id: int,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Any, Error]]:
     """Delete a linker value
 
@@ -157,6 +178,8 @@ async def asyncio(
     Args:
         linker_key (str):
         value_id (int):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Any, Error]]
@@ -167,5 +190,6 @@ async def asyncio(
             linker_key=linker_key,
             value_id=value_id,
             client=client,
+            fields=fields,
         )
     ).parsed
@@ -2,51 +2,61 @@ from typing import Any, Dict, Optional, Union, cast
 
 import httpx
 
+from ...cache import parse_cached
 from ...client import AuthenticatedClient
 from ...models.error import Error
-from ...types import Response
+from ...types import UNSET, Response, Unset
 
 
 def _get_kwargs(
     linker_key: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Dict[str, Any]:
     url = "{}/addon/linkers/{linker_key}/values".format(client.base_url, linker_key=linker_key)
 
     headers: Dict[str, str] = client.get_headers()
     cookies: Dict[str, Any] = client.get_cookies()
 
+    params: Dict[str, Any] = {}
+    params["fields"] = fields
+
+    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+
     return {
         "method": "get",
         "url": url,
         "headers": headers,
         "cookies": cookies,
         "timeout": client.get_timeout(),
+        "params": params,
     }
 
 
-def _parse_response(*, response: httpx.Response) -> Optional[Union[Any, Error]]:
+def _parse_response(*, client: AuthenticatedClient, response: httpx.Response) -> Optional[Union[Any, Error]]:
     if response.status_code == 200:
         response_200 = cast(Any, None)
         return response_200
     if response.status_code == 401:
-        response_401 = Error.from_dict(response.json())
+        response_401 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_401
     if response.status_code == 404:
-        response_404 = Error.from_dict(response.json())
+        response_404 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_404
     return None
 
 
-def _build_response(*, response: httpx.Response) -> Response[Union[Any, Error]]:
+def _build_response(*, client: AuthenticatedClient, response: httpx.Response) -> Response[Union[Any, Error]]:
     return Response(
         status_code=response.status_code,
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(response=response),
+        parse=lambda: parse_cached(_parse_response, client, response),
+        lazy=client.lazy_parsing,
+        keep_content=client.keep_content,
     )
 
 
@@ -54,6 +64,7 @@ def sync_detailed(
     linker_key: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Any, Error]]:
     """List linker values for a linker
 
@@ -69,6 +80,8 @@ def sync_detailed(
 
     Args:
         linker_key (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Any, Error]]
@@ -77,20 +90,21 @@ def sync_detailed(
     kwargs = _get_kwargs(
         linker_key=linker_key,
         client=client,
+        fields=fields,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 def sync(
     linker_key: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Any, Error]]:
     """List linker values for a linker
 
@@ -106,6 +120,8 @@ def sync(
 
     Args:
         linker_key (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Any, Error]]
@@ -114,6 +130,7 @@ def sync(
     return sync_detailed(
         linker_key=linker_key,
         client=client,
+        fields=fields,
     ).parsed
 
 
@@ -121,6 +138,7 @@ async def asyncio_detailed(
     linker_key: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Any, Error]]:
     """List linker values for a linker
 
@@ -136,6 +154,8 @@ async def asyncio_detailed(
 
     Args:
         linker_key (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Any, Error]]
@@ -144,18 +164,19 @@ async def asyncio_detailed(
     kwargs = _get_kwargs(
         linker_key=linker_key,
         client=client,
+        fields=fields,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 async def asyncio(
     linker_key: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Any, Error]]:
     """List linker values for a linker
 
@@ -171,6 +192,8 @@ async def asyncio(
 
     Args:
         linker_key (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Any, Error]]
@@ -180,5 +203,6 @@ async def asyncio(
         await asyncio_detailed(
             linker_key=linker_key,
             client=client,
+            fields=fields,
         )
     ).parsed
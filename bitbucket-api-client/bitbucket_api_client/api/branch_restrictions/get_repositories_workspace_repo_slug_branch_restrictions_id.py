@@ -1,10 +1,11 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Union
 
 import httpx
 
+from ...cache import parse_cached
 from ...client import AuthenticatedClient
 from ...models.error import Error
-from ...types import Response
+from ...types import UNSET, Response, Unset
 
 
 def _get_kwargs(
@@ -13,6 +14,7 @@ def _get_kwargs(
     id: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Dict[str, Any]:
     url = "{}/repositories/{workspace}/{repo_slug}/branch-restrictions/{id}".format(
         client.base_url, workspace=workspace, repo_slug=repo_slug, id=id
@@ -21,37 +23,45 @@ def _get_kwargs(
     headers: Dict[str, str] = client.get_headers()
     cookies: Dict[str, Any] = client.get_cookies()
 
+    params: Dict[str, Any] = {}
+    params["fields"] = fields
+
+    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+
     return {
         "method": "get",
         "url": url,
         "headers": headers,
         "cookies": cookies,
         "timeout": client.get_timeout(),
+        "params": params,
     }
 
 
-def _parse_response(*, response: httpx.Response) -> Optional[Error]:
+def _parse_response(*, client: AuthenticatedClient, response: httpx.Response) -> Optional[Error]:
     if response.status_code == 401:
-        response_401 = Error.from_dict(response.json())
+        response_401 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_401
     if response.status_code == 403:
-        response_403 = Error.from_dict(response.json())
+        response_403 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_403
     if response.status_code == 404:
-        response_404 = Error.from_dict(response.json())
+        response_404 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_404
     return None
 
 
-def _build_response(*, response: httpx.Response) -> Response[Error]:
+def _build_response(*, client: AuthenticatedClient, response: httpx.Response) -> Response[Error]:
     return Response(
         status_code=response.status_code,
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(response=response),
+        parse=lambda: parse_cached(_parse_response, client, response),
+        lazy=client.lazy_parsing,
+        keep_content=client.keep_content,
     )
 
 
@@ -61,6 +71,7 @@ def sync_detailed(
     id: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Error]:
     """Get a branch restriction rule
 
@@ -70,6 +81,8 @@ def sync_detailed(
         workspace (str):
         repo_slug (str):
         id (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Error]
@@ -80,14 +93,14 @@ def sync_detailed(
         repo_slug=repo_slug,
         id=id,
         client=client,
+        fields=fields,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 def sync(
@@ -96,6 +109,7 @@ def sync(
     id: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Error]:
     """Get a branch restriction rule
 
@@ -105,6 +119,8 @@ def sync(
         workspace (str):
         repo_slug (str):
         id (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Error]
@@ -115,6 +131,7 @@ def sync(
         repo_slug=repo_slug,
         id=id,
         client=client,
+        fields=fields,
     ).parsed
 
 
@@ -124,6 +141,7 @@ async def asyncio_detailed(
     id: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Error]:
     """Get a branch restriction rule
 
@@ -133,6 +151,8 @@ async def asyncio_detailed(
         workspace (str):
         repo_slug (str):
         id (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Error]
@@ -143,12 +163,12 @@ async def asyncio_detailed(
         repo_slug=repo_slug,
         id=id,
         client=client,
+        fields=fields,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 async def asyncio(
@@ -157,6 +177,7 @@ async def asyncio(
     id: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Error]:
     """Get a branch restriction rule
 
@@ -166,6 +187,8 @@ async def asyncio(
         workspace (str):
         repo_slug (str):
         id (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Error]
@@ -177,5 +200,6 @@ async def asyncio(
             repo_slug=repo_slug,
             id=id,
             client=client,
+            fields=fields,
         )
     ).parsed
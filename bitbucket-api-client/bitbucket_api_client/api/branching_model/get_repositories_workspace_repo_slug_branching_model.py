@@ -1,10 +1,11 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Union
 
 import httpx
 
+from ...cache import parse_cached
 from ...client import AuthenticatedClient
 from ...models.error import Error
-from ...types import Response
+from ...types import UNSET, Response, Unset
 
 
 def _get_kwargs(
@@ -12,6 +13,7 @@ def _get_kwargs(
     repo_slug: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Dict[str, Any]:
     url = "{}/repositories/{workspace}/{repo_slug}/branching-model".format(
         client.base_url, workspace=workspace, repo_slug=repo_slug
@@ -20,37 +22,45 @@ def _get_kwargs(
     headers: Dict[str, str] = client.get_headers()
     cookies: Dict[str, Any] = client.get_cookies()
 
+    params: Dict[str, Any] = {}
+    params["fields"] = fields
+
+    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+
     return {
         "method": "get",
         "url": url,
         "headers": headers,
         "cookies": cookies,
         "timeout": client.get_timeout(),
+        "params": params,
     }
 
 
-def _parse_response(*, response: httpx.Response) -> Optional[Error]:
+def _parse_response(*, client: AuthenticatedClient, response: httpx.Response) -> Optional[Error]:
     if response.status_code == 401:
-        response_401 = Error.from_dict(response.json())
+        response_401 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_401
     if response.status_code == 403:
-        response_403 = Error.from_dict(response.json())
+        response_403 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_403
     if response.status_code == 404:
-        response_404 = Error.from_dict(response.json())
+        response_404 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_404
     return None
 
 
-def _build_response(*, response: httpx.Response) -> Response[Error]:
+def _build_response(*, client: AuthenticatedClient, response: httpx.Response) -> Response[Error]:
     return Response(
         status_code=response.status_code,
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(response=response),
+        parse=lambda: parse_cached(_parse_response, client, response),
+        lazy=client.lazy_parsing,
+        keep_content=client.keep_content,
     )
 
 
@@ -59,6 +69,7 @@ def sync_detailed(
     repo_slug: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Error]:
     """Get the branching model for a repository
 
@@ -136,6 +147,8 @@ def sync_detailed(
     Args:
         workspace (str):
         repo_slug (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Error]
@@ -145,14 +158,14 @@ def sync_detailed(
         workspace=workspace,
         repo_slug=repo_slug,
         client=client,
+        fields=fields,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 def sync(
@@ -160,6 +173,7 @@ def sync(
     repo_slug: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Error]:
     """Get the branching model for a repository
 
@@ -237,6 +251,8 @@ def sync(
     Args:
         workspace (str):
         repo_slug (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Error]
@@ -246,6 +262,7 @@ def sync(
         workspace=workspace,
         repo_slug=repo_slug,
         client=client,
+        fields=fields,
     ).parsed
 
 
@@ -254,6 +271,7 @@ async def asyncio_detailed(
     repo_slug: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Error]:
     """Get the branching model for a repository
 
@@ -331,6 +349,8 @@ async def asyncio_detailed(
     Args:
         workspace (str):
         repo_slug (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Error]
@@ -340,12 +360,12 @@ async def asyncio_detailed(
         workspace=workspace,
         repo_slug=repo_slug,
         client=client,
+        fields=fields,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 async def asyncio(
@@ -353,6 +373,7 @@ async def asyncio(
     repo_slug: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Error]:
     """Get the branching model for a repository
 
@@ -430,6 +451,8 @@ async def asyncio(
     Args:
         workspace (str):
         repo_slug (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Error]
@@ -440,5 +463,6 @@ async def asyncio(
             workspace=workspace,
             repo_slug=repo_slug,
             client=client,
+            fields=fields,
         )
     ).parsed
@@ -2,10 +2,11 @@ from typing import Any, Dict, Optional, Union
 
 import httpx
 
+from ...cache import parse_cached
 from ...client import AuthenticatedClient
 from ...models.error import Error
 from ...models.project_branching_model import ProjectBranchingModel
-from ...types import Response
+from ...types import UNSET, Response, Unset
 
 
 def _get_kwargs(
@@ -13,6 +14,7 @@ def _get_kwargs(
     project_key: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Dict[str, Any]:
     url = "{}/workspaces/{workspace}/projects/{project_key}/branching-model".format(
         client.base_url, workspace=workspace, project_key=project_key
@@ -21,41 +23,53 @@ def _get_kwargs(
     headers: Dict[str, str] = client.get_headers()
     cookies: Dict[str, Any] = client.get_cookies()
 
+    params: Dict[str, Any] = {}
+    params["fields"] = fields
+
+    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+
     return {
         "method": "get",
         "url": url,
         "headers": headers,
         "cookies": cookies,
         "timeout": client.get_timeout(),
+        "params": params,
     }
 
 
-def _parse_response(*, response: httpx.Response) -> Optional[Union[Error, ProjectBranchingModel]]:
+def _parse_response(
+    *, client: AuthenticatedClient, response: httpx.Response
+) -> Optional[Union[Error, ProjectBranchingModel]]:
     if response.status_code == 200:
-        response_200 = ProjectBranchingModel.from_dict(response.json())
+        response_200 = ProjectBranchingModel.from_dict(client.json_codec.loads(response.content))
 
         return response_200
     if response.status_code == 401:
-        response_401 = Error.from_dict(response.json())
+        response_401 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_401
     if response.status_code == 403:
-        response_403 = Error.from_dict(response.json())
+        response_403 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_403
     if response.status_code == 404:
-        response_404 = Error.from_dict(response.json())
+        response_404 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_404
     return None
 
 
-def _build_response(*, response: httpx.Response) -> Response[Union[Error, ProjectBranchingModel]]:
+def _build_response(
+    *, client: AuthenticatedClient, response: httpx.Response
+) -> Response[Union[Error, ProjectBranchingModel]]:
     return Response(
         status_code=response.status_code,
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(response=response),
+        parse=lambda: parse_cached(_parse_response, client, response),
+        lazy=client.lazy_parsing,
+        keep_content=client.keep_content,
     )
 
 
@@ -64,6 +78,7 @@ def sync_detailed(
     project_key: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Error, ProjectBranchingModel]]:
     """Get the branching model for a project
 
@@ -126,6 +141,8 @@ def sync_detailed(
     Args:
         workspace (str):
         project_key (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, ProjectBranchingModel]]
@@ -135,14 +152,14 @@ def sync_detailed(
         workspace=workspace,
         project_key=project_key,
         client=client,
+        fields=fields,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 def sync(
@@ -150,6 +167,7 @@ def sync(
     project_key: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Error, ProjectBranchingModel]]:
     """Get the branching model for a project
 
@@ -212,6 +230,8 @@ def sync(
     Args:
         workspace (str):
         project_key (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, ProjectBranchingModel]]
@@ -221,6 +241,7 @@ def sync(
         workspace=workspace,
         project_key=project_key,
         client=client,
+        fields=fields,
     ).parsed
 
 
@@ -229,6 +250,7 @@ async def asyncio_detailed(
     project_key: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Error, ProjectBranchingModel]]:
     """Get the branching model for a project
 
@@ -291,6 +313,8 @@ async def asyncio_detailed(
     Args:
         workspace (str):
         project_key (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, ProjectBranchingModel]]
@@ -300,12 +324,12 @@ async def asyncio_detailed(
         workspace=workspace,
         project_key=project_key,
         client=client,
+        fields=fields,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 async def asyncio(
@@ -313,6 +337,7 @@ async def asyncio(
     project_key: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Error, ProjectBranchingModel]]:
     """Get the branching model for a project
 
@@ -375,6 +400,8 @@ async def asyncio(
     Args:
         workspace (str):
         project_key (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, ProjectBranchingModel]]
@@ -385,5 +412,6 @@ async def asyncio(
             workspace=workspace,
             project_key=project_key,
             client=client,
+            fields=fields,
         )
     ).parsed
@@ -2,10 +2,11 @@ from typing import Any, Dict, Optional, Union
 
 import httpx
 
+from ...cache import parse_cached
 from ...client import AuthenticatedClient
 from ...models.branching_model_settings import BranchingModelSettings
 from ...models.error import Error
-from ...types import Response
+from ...types import UNSET, Response, Unset
 
 
 def _get_kwargs(
@@ -13,6 +14,7 @@ def _get_kwargs(
     project_key: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Dict[str, Any]:
     url = "{}/workspaces/{workspace}/projects/{project_key}/branching-model/settings".format(
         client.base_url, workspace=workspace, project_key=project_key
@@ -21,45 +23,57 @@ def _get_kwargs(
     headers: Dict[str, str] = client.get_headers()
     cookies: Dict[str, Any] = client.get_cookies()
 
+    params: Dict[str, Any] = {}
+    params["fields"] = fields
+
+    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+
     return {
         "method": "put",
         "url": url,
         "headers": headers,
         "cookies": cookies,
         "timeout": client.get_timeout(),
+        "params": params,
     }
 
 
-def _parse_response(*, response: httpx.Response) -> Optional[Union[BranchingModelSettings, Error]]:
+def _parse_response(
+    *, client: AuthenticatedClient, response: httpx.Response
+) -> Optional[Union[BranchingModelSettings, Error]]:
     if response.status_code == 200:
-        response_200 = BranchingModelSettings.from_dict(response.json())
+        response_200 = BranchingModelSettings.from_dict(client.json_codec.loads(response.content))
 
         return response_200
     if response.status_code == 400:
-        response_400 = Error.from_dict(response.json())
+        response_400 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_400
     if response.status_code == 401:
-        response_401 = Error.from_dict(response.json())
+        response_401 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_401
     if response.status_code == 403:
-        response_403 = Error.from_dict(response.json())
+        response_403 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_403
     if response.status_code == 404:
-        response_404 = Error.from_dict(response.json())
+        response_404 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_404
     return None
 
 
-def _build_response(*, response: httpx.Response) -> Response[Union[BranchingModelSettings, Error]]:
+def _build_response(
+    *, client: AuthenticatedClient, response: httpx.Response
+) -> Response[Union[BranchingModelSettings, Error]]:
     return Response(
         status_code=response.status_code,
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(response=response),
+        parse=lambda: parse_cached(_parse_response, client, response),
+        lazy=client.lazy_parsing,
+        keep_content=client.keep_content,
     )
 
 
@@ -68,6 +82,7 @@ def sync_detailed(
     project_key: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[BranchingModelSettings, Error]]:
     """Update the branching model config for a project
 
@@ -142,6 +157,8 @@ def sync_detailed(
     Args:
         workspace (str):
         project_key (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[BranchingModelSettings, Error]]
@@ -151,14 +168,14 @@ def sync_detailed(
         workspace=workspace,
         project_key=project_key,
         client=client,
+        fields=fields,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 def sync(
@@ -166,6 +183,7 @@ def sync(
     project_key: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[BranchingModelSettings, Error]]:
     """Update the branching model config for a project
 
@@ -240,6 +258,8 @@ def sync(
     Args:
         workspace (str):
         project_key (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[BranchingModelSettings, Error]]
@@ -249,6 +269,7 @@ def sync(
         workspace=workspace,
         project_key=project_key,
         client=client,
+        fields=fields,
     ).parsed
 
 
@@ -257,6 +278,7 @@ async def asyncio_detailed(
     project_key: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[BranchingModelSettings, Error]]:
     """Update the branching model config for a project
 
@@ -331,6 +353,8 @@ async def asyncio_detailed(
     Args:
         workspace (str):
         project_key (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[BranchingModelSettings, Error]]
@@ -340,12 +364,12 @@ async def asyncio_detailed(
         workspace=workspace,
         project_key=project_key,
         client=client,
+        fields=fields,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 async def asyncio(
@@ -353,6 +377,7 @@ async def asyncio(
     project_key: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[BranchingModelSettings, Error]]:
     """Update the branching model config for a project
 
@@ -427,6 +452,8 @@ async def asyncio(
     Args:
         workspace (str):
         project_key (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[BranchingModelSettings, Error]]
@@ -437,5 +464,6 @@ async def asyncio(
             workspace=workspace,
             project_key=project_key,
             client=client,
+            fields=fields,
         )
     ).parsed
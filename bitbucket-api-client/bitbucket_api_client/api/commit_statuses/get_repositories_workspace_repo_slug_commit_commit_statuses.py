@@ -2,6 +2,7 @@ from typing import Any, Dict, Optional, Union, cast
 
 import httpx
 
+from ...cache import parse_cached
 from ...client import AuthenticatedClient
 from ...models.error import Error
 from ...types import UNSET, Response, Unset
@@ -15,6 +16,7 @@ def _get_kwargs(
     client: AuthenticatedClient,
     q: Union[Unset, None, str] = UNSET,
     sort: Union[Unset, None, str] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Dict[str, Any]:
     url = "{}/repositories/{workspace}/{repo_slug}/commit/{commit}/statuses".format(
         client.base_url, workspace=workspace, repo_slug=repo_slug, commit=commit
@@ -28,6 +30,8 @@ def _get_kwargs(
 
     params["sort"] = sort
 
+    params["fields"] = fields
+
     params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
 
     return {
@@ -40,23 +44,25 @@ def _get_kwargs(
     }
 
 
-def _parse_response(*, response: httpx.Response) -> Optional[Union[Any, Error]]:
+def _parse_response(*, client: AuthenticatedClient, response: httpx.Response) -> Optional[Union[Any, Error]]:
     if response.status_code == 401:
         response_401 = cast(Any, None)
         return response_401
     if response.status_code == 404:
-        response_404 = Error.from_dict(response.json())
+        response_404 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_404
     return None
 
 
-def _build_response(*, response: httpx.Response) -> Response[Union[Any, Error]]:
+def _build_response(*, client: AuthenticatedClient, response: httpx.Response) -> Response[Union[Any, Error]]:
     return Response(
         status_code=response.status_code,
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(response=response),
+        parse=lambda: parse_cached(_parse_response, client, response),
+        lazy=client.lazy_parsing,
+        keep_content=client.keep_content,
     )
 
 
@@ -68,6 +74,7 @@ def sync_detailed(
     client: AuthenticatedClient,
     q: Union[Unset, None, str] = UNSET,
     sort: Union[Unset, None, str] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Any, Error]]:
     """List commit statuses for a commit
 
@@ -79,6 +86,8 @@ def sync_detailed(
         commit (str):
         q (Union[Unset, None, str]):
         sort (Union[Unset, None, str]):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Any, Error]]
@@ -91,14 +100,14 @@ def sync_detailed(
         client=client,
         q=q,
         sort=sort,
+        fields=fields,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 def sync(
@@ -109,6 +118,7 @@ def sync(
     client: AuthenticatedClient,
     q: Union[Unset, None, str] = UNSET,
     sort: Union[Unset, None, str] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Any, Error]]:
     """List commit statuses for a commit
 
@@ -120,6 +130,8 @@ def sync(
         commit (str):
         q (Union[Unset, None, str]):
         sort (Union[Unset, None, str]):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Any, Error]]
@@ -132,6 +144,7 @@ def sync(
         client=client,
         q=q,
         sort=sort,
+        fields=fields,
     ).parsed
 
 
@@ -143,6 +156,7 @@ async def asyncio_detailed(
     client: AuthenticatedClient,
     q: Union[Unset, None, str] = UNSET,
     sort: Union[Unset, None, str] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Any, Error]]:
     """List commit statuses for a commit
 
@@ -154,6 +168,8 @@ async def asyncio_detailed(
         commit (str):
         q (Union[Unset, None, str]):
         sort (Union[Unset, None, str]):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Any, Error]]
@@ -166,12 +182,12 @@ async def asyncio_detailed(
         client=client,
         q=q,
         sort=sort,
+        fields=fields,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 async def asyncio(
@@ -182,6 +198,7 @@ async def asyncio(
     client: AuthenticatedClient,
     q: Union[Unset, None, str] = UNSET,
     sort: Union[Unset, None, str] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Any, Error]]:
     """List commit statuses for a commit
 
@@ -193,6 +210,8 @@ async def asyncio(
         commit (str):
         q (Union[Unset, None, str]):
         sort (Union[Unset, None, str]):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Any, Error]]
@@ -206,5 +225,6 @@ async def asyncio(
             client=client,
             q=q,
             sort=sort,
+            fields=fields,
         )
     ).parsed
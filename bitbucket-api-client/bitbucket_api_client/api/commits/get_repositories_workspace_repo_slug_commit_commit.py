@@ -1,10 +1,11 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Union
 
 import httpx
 
+from ...cache import parse_cached
 from ...client import AuthenticatedClient
 from ...models.error import Error
-from ...types import Response
+from ...types import UNSET, Response, Unset
 
 
 def _get_kwargs(
@@ -13,6 +14,7 @@ def _get_kwargs(
     commit: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Dict[str, Any]:
     url = "{}/repositories/{workspace}/{repo_slug}/commit/{commit}".format(
         client.base_url, workspace=workspace, repo_slug=repo_slug, commit=commit
@@ -21,29 +23,37 @@ def _get_kwargs(
     headers: Dict[str, str] = client.get_headers()
     cookies: Dict[str, Any] = client.get_cookies()
 
+    params: Dict[str, Any] = {}
+    params["fields"] = fields
+
+    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+
     return {
         "method": "get",
         "url": url,
         "headers": headers,
         "cookies": cookies,
         "timeout": client.get_timeout(),
+        "params": params,
     }
 
 
-def _parse_response(*, response: httpx.Response) -> Optional[Error]:
+def _parse_response(*, client: AuthenticatedClient, response: httpx.Response) -> Optional[Error]:
     if response.status_code == 404:
-        response_404 = Error.from_dict(response.json())
+        response_404 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_404
     return None
 
 
-def _build_response(*, response: httpx.Response) -> Response[Error]:
+def _build_response(*, client: AuthenticatedClient, response: httpx.Response) -> Response[Error]:
     return Response(
         status_code=response.status_code,
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(response=response),
+        parse=lambda: parse_cached(_parse_response, client, response),
+        lazy=client.lazy_parsing,
+        keep_content=client.keep_content,
     )
 
 
@@ -53,6 +63,7 @@ def sync_detailed(
     commit: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Error]:
     """Get a commit
 
@@ -177,6 +188,8 @@ def sync_detailed(
         workspace (str):
         repo_slug (str):
         commit (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Error]
@@ -187,14 +200,14 @@ def sync_detailed(
         repo_slug=repo_slug,
         commit=commit,
         client=client,
+        fields=fields,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 def sync(
@@ -203,6 +216,7 @@ def sync(
     commit: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Error]:
     """Get a commit
 
@@ -327,6 +341,8 @@ def sync(
         workspace (str):
         repo_slug (str):
         commit (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Error]
@@ -337,6 +353,7 @@ def sync(
         repo_slug=repo_slug,
         commit=commit,
         client=client,
+        fields=fields,
     ).parsed
 
 
@@ -346,6 +363,7 @@ async def asyncio_detailed(
     commit: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Error]:
     """Get a commit
 
@@ -470,6 +488,8 @@ async def asyncio_detailed(
         workspace (str):
         repo_slug (str):
         commit (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Error]
@@ -480,12 +500,12 @@ async def asyncio_detailed(
         repo_slug=repo_slug,
         commit=commit,
         client=client,
+        fields=fields,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 async def asyncio(
@@ -494,6 +514,7 @@ async def asyncio(
     commit: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Error]:
     """Get a commit
 
@@ -618,6 +639,8 @@ async def asyncio(
         workspace (str):
         repo_slug (str):
         commit (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Error]
@@ -629,5 +652,6 @@ async def asyncio(
             repo_slug=repo_slug,
             commit=commit,
             client=client,
+            fields=fields,
         )
     ).parsed
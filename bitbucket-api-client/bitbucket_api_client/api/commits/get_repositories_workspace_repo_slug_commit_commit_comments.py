@@ -14,6 +14,7 @@ def _get_kwargs(
     client: AuthenticatedClient,
     q: Union[Unset, None, str] = UNSET,
     sort: Union[Unset, None, str] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Dict[str, Any]:
     url = "{}/repositories/{workspace}/{repo_slug}/commit/{commit}/comments".format(
         client.base_url, workspace=workspace, repo_slug=repo_slug, commit=commit
@@ -27,6 +28,8 @@ def _get_kwargs(
 
     params["sort"] = sort
 
+    params["fields"] = fields
+
     params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
 
     return {
@@ -39,7 +42,7 @@ def _get_kwargs(
     }
 
 
-def _build_response(*, response: httpx.Response) -> Response[Any]:
+def _build_response(*, client: AuthenticatedClient, response: httpx.Response) -> Response[Any]:
     return Response(
         status_code=response.status_code,
         content=response.content,
@@ -56,6 +59,7 @@ def sync_detailed(
     client: AuthenticatedClient,
     q: Union[Unset, None, str] = UNSET,
     sort: Union[Unset, None, str] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Any]:
     """List a commit's comments
 
@@ -72,6 +76,8 @@ def sync_detailed(
         commit (str):
         q (Union[Unset, None, str]):
         sort (Union[Unset, None, str]):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Any]
@@ -84,14 +90,14 @@ def sync_detailed(
         client=client,
         q=q,
         sort=sort,
+        fields=fields,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 async def asyncio_detailed(
@@ -102,6 +108,7 @@ async def asyncio_detailed(
     client: AuthenticatedClient,
     q: Union[Unset, None, str] = UNSET,
     sort: Union[Unset, None, str] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Any]:
     """List a commit's comments
 
@@ -118,6 +125,8 @@ async def asyncio_detailed(
         commit (str):
         q (Union[Unset, None, str]):
         sort (Union[Unset, None, str]):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Any]
@@ -130,9 +139,9 @@ async def asyncio_detailed(
         client=client,
         q=q,
         sort=sort,
+        fields=fields,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
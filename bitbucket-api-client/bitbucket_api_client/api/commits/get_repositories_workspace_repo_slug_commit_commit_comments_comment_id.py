@@ -1,9 +1,9 @@
-from typing import Any, Dict
+from typing import Any, Dict, Union
 
 import httpx
 
 from ...client import AuthenticatedClient
-from ...types import Response
+from ...types import UNSET, Response, Unset
 
 
 def _get_kwargs(
@@ -13,6 +13,7 @@ def _get_kwargs(
     comment_id: int,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Dict[str, Any]:
     url = "{}/repositories/{workspace}/{repo_slug}/commit/{commit}/comments/{comment_id}".format(
         client.base_url, workspace=workspace, repo_slug=repo_slug, commit=commit, comment_id=comment_id
@@ -21,16 +22,22 @@ def _get_kwargs(
     headers: Dict[str, str] = client.get_headers()
     cookies: Dict[str, Any] = client.get_cookies()
 
+    params: Dict[str, Any] = {}
+    params["fields"] = fields
+
+    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+
     return {
         "method": "get",
         "url": url,
         "headers": headers,
         "cookies": cookies,
         "timeout": client.get_timeout(),
+        "params": params,
     }
 
 
-def _build_response(*, response: httpx.Response) -> Response[Any]:
+def _build_response(*, client: AuthenticatedClient, response: httpx.Response) -> Response[Any]:
     return Response(
         status_code=response.status_code,
         content=response.content,
@@ -46,6 +53,7 @@ def sync_detailed(
     comment_id: int,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Any]:
     """Get a commit comment
 
@@ -56,6 +64,8 @@ def sync_detailed(
         repo_slug (str):
         commit (str):
         comment_id (int):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Any]
@@ -67,14 +77,14 @@ def sync_detailed(
         commit=commit,
         comment_id=comment_id,
         client=client,
+        fields=fields,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 async def asyncio_detailed(
@@ -84,6 +94,7 @@ async def asyncio_detailed(
     comment_id: int,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Any]:
     """Get a commit comment
 
@@ -94,6 +105,8 @@ async def asyncio_detailed(
         repo_slug (str):
         commit (str):
         comment_id (int):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Any]
@@ -105,9 +118,9 @@ async def asyncio_detailed(
         commit=commit,
         comment_id=comment_id,
         client=client,
+        fields=fields,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
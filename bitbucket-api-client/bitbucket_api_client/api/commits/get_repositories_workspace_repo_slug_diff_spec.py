@@ -2,6 +2,7 @@ from typing import Any, Dict, Optional, Union, cast
 
 import httpx
 
+from ...cache import parse_cached
 from ...client import AuthenticatedClient
 from ...models.error import Error
 from ...types import UNSET, Response, Unset
@@ -20,6 +21,7 @@ def _get_kwargs(
     renames: Union[Unset, None, bool] = UNSET,
     merge: Union[Unset, None, bool] = UNSET,
     topic: Union[Unset, None, bool] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Dict[str, Any]:
     url = "{}/repositories/{workspace}/{repo_slug}/diff/{spec}".format(
         client.base_url, workspace=workspace, repo_slug=repo_slug, spec=spec
@@ -43,6 +45,8 @@ def _get_kwargs(
 
     params["topic"] = topic
 
+    params["fields"] = fields
+
     params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
 
     return {
@@ -55,23 +59,25 @@ def _get_kwargs(
     }
 
 
-def _parse_response(*, response: httpx.Response) -> Optional[Union[Any, Error]]:
+def _parse_response(*, client: AuthenticatedClient, response: httpx.Response) -> Optional[Union[Any, Error]]:
     if response.status_code == 200:
         response_200 = cast(Any, None)
         return response_200
     if response.status_code == 555:
-        response_555 = Error.from_dict(response.json())
+        response_555 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_555
     return None
 
 
-def _build_response(*, response: httpx.Response) -> Response[Union[Any, Error]]:
+def _build_response(*, client: AuthenticatedClient, response: httpx.Response) -> Response[Union[Any, Error]]:
     return Response(
         status_code=response.status_code,
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(response=response),
+        parse=lambda: parse_cached(_parse_response, client, response),
+        lazy=client.lazy_parsing,
+        keep_content=client.keep_content,
     )
 
 
@@ -88,6 +94,7 @@ def sync_detailed(
     renames: Union[Unset, None, bool] = UNSET,
     merge: Union[Unset, None, bool] = UNSET,
     topic: Union[Unset, None, bool] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Any, Error]]:
     """Compare two commits
 
@@ -139,6 +146,8 @@ def sync_detailed(
         renames (Union[Unset, None, bool]):
         merge (Union[Unset, None, bool]):
         topic (Union[Unset, None, bool]):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Any, Error]]
@@ -156,14 +165,14 @@ def sync_detailed(
         renames=renames,
         merge=merge,
         topic=topic,
+        fields=fields,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 def sync(
@@ -179,6 +188,7 @@ def sync(
     renames: Union[Unset, None, bool] = UNSET,
     merge: Union[Unset, None, bool] = UNSET,
     topic: Union[Unset, None, bool] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Any, Error]]:
     """Compare two commits
 
@@ -230,6 +240,8 @@ def sync(
         renames (Union[Unset, None, bool]):
         merge (Union[Unset, None, bool]):
         topic (Union[Unset, None, bool]):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Any, Error]]
@@ -247,6 +259,7 @@ def sync(
         renames=renames,
         merge=merge,
         topic=topic,
+        fields=fields,
     ).parsed
 
 
@@ -263,6 +276,7 @@ async def asyncio_detailed(
     renames: Union[Unset, None, bool] = UNSET,
     merge: Union[Unset, None, bool] = UNSET,
     topic: Union[Unset, None, bool] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Any, Error]]:
     """Compare two commits
 
@@ -314,6 +328,8 @@ async def asyncio_detailed(
         renames (Union[Unset, None, bool]):
         merge (Union[Unset, None, bool]):
         topic (Union[Unset, None, bool]):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Any, Error]]
@@ -331,12 +347,12 @@ async def asyncio_detailed(
         renames=renames,
         merge=merge,
         topic=topic,
+        fields=fields,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 async def asyncio(
@@ -352,6 +368,7 @@ async def asyncio(
     renames: Union[Unset, None, bool] = UNSET,
     merge: Union[Unset, None, bool] = UNSET,
     topic: Union[Unset, None, bool] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Any, Error]]:
     """Compare two commits
 
@@ -403,6 +420,8 @@ async def asyncio(
         renames (Union[Unset, None, bool]):
         merge (Union[Unset, None, bool]):
         topic (Union[Unset, None, bool]):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Any, Error]]
@@ -421,5 +440,6 @@ async def asyncio(
             renames=renames,
             merge=merge,
             topic=topic,
+            fields=fields,
         )
     ).parsed
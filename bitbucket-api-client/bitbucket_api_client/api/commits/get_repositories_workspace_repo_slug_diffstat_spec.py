@@ -2,6 +2,7 @@ from typing import Any, Dict, Optional, Union
 
 import httpx
 
+from ...cache import parse_cached
 from ...client import AuthenticatedClient
 from ...models.error import Error
 from ...types import UNSET, Response, Unset
@@ -18,6 +19,7 @@ def _get_kwargs(
     path: Union[Unset, None, str] = UNSET,
     renames: Union[Unset, None, bool] = UNSET,
     topic: Union[Unset, None, bool] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Dict[str, Any]:
     url = "{}/repositories/{workspace}/{repo_slug}/diffstat/{spec}".format(
         client.base_url, workspace=workspace, repo_slug=repo_slug, spec=spec
@@ -37,6 +39,8 @@ def _get_kwargs(
 
     params["topic"] = topic
 
+    params["fields"] = fields
+
     params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
 
     return {
@@ -49,20 +53,22 @@ def _get_kwargs(
     }
 
 
-def _parse_response(*, response: httpx.Response) -> Optional[Error]:
+def _parse_response(*, client: AuthenticatedClient, response: httpx.Response) -> Optional[Error]:
     if response.status_code == 555:
-        response_555 = Error.from_dict(response.json())
+        response_555 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_555
     return None
 
 
-def _build_response(*, response: httpx.Response) -> Response[Error]:
+def _build_response(*, client: AuthenticatedClient, response: httpx.Response) -> Response[Error]:
     return Response(
         status_code=response.status_code,
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(response=response),
+        parse=lambda: parse_cached(_parse_response, client, response),
+        lazy=client.lazy_parsing,
+        keep_content=client.keep_content,
     )
 
 
@@ -77,6 +83,7 @@ def sync_detailed(
     path: Union[Unset, None, str] = UNSET,
     renames: Union[Unset, None, bool] = UNSET,
     topic: Union[Unset, None, bool] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Error]:
     """Compare two commit diff stats
 
@@ -154,6 +161,8 @@ def sync_detailed(
         path (Union[Unset, None, str]):
         renames (Union[Unset, None, bool]):
         topic (Union[Unset, None, bool]):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Error]
@@ -169,14 +178,14 @@ def sync_detailed(
         path=path,
         renames=renames,
         topic=topic,
+        fields=fields,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 def sync(
@@ -190,6 +199,7 @@ def sync(
     path: Union[Unset, None, str] = UNSET,
     renames: Union[Unset, None, bool] = UNSET,
     topic: Union[Unset, None, bool] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Error]:
     """Compare two commit diff stats
 
@@ -267,6 +277,8 @@ def sync(
         path (Union[Unset, None, str]):
         renames (Union[Unset, None, bool]):
         topic (Union[Unset, None, bool]):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Error]
@@ -282,6 +294,7 @@ def sync(
         path=path,
         renames=renames,
         topic=topic,
+        fields=fields,
     ).parsed
 
 
@@ -296,6 +309,7 @@ async def asyncio_detailed(
     path: Union[Unset, None, str] = UNSET,
     renames: Union[Unset, None, bool] = UNSET,
     topic: Union[Unset, None, bool] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Error]:
     """Compare two commit diff stats
 
@@ -373,6 +387,8 @@ async def asyncio_detailed(
         path (Union[Unset, None, str]):
         renames (Union[Unset, None, bool]):
         topic (Union[Unset, None, bool]):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Error]
@@ -388,12 +404,12 @@ async def asyncio_detailed(
         path=path,
         renames=renames,
         topic=topic,
+        fields=fields,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 async def asyncio(
@@ -407,6 +423,7 @@ async def asyncio(
     path: Union[Unset, None, str] = UNSET,
     renames: Union[Unset, None, bool] = UNSET,
     topic: Union[Unset, None, bool] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Error]:
     """Compare two commit diff stats
 
@@ -484,6 +501,8 @@ async def asyncio(
         path (Union[Unset, None, str]):
         renames (Union[Unset, None, bool]):
         topic (Union[Unset, None, bool]):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Error]
@@ -500,5 +519,6 @@ async def asyncio(
             path=path,
             renames=renames,
             topic=topic,
+            fields=fields,
         )
     ).parsed
@@ -2,10 +2,11 @@ from typing import Any, Dict, Optional, Union
 
 import httpx
 
+from ...cache import parse_cached
 from ...client import AuthenticatedClient
 from ...models.error import Error
 from ...models.participant import Participant
-from ...types import Response
+from ...types import UNSET, Response, Unset
 
 
 def _get_kwargs(
@@ -14,6 +15,7 @@ def _get_kwargs(
     commit: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Dict[str, Any]:
     url = "{}/repositories/{workspace}/{repo_slug}/commit/{commit}/approve".format(
         client.base_url, workspace=workspace, repo_slug=repo_slug, commit=commit
@@ -22,33 +24,41 @@ def _get_kwargs(
     headers: Dict[str, str] = client.get_headers()
     cookies: Dict[str, Any] = client.get_cookies()
 
+    params: Dict[str, Any] = {}
+    params["fields"] = fields
+
+    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+
     return {
         "method": "post",
         "url": url,
         "headers": headers,
         "cookies": cookies,
         "timeout": client.get_timeout(),
+        "params": params,
     }
 
 
-def _parse_response(*, response: httpx.Response) -> Optional[Union[Error, Participant]]:
+def _parse_response(*, client: AuthenticatedClient, response: httpx.Response) -> Optional[Union[Error, Participant]]:
     if response.status_code == 200:
-        response_200 = Participant.from_dict(response.json())
+        response_200 = Participant.from_dict(client.json_codec.loads(response.content))
 
         return response_200
     if response.status_code == 404:
-        response_404 = Error.from_dict(response.json())
+        response_404 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_404
     return None
 
 
-def _build_response(*, response: httpx.Response) -> Response[Union[Error, Participant]]:
+def _build_response(*, client: AuthenticatedClient, response: httpx.Response) -> Response[Union[Error, Participant]]:
     return Response(
         status_code=response.status_code,
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(response=response),
+        parse=lambda: parse_cached(_parse_response, client, response),
+        lazy=client.lazy_parsing,
+        keep_content=client.keep_content,
     )
 
 
@@ -58,6 +68,7 @@ def sync_detailed(
     commit: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Error, Participant]]:
     """Approve a commit
 
@@ -72,6 +83,8 @@ def sync_detailed(
         workspace (str):
         repo_slug (str):
         commit (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, Participant]]
@@ -82,14 +95,14 @@ def sync_detailed(
         repo_slug=repo_slug,
         commit=commit,
         client=client,
+        fields=fields,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 def sync(
@@ -98,6 +111,7 @@ def sync(
     commit: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Error, Participant]]:
     """Approve a commit
 
@@ -112,6 +126,8 @@ def sync(
         workspace (str):
         repo_slug (str):
         commit (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, Participant]]
@@ -122,6 +138,7 @@ def sync(
         repo_slug=repo_slug,
         commit=commit,
         client=client,
+        fields=fields,
     ).parsed
 
 
@@ -131,6 +148,7 @@ async def asyncio_detailed(
     commit: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Error, Participant]]:
     """Approve a commit
 
@@ -145,6 +163,8 @@ async def asyncio_detailed(
         workspace (str):
         repo_slug (str):
         commit (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, Participant]]
@@ -155,12 +175,12 @@ async def asyncio_detailed(
         repo_slug=repo_slug,
         commit=commit,
         client=client,
+        fields=fields,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 async def asyncio(
@@ -169,6 +189,7 @@ async def asyncio(
     commit: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Error, Participant]]:
     """Approve a commit
 
@@ -183,6 +204,8 @@ async def asyncio(
         workspace (str):
         repo_slug (str):
         commit (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, Participant]]
@@ -194,5 +217,6 @@ async def asyncio(
             repo_slug=repo_slug,
             commit=commit,
             client=client,
+            fields=fields,
         )
     ).parsed
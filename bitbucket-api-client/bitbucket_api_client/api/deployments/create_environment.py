@@ -2,10 +2,11 @@ from typing import Any, Dict, Optional, Union
 
 import httpx
 
+from ...cache import parse_cached
 from ...client import Client
 from ...models.deployment_environment import DeploymentEnvironment
 from ...models.error import Error
-from ...types import Response
+from ...types import UNSET, Response, Unset
 
 
 def _get_kwargs(
@@ -14,6 +15,7 @@ def _get_kwargs(
     *,
     client: Client,
     json_body: DeploymentEnvironment,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Dict[str, Any]:
     url = "{}/repositories/{workspace}/{repo_slug}/environments/".format(
         client.base_url, workspace=workspace, repo_slug=repo_slug
@@ -24,38 +26,48 @@ def _get_kwargs(
 
     json_json_body = json_body.to_dict()
 
+    headers["Content-Type"] = "application/json"
+
+    params: Dict[str, Any] = {}
+    params["fields"] = fields
+
+    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+
     return {
         "method": "post",
         "url": url,
         "headers": headers,
         "cookies": cookies,
         "timeout": client.get_timeout(),
-        "json": json_json_body,
+        "params": params,
+        "content": client.json_codec.dumps(json_json_body),
     }
 
 
-def _parse_response(*, response: httpx.Response) -> Optional[Union[DeploymentEnvironment, Error]]:
+def _parse_response(*, client: Client, response: httpx.Response) -> Optional[Union[DeploymentEnvironment, Error]]:
     if response.status_code == 201:
-        response_201 = DeploymentEnvironment.from_dict(response.json())
+        response_201 = DeploymentEnvironment.from_dict(client.json_codec.loads(response.content))
 
         return response_201
     if response.status_code == 404:
-        response_404 = Error.from_dict(response.json())
+        response_404 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_404
     if response.status_code == 409:
-        response_409 = Error.from_dict(response.json())
+        response_409 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_409
     return None
 
 
-def _build_response(*, response: httpx.Response) -> Response[Union[DeploymentEnvironment, Error]]:
+def _build_response(*, client: Client, response: httpx.Response) -> Response[Union[DeploymentEnvironment, Error]]:
     return Response(
         status_code=response.status_code,
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(response=response),
+        parse=lambda: parse_cached(_parse_response, client, response),
+        lazy=client.lazy_parsing,
+        keep_content=client.keep_content,
     )
 
 
@@ -65,6 +77,7 @@ def sync_detailed(
     *,
     client: Client,
     json_body: DeploymentEnvironment,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[DeploymentEnvironment, Error]]:
     """Create an environment
 
@@ -74,6 +87,8 @@ def sync_detailed(
         workspace (str):
         repo_slug (str):
         json_body (DeploymentEnvironment):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[DeploymentEnvironment, Error]]
@@ -84,14 +99,14 @@ def sync_detailed(
         repo_slug=repo_slug,
         client=client,
         json_body=json_body,
+        fields=fields,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 def sync(
@@ -100,6 +115,7 @@ def sync(
     *,
     client: Client,
     json_body: DeploymentEnvironment,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[DeploymentEnvironment, Error]]:
     """Create an environment
 
@@ -109,6 +125,8 @@ def sync(
         workspace (str):
         repo_slug (str):
         json_body (DeploymentEnvironment):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[DeploymentEnvironment, Error]]
@@ -119,6 +137,7 @@ def sync(
         repo_slug=repo_slug,
         client=client,
         json_body=json_body,
+        fields=fields,
     ).parsed
 
 
@@ -128,6 +147,7 @@ async def asyncio_detailed(
     *,
     client: Client,
     json_body: DeploymentEnvironment,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[DeploymentEnvironment, Error]]:
     """Create an environment
 
@@ -137,6 +157,8 @@ async def asyncio_detailed(
         workspace (str):
         repo_slug (str):
         json_body (DeploymentEnvironment):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[DeploymentEnvironment, Error]]
@@ -147,12 +169,12 @@ async def asyncio_detailed(
         repo_slug=repo_slug,
         client=client,
         json_body=json_body,
+        fields=fields,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 async def asyncio(
@@ -161,6 +183,7 @@ async def asyncio(
     *,
     client: Client,
     json_body: DeploymentEnvironment,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[DeploymentEnvironment, Error]]:
     """Create an environment
 
@@ -170,6 +193,8 @@ async def asyncio(
         workspace (str):
         repo_slug (str):
         json_body (DeploymentEnvironment):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[DeploymentEnvironment, Error]]
@@ -181,5 +206,6 @@ async def asyncio(
             repo_slug=repo_slug,
             client=client,
             json_body=json_body,
+            fields=fields,
         )
     ).parsed
@@ -2,9 +2,10 @@ from typing import Any, Dict, Optional, Union, cast
 
 import httpx
 
+from ...cache import parse_cached
 from ...client import Client
 from ...models.error import Error
-from ...types import Response
+from ...types import UNSET, Response, Unset
 
 
 def _get_kwargs(
@@ -13,6 +14,7 @@ def _get_kwargs(
     environment_uuid: str,
     *,
     client: Client,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Dict[str, Any]:
     url = "{}/repositories/{workspace}/{repo_slug}/environments/{environment_uuid}".format(
         client.base_url, workspace=workspace, repo_slug=repo_slug, environment_uuid=environment_uuid
@@ -21,32 +23,40 @@ def _get_kwargs(
     headers: Dict[str, str] = client.get_headers()
     cookies: Dict[str, Any] = client.get_cookies()
 
+    params: Dict[str, Any] = {}
+    params["fields"] = fields
+
+    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+
     return {
         "method": "delete",
         "url": url,
         "headers": headers,
         "cookies": cookies,
         "timeout": client.get_timeout(),
+        "params": params,
     }
 
 
-def _parse_response(*, response: httpx.Response) -> Optional[Union[Any, Error]]:
+def _parse_response(*, client: Client, response: httpx.Response) -> Optional[Union[Any, Error]]:
     if response.status_code == 204:
         response_204 = cast(Any, None)
         return response_204
     if response.status_code == 404:
-        response_404 = Error.from_dict(response.json())
+        response_404 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_404
     return None
 
 
-def _build_response(*, response: httpx.Response) -> Response[Union[Any, Error]]:
+def _build_response(*, client: Client, response: httpx.Response) -> Response[Union[Any, Error]]:
     return Response(
         status_code=response.status_code,
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(response=response),
+        parse=lambda: parse_cached(_parse_response, client, response),
+        lazy=client.lazy_parsing,
+        keep_content=client.keep_content,
     )
 
 
@@ -56,6 +66,7 @@ def sync_detailed(
     environment_uuid: str,
     *,
     client: Client,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Any, Error]]:
     """Delete an environment
 
@@ -65,6 +76,8 @@ def sync_detailed(
         workspace (str):
         repo_slug (str):
         environment_uuid (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Any, Error]]
@@ -75,14 +88,14 @@ def sync_detailed(
         repo_slug=repo_slug,
         environment_uuid=environment_uuid,
         client=client,
+        fields=fields,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 def sync(
@@ -91,6 +104,7 @@ def sync(
     environment_uuid: str,
     *,
     client: Client,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Any, Error]]:
     """Delete an environment
 
@@ -100,6 +114,8 @@ def sync(
         workspace (str):
         repo_slug (str):
         environment_uuid (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Any, Error]]
@@ -110,6 +126,7 @@ def sync(
         repo_slug=repo_slug,
         environment_uuid=environment_uuid,
         client=client,
+        fields=fields,
     ).parsed
 
 
@@ -119,6 +136,7 @@ async def asyncio_detailed(
     environment_uuid: str,
     *,
     client: Client,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Any, Error]]:
     """Delete an environment
 
@@ -128,6 +146,8 @@ async def asyncio_detailed(
         workspace (str):
         repo_slug (str):
         environment_uuid (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Any, Error]]
@@ -138,12 +158,12 @@ async def asyncio_detailed(
         repo_slug=repo_slug,
         environment_uuid=environment_uuid,
         client=client,
+        fields=fields,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 async def asyncio(
@@ -152,6 +172,7 @@ async def asyncio(
     environment_uuid: str,
     *,
     client: Client,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Any, Error]]:
     """Delete an environment
 
@@ -161,6 +182,8 @@ async def asyncio(
         workspace (str):
         repo_slug (str):
         environment_uuid (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Any, Error]]
@@ -172,5 +195,6 @@ async def asyncio(
             repo_slug=repo_slug,
             environment_uuid=environment_uuid,
             client=client,
+            fields=fields,
         )
     ).parsed
@@ -1,10 +1,11 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Union
 
 import httpx
 
+from ...cache import parse_cached
 from ...client import Client
 from ...models.error import Error
-from ...types import Response
+from ...types import UNSET, Response, Unset
 
 
 def _get_kwargs(
@@ -13,6 +14,7 @@ def _get_kwargs(
     deployment_uuid: str,
     *,
     client: Client,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Dict[str, Any]:
     url = "{}/repositories/{workspace}/{repo_slug}/deployments/{deployment_uuid}".format(
         client.base_url, workspace=workspace, repo_slug=repo_slug, deployment_uuid=deployment_uuid
@@ -21,29 +23,37 @@ def _get_kwargs(
     headers: Dict[str, str] = client.get_headers()
     cookies: Dict[str, Any] = client.get_cookies()
 
+    params: Dict[str, Any] = {}
+    params["fields"] = fields
+
+    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+
     return {
         "method": "get",
         "url": url,
         "headers": headers,
         "cookies": cookies,
         "timeout": client.get_timeout(),
+        "params": params,
     }
 
 
-def _parse_response(*, response: httpx.Response) -> Optional[Error]:
+def _parse_response(*, client: Client, response: httpx.Response) -> Optional[Error]:
     if response.status_code == 404:
-        response_404 = Error.from_dict(response.json())
+        response_404 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_404
     return None
 
 
-def _build_response(*, response: httpx.Response) -> Response[Error]:
+def _build_response(*, client: Client, response: httpx.Response) -> Response[Error]:
     return Response(
         status_code=response.status_code,
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(response=response),
+        parse=lambda: parse_cached(_parse_response, client, response),
+        lazy=client.lazy_parsing,
+        keep_content=client.keep_content,
     )
 
 
@@ -53,6 +63,7 @@ def sync_detailed(
     deployment_uuid: str,
     *,
     client: Client,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Error]:
     """Get a deployment
 
@@ -62,6 +73,8 @@ def sync_detailed(
         workspace (str):
         repo_slug (str):
         deployment_uuid (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Error]
@@ -72,14 +85,14 @@ def sync_detailed(
         repo_slug=repo_slug,
         deployment_uuid=deployment_uuid,
         client=client,
+        fields=fields,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 def sync(
@@ -88,6 +101,7 @@ def sync(
     deployment_uuid: str,
     *,
     client: Client,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Error]:
     """Get a deployment
 
@@ -97,6 +111,8 @@ def sync(
         workspace (str):
         repo_slug (str):
         deployment_uuid (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Error]
@@ -107,6 +123,7 @@ def sync(
         repo_slug=repo_slug,
         deployment_uuid=deployment_uuid,
         client=client,
+        fields=fields,
     ).parsed
 
 
@@ -116,6 +133,7 @@ async def asyncio_detailed(
     deployment_uuid: str,
     *,
     client: Client,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Error]:
     """Get a deployment
 
@@ -125,6 +143,8 @@ async def asyncio_detailed(
         workspace (str):
         repo_slug (str):
         deployment_uuid (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Error]
@@ -135,12 +155,12 @@ async def asyncio_detailed(
         repo_slug=repo_slug,
         deployment_uuid=deployment_uuid,
         client=client,
+        fields=fields,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 async def asyncio(
@@ -149,6 +169,7 @@ async def asyncio(
     deployment_uuid: str,
     *,
     client: Client,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Error]:
     """Get a deployment
 
@@ -158,6 +179,8 @@ async def asyncio(
         workspace (str):
         repo_slug (str):
         deployment_uuid (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Error]
@@ -169,5 +192,6 @@ async def asyncio(
             repo_slug=repo_slug,
             deployment_uuid=deployment_uuid,
             client=client,
+            fields=fields,
         )
     ).parsed
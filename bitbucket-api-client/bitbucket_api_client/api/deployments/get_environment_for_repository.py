@@ -2,10 +2,11 @@ from typing import Any, Dict, Optional, Union
 
 import httpx
 
+from ...cache import parse_cached
 from ...client import Client
 from ...models.deployment_environment import DeploymentEnvironment
 from ...models.error import Error
-from ...types import Response
+from ...types import UNSET, Response, Unset
 
 
 def _get_kwargs(
@@ -14,6 +15,7 @@ def _get_kwargs(
     environment_uuid: str,
     *,
     client: Client,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Dict[str, Any]:
     url = "{}/repositories/{workspace}/{repo_slug}/environments/{environment_uuid}".format(
         client.base_url, workspace=workspace, repo_slug=repo_slug, environment_uuid=environment_uuid
@@ -22,33 +24,41 @@ def _get_kwargs(
     headers: Dict[str, str] = client.get_headers()
     cookies: Dict[str, Any] = client.get_cookies()
 
+    params: Dict[str, Any] = {}
+    params["fields"] = fields
+
+    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+
     return {
         "method": "get",
         "url": url,
         "headers": headers,
         "cookies": cookies,
         "timeout": client.get_timeout(),
+        "params": params,
     }
 
 
-def _parse_response(*, response: httpx.Response) -> Optional[Union[DeploymentEnvironment, Error]]:
+def _parse_response(*, client: Client, response: httpx.Response) -> Optional[Union[DeploymentEnvironment, Error]]:
     if response.status_code == 200:
-        response_200 = DeploymentEnvironment.from_dict(response.json())
+        response_200 = DeploymentEnvironment.from_dict(client.json_codec.loads(response.content))
 
         return response_200
     if response.status_code == 404:
-        response_404 = Error.from_dict(response.json())
+        response_404 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_404
     return None
 
 
-def _build_response(*, response: httpx.Response) -> Response[Union[DeploymentEnvironment, Error]]:
+def _build_response(*, client: Client, response: httpx.Response) -> Response[Union[DeploymentEnvironment, Error]]:
     return Response(
         status_code=response.status_code,
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(response=response),
+        parse=lambda: parse_cached(_parse_response, client, response),
+        lazy=client.lazy_parsing,
+        keep_content=client.keep_content,
     )
 
 
@@ -58,6 +68,7 @@ def sync_detailed(
     environment_uuid: str,
     *,
     client: Client,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[DeploymentEnvironment, Error]]:
     """Get an environment
 
@@ -67,6 +78,8 @@ def sync_detailed(
         workspace (str):
         repo_slug (str):
         environment_uuid (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[DeploymentEnvironment, Error]]
@@ -77,14 +90,14 @@ def sync_detailed(
         repo_slug=repo_slug,
         environment_uuid=environment_uuid,
         client=client,
+        fields=fields,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 def sync(
@@ -93,6 +106,7 @@ def sync(
     environment_uuid: str,
     *,
     client: Client,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[DeploymentEnvironment, Error]]:
     """Get an environment
 
@@ -102,6 +116,8 @@ def sync(
         workspace (str):
         repo_slug (str):
         environment_uuid (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[DeploymentEnvironment, Error]]
@@ -112,6 +128,7 @@ def sync(
         repo_slug=repo_slug,
         environment_uuid=environment_uuid,
         client=client,
+        fields=fields,
     ).parsed
 
 
@@ -121,6 +138,7 @@ async def asyncio_detailed(
     environment_uuid: str,
     *,
     client: Client,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[DeploymentEnvironment, Error]]:
     """Get an environment
 
@@ -130,6 +148,8 @@ async def asyncio_detailed(
         workspace (str):
         repo_slug (str):
         environment_uuid (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[DeploymentEnvironment, Error]]
@@ -140,12 +160,12 @@ async def asyncio_detailed(
         repo_slug=repo_slug,
         environment_uuid=environment_uuid,
         client=client,
+        fields=fields,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 async def asyncio(
@@ -154,6 +174,7 @@ async def asyncio(
     environment_uuid: str,
     *,
     client: Client,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[DeploymentEnvironment, Error]]:
     """Get an environment
 
@@ -163,6 +184,8 @@ async def asyncio(
         workspace (str):
         repo_slug (str):
         environment_uuid (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[DeploymentEnvironment, Error]]
@@ -174,5 +197,6 @@ async def asyncio(
             repo_slug=repo_slug,
             environment_uuid=environment_uuid,
             client=client,
+            fields=fields,
         )
     ).parsed
@@ -2,10 +2,11 @@ from typing import Any, Dict, Optional, Union
 
 import httpx
 
+from ...cache import parse_cached
 from ...client import AuthenticatedClient
 from ...models.error import Error
 from ...models.issue_job_status import IssueJobStatus
-from ...types import Response
+from ...types import UNSET, Response, Unset
 
 
 def _get_kwargs(
@@ -15,6 +16,7 @@ def _get_kwargs(
     task_id: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Dict[str, Any]:
     url = "{}/repositories/{workspace}/{repo_slug}/issues/export/{repo_name}-issues-{task_id}.zip".format(
         client.base_url, workspace=workspace, repo_slug=repo_slug, repo_name=repo_name, task_id=task_id
@@ -23,41 +25,49 @@ def _get_kwargs(
     headers: Dict[str, str] = client.get_headers()
     cookies: Dict[str, Any] = client.get_cookies()
 
+    params: Dict[str, Any] = {}
+    params["fields"] = fields
+
+    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+
     return {
         "method": "get",
         "url": url,
         "headers": headers,
         "cookies": cookies,
         "timeout": client.get_timeout(),
+        "params": params,
     }
 
 
-def _parse_response(*, response: httpx.Response) -> Optional[Union[Error, IssueJobStatus]]:
+def _parse_response(*, client: AuthenticatedClient, response: httpx.Response) -> Optional[Union[Error, IssueJobStatus]]:
     if response.status_code == 202:
-        response_202 = IssueJobStatus.from_dict(response.json())
+        response_202 = IssueJobStatus.from_dict(client.json_codec.loads(response.content))
 
         return response_202
     if response.status_code == 401:
-        response_401 = Error.from_dict(response.json())
+        response_401 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_401
     if response.status_code == 403:
-        response_403 = Error.from_dict(response.json())
+        response_403 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_403
     if response.status_code == 404:
-        response_404 = Error.from_dict(response.json())
+        response_404 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_404
     return None
 
 
-def _build_response(*, response: httpx.Response) -> Response[Union[Error, IssueJobStatus]]:
+def _build_response(*, client: AuthenticatedClient, response: httpx.Response) -> Response[Union[Error, IssueJobStatus]]:
     return Response(
         status_code=response.status_code,
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(response=response),
+        parse=lambda: parse_cached(_parse_response, client, response),
+        lazy=client.lazy_parsing,
+        keep_content=client.keep_content,
     )
 
 
@@ -68,6 +78,7 @@ def sync_detailed(
     task_id: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Error, IssueJobStatus]]:
     """Check issue export status
 
@@ -107,6 +118,8 @@ def sync_detailed(
         repo_slug (str):
         repo_name (str):
         task_id (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, IssueJobStatus]]
@@ -118,14 +131,14 @@ def sync_detailed(
         repo_name=repo_name,
         task_id=task_id,
         client=client,
+        fields=fields,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 def sync(
@@ -135,6 +148,7 @@ def sync(
     task_id: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Error, IssueJobStatus]]:
     """Check issue export status
 
@@ -174,6 +188,8 @@ def sync(
         repo_slug (str):
         repo_name (str):
         task_id (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, IssueJobStatus]]
@@ -185,6 +201,7 @@ def sync(
         repo_name=repo_name,
         task_id=task_id,
         client=client,
+        fields=fields,
     ).parsed
 
 
@@ -195,6 +212,7 @@ async def asyncio_detailed(
     task_id: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Error, IssueJobStatus]]:
     """Check issue export status
 
@@ -234,6 +252,8 @@ async def asyncio_detailed(
         repo_slug (str):
         repo_name (str):
         task_id (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, IssueJobStatus]]
@@ -245,12 +265,12 @@ async def asyncio_detailed(
         repo_name=repo_name,
         task_id=task_id,
         client=client,
+        fields=fields,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 async def asyncio(
@@ -260,6 +280,7 @@ async def asyncio(
     task_id: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Error, IssueJobStatus]]:
     """Check issue export status
 
@@ -299,6 +320,8 @@ async def asyncio(
         repo_slug (str):
         repo_name (str):
         task_id (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, IssueJobStatus]]
@@ -311,5 +334,6 @@ async def asyncio(
             repo_name=repo_name,
             task_id=task_id,
             client=client,
+            fields=fields,
         )
     ).parsed
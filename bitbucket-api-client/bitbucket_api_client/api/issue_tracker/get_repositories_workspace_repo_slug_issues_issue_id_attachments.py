@@ -2,10 +2,11 @@ from typing import Any, Dict, Optional, Union, cast
 
 import httpx
 
+from ...cache import parse_cached
 from ...client import AuthenticatedClient
 from ...models.error import Error
 from ...models.paginated_issue_attachment import PaginatedIssueAttachment
-from ...types import Response
+from ...types import UNSET, Response, Unset
 
 
 def _get_kwargs(
@@ -14,6 +15,7 @@ def _get_kwargs(
     issue_id: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Dict[str, Any]:
     url = "{}/repositories/{workspace}/{repo_slug}/issues/{issue_id}/attachments".format(
         client.base_url, workspace=workspace, repo_slug=repo_slug, issue_id=issue_id
@@ -22,36 +24,48 @@ def _get_kwargs(
     headers: Dict[str, str] = client.get_headers()
     cookies: Dict[str, Any] = client.get_cookies()
 
+    params: Dict[str, Any] = {}
+    params["fields"] = fields
+
+    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+
     return {
         "method": "get",
         "url": url,
         "headers": headers,
         "cookies": cookies,
         "timeout": client.get_timeout(),
+        "params": params,
     }
 
 
-def _parse_response(*, response: httpx.Response) -> Optional[Union[Any, Error, PaginatedIssueAttachment]]:
+def _parse_response(
+    *, client: AuthenticatedClient, response: httpx.Response
+) -> Optional[Union[Any, Error, PaginatedIssueAttachment]]:
     if response.status_code == 200:
-        response_200 = PaginatedIssueAttachment.from_dict(response.json())
+        response_200 = PaginatedIssueAttachment.from_dict(client.json_codec.loads(response.content))
 
         return response_200
     if response.status_code == 401:
         response_401 = cast(Any, None)
         return response_401
     if response.status_code == 404:
-        response_404 = Error.from_dict(response.json())
+        response_404 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_404
     return None
 
 
-def _build_response(*, response: httpx.Response) -> Response[Union[Any, Error, PaginatedIssueAttachment]]:
+def _build_response(
+    *, client: AuthenticatedClient, response: httpx.Response
+) -> Response[Union[Any, Error, PaginatedIssueAttachment]]:
     return Response(
         status_code=response.status_code,
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(response=response),
+        parse=lambda: parse_cached(_parse_response, client, response),
+        lazy=client.lazy_parsing,
+        keep_content=client.keep_content,
     )
 
 
@@ -61,6 +75,7 @@ def sync_detailed(
     issue_id: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Any, Error, PaginatedIssueAttachment]]:
     """List attachments for an issue
 
@@ -75,6 +90,8 @@ def sync_detailed(
         workspace (str):
         repo_slug (str):
         issue_id (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Any, Error, PaginatedIssueAttachment]]
@@ -85,14 +102,14 @@ def sync_detailed(
         repo_slug=repo_slug,
         issue_id=issue_id,
         client=client,
+        fields=fields,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 def sync(
@@ -101,6 +118,7 @@ def sync(
     issue_id: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Any, Error, PaginatedIssueAttachment]]:
     """List attachments for an issue
 
@@ -115,6 +133,8 @@ def sync(
         workspace (str):
         repo_slug (str):
         issue_id (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Any, Error, PaginatedIssueAttachment]]
@@ -125,6 +145,7 @@ def sync(
         repo_slug=repo_slug,
         issue_id=issue_id,
         client=client,
+        fields=fields,
     ).parsed
 
 
@@ -134,6 +155,7 @@ async def asyncio_detailed(
     issue_id: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Any, Error, PaginatedIssueAttachment]]:
     """List attachments for an issue
 
@@ -148,6 +170,8 @@ async def asyncio_detailed(
         workspace (str):
         repo_slug (str):
         issue_id (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Any, Error, PaginatedIssueAttachment]]
@@ -158,12 +182,12 @@ async def asyncio_detailed(
         repo_slug=repo_slug,
         issue_id=issue_id,
         client=client,
+        fields=fields,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 async def asyncio(
@@ -172,6 +196,7 @@ async def asyncio(
     issue_id: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Any, Error, PaginatedIssueAttachment]]:
     """List attachments for an issue
 
@@ -186,6 +211,8 @@ async def asyncio(
         workspace (str):
         repo_slug (str):
         issue_id (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Any, Error, PaginatedIssueAttachment]]
@@ -197,5 +224,6 @@ async def asyncio(
             repo_slug=repo_slug,
             issue_id=issue_id,
             client=client,
+            fields=fields,
         )
     ).parsed
@@ -13,6 +13,7 @@ def _get_kwargs(
     *,
     client: AuthenticatedClient,
     q: Union[Unset, None, str] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Dict[str, Any]:
     url = "{}/repositories/{workspace}/{repo_slug}/issues/{issue_id}/comments".format(
         client.base_url, workspace=workspace, repo_slug=repo_slug, issue_id=issue_id
@@ -24,6 +25,8 @@ def _get_kwargs(
     params: Dict[str, Any] = {}
     params["q"] = q
 
+    params["fields"] = fields
+
     params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
 
     return {
@@ -36,7 +39,7 @@ def _get_kwargs(
     }
 
 
-def _build_response(*, response: httpx.Response) -> Response[Any]:
+def _build_response(*, client: AuthenticatedClient, response: httpx.Response) -> Response[Any]:
     return Response(
         status_code=response.status_code,
         content=response.content,
@@ -52,6 +55,7 @@ def sync_detailed(
     *,
     client: AuthenticatedClient,
     q: Union[Unset, None, str] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Any]:
     """List comments on an issue
 
@@ -69,6 +73,8 @@ def sync_detailed(
         repo_slug (str):
         issue_id (str):
         q (Union[Unset, None, str]):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Any]
@@ -80,14 +86,14 @@ def sync_detailed(
         issue_id=issue_id,
         client=client,
         q=q,
+        fields=fields,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 async def asyncio_detailed(
@@ -97,6 +103,7 @@ async def asyncio_detailed(
     *,
     client: AuthenticatedClient,
     q: Union[Unset, None, str] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Any]:
     """List comments on an issue
 
@@ -114,6 +121,8 @@ async def asyncio_detailed(
         repo_slug (str):
         issue_id (str):
         q (Union[Unset, None, str]):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Any]
@@ -125,9 +134,9 @@ async def asyncio_detailed(
         issue_id=issue_id,
         client=client,
         q=q,
+        fields=fields,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
@@ -2,10 +2,11 @@ from typing import Any, Dict, Optional, Union, cast
 
 import httpx
 
+from ...cache import parse_cached
 from ...client import AuthenticatedClient
 from ...models.error import Error
 from ...models.export_options import ExportOptions
-from ...types import Response
+from ...types import UNSET, Response, Unset
 
 
 def _get_kwargs(
@@ -14,6 +15,7 @@ def _get_kwargs(
     *,
     client: AuthenticatedClient,
     json_body: ExportOptions,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Dict[str, Any]:
     url = "{}/repositories/{workspace}/{repo_slug}/issues/export".format(
         client.base_url, workspace=workspace, repo_slug=repo_slug
@@ -24,41 +26,51 @@ def _get_kwargs(
 
     json_json_body = json_body.to_dict()
 
+    headers["Content-Type"] = "application/json"
+
+    params: Dict[str, Any] = {}
+    params["fields"] = fields
+
+    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+
     return {
         "method": "post",
         "url": url,
         "headers": headers,
         "cookies": cookies,
         "timeout": client.get_timeout(),
-        "json": json_json_body,
+        "params": params,
+        "content": client.json_codec.dumps(json_json_body),
     }
 
 
-def _parse_response(*, response: httpx.Response) -> Optional[Union[Any, Error]]:
+def _parse_response(*, client: AuthenticatedClient, response: httpx.Response) -> Optional[Union[Any, Error]]:
     if response.status_code == 202:
         response_202 = cast(Any, None)
         return response_202
     if response.status_code == 401:
-        response_401 = Error.from_dict(response.json())
+        response_401 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_401
     if response.status_code == 403:
-        response_403 = Error.from_dict(response.json())
+        response_403 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_403
     if response.status_code == 404:
-        response_404 = Error.from_dict(response.json())
+        response_404 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_404
     return None
 
 
-def _build_response(*, response: httpx.Response) -> Response[Union[Any, Error]]:
+def _build_response(*, client: AuthenticatedClient, response: httpx.Response) -> Response[Union[Any, Error]]:
     return Response(
         status_code=response.status_code,
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(response=response),
+        parse=lambda: parse_cached(_parse_response, client, response),
+        lazy=client.lazy_parsing,
+        keep_content=client.keep_content,
     )
 
 
@@ -68,6 +80,7 @@ def sync_detailed(
     *,
     client: AuthenticatedClient,
     json_body: ExportOptions,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Any, Error]]:
     """Export issues
 
@@ -88,6 +101,8 @@ def sync_detailed(
         workspace (str):
         repo_slug (str):
         json_body (ExportOptions): Options for issue export.
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Any, Error]]
@@ -98,14 +113,14 @@ def sync_detailed(
         repo_slug=repo_slug,
         client=client,
         json_body=json_body,
+        fields=fields,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 def sync(
@@ -114,6 +129,7 @@ def sync(
     *,
     client: AuthenticatedClient,
     json_body: ExportOptions,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Any, Error]]:
     """Export issues
 
@@ -134,6 +150,8 @@ def sync(
         workspace (str):
         repo_slug (str):
         json_body (ExportOptions): Options for issue export.
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Any, Error]]
@@ -144,6 +162,7 @@ def sync(
         repo_slug=repo_slug,
         client=client,
         json_body=json_body,
+        fields=fields,
     ).parsed
 
 
@@ -153,6 +172,7 @@ async def asyncio_detailed(
     *,
     client: AuthenticatedClient,
     json_body: ExportOptions,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Any, Error]]:
     """Export issues
 
@@ -173,6 +193,8 @@ async def asyncio_detailed(
         workspace (str):
         repo_slug (str):
         json_body (ExportOptions): Options for issue export.
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Any, Error]]
@@ -183,12 +205,12 @@ async def asyncio_detailed(
         repo_slug=repo_slug,
         client=client,
         json_body=json_body,
+        fields=fields,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 async def asyncio(
@@ -197,6 +219,7 @@ async def asyncio(
     *,
     client: AuthenticatedClient,
     json_body: ExportOptions,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Any, Error]]:
     """Export issues
 
@@ -217,6 +240,8 @@ async def asyncio(
         workspace (str):
         repo_slug (str):
         json_body (ExportOptions): Options for issue export.
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Any, Error]]
@@ -228,5 +253,6 @@ async def asyncio(
             repo_slug=repo_slug,
             client=client,
             json_body=json_body,
+            fields=fields,
         )
     ).parsed
@@ -2,10 +2,11 @@ from typing import Any, Dict, Optional, Union
 
 import httpx
 
+from ...cache import parse_cached
 from ...client import Client
 from ...models.deployment_variable import DeploymentVariable
 from ...models.error import Error
-from ...types import Response
+from ...types import UNSET, Response, Unset
 
 
 def _get_kwargs(
@@ -15,6 +16,7 @@ def _get_kwargs(
     *,
     client: Client,
     json_body: DeploymentVariable,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Dict[str, Any]:
     url = "{}/repositories/{workspace}/{repo_slug}/deployments_config/environments/{environment_uuid}/variables".format(
         client.base_url, workspace=workspace, repo_slug=repo_slug, environment_uuid=environment_uuid
@@ -25,38 +27,48 @@ def _get_kwargs(
 
     json_json_body = json_body.to_dict()
 
+    headers["Content-Type"] = "application/json"
+
+    params: Dict[str, Any] = {}
+    params["fields"] = fields
+
+    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+
     return {
         "method": "post",
         "url": url,
         "headers": headers,
         "cookies": cookies,
         "timeout": client.get_timeout(),
-        "json": json_json_body,
+        "params": params,
+        "content": client.json_codec.dumps(json_json_body),
     }
 
 
-def _parse_response(*, response: httpx.Response) -> Optional[Union[DeploymentVariable, Error]]:
+def _parse_response(*, client: Client, response: httpx.Response) -> Optional[Union[DeploymentVariable, Error]]:
     if response.status_code == 201:
-        response_201 = DeploymentVariable.from_dict(response.json())
+        response_201 = DeploymentVariable.from_dict(client.json_codec.loads(response.content))
 
         return response_201
     if response.status_code == 404:
-        response_404 = Error.from_dict(response.json())
+        response_404 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_404
     if response.status_code == 409:
-        response_409 = Error.from_dict(response.json())
+        response_409 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_409
     return None
 
 
-def _build_response(*, response: httpx.Response) -> Response[Union[DeploymentVariable, Error]]:
+def _build_response(*, client: Client, response: httpx.Response) -> Response[Union[DeploymentVariable, Error]]:
     return Response(
         status_code=response.status_code,
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(response=response),
+        parse=lambda: parse_cached(_parse_response, client, response),
+        lazy=client.lazy_parsing,
+        keep_content=client.keep_content,
     )
 
 
@@ -67,6 +79,7 @@ def sync_detailed(
     *,
     client: Client,
     json_body: DeploymentVariable,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[DeploymentVariable, Error]]:
     """Create a variable for an environment
 
@@ -77,6 +90,8 @@ def sync_detailed(
         repo_slug (str):
         environment_uuid (str):
         json_body (DeploymentVariable):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[DeploymentVariable, Error]]
@@ -88,14 +103,14 @@ def sync_detailed(
         environment_uuid=environment_uuid,
         client=client,
         json_body=json_body,
+        fields=fields,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 def sync(
@@ -105,6 +120,7 @@ def sync(
     *,
     client: Client,
     json_body: DeploymentVariable,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[DeploymentVariable, Error]]:
     """Create a variable for an environment
 
@@ -115,6 +131,8 @@ def sync(
         repo_slug (str):
         environment_uuid (str):
         json_body (DeploymentVariable):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[DeploymentVariable, Error]]
@@ -126,6 +144,7 @@ def sync(
         environment_uuid=environment_uuid,
         client=client,
         json_body=json_body,
+        fields=fields,
     ).parsed
 
 
@@ -136,6 +155,7 @@ async def asyncio_detailed(
     *,
     client: Client,
     json_body: DeploymentVariable,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[DeploymentVariable, Error]]:
     """Create a variable for an environment
 
@@ -146,6 +166,8 @@ async def asyncio_detailed(
         repo_slug (str):
         environment_uuid (str):
         json_body (DeploymentVariable):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[DeploymentVariable, Error]]
@@ -157,12 +179,12 @@ async def asyncio_detailed(
         environment_uuid=environment_uuid,
         client=client,
         json_body=json_body,
+        fields=fields,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 async def asyncio(
@@ -172,6 +194,7 @@ async def asyncio(
     *,
     client: Client,
     json_body: DeploymentVariable,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[DeploymentVariable, Error]]:
     """Create a variable for an environment
 
@@ -182,6 +205,8 @@ async def asyncio(
         repo_slug (str):
         environment_uuid (str):
         json_body (DeploymentVariable):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[DeploymentVariable, Error]]
@@ -194,5 +219,6 @@ async def asyncio(
             environment_uuid=environment_uuid,
             client=client,
             json_body=json_body,
+            fields=fields,
         )
     ).parsed
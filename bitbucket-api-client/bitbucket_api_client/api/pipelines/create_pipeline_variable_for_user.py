@@ -2,53 +2,63 @@ from typing import Any, Dict, Optional, Union
 
 import httpx
 
+from ...cache import parse_cached
 from ...client import Client
 from ...models.error import Error
 from ...models.pipeline_variable import PipelineVariable
-from ...types import Response
+from ...types import UNSET, Response, Unset
 
 
 def _get_kwargs(
     selected_user: str,
     *,
     client: Client,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Dict[str, Any]:
     url = "{}/users/{selected_user}/pipelines_config/variables/".format(client.base_url, selected_user=selected_user)
 
     headers: Dict[str, str] = client.get_headers()
     cookies: Dict[str, Any] = client.get_cookies()
 
+    params: Dict[str, Any] = {}
+    params["fields"] = fields
+
+    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+
     return {
         "method": "post",
         "url": url,
         "headers": headers,
         "cookies": cookies,
         "timeout": client.get_timeout(),
+        "params": params,
     }
 
 
-def _parse_response(*, response: httpx.Response) -> Optional[Union[Error, PipelineVariable]]:
+def _parse_response(*, client: Client, response: httpx.Response) -> Optional[Union[Error, PipelineVariable]]:
     if response.status_code == 201:
-        response_201 = PipelineVariable.from_dict(response.json())
+        response_201 = PipelineVariable.from_dict(client.json_codec.loads(response.content))
 
         return response_201
     if response.status_code == 404:
-        response_404 = Error.from_dict(response.json())
+        response_404 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_404
     if response.status_code == 409:
-        response_409 = Error.from_dict(response.json())
+        response_409 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_409
     return None
 
 
-def _build_response(*, response: httpx.Response) -> Response[Union[Error, PipelineVariable]]:
+def _build_response(*, client: Client, response: httpx.Response) -> Response[Union[Error, PipelineVariable]]:
     return Response(
         status_code=response.status_code,
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(response=response),
+        parse=lambda: parse_cached(_parse_response, client, response),
+        lazy=client.lazy_parsing,
+        keep_content=client.keep_content,
     )
 
 
@@ -56,6 +66,7 @@ def sync_detailed(
     selected_user: str,
     *,
     client: Client,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Error, PipelineVariable]]:
     """Create a variable for a user
 
@@ -66,6 +77,8 @@ def sync_detailed(
 
     Args:
         selected_user (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, PipelineVariable]]
@@ -74,20 +87,21 @@ def sync_detailed(
     kwargs = _get_kwargs(
         selected_user=selected_user,
         client=client,
+        fields=fields,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 def sync(
     selected_user: str,
     *,
     client: Client,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Error, PipelineVariable]]:
     """Create a variable for a user
 
@@ -98,6 +112,8 @@ def sync(
 
     Args:
         selected_user (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, PipelineVariable]]
@@ -106,6 +122,7 @@ def sync(
     return sync_detailed(
         selected_user=selected_user,
         client=client,
+        fields=fields,
     ).parsed
 
 
@@ -113,6 +130,7 @@ async def asyncio_detailed(
     selected_user: str,
     *,
     client: Client,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Error, PipelineVariable]]:
     """Create a variable for a user
 
@@ -123,6 +141,8 @@ async def asyncio_detailed(
 
     Args:
         selected_user (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, PipelineVariable]]
@@ -131,18 +151,19 @@ async def asyncio_detailed(
     kwargs = _get_kwargs(
         selected_user=selected_user,
         client=client,
+        fields=fields,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 async def asyncio(
     selected_user: str,
     *,
     client: Client,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Error, PipelineVariable]]:
     """Create a variable for a user
 
@@ -153,6 +174,8 @@ async def asyncio(
 
     Args:
         selected_user (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, PipelineVariable]]
@@ -162,5 +185,6 @@ async def asyncio(
         await asyncio_detailed(
             selected_user=selected_user,
             client=client,
+            fields=fields,
         )
     ).parsed
@@ -2,10 +2,11 @@ from typing import Any, Dict, Optional, Union
 
 import httpx
 
+from ...cache import parse_cached
 from ...client import Client
 from ...models.error import Error
 from ...models.pipeline_step import PipelineStep
-from ...types import Response
+from ...types import UNSET, Response, Unset
 
 
 def _get_kwargs(
@@ -15,6 +16,7 @@ def _get_kwargs(
     step_uuid: str,
     *,
     client: Client,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Dict[str, Any]:
     url = "{}/repositories/{workspace}/{repo_slug}/pipelines/{pipeline_uuid}/steps/{step_uuid}".format(
         client.base_url, workspace=workspace, repo_slug=repo_slug, pipeline_uuid=pipeline_uuid, step_uuid=step_uuid
@@ -23,33 +25,41 @@ def _get_kwargs(
     headers: Dict[str, str] = client.get_headers()
     cookies: Dict[str, Any] = client.get_cookies()
 
+    params: Dict[str, Any] = {}
+    params["fields"] = fields
+
+    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+
     return {
         "method": "get",
         "url": url,
         "headers": headers,
         "cookies": cookies,
         "timeout": client.get_timeout(),
+        "params": params,
     }
 
 
-def _parse_response(*, response: httpx.Response) -> Optional[Union[Error, PipelineStep]]:
+def _parse_response(*, client: Client, response: httpx.Response) -> Optional[Union[Error, PipelineStep]]:
     if response.status_code == 200:
-        response_200 = PipelineStep.from_dict(response.json())
+        response_200 = PipelineStep.from_dict(client.json_codec.loads(response.content))
 
         return response_200
     if response.status_code == 404:
-        response_404 = Error.from_dict(response.json())
+        response_404 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_404
     return None
 
 
-def _build_response(*, response: httpx.Response) -> Response[Union[Error, PipelineStep]]:
+def _build_response(*, client: Client, response: httpx.Response) -> Response[Union[Error, PipelineStep]]:
     return Response(
         status_code=response.status_code,
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(response=response),
+        parse=lambda: parse_cached(_parse_response, client, response),
+        lazy=client.lazy_parsing,
+        keep_content=client.keep_content,
     )
 
 
@@ -60,6 +70,7 @@ def sync_detailed(
     step_uuid: str,
     *,
     client: Client,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Error, PipelineStep]]:
     """Get a step of a pipeline
 
@@ -70,6 +81,8 @@ def sync_detailed(
         repo_slug (str):
         pipeline_uuid (str):
         step_uuid (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, PipelineStep]]
@@ -81,14 +94,14 @@ def sync_detailed(
         pipeline_uuid=pipeline_uuid,
         step_uuid=step_uuid,
         client=client,
+        fields=fields,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 def sync(
@@ -98,6 +111,7 @@ def sync(
     step_uuid: str,
     *,
     client: Client,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Error, PipelineStep]]:
     """Get a step of a pipeline
 
@@ -108,6 +122,8 @@ def sync(
         repo_slug (str):
         pipeline_uuid (str):
         step_uuid (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, PipelineStep]]
@@ -119,6 +135,7 @@ def sync(
         pipeline_uuid=pipeline_uuid,
         step_uuid=step_uuid,
         client=client,
+        fields=fields,
     ).parsed
 
 
@@ -129,6 +146,7 @@ async def asyncio_detailed(
     step_uuid: str,
     *,
     client: Client,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Error, PipelineStep]]:
     """Get a step of a pipeline
 
@@ -139,6 +157,8 @@ async def asyncio_detailed(
         repo_slug (str):
         pipeline_uuid (str):
         step_uuid (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, PipelineStep]]
@@ -150,12 +170,12 @@ async def asyncio_detailed(
         pipeline_uuid=pipeline_uuid,
         step_uuid=step_uuid,
         client=client,
+        fields=fields,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 async def asyncio(
@@ -165,6 +185,7 @@ async def asyncio(
     step_uuid: str,
     *,
     client: Client,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Error, PipelineStep]]:
     """Get a step of a pipeline
 
@@ -175,6 +196,8 @@ async def asyncio(
         repo_slug (str):
         pipeline_uuid (str):
         step_uuid (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, PipelineStep]]
@@ -187,5 +210,6 @@ async def asyncio(
             pipeline_uuid=pipeline_uuid,
             step_uuid=step_uuid,
             client=client,
+            fields=fields,
         )
     ).parsed
@@ -1,45 +1,55 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Union
 
 import httpx
 
+from ...cache import parse_cached
 from ...client import Client
 from ...models.paginated_pipeline_variables import PaginatedPipelineVariables
-from ...types import Response
+from ...types import UNSET, Response, Unset
 
 
 def _get_kwargs(
     workspace: str,
     *,
     client: Client,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Dict[str, Any]:
     url = "{}/workspaces/{workspace}/pipelines-config/variables".format(client.base_url, workspace=workspace)
 
     headers: Dict[str, str] = client.get_headers()
     cookies: Dict[str, Any] = client.get_cookies()
 
+    params: Dict[str, Any] = {}
+    params["fields"] = fields
+
+    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+
     return {
         "method": "get",
         "url": url,
         "headers": headers,
         "cookies": cookies,
         "timeout": client.get_timeout(),
+        "params": params,
     }
 
 
-def _parse_response(*, response: httpx.Response) -> Optional[PaginatedPipelineVariables]:
+def _parse_response(*, client: Client, response: httpx.Response) -> Optional[PaginatedPipelineVariables]:
     if response.status_code == 200:
-        response_200 = PaginatedPipelineVariables.from_dict(response.json())
+        response_200 = PaginatedPipelineVariables.from_dict(client.json_codec.loads(response.content))
 
         return response_200
     return None
 
 
-def _build_response(*, response: httpx.Response) -> Response[PaginatedPipelineVariables]:
+def _build_response(*, client: Client, response: httpx.Response) -> Response[PaginatedPipelineVariables]:
     return Response(
         status_code=response.status_code,
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(response=response),
+        parse=lambda: parse_cached(_parse_response, client, response),
+        lazy=client.lazy_parsing,
+        keep_content=client.keep_content,
     )
 
 
@@ -47,6 +57,7 @@ def sync_detailed(
     workspace: str,
     *,
     client: Client,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[PaginatedPipelineVariables]:
     """List variables for a workspace
 
@@ -54,6 +65,8 @@ def sync_detailed(
 
     Args:
         workspace (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[PaginatedPipelineVariables]
@@ -62,20 +75,21 @@ def sync_detailed(
     kwargs = _get_kwargs(
         workspace=workspace,
         client=client,
+        fields=fields,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 def sync(
     workspace: str,
     *,
     client: Client,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[PaginatedPipelineVariables]:
     """List variables for a workspace
 
@@ -83,6 +97,8 @@ def sync(
 
     Args:
         workspace (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[PaginatedPipelineVariables]
@@ -91,6 +107,7 @@ def sync(
     return sync_detailed(
         workspace=workspace,
         client=client,
+        fields=fields,
     ).parsed
 
 
@@ -98,6 +115,7 @@ async def asyncio_detailed(
     workspace: str,
     *,
     client: Client,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[PaginatedPipelineVariables]:
     """List variables for a workspace
 
@@ -105,6 +123,8 @@ async def asyncio_detailed(
 
     Args:
         workspace (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[PaginatedPipelineVariables]
@@ -113,18 +133,19 @@ async def asyncio_detailed(
     kwargs = _get_kwargs(
         workspace=workspace,
         client=client,
+        fields=fields,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 async def asyncio(
     workspace: str,
     *,
     client: Client,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[PaginatedPipelineVariables]:
     """List variables for a workspace
 
@@ -132,6 +153,8 @@ async def asyncio(
 
     Args:
         workspace (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[PaginatedPipelineVariables]
@@ -141,5 +164,6 @@ async def asyncio(
         await asyncio_detailed(
             workspace=workspace,
             client=client,
+            fields=fields,
         )
     ).parsed
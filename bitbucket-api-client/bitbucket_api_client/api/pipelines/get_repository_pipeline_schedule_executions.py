@@ -2,10 +2,11 @@ from typing import Any, Dict, Optional, Union
 
 import httpx
 
+from ...cache import parse_cached
 from ...client import Client
 from ...models.error import Error
 from ...models.paginated_pipeline_schedule_executions import PaginatedPipelineScheduleExecutions
-from ...types import Response
+from ...types import UNSET, Response, Unset
 
 
 def _get_kwargs(
@@ -14,6 +15,7 @@ def _get_kwargs(
     schedule_uuid: str,
     *,
     client: Client,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Dict[str, Any]:
     url = "{}/repositories/{workspace}/{repo_slug}/pipelines_config/schedules/{schedule_uuid}/executions/".format(
         client.base_url, workspace=workspace, repo_slug=repo_slug, schedule_uuid=schedule_uuid
@@ -22,33 +24,45 @@ def _get_kwargs(
     headers: Dict[str, str] = client.get_headers()
     cookies: Dict[str, Any] = client.get_cookies()
 
+    params: Dict[str, Any] = {}
+    params["fields"] = fields
+
+    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+
     return {
         "method": "get",
         "url": url,
         "headers": headers,
         "cookies": cookies,
         "timeout": client.get_timeout(),
+        "params": params,
     }
 
 
-def _parse_response(*, response: httpx.Response) -> Optional[Union[Error, PaginatedPipelineScheduleExecutions]]:
+def _parse_response(
+    *, client: Client, response: httpx.Response
+) -> Optional[Union[Error, PaginatedPipelineScheduleExecutions]]:
     if response.status_code == 200:
-        response_200 = PaginatedPipelineScheduleExecutions.from_dict(response.json())
+        response_200 = PaginatedPipelineScheduleExecutions.from_dict(client.json_codec.loads(response.content))
 
         return response_200
     if response.status_code == 404:
-        response_404 = Error.from_dict(response.json())
+        response_404 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_404
     return None
 
 
-def _build_response(*, response: httpx.Response) -> Response[Union[Error, PaginatedPipelineScheduleExecutions]]:
+def _build_response(
+    *, client: Client, response: httpx.Response
+) -> Response[Union[Error, PaginatedPipelineScheduleExecutions]]:
     return Response(
         status_code=response.status_code,
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(response=response),
+        parse=lambda: parse_cached(_parse_response, client, response),
+        lazy=client.lazy_parsing,
+        keep_content=client.keep_content,
     )
 
 
@@ -58,6 +72,7 @@ def sync_detailed(
     schedule_uuid: str,
     *,
     client: Client,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Error, PaginatedPipelineScheduleExecutions]]:
     """List executions of a schedule
 
@@ -67,6 +82,8 @@ def sync_detailed(
         workspace (str):
         repo_slug (str):
         schedule_uuid (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, PaginatedPipelineScheduleExecutions]]
@@ -77,14 +94,14 @@ def sync_detailed(
         repo_slug=repo_slug,
         schedule_uuid=schedule_uuid,
         client=client,
+        fields=fields,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 def sync(
@@ -93,6 +110,7 @@ def sync(
     schedule_uuid: str,
     *,
     client: Client,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Error, PaginatedPipelineScheduleExecutions]]:
     """List executions of a schedule
 
@@ -102,6 +120,8 @@ def sync(
         workspace (str):
         repo_slug (str):
         schedule_uuid (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, PaginatedPipelineScheduleExecutions]]
@@ -112,6 +132,7 @@ def sync(
         repo_slug=repo_slug,
         schedule_uuid=schedule_uuid,
         client=client,
+        fields=fields,
     ).parsed
 
 
@@ -121,6 +142,7 @@ async def asyncio_detailed(
     schedule_uuid: str,
     *,
     client: Client,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Error, PaginatedPipelineScheduleExecutions]]:
     """List executions of a schedule
 
@@ -130,6 +152,8 @@ async def asyncio_detailed(
         workspace (str):
         repo_slug (str):
         schedule_uuid (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, PaginatedPipelineScheduleExecutions]]
@@ -140,12 +164,12 @@ async def asyncio_detailed(
         repo_slug=repo_slug,
         schedule_uuid=schedule_uuid,
         client=client,
+        fields=fields,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 async def asyncio(
@@ -154,6 +178,7 @@ async def asyncio(
     schedule_uuid: str,
     *,
     client: Client,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Error, PaginatedPipelineScheduleExecutions]]:
     """List executions of a schedule
 
@@ -163,6 +188,8 @@ async def asyncio(
         workspace (str):
         repo_slug (str):
         schedule_uuid (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, PaginatedPipelineScheduleExecutions]]
@@ -174,5 +201,6 @@ async def asyncio(
             repo_slug=repo_slug,
             schedule_uuid=schedule_uuid,
             client=client,
+            fields=fields,
         )
     ).parsed
@@ -2,10 +2,11 @@ from typing import Any, Dict, Optional, Union
 
 import httpx
 
+from ...cache import parse_cached
 from ...client import Client
 from ...models.deployment_variable import DeploymentVariable
 from ...models.error import Error
-from ...types import Response
+from ...types import UNSET, Response, Unset
 
 
 def _get_kwargs(
@@ -16,6 +17,7 @@ def _get_kwargs(
     *,
     client: Client,
     json_body: DeploymentVariable,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Dict[str, Any]:
     url = "{}/repositories/{workspace}/{repo_slug}/deployments_config/environments/{environment_uuid}/variables/{variable_uuid}".format(
         client.base_url,
@@ -30,34 +32,44 @@ def _get_kwargs(
 
     json_json_body = json_body.to_dict()
 
+    headers["Content-Type"] = "application/json"
+
+    params: Dict[str, Any] = {}
+    params["fields"] = fields
+
+    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+
     return {
         "method": "put",
         "url": url,
         "headers": headers,
         "cookies": cookies,
         "timeout": client.get_timeout(),
-        "json": json_json_body,
+        "params": params,
+        "content": client.json_codec.dumps(json_json_body),
     }
 
 
-def _parse_response(*, response: httpx.Response) -> Optional[Union[DeploymentVariable, Error]]:
+def _parse_response(*, client: Client, response: httpx.Response) -> Optional[Union[DeploymentVariable, Error]]:
     if response.status_code == 200:
-        response_200 = DeploymentVariable.from_dict(response.json())
+        response_200 = DeploymentVariable.from_dict(client.json_codec.loads(response.content))
 
         return response_200
     if response.status_code == 404:
-        response_404 = Error.from_dict(response.json())
+        response_404 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_404
     return None
 
 
-def _build_response(*, response: httpx.Response) -> Response[Union[DeploymentVariable, Error]]:
+def _build_response(*, client: Client, response: httpx.Response) -> Response[Union[DeploymentVariable, Error]]:
     return Response(
         status_code=response.status_code,
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(response=response),
+        parse=lambda: parse_cached(_parse_response, client, response),
+        lazy=client.lazy_parsing,
+        keep_content=client.keep_content,
     )
 
 
@@ -69,6 +81,7 @@ def sync_detailed(
     *,
     client: Client,
     json_body: DeploymentVariable,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[DeploymentVariable, Error]]:
     """Update a variable for an environment
 
@@ -80,6 +93,8 @@ def sync_detailed(
         environment_uuid (str):
         variable_uuid (str):
         json_body (DeploymentVariable):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[DeploymentVariable, Error]]
@@ -92,14 +107,14 @@ def sync_detailed(
         variable_uuid=variable_uuid,
         client=client,
         json_body=json_body,
+        fields=fields,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 def sync(
@@ -110,6 +125,7 @@ def sync(
     *,
     client: Client,
     json_body: DeploymentVariable,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[DeploymentVariable, Error]]:
     """Update a variable for an environment
 
@@ -121,6 +137,8 @@ def sync(
         environment_uuid (str):
         variable_uuid (str):
         json_body (DeploymentVariable):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[DeploymentVariable, Error]]
@@ -133,6 +151,7 @@ def sync(
         variable_uuid=variable_uuid,
         client=client,
         json_body=json_body,
+        fields=fields,
     ).parsed
 
 
@@ -144,6 +163,7 @@ async def asyncio_detailed(
     *,
     client: Client,
     json_body: DeploymentVariable,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[DeploymentVariable, Error]]:
     """Update a variable for an environment
 
@@ -155,6 +175,8 @@ async def asyncio_detailed(
         environment_uuid (str):
         variable_uuid (str):
         json_body (DeploymentVariable):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[DeploymentVariable, Error]]
@@ -167,12 +189,12 @@ async def asyncio_detailed(
         variable_uuid=variable_uuid,
         client=client,
         json_body=json_body,
+        fields=fields,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 async def asyncio(
@@ -183,6 +205,7 @@ async def asyncio(
     *,
     client: Client,
     json_body: DeploymentVariable,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[DeploymentVariable, Error]]:
     """Update a variable for an environment
 
@@ -194,6 +217,8 @@ async def asyncio(
         environment_uuid (str):
         variable_uuid (str):
         json_body (DeploymentVariable):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[DeploymentVariable, Error]]
@@ -207,5 +232,6 @@ async def asyncio(
             variable_uuid=variable_uuid,
             client=client,
             json_body=json_body,
+            fields=fields,
         )
     ).parsed
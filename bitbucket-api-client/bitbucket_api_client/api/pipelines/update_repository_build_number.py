@@ -2,10 +2,11 @@ from typing import Any, Dict, Optional, Union
 
 import httpx
 
+from ...cache import parse_cached
 from ...client import Client
 from ...models.error import Error
 from ...models.pipeline_build_number import PipelineBuildNumber
-from ...types import Response
+from ...types import UNSET, Response, Unset
 
 
 def _get_kwargs(
@@ -14,6 +15,7 @@ def _get_kwargs(
     *,
     client: Client,
     json_body: PipelineBuildNumber,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Dict[str, Any]:
     url = "{}/repositories/{workspace}/{repo_slug}/pipelines_config/build_number".format(
         client.base_url, workspace=workspace, repo_slug=repo_slug
@@ -24,38 +26,48 @@ def _get_kwargs(
 
     json_json_body = json_body.to_dict()
 
+    headers["Content-Type"] = "application/json"
+
+    params: Dict[str, Any] = {}
+    params["fields"] = fields
+
+    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+
     return {
         "method": "put",
         "url": url,
         "headers": headers,
         "cookies": cookies,
         "timeout": client.get_timeout(),
-        "json": json_json_body,
+        "params": params,
+        "content": client.json_codec.dumps(json_json_body),
     }
 
 
-def _parse_response(*, response: httpx.Response) -> Optional[Union[Error, PipelineBuildNumber]]:
+def _parse_response(*, client: Client, response: httpx.Response) -> Optional[Union[Error, PipelineBuildNumber]]:
     if response.status_code == 200:
-        response_200 = PipelineBuildNumber.from_dict(response.json())
+        response_200 = PipelineBuildNumber.from_dict(client.json_codec.loads(response.content))
 
         return response_200
     if response.status_code == 400:
-        response_400 = Error.from_dict(response.json())
+        response_400 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_400
     if response.status_code == 404:
-        response_404 = Error.from_dict(response.json())
+        response_404 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_404
     return None
 
 
-def _build_response(*, response: httpx.Response) -> Response[Union[Error, PipelineBuildNumber]]:
+def _build_response(*, client: Client, response: httpx.Response) -> Response[Union[Error, PipelineBuildNumber]]:
     return Response(
         status_code=response.status_code,
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(response=response),
+        parse=lambda: parse_cached(_parse_response, client, response),
+        lazy=client.lazy_parsing,
+        keep_content=client.keep_content,
     )
 
 
@@ -65,6 +77,7 @@ def sync_detailed(
     *,
     client: Client,
     json_body: PipelineBuildNumber,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Error, PipelineBuildNumber]]:
     """Update the next build number
 
@@ -75,6 +88,8 @@ def sync_detailed(
         workspace (str):
         repo_slug (str):
         json_body (PipelineBuildNumber):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, PipelineBuildNumber]]
@@ -85,14 +100,14 @@ def sync_detailed(
         repo_slug=repo_slug,
         client=client,
         json_body=json_body,
+        fields=fields,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 def sync(
@@ -101,6 +116,7 @@ def sync(
     *,
     client: Client,
     json_body: PipelineBuildNumber,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Error, PipelineBuildNumber]]:
     """Update the next build number
 
@@ -111,6 +127,8 @@ def sync(
         workspace (str):
         repo_slug (str):
         json_body (PipelineBuildNumber):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, PipelineBuildNumber]]
@@ -121,6 +139,7 @@ def sync(
         repo_slug=repo_slug,
         client=client,
         json_body=json_body,
+        fields=fields,
     ).parsed
 
 
@@ -130,6 +149,7 @@ async def asyncio_detailed(
     *,
     client: Client,
     json_body: PipelineBuildNumber,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Error, PipelineBuildNumber]]:
     """Update the next build number
 
@@ -140,6 +160,8 @@ async def asyncio_detailed(
         workspace (str):
         repo_slug (str):
         json_body (PipelineBuildNumber):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, PipelineBuildNumber]]
@@ -150,12 +172,12 @@ async def asyncio_detailed(
         repo_slug=repo_slug,
         client=client,
         json_body=json_body,
+        fields=fields,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 async def asyncio(
@@ -164,6 +186,7 @@ async def asyncio(
     *,
     client: Client,
     json_body: PipelineBuildNumber,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Error, PipelineBuildNumber]]:
     """Update the next build number
 
@@ -174,6 +197,8 @@ async def asyncio(
         workspace (str):
         repo_slug (str):
         json_body (PipelineBuildNumber):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, PipelineBuildNumber]]
@@ -185,5 +210,6 @@ async def asyncio(
             repo_slug=repo_slug,
             client=client,
             json_body=json_body,
+            fields=fields,
         )
     ).parsed
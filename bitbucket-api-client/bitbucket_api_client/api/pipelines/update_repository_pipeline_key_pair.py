@@ -2,10 +2,11 @@ from typing import Any, Dict, Optional, Union
 
 import httpx
 
+from ...cache import parse_cached
 from ...client import Client
 from ...models.error import Error
 from ...models.pipeline_ssh_key_pair import PipelineSshKeyPair
-from ...types import Response
+from ...types import UNSET, Response, Unset
 
 
 def _get_kwargs(
@@ -14,6 +15,7 @@ def _get_kwargs(
     *,
     client: Client,
     json_body: PipelineSshKeyPair,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Dict[str, Any]:
     url = "{}/repositories/{workspace}/{repo_slug}/pipelines_config/ssh/key_pair".format(
         client.base_url, workspace=workspace, repo_slug=repo_slug
@@ -24,34 +26,44 @@ def _get_kwargs(
 
     json_json_body = json_body.to_dict()
 
+    headers["Content-Type"] = "application/json"
+
+    params: Dict[str, Any] = {}
+    params["fields"] = fields
+
+    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+
     return {
         "method": "put",
         "url": url,
         "headers": headers,
         "cookies": cookies,
         "timeout": client.get_timeout(),
-        "json": json_json_body,
+        "params": params,
+        "content": client.json_codec.dumps(json_json_body),
     }
 
 
-def _parse_response(*, response: httpx.Response) -> Optional[Union[Error, PipelineSshKeyPair]]:
+def _parse_response(*, client: Client, response: httpx.Response) -> Optional[Union[Error, PipelineSshKeyPair]]:
     if response.status_code == 200:
-        response_200 = PipelineSshKeyPair.from_dict(response.json())
+        response_200 = PipelineSshKeyPair.from_dict(client.json_codec.loads(response.content))
 
         return response_200
     if response.status_code == 404:
-        response_404 = Error.from_dict(response.json())
+        response_404 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_404
     return None
 
 
-def _build_response(*, response: httpx.Response) -> Response[Union[Error, PipelineSshKeyPair]]:
+def _build_response(*, client: Client, response: httpx.Response) -> Response[Union[Error, PipelineSshKeyPair]]:
     return Response(
         status_code=response.status_code,
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(response=response),
+        parse=lambda: parse_cached(_parse_response, client, response),
+        lazy=client.lazy_parsing,
+        keep_content=client.keep_content,
     )
 
 
@@ -61,6 +73,7 @@ def sync_detailed(
     *,
     client: Client,
     json_body: PipelineSshKeyPair,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Error, PipelineSshKeyPair]]:
     """Update SSH key pair
 
@@ -71,6 +84,8 @@ def sync_detailed(
         workspace (str):
         repo_slug (str):
         json_body (PipelineSshKeyPair):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, PipelineSshKeyPair]]
@@ -81,14 +96,14 @@ def sync_detailed(
         repo_slug=repo_slug,
         client=client,
         json_body=json_body,
+        fields=fields,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 def sync(
@@ -97,6 +112,7 @@ def sync(
     *,
     client: Client,
     json_body: PipelineSshKeyPair,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Error, PipelineSshKeyPair]]:
     """Update SSH key pair
 
@@ -107,6 +123,8 @@ def sync(
         workspace (str):
         repo_slug (str):
         json_body (PipelineSshKeyPair):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, PipelineSshKeyPair]]
@@ -117,6 +135,7 @@ def sync(
         repo_slug=repo_slug,
         client=client,
         json_body=json_body,
+        fields=fields,
     ).parsed
 
 
@@ -126,6 +145,7 @@ async def asyncio_detailed(
     *,
     client: Client,
     json_body: PipelineSshKeyPair,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Error, PipelineSshKeyPair]]:
     """Update SSH key pair
 
@@ -136,6 +156,8 @@ async def asyncio_detailed(
         workspace (str):
         repo_slug (str):
         json_body (PipelineSshKeyPair):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, PipelineSshKeyPair]]
@@ -146,12 +168,12 @@ async def asyncio_detailed(
         repo_slug=repo_slug,
         client=client,
         json_body=json_body,
+        fields=fields,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 async def asyncio(
@@ -160,6 +182,7 @@ async def asyncio(
     *,
     client: Client,
     json_body: PipelineSshKeyPair,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Error, PipelineSshKeyPair]]:
     """Update SSH key pair
 
@@ -170,6 +193,8 @@ async def asyncio(
         workspace (str):
         repo_slug (str):
         json_body (PipelineSshKeyPair):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, PipelineSshKeyPair]]
@@ -181,5 +206,6 @@ async def asyncio(
             repo_slug=repo_slug,
             client=client,
             json_body=json_body,
+            fields=fields,
         )
     ).parsed
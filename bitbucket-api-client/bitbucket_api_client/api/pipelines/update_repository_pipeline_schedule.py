@@ -2,10 +2,11 @@ from typing import Any, Dict, Optional, Union
 
 import httpx
 
+from ...cache import parse_cached
 from ...client import Client
 from ...models.error import Error
 from ...models.pipeline_schedule import PipelineSchedule
-from ...types import Response
+from ...types import UNSET, Response, Unset
 
 
 def _get_kwargs(
@@ -15,6 +16,7 @@ def _get_kwargs(
     *,
     client: Client,
     json_body: PipelineSchedule,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Dict[str, Any]:
     url = "{}/repositories/{workspace}/{repo_slug}/pipelines_config/schedules/{schedule_uuid}".format(
         client.base_url, workspace=workspace, repo_slug=repo_slug, schedule_uuid=schedule_uuid
@@ -25,34 +27,44 @@ def _get_kwargs(
 
     json_json_body = json_body.to_dict()
 
+    headers["Content-Type"] = "application/json"
+
+    params: Dict[str, Any] = {}
+    params["fields"] = fields
+
+    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+
     return {
         "method": "put",
         "url": url,
         "headers": headers,
         "cookies": cookies,
         "timeout": client.get_timeout(),
-        "json": json_json_body,
+        "params": params,
+        "content": client.json_codec.dumps(json_json_body),
     }
 
 
-def _parse_response(*, response: httpx.Response) -> Optional[Union[Error, PipelineSchedule]]:
+def _parse_response(*, client: Client, response: httpx.Response) -> Optional[Union[Error, PipelineSchedule]]:
     if response.status_code == 200:
-        response_200 = PipelineSchedule.from_dict(response.json())
+        response_200 = PipelineSchedule.from_dict(client.json_codec.loads(response.content))
 
         return response_200
     if response.status_code == 404:
-        response_404 = Error.from_dict(response.json())
+        response_404 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_404
     return None
 
 
-def _build_response(*, response: httpx.Response) -> Response[Union[Error, PipelineSchedule]]:
+def _build_response(*, client: Client, response: httpx.Response) -> Response[Union[Error, PipelineSchedule]]:
     return Response(
         status_code=response.status_code,
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(response=response),
+        parse=lambda: parse_cached(_parse_response, client, response),
+        lazy=client.lazy_parsing,
+        keep_content=client.keep_content,
     )
 
 
@@ -63,6 +75,7 @@ def sync_detailed(
     *,
     client: Client,
     json_body: PipelineSchedule,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Error, PipelineSchedule]]:
     """Update a schedule
 
@@ -73,6 +86,8 @@ def sync_detailed(
         repo_slug (str):
         schedule_uuid (str):
         json_body (PipelineSchedule):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, PipelineSchedule]]
@@ -84,14 +99,14 @@ def sync_detailed(
         schedule_uuid=schedule_uuid,
         client=client,
         json_body=json_body,
+        fields=fields,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 def sync(
@@ -101,6 +116,7 @@ def sync(
     *,
     client: Client,
     json_body: PipelineSchedule,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Error, PipelineSchedule]]:
     """Update a schedule
 
@@ -111,6 +127,8 @@ def sync(
         repo_slug (str):
         schedule_uuid (str):
         json_body (PipelineSchedule):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, PipelineSchedule]]
@@ -122,6 +140,7 @@ def sync(
         schedule_uuid=schedule_uuid,
         client=client,
         json_body=json_body,
+        fields=fields,
     ).parsed
 
 
@@ -132,6 +151,7 @@ async def asyncio_detailed(
     *,
     client: Client,
     json_body: PipelineSchedule,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Error, PipelineSchedule]]:
     """Update a schedule
 
@@ -142,6 +162,8 @@ async def asyncio_detailed(
         repo_slug (str):
         schedule_uuid (str):
         json_body (PipelineSchedule):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, PipelineSchedule]]
@@ -153,12 +175,12 @@ async def asyncio_detailed(
         schedule_uuid=schedule_uuid,
         client=client,
         json_body=json_body,
+        fields=fields,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 async def asyncio(
@@ -168,6 +190,7 @@ async def asyncio(
     *,
     client: Client,
     json_body: PipelineSchedule,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Error, PipelineSchedule]]:
     """Update a schedule
 
@@ -178,6 +201,8 @@ async def asyncio(
         repo_slug (str):
         schedule_uuid (str):
         json_body (PipelineSchedule):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, PipelineSchedule]]
@@ -190,5 +215,6 @@ async def asyncio(
             schedule_uuid=schedule_uuid,
             client=client,
             json_body=json_body,
+            fields=fields,
         )
     ).parsed
@@ -1,10 +1,11 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Union
 
 import httpx
 
+from ...cache import parse_cached
 from ...client import Client
 from ...models.application_property import ApplicationProperty
-from ...types import Response
+from ...types import UNSET, Response, Unset
 
 
 def _get_kwargs(
@@ -15,6 +16,7 @@ def _get_kwargs(
     property_name: str,
     *,
     client: Client,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Dict[str, Any]:
     url = "{}/repositories/{workspace}/{repo_slug}/commit/{commit}/properties/{app_key}/{property_name}".format(
         client.base_url,
@@ -28,29 +30,37 @@ def _get_kwargs(
     headers: Dict[str, str] = client.get_headers()
     cookies: Dict[str, Any] = client.get_cookies()
 
+    params: Dict[str, Any] = {}
+    params["fields"] = fields
+
+    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+
     return {
         "method": "get",
         "url": url,
         "headers": headers,
         "cookies": cookies,
         "timeout": client.get_timeout(),
+        "params": params,
     }
 
 
-def _parse_response(*, response: httpx.Response) -> Optional[ApplicationProperty]:
+def _parse_response(*, client: Client, response: httpx.Response) -> Optional[ApplicationProperty]:
     if response.status_code == 200:
-        response_200 = ApplicationProperty.from_dict(response.json())
+        response_200 = ApplicationProperty.from_dict(client.json_codec.loads(response.content))
 
         return response_200
     return None
 
 
-def _build_response(*, response: httpx.Response) -> Response[ApplicationProperty]:
+def _build_response(*, client: Client, response: httpx.Response) -> Response[ApplicationProperty]:
     return Response(
         status_code=response.status_code,
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(response=response),
+        parse=lambda: parse_cached(_parse_response, client, response),
+        lazy=client.lazy_parsing,
+        keep_content=client.keep_content,
     )
 
 
@@ -62,6 +72,7 @@ def sync_detailed(
     property_name: str,
     *,
     client: Client,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[ApplicationProperty]:
     """Get a commit application property
 
@@ -74,6 +85,8 @@ def sync_detailed(
         commit (str):
         app_key (str):
         property_name (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[ApplicationProperty]
@@ -86,14 +99,14 @@ def sync_detailed(
         app_key=app_key,
         property_name=property_name,
         client=client,
+        fields=fields,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 def sync(
@@ -104,6 +117,7 @@ def sync(
     property_name: str,
     *,
     client: Client,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[ApplicationProperty]:
     """Get a commit application property
 
@@ -116,6 +130,8 @@ def sync(
         commit (str):
         app_key (str):
         property_name (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[ApplicationProperty]
@@ -128,6 +144,7 @@ def sync(
         app_key=app_key,
         property_name=property_name,
         client=client,
+        fields=fields,
     ).parsed
 
 
@@ -139,6 +156,7 @@ async def asyncio_detailed(
     property_name: str,
     *,
     client: Client,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[ApplicationProperty]:
     """Get a commit application property
 
@@ -151,6 +169,8 @@ async def asyncio_detailed(
         commit (str):
         app_key (str):
         property_name (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[ApplicationProperty]
@@ -163,12 +183,12 @@ async def asyncio_detailed(
         app_key=app_key,
         property_name=property_name,
         client=client,
+        fields=fields,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 async def asyncio(
@@ -179,6 +199,7 @@ async def asyncio(
     property_name: str,
     *,
     client: Client,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[ApplicationProperty]:
     """Get a commit application property
 
@@ -191,6 +212,8 @@ async def asyncio(
         commit (str):
         app_key (str):
         property_name (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[ApplicationProperty]
@@ -204,5 +227,6 @@ async def asyncio(
             app_key=app_key,
             property_name=property_name,
             client=client,
+            fields=fields,
         )
     ).parsed
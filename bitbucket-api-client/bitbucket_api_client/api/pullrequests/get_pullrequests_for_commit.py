@@ -2,6 +2,7 @@ from typing import Any, Dict, Optional, Union
 
 import httpx
 
+from ...cache import parse_cached
 from ...client import Client
 from ...models.error import Error
 from ...types import UNSET, Response, Unset
@@ -15,6 +16,7 @@ def _get_kwargs(
     client: Client,
     page: Union[Unset, None, int] = 1,
     pagelen: Union[Unset, None, int] = 30,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Dict[str, Any]:
     url = "{}/repositories/{workspace}/{repo_slug}/commit/{commit}/pullrequests".format(
         client.base_url, workspace=workspace, repo_slug=repo_slug, commit=commit
@@ -28,6 +30,8 @@ def _get_kwargs(
 
     params["pagelen"] = pagelen
 
+    params["fields"] = fields
+
     params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
 
     return {
@@ -40,20 +44,22 @@ def _get_kwargs(
     }
 
 
-def _parse_response(*, response: httpx.Response) -> Optional[Error]:
+def _parse_response(*, client: Client, response: httpx.Response) -> Optional[Error]:
     if response.status_code == 404:
-        response_404 = Error.from_dict(response.json())
+        response_404 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_404
     return None
 
 
-def _build_response(*, response: httpx.Response) -> Response[Error]:
+def _build_response(*, client: Client, response: httpx.Response) -> Response[Error]:
     return Response(
         status_code=response.status_code,
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(response=response),
+        parse=lambda: parse_cached(_parse_response, client, response),
+        lazy=client.lazy_parsing,
+        keep_content=client.keep_content,
     )
 
 
@@ -65,6 +71,7 @@ def sync_detailed(
     client: Client,
     page: Union[Unset, None, int] = 1,
     pagelen: Union[Unset, None, int] = 30,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Error]:
     """List pull requests that contain a commit
 
@@ -78,6 +85,8 @@ def sync_detailed(
         commit (str):
         page (Union[Unset, None, int]):  Default: 1.
         pagelen (Union[Unset, None, int]):  Default: 30.
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Error]
@@ -90,14 +99,14 @@ def sync_detailed(
         client=client,
         page=page,
         pagelen=pagelen,
+        fields=fields,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 def sync(
@@ -108,6 +117,7 @@ def sync(
     client: Client,
     page: Union[Unset, None, int] = 1,
     pagelen: Union[Unset, None, int] = 30,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Error]:
     """List pull requests that contain a commit
 
@@ -121,6 +131,8 @@ def sync(
         commit (str):
         page (Union[Unset, None, int]):  Default: 1.
         pagelen (Union[Unset, None, int]):  Default: 30.
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Error]
@@ -133,6 +145,7 @@ def sync(
         client=client,
         page=page,
         pagelen=pagelen,
+        fields=fields,
     ).parsed
 
 
@@ -144,6 +157,7 @@ async def asyncio_detailed(
     client: Client,
     page: Union[Unset, None, int] = 1,
     pagelen: Union[Unset, None, int] = 30,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Error]:
     """List pull requests that contain a commit
 
@@ -157,6 +171,8 @@ async def asyncio_detailed(
         commit (str):
         page (Union[Unset, None, int]):  Default: 1.
         pagelen (Union[Unset, None, int]):  Default: 30.
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Error]
@@ -169,12 +185,12 @@ async def asyncio_detailed(
         client=client,
         page=page,
         pagelen=pagelen,
+        fields=fields,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 async def asyncio(
@@ -185,6 +201,7 @@ async def asyncio(
     client: Client,
     page: Union[Unset, None, int] = 1,
     pagelen: Union[Unset, None, int] = 30,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Error]:
     """List pull requests that contain a commit
 
@@ -198,6 +215,8 @@ async def asyncio(
         commit (str):
         page (Union[Unset, None, int]):  Default: 1.
         pagelen (Union[Unset, None, int]):  Default: 30.
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Error]
@@ -211,5 +230,6 @@ async def asyncio(
             client=client,
             page=page,
             pagelen=pagelen,
+            fields=fields,
         )
     ).parsed
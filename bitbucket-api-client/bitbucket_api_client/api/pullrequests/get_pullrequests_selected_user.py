@@ -2,6 +2,7 @@ from typing import Any, Dict, Optional, Union
 
 import httpx
 
+from ...cache import parse_cached
 from ...client import AuthenticatedClient
 from ...models.error import Error
 from ...models.get_pullrequests_selected_user_state import GetPullrequestsSelectedUserState
@@ -13,6 +14,7 @@ def _get_kwargs(
     *,
     client: AuthenticatedClient,
     state: Union[Unset, None, GetPullrequestsSelectedUserState] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Dict[str, Any]:
     url = "{}/pullrequests/{selected_user}".format(client.base_url, selected_user=selected_user)
 
@@ -26,6 +28,8 @@ def _get_kwargs(
 
     params["state"] = json_state
 
+    params["fields"] = fields
+
     params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
 
     return {
@@ -38,20 +42,22 @@ def _get_kwargs(
     }
 
 
-def _parse_response(*, response: httpx.Response) -> Optional[Error]:
+def _parse_response(*, client: AuthenticatedClient, response: httpx.Response) -> Optional[Error]:
     if response.status_code == 404:
-        response_404 = Error.from_dict(response.json())
+        response_404 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_404
     return None
 
 
-def _build_response(*, response: httpx.Response) -> Response[Error]:
+def _build_response(*, client: AuthenticatedClient, response: httpx.Response) -> Response[Error]:
     return Response(
         status_code=response.status_code,
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(response=response),
+        parse=lambda: parse_cached(_parse_response, client, response),
+        lazy=client.lazy_parsing,
+        keep_content=client.keep_content,
     )
 
 
@@ -60,6 +66,7 @@ def sync_detailed(
     *,
     client: AuthenticatedClient,
     state: Union[Unset, None, GetPullrequestsSelectedUserState] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Error]:
     """List pull requests for a user
 
@@ -76,6 +83,8 @@ def sync_detailed(
     Args:
         selected_user (str):
         state (Union[Unset, None, GetPullrequestsSelectedUserState]):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Error]
@@ -85,14 +94,14 @@ def sync_detailed(
         selected_user=selected_user,
         client=client,
         state=state,
+        fields=fields,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 def sync(
@@ -100,6 +109,7 @@ def sync(
     *,
     client: AuthenticatedClient,
     state: Union[Unset, None, GetPullrequestsSelectedUserState] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Error]:
     """List pull requests for a user
 
@@ -116,6 +126,8 @@ def sync(
     Args:
         selected_user (str):
         state (Union[Unset, None, GetPullrequestsSelectedUserState]):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Error]
@@ -125,6 +137,7 @@ def sync(
         selected_user=selected_user,
         client=client,
         state=state,
+        fields=fields,
     ).parsed
 
 
@@ -133,6 +146,7 @@ async def asyncio_detailed(
     *,
     client: AuthenticatedClient,
     state: Union[Unset, None, GetPullrequestsSelectedUserState] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Error]:
     """List pull requests for a user
 
@@ -149,6 +163,8 @@ async def asyncio_detailed(
     Args:
         selected_user (str):
         state (Union[Unset, None, GetPullrequestsSelectedUserState]):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Error]
@@ -158,12 +174,12 @@ async def asyncio_detailed(
         selected_user=selected_user,
         client=client,
         state=state,
+        fields=fields,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 async def asyncio(
@@ -171,6 +187,7 @@ async def asyncio(
     *,
     client: AuthenticatedClient,
     state: Union[Unset, None, GetPullrequestsSelectedUserState] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Error]:
     """List pull requests for a user
 
@@ -187,6 +204,8 @@ async def asyncio(
     Args:
         selected_user (str):
         state (Union[Unset, None, GetPullrequestsSelectedUserState]):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Error]
@@ -197,5 +216,6 @@ async def asyncio(
             selected_user=selected_user,
             client=client,
             state=state,
+            fields=fields,
         )
     ).parsed
@@ -2,6 +2,7 @@ from typing import Any, Dict, Optional, Union, cast
 
 import httpx
 
+from ...cache import parse_cached
 from ...client import AuthenticatedClient
 from ...models.error import Error
 from ...models.get_repositories_workspace_repo_slug_pullrequests_state import (
@@ -16,6 +17,7 @@ def _get_kwargs(
     *,
     client: AuthenticatedClient,
     state: Union[Unset, None, GetRepositoriesWorkspaceRepoSlugPullrequestsState] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Dict[str, Any]:
     url = "{}/repositories/{workspace}/{repo_slug}/pullrequests".format(
         client.base_url, workspace=workspace, repo_slug=repo_slug
@@ -31,6 +33,8 @@ def _get_kwargs(
 
     params["state"] = json_state
 
+    params["fields"] = fields
+
     params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
 
     return {
@@ -43,23 +47,25 @@ def _get_kwargs(
     }
 
 
-def _parse_response(*, response: httpx.Response) -> Optional[Union[Any, Error]]:
+def _parse_response(*, client: AuthenticatedClient, response: httpx.Response) -> Optional[Union[Any, Error]]:
     if response.status_code == 401:
         response_401 = cast(Any, None)
         return response_401
     if response.status_code == 404:
-        response_404 = Error.from_dict(response.json())
+        response_404 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_404
     return None
 
 
-def _build_response(*, response: httpx.Response) -> Response[Union[Any, Error]]:
+def _build_response(*, client: AuthenticatedClient, response: httpx.Response) -> Response[Union[Any, Error]]:
     return Response(
         status_code=response.status_code,
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(response=response),
+        parse=lambda: parse_cached(_parse_response, client, response),
+        lazy=client.lazy_parsing,
+        keep_content=client.keep_content,
     )
 
 
@@ -69,6 +75,7 @@ def sync_detailed(
     *,
     client: AuthenticatedClient,
     state: Union[Unset, None, GetRepositoriesWorkspaceRepoSlugPullrequestsState] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Any, Error]]:
     """List pull requests
 
@@ -86,6 +93,8 @@ def sync_detailed(
         workspace (str):
         repo_slug (str):
         state (Union[Unset, None, GetRepositoriesWorkspaceRepoSlugPullrequestsState]):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Any, Error]]
@@ -96,14 +105,14 @@ def sync_detailed(
         repo_slug=repo_slug,
         client=client,
         state=state,
+        fields=fields,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 def sync(
@@ -112,6 +121,7 @@ def sync(
     *,
     client: AuthenticatedClient,
     state: Union[Unset, None, GetRepositoriesWorkspaceRepoSlugPullrequestsState] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Any, Error]]:
     """List pull requests
 
@@ -129,6 +139,8 @@ def sync(
         workspace (str):
         repo_slug (str):
         state (Union[Unset, None, GetRepositoriesWorkspaceRepoSlugPullrequestsState]):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Any, Error]]
@@ -139,6 +151,7 @@ def sync(
         repo_slug=repo_slug,
         client=client,
         state=state,
+        fields=fields,
     ).parsed
 
 
@@ -148,6 +161,7 @@ async def asyncio_detailed(
     *,
     client: AuthenticatedClient,
     state: Union[Unset, None, GetRepositoriesWorkspaceRepoSlugPullrequestsState] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Any, Error]]:
     """List pull requests
 
@@ -165,6 +179,8 @@ async def asyncio_detailed(
         workspace (str):
         repo_slug (str):
         state (Union[Unset, None, GetRepositoriesWorkspaceRepoSlugPullrequestsState]):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Any, Error]]
@@ -175,12 +191,12 @@ async def asyncio_detailed(
         repo_slug=repo_slug,
         client=client,
         state=state,
+        fields=fields,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 async def asyncio(
@@ -189,6 +205,7 @@ async def asyncio(
     *,
     client: AuthenticatedClient,
     state: Union[Unset, None, GetRepositoriesWorkspaceRepoSlugPullrequestsState] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Any, Error]]:
     """List pull requests
 
@@ -206,6 +223,8 @@ async def asyncio(
         workspace (str):
         repo_slug (str):
         state (Union[Unset, None, GetRepositoriesWorkspaceRepoSlugPullrequestsState]):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Any, Error]]
@@ -217,5 +236,6 @@ async def asyncio(
             repo_slug=repo_slug,
             client=client,
             state=state,
+            fields=fields,
         )
     ).parsed
@@ -2,6 +2,7 @@ from typing import Any, Dict, Optional, Union, cast
 
 import httpx
 
+from ...cache import parse_cached
 from ...client import AuthenticatedClient
 from ...models.error import Error
 from ...models.pull_request_merge_parameters import PullRequestMergeParameters
@@ -16,6 +17,7 @@ def _get_kwargs(
     client: AuthenticatedClient,
     json_body: PullRequestMergeParameters,
     async_: Union[Unset, None, bool] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Dict[str, Any]:
     url = "{}/repositories/{workspace}/{repo_slug}/pullrequests/{pull_request_id}/merge".format(
         client.base_url, workspace=workspace, repo_slug=repo_slug, pull_request_id=pull_request_id
@@ -24,9 +26,13 @@ def _get_kwargs(
     headers: Dict[str, str] = client.get_headers()
     cookies: Dict[str, Any] = client.get_cookies()
 
+    headers["Content-Type"] = "application/json"
+
     params: Dict[str, Any] = {}
     params["async"] = async_
 
+    params["fields"] = fields
+
     params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
 
     json_json_body = json_body.to_dict()
@@ -37,28 +43,30 @@ def _get_kwargs(
         "headers": headers,
         "cookies": cookies,
         "timeout": client.get_timeout(),
-        "json": json_json_body,
+        "content": client.json_codec.dumps(json_json_body),
         "params": params,
     }
 
 
-def _parse_response(*, response: httpx.Response) -> Optional[Union[Any, Error]]:
+def _parse_response(*, client: AuthenticatedClient, response: httpx.Response) -> Optional[Union[Any, Error]]:
     if response.status_code == 202:
         response_202 = cast(Any, None)
         return response_202
     if response.status_code == 555:
-        response_555 = Error.from_dict(response.json())
+        response_555 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_555
     return None
 
 
-def _build_response(*, response: httpx.Response) -> Response[Union[Any, Error]]:
+def _build_response(*, client: AuthenticatedClient, response: httpx.Response) -> Response[Union[Any, Error]]:
     return Response(
         status_code=response.status_code,
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(response=response),
+        parse=lambda: parse_cached(_parse_response, client, response),
+        lazy=client.lazy_parsing,
+        keep_content=client.keep_content,
     )
 
 
@@ -70,6 +78,7 @@ def sync_detailed(
     client: AuthenticatedClient,
     json_body: PullRequestMergeParameters,
     async_: Union[Unset, None, bool] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Any, Error]]:
     """Merge a pull request
 
@@ -81,6 +90,8 @@ def sync_detailed(
         pull_request_id (int):
         async_ (Union[Unset, None, bool]):
         json_body (PullRequestMergeParameters): The metadata that describes a pull request merge.
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Any, Error]]
@@ -93,14 +104,14 @@ def sync_detailed(
         client=client,
         json_body=json_body,
         async_=async_,
+        fields=fields,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 def sync(
@@ -111,6 +122,7 @@ def sync(
     client: AuthenticatedClient,
     json_body: PullRequestMergeParameters,
     async_: Union[Unset, None, bool] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Any, Error]]:
     """Merge a pull request
 
@@ -122,6 +134,8 @@ def sync(
         pull_request_id (int):
         async_ (Union[Unset, None, bool]):
         json_body (PullRequestMergeParameters): The metadata that describes a pull request merge.
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Any, Error]]
@@ -134,6 +148,7 @@ def sync(
         client=client,
         json_body=json_body,
         async_=async_,
+        fields=fields,
     ).parsed
 
 
@@ -145,6 +160,7 @@ async def asyncio_detailed(
     client: AuthenticatedClient,
     json_body: PullRequestMergeParameters,
     async_: Union[Unset, None, bool] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Any, Error]]:
     """Merge a pull request
 
@@ -156,6 +172,8 @@ async def asyncio_detailed(
         pull_request_id (int):
         async_ (Union[Unset, None, bool]):
         json_body (PullRequestMergeParameters): The metadata that describes a pull request merge.
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Any, Error]]
@@ -168,12 +186,12 @@ async def asyncio_detailed(
         client=client,
         json_body=json_body,
         async_=async_,
+        fields=fields,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 async def asyncio(
@@ -184,6 +202,7 @@ async def asyncio(
     client: AuthenticatedClient,
     json_body: PullRequestMergeParameters,
     async_: Union[Unset, None, bool] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Any, Error]]:
     """Merge a pull request
 
@@ -195,6 +214,8 @@ async def asyncio(
         pull_request_id (int):
         async_ (Union[Unset, None, bool]):
         json_body (PullRequestMergeParameters): The metadata that describes a pull request merge.
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Any, Error]]
@@ -208,5 +229,6 @@ async def asyncio(
             client=client,
             json_body=json_body,
             async_=async_,
+            fields=fields,
         )
     ).parsed
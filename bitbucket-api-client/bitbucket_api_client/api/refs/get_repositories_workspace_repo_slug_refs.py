@@ -2,6 +2,7 @@ from typing import Any, Dict, Optional, Union
 
 import httpx
 
+from ...cache import parse_cached
 from ...client import AuthenticatedClient
 from ...models.error import Error
 from ...types import UNSET, Response, Unset
@@ -14,6 +15,7 @@ def _get_kwargs(
     client: AuthenticatedClient,
     q: Union[Unset, None, str] = UNSET,
     sort: Union[Unset, None, str] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Dict[str, Any]:
     url = "{}/repositories/{workspace}/{repo_slug}/refs".format(
         client.base_url, workspace=workspace, repo_slug=repo_slug
@@ -27,6 +29,8 @@ def _get_kwargs(
 
     params["sort"] = sort
 
+    params["fields"] = fields
+
     params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
 
     return {
@@ -39,24 +43,26 @@ def _get_kwargs(
     }
 
 
-def _parse_response(*, response: httpx.Response) -> Optional[Error]:
+def _parse_response(*, client: AuthenticatedClient, response: httpx.Response) -> Optional[Error]:
     if response.status_code == 403:
-        response_403 = Error.from_dict(response.json())
+        response_403 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_403
     if response.status_code == 404:
-        response_404 = Error.from_dict(response.json())
+        response_404 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_404
     return None
 
 
-def _build_response(*, response: httpx.Response) -> Response[Error]:
+def _build_response(*, client: AuthenticatedClient, response: httpx.Response) -> Response[Error]:
     return Response(
         status_code=response.status_code,
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(response=response),
+        parse=lambda: parse_cached(_parse_response, client, response),
+        lazy=client.lazy_parsing,
+        keep_content=client.keep_content,
     )
 
 
@@ -67,6 +73,7 @@ def sync_detailed(
     client: AuthenticatedClient,
     q: Union[Unset, None, str] = UNSET,
     sort: Union[Unset, None, str] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Error]:
     """List branches and tags
 
@@ -92,6 +99,8 @@ def sync_detailed(
         repo_slug (str):
         q (Union[Unset, None, str]):
         sort (Union[Unset, None, str]):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Error]
@@ -103,14 +112,14 @@ def sync_detailed(
         client=client,
         q=q,
         sort=sort,
+        fields=fields,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 def sync(
@@ -120,6 +129,7 @@ def sync(
     client: AuthenticatedClient,
     q: Union[Unset, None, str] = UNSET,
     sort: Union[Unset, None, str] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Error]:
     """List branches and tags
 
@@ -145,6 +155,8 @@ def sync(
         repo_slug (str):
         q (Union[Unset, None, str]):
         sort (Union[Unset, None, str]):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Error]
@@ -156,6 +168,7 @@ def sync(
         client=client,
         q=q,
         sort=sort,
+        fields=fields,
     ).parsed
 
 
@@ -166,6 +179,7 @@ async def asyncio_detailed(
     client: AuthenticatedClient,
     q: Union[Unset, None, str] = UNSET,
     sort: Union[Unset, None, str] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Error]:
     """List branches and tags
 
@@ -191,6 +205,8 @@ async def asyncio_detailed(
         repo_slug (str):
         q (Union[Unset, None, str]):
         sort (Union[Unset, None, str]):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Error]
@@ -202,12 +218,12 @@ async def asyncio_detailed(
         client=client,
         q=q,
         sort=sort,
+        fields=fields,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 async def asyncio(
@@ -217,6 +233,7 @@ async def asyncio(
     client: AuthenticatedClient,
     q: Union[Unset, None, str] = UNSET,
     sort: Union[Unset, None, str] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Error]:
     """List branches and tags
 
@@ -242,6 +259,8 @@ async def asyncio(
         repo_slug (str):
         q (Union[Unset, None, str]):
         sort (Union[Unset, None, str]):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Error]
@@ -254,5 +273,6 @@ async def asyncio(
             client=client,
             q=q,
             sort=sort,
+            fields=fields,
         )
     ).parsed
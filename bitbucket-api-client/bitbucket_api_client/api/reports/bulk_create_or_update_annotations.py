@@ -1,10 +1,11 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 import httpx
 
+from ...cache import parse_cached
 from ...client import Client
 from ...models.report_annotation import ReportAnnotation
-from ...types import Response
+from ...types import UNSET, Response, Unset
 
 
 def _get_kwargs(
@@ -15,6 +16,7 @@ def _get_kwargs(
     *,
     client: Client,
     json_body: List[ReportAnnotation],
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Dict[str, Any]:
     url = "{}/repositories/{workspace}/{repo_slug}/commit/{commit}/reports/{reportId}/annotations".format(
         client.base_url, workspace=workspace, repo_slug=repo_slug, commit=commit, reportId=report_id
@@ -29,20 +31,28 @@ def _get_kwargs(
 
         json_json_body.append(json_body_item)
 
+    headers["Content-Type"] = "application/json"
+
+    params: Dict[str, Any] = {}
+    params["fields"] = fields
+
+    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+
     return {
         "method": "post",
         "url": url,
         "headers": headers,
         "cookies": cookies,
         "timeout": client.get_timeout(),
-        "json": json_json_body,
+        "params": params,
+        "content": client.json_codec.dumps(json_json_body),
     }
 
 
-def _parse_response(*, response: httpx.Response) -> Optional[List[ReportAnnotation]]:
+def _parse_response(*, client: Client, response: httpx.Response) -> Optional[List[ReportAnnotation]]:
     if response.status_code == 200:
         response_200 = []
-        _response_200 = response.json()
+        _response_200 = client.json_codec.loads(response.content)
         for response_200_item_data in _response_200:
             response_200_item = ReportAnnotation.from_dict(response_200_item_data)
 
@@ -52,12 +62,14 @@ def _parse_response(*, response: httpx.Response) -> Optional[List[ReportAnnotati
     return None
 
 
-def _build_response(*, response: httpx.Response) -> Response[List[ReportAnnotation]]:
+def _build_response(*, client: Client, response: httpx.Response) -> Response[List[ReportAnnotation]]:
     return Response(
         status_code=response.status_code,
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(response=response),
+        parse=lambda: parse_cached(_parse_response, client, response),
+        lazy=client.lazy_parsing,
+        keep_content=client.keep_content,
     )
 
 
@@ -69,6 +81,7 @@ def sync_detailed(
     *,
     client: Client,
     json_body: List[ReportAnnotation],
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[List[ReportAnnotation]]:
     """Bulk create or update annotations
 
@@ -127,6 +140,8 @@ def sync_detailed(
         commit (str):
         report_id (str):
         json_body (List[ReportAnnotation]):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[List[ReportAnnotation]]
@@ -139,14 +154,14 @@ def sync_detailed(
         report_id=report_id,
         client=client,
         json_body=json_body,
+        fields=fields,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 def sync(
@@ -157,6 +172,7 @@ def sync(
     *,
     client: Client,
     json_body: List[ReportAnnotation],
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[List[ReportAnnotation]]:
     """Bulk create or update annotations
 
@@ -215,6 +231,8 @@ def sync(
         commit (str):
         report_id (str):
         json_body (List[ReportAnnotation]):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[List[ReportAnnotation]]
@@ -227,6 +245,7 @@ def sync(
         report_id=report_id,
         client=client,
         json_body=json_body,
+        fields=fields,
     ).parsed
 
 
@@ -238,6 +257,7 @@ async def asyncio_detailed(
     *,
     client: Client,
     json_body: List[ReportAnnotation],
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[List[ReportAnnotation]]:
     """Bulk create or update annotations
 
@@ -296,6 +316,8 @@ async def asyncio_detailed(
         commit (str):
         report_id (str):
         json_body (List[ReportAnnotation]):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[List[ReportAnnotation]]
@@ -308,12 +330,12 @@ async def asyncio_detailed(
         report_id=report_id,
         client=client,
         json_body=json_body,
+        fields=fields,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 async def asyncio(
@@ -324,6 +346,7 @@ async def asyncio(
     *,
     client: Client,
     json_body: List[ReportAnnotation],
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[List[ReportAnnotation]]:
     """Bulk create or update annotations
 
@@ -382,6 +405,8 @@ async def asyncio(
         commit (str):
         report_id (str):
         json_body (List[ReportAnnotation]):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[List[ReportAnnotation]]
@@ -395,5 +420,6 @@ async def asyncio(
             report_id=report_id,
             client=client,
             json_body=json_body,
+            fields=fields,
         )
     ).parsed
@@ -2,10 +2,11 @@ from typing import Any, Dict, Optional, Union
 
 import httpx
 
+from ...cache import parse_cached
 from ...client import Client
 from ...models.error import Error
 from ...models.report_annotation import ReportAnnotation
-from ...types import Response
+from ...types import UNSET, Response, Unset
 
 
 def _get_kwargs(
@@ -17,6 +18,7 @@ def _get_kwargs(
     *,
     client: Client,
     json_body: ReportAnnotation,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Dict[str, Any]:
     url = (
         "{}/repositories/{workspace}/{repo_slug}/commit/{commit}/reports/{reportId}/annotations/{annotationId}".format(
@@ -34,34 +36,44 @@ def _get_kwargs(
 
     json_json_body = json_body.to_dict()
 
+    headers["Content-Type"] = "application/json"
+
+    params: Dict[str, Any] = {}
+    params["fields"] = fields
+
+    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+
     return {
         "method": "put",
         "url": url,
         "headers": headers,
         "cookies": cookies,
         "timeout": client.get_timeout(),
-        "json": json_json_body,
+        "params": params,
+        "content": client.json_codec.dumps(json_json_body),
     }
 
 
-def _parse_response(*, response: httpx.Response) -> Optional[Union[Error, ReportAnnotation]]:
+def _parse_response(*, client: Client, response: httpx.Response) -> Optional[Union[Error, ReportAnnotation]]:
     if response.status_code == 200:
-        response_200 = ReportAnnotation.from_dict(response.json())
+        response_200 = ReportAnnotation.from_dict(client.json_codec.loads(response.content))
 
         return response_200
     if response.status_code == 400:
-        response_400 = Error.from_dict(response.json())
+        response_400 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_400
     return None
 
 
-def _build_response(*, response: httpx.Response) -> Response[Union[Error, ReportAnnotation]]:
+def _build_response(*, client: Client, response: httpx.Response) -> Response[Union[Error, ReportAnnotation]]:
     return Response(
         status_code=response.status_code,
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(response=response),
+        parse=lambda: parse_cached(_parse_response, client, response),
+        lazy=client.lazy_parsing,
+        keep_content=client.keep_content,
     )
 
 
@@ -74,6 +86,7 @@ def sync_detailed(
     *,
     client: Client,
     json_body: ReportAnnotation,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Error, ReportAnnotation]]:
     """Create or update an annotation
 
@@ -119,6 +132,8 @@ def sync_detailed(
         report_id (str):
         annotation_id (str):
         json_body (ReportAnnotation):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, ReportAnnotation]]
@@ -132,14 +147,14 @@ def sync_detailed(
         annotation_id=annotation_id,
         client=client,
         json_body=json_body,
+        fields=fields,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 def sync(
@@ -151,6 +166,7 @@ def sync(
     *,
     client: Client,
     json_body: ReportAnnotation,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Error, ReportAnnotation]]:
     """Create or update an annotation
 
@@ -196,6 +212,8 @@ def sync(
         report_id (str):
         annotation_id (str):
         json_body (ReportAnnotation):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, ReportAnnotation]]
@@ -209,6 +227,7 @@ def sync(
         annotation_id=annotation_id,
         client=client,
         json_body=json_body,
+        fields=fields,
     ).parsed
 
 
@@ -221,6 +240,7 @@ async def asyncio_detailed(
     *,
     client: Client,
     json_body: ReportAnnotation,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Error, ReportAnnotation]]:
     """Create or update an annotation
 
@@ -266,6 +286,8 @@ async def asyncio_detailed(
         report_id (str):
         annotation_id (str):
         json_body (ReportAnnotation):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, ReportAnnotation]]
@@ -279,12 +301,12 @@ async def asyncio_detailed(
         annotation_id=annotation_id,
         client=client,
         json_body=json_body,
+        fields=fields,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 async def asyncio(
@@ -296,6 +318,7 @@ async def asyncio(
     *,
     client: Client,
     json_body: ReportAnnotation,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Error, ReportAnnotation]]:
     """Create or update an annotation
 
@@ -341,6 +364,8 @@ async def asyncio(
         report_id (str):
         annotation_id (str):
         json_body (ReportAnnotation):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, ReportAnnotation]]
@@ -355,5 +380,6 @@ async def asyncio(
             annotation_id=annotation_id,
             client=client,
             json_body=json_body,
+            fields=fields,
         )
     ).parsed
@@ -2,10 +2,11 @@ from typing import Any, Dict, Optional, Union
 
 import httpx
 
+from ...cache import parse_cached
 from ...client import Client
 from ...models.error import Error
 from ...models.report import Report
-from ...types import Response
+from ...types import UNSET, Response, Unset
 
 
 def _get_kwargs(
@@ -16,6 +17,7 @@ def _get_kwargs(
     *,
     client: Client,
     json_body: Report,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Dict[str, Any]:
     url = "{}/repositories/{workspace}/{repo_slug}/commit/{commit}/reports/{reportId}".format(
         client.base_url, workspace=workspace, repo_slug=repo_slug, commit=commit, reportId=report_id
@@ -26,34 +28,44 @@ def _get_kwargs(
 
     json_json_body = json_body.to_dict()
 
+    headers["Content-Type"] = "application/json"
+
+    params: Dict[str, Any] = {}
+    params["fields"] = fields
+
+    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+
     return {
         "method": "put",
         "url": url,
         "headers": headers,
         "cookies": cookies,
         "timeout": client.get_timeout(),
-        "json": json_json_body,
+        "params": params,
+        "content": client.json_codec.dumps(json_json_body),
     }
 
 
-def _parse_response(*, response: httpx.Response) -> Optional[Union[Error, Report]]:
+def _parse_response(*, client: Client, response: httpx.Response) -> Optional[Union[Error, Report]]:
     if response.status_code == 200:
-        response_200 = Report.from_dict(response.json())
+        response_200 = Report.from_dict(client.json_codec.loads(response.content))
 
         return response_200
     if response.status_code == 400:
-        response_400 = Error.from_dict(response.json())
+        response_400 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_400
     return None
 
 
-def _build_response(*, response: httpx.Response) -> Response[Union[Error, Report]]:
+def _build_response(*, client: Client, response: httpx.Response) -> Response[Union[Error, Report]]:
     return Response(
         status_code=response.status_code,
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(response=response),
+        parse=lambda: parse_cached(_parse_response, client, response),
+        lazy=client.lazy_parsing,
+        keep_content=client.keep_content,
     )
 
 
@@ -65,6 +77,7 @@ def sync_detailed(
     *,
     client: Client,
     json_body: Report,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Error, Report]]:
     """Create or update a report
 
@@ -134,6 +147,8 @@ def sync_detailed(
         commit (str):
         report_id (str):
         json_body (Report):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, Report]]
@@ -146,14 +161,14 @@ def sync_detailed(
         report_id=report_id,
         client=client,
         json_body=json_body,
+        fields=fields,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 def sync(
@@ -164,6 +179,7 @@ def sync(
     *,
     client: Client,
     json_body: Report,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Error, Report]]:
     """Create or update a report
 
@@ -233,6 +249,8 @@ def sync(
         commit (str):
         report_id (str):
         json_body (Report):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, Report]]
@@ -245,6 +263,7 @@ def sync(
         report_id=report_id,
         client=client,
         json_body=json_body,
+        fields=fields,
     ).parsed
 
 
@@ -256,6 +275,7 @@ async def asyncio_detailed(
     *,
     client: Client,
     json_body: Report,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Error, Report]]:
     """Create or update a report
 
@@ -325,6 +345,8 @@ async def asyncio_detailed(
         commit (str):
         report_id (str):
         json_body (Report):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, Report]]
@@ -337,12 +359,12 @@ async def asyncio_detailed(
         report_id=report_id,
         client=client,
         json_body=json_body,
+        fields=fields,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 async def asyncio(
@@ -353,6 +375,7 @@ async def asyncio(
     *,
     client: Client,
     json_body: Report,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Error, Report]]:
     """Create or update a report
 
@@ -422,6 +445,8 @@ async def asyncio(
         commit (str):
         report_id (str):
         json_body (Report):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, Report]]
@@ -435,5 +460,6 @@ async def asyncio(
             report_id=report_id,
             client=client,
             json_body=json_body,
+            fields=fields,
         )
     ).parsed
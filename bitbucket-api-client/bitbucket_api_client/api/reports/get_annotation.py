@@ -2,10 +2,11 @@ from typing import Any, Dict, Optional, Union
 
 import httpx
 
+from ...cache import parse_cached
 from ...client import Client
 from ...models.error import Error
 from ...models.report_annotation import ReportAnnotation
-from ...types import Response
+from ...types import UNSET, Response, Unset
 
 
 def _get_kwargs(
@@ -16,6 +17,7 @@ def _get_kwargs(
     annotation_id: str,
     *,
     client: Client,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Dict[str, Any]:
     url = (
         "{}/repositories/{workspace}/{repo_slug}/commit/{commit}/reports/{reportId}/annotations/{annotationId}".format(
@@ -31,33 +33,41 @@ def _get_kwargs(
     headers: Dict[str, str] = client.get_headers()
     cookies: Dict[str, Any] = client.get_cookies()
 
+    params: Dict[str, Any] = {}
+    params["fields"] = fields
+
+    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+
     return {
         "method": "get",
         "url": url,
         "headers": headers,
         "cookies": cookies,
         "timeout": client.get_timeout(),
+        "params": params,
     }
 
 
-def _parse_response(*, response: httpx.Response) -> Optional[Union[Error, ReportAnnotation]]:
+def _parse_response(*, client: Client, response: httpx.Response) -> Optional[Union[Error, ReportAnnotation]]:
     if response.status_code == 200:
-        response_200 = ReportAnnotation.from_dict(response.json())
+        response_200 = ReportAnnotation.from_dict(client.json_codec.loads(response.content))
 
         return response_200
     if response.status_code == 404:
-        response_404 = Error.from_dict(response.json())
+        response_404 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_404
     return None
 
 
-def _build_response(*, response: httpx.Response) -> Response[Union[Error, ReportAnnotation]]:
+def _build_response(*, client: Client, response: httpx.Response) -> Response[Union[Error, ReportAnnotation]]:
     return Response(
         status_code=response.status_code,
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(response=response),
+        parse=lambda: parse_cached(_parse_response, client, response),
+        lazy=client.lazy_parsing,
+        keep_content=client.keep_content,
     )
 
 
@@ -69,6 +79,7 @@ def sync_detailed(
     annotation_id: str,
     *,
     client: Client,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Error, ReportAnnotation]]:
     """Get an annotation
 
@@ -80,6 +91,8 @@ def sync_detailed(
         commit (str):
         report_id (str):
         annotation_id (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, ReportAnnotation]]
@@ -92,14 +105,14 @@ def sync_detailed(
         report_id=report_id,
         annotation_id=annotation_id,
         client=client,
+        fields=fields,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 def sync(
@@ -110,6 +123,7 @@ def sync(
     annotation_id: str,
     *,
     client: Client,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Error, ReportAnnotation]]:
     """Get an annotation
 
@@ -121,6 +135,8 @@ def sync(
         commit (str):
         report_id (str):
         annotation_id (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, ReportAnnotation]]
@@ -133,6 +149,7 @@ def sync(
         report_id=report_id,
         annotation_id=annotation_id,
         client=client,
+        fields=fields,
     ).parsed
 
 
@@ -144,6 +161,7 @@ async def asyncio_detailed(
     annotation_id: str,
     *,
     client: Client,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Error, ReportAnnotation]]:
     """Get an annotation
 
@@ -155,6 +173,8 @@ async def asyncio_detailed(
         commit (str):
         report_id (str):
         annotation_id (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, ReportAnnotation]]
@@ -167,12 +187,12 @@ async def asyncio_detailed(
         report_id=report_id,
         annotation_id=annotation_id,
         client=client,
+        fields=fields,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 async def asyncio(
@@ -183,6 +203,7 @@ async def asyncio(
     annotation_id: str,
     *,
     client: Client,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Error, ReportAnnotation]]:
     """Get an annotation
 
@@ -194,6 +215,8 @@ async def asyncio(
         commit (str):
         report_id (str):
         annotation_id (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, ReportAnnotation]]
@@ -207,5 +230,6 @@ async def asyncio(
             report_id=report_id,
             annotation_id=annotation_id,
             client=client,
+            fields=fields,
         )
     ).parsed
@@ -1,10 +1,11 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Union
 
 import httpx
 
+from ...cache import parse_cached
 from ...client import Client
 from ...models.paginated_annotations import PaginatedAnnotations
-from ...types import Response
+from ...types import UNSET, Response, Unset
 
 
 def _get_kwargs(
@@ -14,6 +15,7 @@ def _get_kwargs(
     report_id: str,
     *,
     client: Client,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Dict[str, Any]:
     url = "{}/repositories/{workspace}/{repo_slug}/commit/{commit}/reports/{reportId}/annotations".format(
         client.base_url, workspace=workspace, repo_slug=repo_slug, commit=commit, reportId=report_id
@@ -22,29 +24,37 @@ def _get_kwargs(
     headers: Dict[str, str] = client.get_headers()
     cookies: Dict[str, Any] = client.get_cookies()
 
+    params: Dict[str, Any] = {}
+    params["fields"] = fields
+
+    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+
     return {
         "method": "get",
         "url": url,
         "headers": headers,
         "cookies": cookies,
         "timeout": client.get_timeout(),
+        "params": params,
     }
 
 
-def _parse_response(*, response: httpx.Response) -> Optional[PaginatedAnnotations]:
+def _parse_response(*, client: Client, response: httpx.Response) -> Optional[PaginatedAnnotations]:
     if response.status_code == 200:
-        response_200 = PaginatedAnnotations.from_dict(response.json())
+        response_200 = PaginatedAnnotations.from_dict(client.json_codec.loads(response.content))
 
         return response_200
     return None
 
 
-def _build_response(*, response: httpx.Response) -> Response[PaginatedAnnotations]:
+def _build_response(*, client: Client, response: httpx.Response) -> Response[PaginatedAnnotations]:
     return Response(
         status_code=response.status_code,
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(response=response),
+        parse=lambda: parse_cached(_parse_response, client, response),
+        lazy=client.lazy_parsing,
+        keep_content=client.keep_content,
     )
 
 
@@ -55,6 +65,7 @@ def sync_detailed(
     report_id: str,
     *,
     client: Client,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[PaginatedAnnotations]:
     """List annotations
 
@@ -65,6 +76,8 @@ def sync_detailed(
         repo_slug (str):
         commit (str):
         report_id (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[PaginatedAnnotations]
@@ -76,14 +89,14 @@ def sync_detailed(
         commit=commit,
         report_id=report_id,
         client=client,
+        fields=fields,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 def sync(
@@ -93,6 +106,7 @@ def sync(
     report_id: str,
     *,
     client: Client,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[PaginatedAnnotations]:
     """List annotations
 
@@ -103,6 +117,8 @@ def sync(
         repo_slug (str):
         commit (str):
         report_id (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[PaginatedAnnotations]
@@ -114,6 +130,7 @@ def sync(
         commit=commit,
         report_id=report_id,
         client=client,
+        fields=fields,
     ).parsed
 
 
@@ -124,6 +141,7 @@ async def asyncio_detailed(
     report_id: str,
     *,
     client: Client,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[PaginatedAnnotations]:
     """List annotations
 
@@ -134,6 +152,8 @@ async def asyncio_detailed(
         repo_slug (str):
         commit (str):
         report_id (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[PaginatedAnnotations]
@@ -145,12 +165,12 @@ async def asyncio_detailed(
         commit=commit,
         report_id=report_id,
         client=client,
+        fields=fields,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 async def asyncio(
@@ -160,6 +180,7 @@ async def asyncio(
     report_id: str,
     *,
     client: Client,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[PaginatedAnnotations]:
     """List annotations
 
@@ -170,6 +191,8 @@ async def asyncio(
         repo_slug (str):
         commit (str):
         report_id (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[PaginatedAnnotations]
@@ -182,5 +205,6 @@ async def asyncio(
             commit=commit,
             report_id=report_id,
             client=client,
+            fields=fields,
         )
     ).parsed
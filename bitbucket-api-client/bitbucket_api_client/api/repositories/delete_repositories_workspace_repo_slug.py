@@ -2,6 +2,7 @@ from typing import Any, Dict, Optional, Union, cast
 
 import httpx
 
+from ...cache import parse_cached
 from ...client import AuthenticatedClient
 from ...models.error import Error
 from ...types import UNSET, Response, Unset
@@ -13,6 +14,7 @@ def _get_kwargs(
     *,
     client: AuthenticatedClient,
     redirect_to: Union[Unset, None, str] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Dict[str, Any]:
     url = "{}/repositories/{workspace}/{repo_slug}".format(client.base_url, workspace=workspace, repo_slug=repo_slug)
 
@@ -22,6 +24,8 @@ def _get_kwargs(
     params: Dict[str, Any] = {}
     params["redirect_to"] = redirect_to
 
+    params["fields"] = fields
+
     params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
 
     return {
@@ -34,27 +38,29 @@ def _get_kwargs(
     }
 
 
-def _parse_response(*, response: httpx.Response) -> Optional[Union[Any, Error]]:
+def _parse_response(*, client: AuthenticatedClient, response: httpx.Response) -> Optional[Union[Any, Error]]:
     if response.status_code == 204:
         response_204 = cast(Any, None)
         return response_204
     if response.status_code == 403:
-        response_403 = Error.from_dict(response.json())
+        response_403 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_403
     if response.status_code == 404:
-        response_404 = Error.from_dict(response.json())
+        response_404 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_404
     return None
 
 
-def _build_response(*, response: httpx.Response) -> Response[Union[Any, Error]]:
+def _build_response(*, client: AuthenticatedClient, response: httpx.Response) -> Response[Union[Any, Error]]:
     return Response(
         status_code=response.status_code,
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(response=response),
+        parse=lambda: parse_cached(_parse_response, client, response),
+        lazy=client.lazy_parsing,
+        keep_content=client.keep_content,
     )
 
 
@@ -64,6 +70,7 @@ def sync_detailed(
     *,
     client: AuthenticatedClient,
     redirect_to: Union[Unset, None, str] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Any, Error]]:
     """Delete a repository
 
@@ -75,6 +82,8 @@ def sync_detailed(
         workspace (str):
         repo_slug (str):
         redirect_to (Union[Unset, None, str]):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Any, Error]]
@@ -85,14 +94,14 @@ def sync_detailed(
         repo_slug=repo_slug,
         client=client,
         redirect_to=redirect_to,
+        fields=fields,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 def sync(
@@ -101,6 +110,7 @@ def sync(
     *,
     client: AuthenticatedClient,
     redirect_to: Union[Unset, None, str] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Any, Error]]:
     """Delete a repository
 
@@ -112,6 +122,8 @@ def sync(
         workspace (str):
         repo_slug (str):
         redirect_to (Union[Unset, None, str]):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Any, Error]]
@@ -122,6 +134,7 @@ def sync(
         repo_slug=repo_slug,
         client=client,
         redirect_to=redirect_to,
+        fields=fields,
     ).parsed
 
 
@@ -131,6 +144,7 @@ async def asyncio_detailed(
     *,
     client: AuthenticatedClient,
     redirect_to: Union[Unset, None, str] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Any, Error]]:
     """Delete a repository
 
@@ -142,6 +156,8 @@ async def asyncio_detailed(
         workspace (str):
         repo_slug (str):
         redirect_to (Union[Unset, None, str]):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Any, Error]]
@@ -152,12 +168,12 @@ async def asyncio_detailed(
         repo_slug=repo_slug,
         client=client,
         redirect_to=redirect_to,
+        fields=fields,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 async def asyncio(
@@ -166,6 +182,7 @@ async def asyncio(
     *,
     client: AuthenticatedClient,
     redirect_to: Union[Unset, None, str] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Any, Error]]:
     """Delete a repository
 
@@ -177,6 +194,8 @@ async def asyncio(
         workspace (str):
         repo_slug (str):
         redirect_to (Union[Unset, None, str]):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Any, Error]]
@@ -188,5 +207,6 @@ async def asyncio(
             repo_slug=repo_slug,
             client=client,
             redirect_to=redirect_to,
+            fields=fields,
         )
     ).parsed
@@ -2,6 +2,7 @@ from typing import Any, Dict, Optional, Union
 
 import httpx
 
+from ...cache import parse_cached
 from ...client import AuthenticatedClient
 from ...models.error import Error
 from ...models.get_repositories_workspace_role import GetRepositoriesWorkspaceRole
@@ -15,6 +16,7 @@ def _get_kwargs(
     role: Union[Unset, None, GetRepositoriesWorkspaceRole] = UNSET,
     q: Union[Unset, None, str] = UNSET,
     sort: Union[Unset, None, str] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Dict[str, Any]:
     url = "{}/repositories/{workspace}".format(client.base_url, workspace=workspace)
 
@@ -32,6 +34,8 @@ def _get_kwargs(
 
     params["sort"] = sort
 
+    params["fields"] = fields
+
     params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
 
     return {
@@ -44,24 +48,26 @@ def _get_kwargs(
     }
 
 
-def _parse_response(*, response: httpx.Response) -> Optional[Error]:
+def _parse_response(*, client: AuthenticatedClient, response: httpx.Response) -> Optional[Error]:
     if response.status_code == 404:
-        response_404 = Error.from_dict(response.json())
+        response_404 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_404
     if response.status_code == 410:
-        response_410 = Error.from_dict(response.json())
+        response_410 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_410
     return None
 
 
-def _build_response(*, response: httpx.Response) -> Response[Error]:
+def _build_response(*, client: AuthenticatedClient, response: httpx.Response) -> Response[Error]:
     return Response(
         status_code=response.status_code,
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(response=response),
+        parse=lambda: parse_cached(_parse_response, client, response),
+        lazy=client.lazy_parsing,
+        keep_content=client.keep_content,
     )
 
 
@@ -72,6 +78,7 @@ def sync_detailed(
     role: Union[Unset, None, GetRepositoriesWorkspaceRole] = UNSET,
     q: Union[Unset, None, str] = UNSET,
     sort: Union[Unset, None, str] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Error]:
     """List repositories in a workspace
 
@@ -92,6 +99,8 @@ def sync_detailed(
         role (Union[Unset, None, GetRepositoriesWorkspaceRole]):
         q (Union[Unset, None, str]):
         sort (Union[Unset, None, str]):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Error]
@@ -103,14 +112,14 @@ def sync_detailed(
         role=role,
         q=q,
         sort=sort,
+        fields=fields,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 def sync(
@@ -120,6 +129,7 @@ def sync(
     role: Union[Unset, None, GetRepositoriesWorkspaceRole] = UNSET,
     q: Union[Unset, None, str] = UNSET,
     sort: Union[Unset, None, str] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Error]:
     """List repositories in a workspace
 
@@ -140,6 +150,8 @@ def sync(
         role (Union[Unset, None, GetRepositoriesWorkspaceRole]):
         q (Union[Unset, None, str]):
         sort (Union[Unset, None, str]):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Error]
@@ -151,6 +163,7 @@ def sync(
         role=role,
         q=q,
         sort=sort,
+        fields=fields,
     ).parsed
 
 
@@ -161,6 +174,7 @@ async def asyncio_detailed(
     role: Union[Unset, None, GetRepositoriesWorkspaceRole] = UNSET,
     q: Union[Unset, None, str] = UNSET,
     sort: Union[Unset, None, str] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Error]:
     """List repositories in a workspace
 
@@ -181,6 +195,8 @@ async def asyncio_detailed(
         role (Union[Unset, None, GetRepositoriesWorkspaceRole]):
         q (Union[Unset, None, str]):
         sort (Union[Unset, None, str]):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Error]
@@ -192,12 +208,12 @@ async def asyncio_detailed(
         role=role,
         q=q,
         sort=sort,
+        fields=fields,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 async def asyncio(
@@ -207,6 +223,7 @@ async def asyncio(
     role: Union[Unset, None, GetRepositoriesWorkspaceRole] = UNSET,
     q: Union[Unset, None, str] = UNSET,
     sort: Union[Unset, None, str] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Error]:
     """List repositories in a workspace
 
@@ -227,6 +244,8 @@ async def asyncio(
         role (Union[Unset, None, GetRepositoriesWorkspaceRole]):
         q (Union[Unset, None, str]):
         sort (Union[Unset, None, str]):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Error]
@@ -239,5 +258,6 @@ async def asyncio(
             role=role,
             q=q,
             sort=sort,
+            fields=fields,
         )
     ).parsed
@@ -15,6 +15,7 @@ def _get_kwargs(
     role: Union[Unset, None, GetRepositoriesWorkspaceRepoSlugForksRole] = UNSET,
     q: Union[Unset, None, str] = UNSET,
     sort: Union[Unset, None, str] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Dict[str, Any]:
     url = "{}/repositories/{workspace}/{repo_slug}/forks".format(
         client.base_url, workspace=workspace, repo_slug=repo_slug
@@ -34,6 +35,8 @@ def _get_kwargs(
 
     params["sort"] = sort
 
+    params["fields"] = fields
+
     params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
 
     return {
@@ -46,7 +49,7 @@ def _get_kwargs(
     }
 
 
-def _build_response(*, response: httpx.Response) -> Response[Any]:
+def _build_response(*, client: AuthenticatedClient, response: httpx.Response) -> Response[Any]:
     return Response(
         status_code=response.status_code,
         content=response.content,
@@ -63,6 +66,7 @@ def sync_detailed(
     role: Union[Unset, None, GetRepositoriesWorkspaceRepoSlugForksRole] = UNSET,
     q: Union[Unset, None, str] = UNSET,
     sort: Union[Unset, None, str] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Any]:
     """List repository forks
 
@@ -75,6 +79,8 @@ def sync_detailed(
         role (Union[Unset, None, GetRepositoriesWorkspaceRepoSlugForksRole]):
         q (Union[Unset, None, str]):
         sort (Union[Unset, None, str]):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Any]
@@ -87,14 +93,14 @@ def sync_detailed(
         role=role,
         q=q,
         sort=sort,
+        fields=fields,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 async def asyncio_detailed(
@@ -105,6 +111,7 @@ async def asyncio_detailed(
     role: Union[Unset, None, GetRepositoriesWorkspaceRepoSlugForksRole] = UNSET,
     q: Union[Unset, None, str] = UNSET,
     sort: Union[Unset, None, str] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Any]:
     """List repository forks
 
@@ -117,6 +124,8 @@ async def asyncio_detailed(
         role (Union[Unset, None, GetRepositoriesWorkspaceRepoSlugForksRole]):
         q (Union[Unset, None, str]):
         sort (Union[Unset, None, str]):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Any]
@@ -129,9 +138,9 @@ async def asyncio_detailed(
         role=role,
         q=q,
         sort=sort,
+        fields=fields,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
@@ -2,10 +2,11 @@ from typing import Any, Dict, Optional, Union
 
 import httpx
 
+from ...cache import parse_cached
 from ...client import AuthenticatedClient
 from ...models.error import Error
 from ...models.webhook_subscription import WebhookSubscription
-from ...types import Response
+from ...types import UNSET, Response, Unset
 
 
 def _get_kwargs(
@@ -14,6 +15,7 @@ def _get_kwargs(
     uid: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Dict[str, Any]:
     url = "{}/repositories/{workspace}/{repo_slug}/hooks/{uid}".format(
         client.base_url, workspace=workspace, repo_slug=repo_slug, uid=uid
@@ -22,33 +24,45 @@ def _get_kwargs(
     headers: Dict[str, str] = client.get_headers()
     cookies: Dict[str, Any] = client.get_cookies()
 
+    params: Dict[str, Any] = {}
+    params["fields"] = fields
+
+    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+
     return {
         "method": "get",
         "url": url,
         "headers": headers,
         "cookies": cookies,
         "timeout": client.get_timeout(),
+        "params": params,
     }
 
 
-def _parse_response(*, response: httpx.Response) -> Optional[Union[Error, WebhookSubscription]]:
+def _parse_response(
+    *, client: AuthenticatedClient, response: httpx.Response
+) -> Optional[Union[Error, WebhookSubscription]]:
     if response.status_code == 200:
-        response_200 = WebhookSubscription.from_dict(response.json())
+        response_200 = WebhookSubscription.from_dict(client.json_codec.loads(response.content))
 
         return response_200
     if response.status_code == 404:
-        response_404 = Error.from_dict(response.json())
+        response_404 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_404
     return None
 
 
-def _build_response(*, response: httpx.Response) -> Response[Union[Error, WebhookSubscription]]:
+def _build_response(
+    *, client: AuthenticatedClient, response: httpx.Response
+) -> Response[Union[Error, WebhookSubscription]]:
     return Response(
         status_code=response.status_code,
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(response=response),
+        parse=lambda: parse_cached(_parse_response, client, response),
+        lazy=client.lazy_parsing,
+        keep_content=client.keep_content,
     )
 
 
@@ -58,6 +72,7 @@ def sync_detailed(
     uid: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Error, WebhookSubscription]]:
     """Get a webhook for a repository
 
@@ -68,6 +83,8 @@ def sync_detailed(
         workspace (str):
         repo_slug (str):
         uid (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, WebhookSubscription]]
@@ -78,14 +95,14 @@ def sync_detailed(
         repo_slug=repo_slug,
         uid=uid,
         client=client,
+        fields=fields,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 def sync(
@@ -94,6 +111,7 @@ def sync(
     uid: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Error, WebhookSubscription]]:
     """Get a webhook for a repository
 
@@ -104,6 +122,8 @@ def sync(
         workspace (str):
         repo_slug (str):
         uid (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, WebhookSubscription]]
@@ -114,6 +134,7 @@ def sync(
         repo_slug=repo_slug,
         uid=uid,
         client=client,
+        fields=fields,
     ).parsed
 
 
@@ -123,6 +144,7 @@ async def asyncio_detailed(
     uid: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Error, WebhookSubscription]]:
     """Get a webhook for a repository
 
@@ -133,6 +155,8 @@ async def asyncio_detailed(
         workspace (str):
         repo_slug (str):
         uid (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, WebhookSubscription]]
@@ -143,12 +167,12 @@ async def asyncio_detailed(
         repo_slug=repo_slug,
         uid=uid,
         client=client,
+        fields=fields,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 async def asyncio(
@@ -157,6 +181,7 @@ async def asyncio(
     uid: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Error, WebhookSubscription]]:
     """Get a webhook for a repository
 
@@ -167,6 +192,8 @@ async def asyncio(
         workspace (str):
         repo_slug (str):
         uid (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, WebhookSubscription]]
@@ -178,5 +205,6 @@ async def asyncio(
             repo_slug=repo_slug,
             uid=uid,
             client=client,
+            fields=fields,
         )
     ).parsed
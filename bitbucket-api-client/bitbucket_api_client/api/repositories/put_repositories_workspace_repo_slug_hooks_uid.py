@@ -2,10 +2,11 @@ from typing import Any, Dict, Optional, Union
 
 import httpx
 
+from ...cache import parse_cached
 from ...client import AuthenticatedClient
 from ...models.error import Error
 from ...models.webhook_subscription import WebhookSubscription
-from ...types import Response
+from ...types import UNSET, Response, Unset
 
 
 def _get_kwargs(
@@ -14,6 +15,7 @@ def _get_kwargs(
     uid: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Dict[str, Any]:
     url = "{}/repositories/{workspace}/{repo_slug}/hooks/{uid}".format(
         client.base_url, workspace=workspace, repo_slug=repo_slug, uid=uid
@@ -22,37 +24,49 @@ def _get_kwargs(
     headers: Dict[str, str] = client.get_headers()
     cookies: Dict[str, Any] = client.get_cookies()
 
+    params: Dict[str, Any] = {}
+    params["fields"] = fields
+
+    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+
     return {
         "method": "put",
         "url": url,
         "headers": headers,
         "cookies": cookies,
         "timeout": client.get_timeout(),
+        "params": params,
     }
 
 
-def _parse_response(*, response: httpx.Response) -> Optional[Union[Error, WebhookSubscription]]:
+def _parse_response(
+    *, client: AuthenticatedClient, response: httpx.Response
+) -> Optional[Union[Error, WebhookSubscription]]:
     if response.status_code == 200:
-        response_200 = WebhookSubscription.from_dict(response.json())
+        response_200 = WebhookSubscription.from_dict(client.json_codec.loads(response.content))
 
         return response_200
     if response.status_code == 403:
-        response_403 = Error.from_dict(response.json())
+        response_403 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_403
     if response.status_code == 404:
-        response_404 = Error.from_dict(response.json())
+        response_404 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_404
     return None
 
 
-def _build_response(*, response: httpx.Response) -> Response[Union[Error, WebhookSubscription]]:
+def _build_response(
+    *, client: AuthenticatedClient, response: httpx.Response
+) -> Response[Union[Error, WebhookSubscription]]:
     return Response(
         status_code=response.status_code,
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(response=response),
+        parse=lambda: parse_cached(_parse_response, client, response),
+        lazy=client.lazy_parsing,
+        keep_content=client.keep_content,
     )
 
 
@@ -62,6 +76,7 @@ def sync_detailed(
     uid: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Error, WebhookSubscription]]:
     """Update a webhook for a repository
 
@@ -78,6 +93,8 @@ def sync_detailed(
         workspace (str):
         repo_slug (str):
         uid (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, WebhookSubscription]]
@@ -88,14 +105,14 @@ def sync_detailed(
         repo_slug=repo_slug,
         uid=uid,
         client=client,
+        fields=fields,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 def sync(
@@ -104,6 +121,7 @@ def sync(
     uid: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Error, WebhookSubscription]]:
     """Update a webhook for a repository
 
@@ -120,6 +138,8 @@ def sync(
         workspace (str):
         repo_slug (str):
         uid (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, WebhookSubscription]]
@@ -130,6 +150,7 @@ def sync(
         repo_slug=repo_slug,
         uid=uid,
         client=client,
+        fields=fields,
     ).parsed
 
 
@@ -139,6 +160,7 @@ async def asyncio_detailed(
     uid: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Error, WebhookSubscription]]:
     """Update a webhook for a repository
 
@@ -155,6 +177,8 @@ async def asyncio_detailed(
         workspace (str):
         repo_slug (str):
         uid (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, WebhookSubscription]]
@@ -165,12 +189,12 @@ async def asyncio_detailed(
         repo_slug=repo_slug,
         uid=uid,
         client=client,
+        fields=fields,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 async def asyncio(
@@ -179,6 +203,7 @@ async def asyncio(
     uid: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Error, WebhookSubscription]]:
     """Update a webhook for a repository
 
@@ -195,6 +220,8 @@ async def asyncio(
         workspace (str):
         repo_slug (str):
         uid (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, WebhookSubscription]]
@@ -206,5 +233,6 @@ async def asyncio(
             repo_slug=repo_slug,
             uid=uid,
             client=client,
+            fields=fields,
         )
     ).parsed
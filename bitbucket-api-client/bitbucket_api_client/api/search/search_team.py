@@ -2,6 +2,7 @@ from typing import Any, Dict, Optional, Union
 
 import httpx
 
+from ...cache import parse_cached
 from ...client import Client
 from ...models.error import Error
 from ...types import UNSET, Response, Unset
@@ -14,6 +15,7 @@ def _get_kwargs(
     search_query: str,
     page: Union[Unset, None, int] = 1,
     pagelen: Union[Unset, None, int] = 10,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Dict[str, Any]:
     url = "{}/teams/{username}/search/code".format(client.base_url, username=username)
 
@@ -27,6 +29,8 @@ def _get_kwargs(
 
     params["pagelen"] = pagelen
 
+    params["fields"] = fields
+
     params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
 
     return {
@@ -39,28 +43,30 @@ def _get_kwargs(
     }
 
 
-def _parse_response(*, response: httpx.Response) -> Optional[Error]:
+def _parse_response(*, client: Client, response: httpx.Response) -> Optional[Error]:
     if response.status_code == 400:
-        response_400 = Error.from_dict(response.json())
+        response_400 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_400
     if response.status_code == 404:
-        response_404 = Error.from_dict(response.json())
+        response_404 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_404
     if response.status_code == 429:
-        response_429 = Error.from_dict(response.json())
+        response_429 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_429
     return None
 
 
-def _build_response(*, response: httpx.Response) -> Response[Error]:
+def _build_response(*, client: Client, response: httpx.Response) -> Response[Error]:
     return Response(
         status_code=response.status_code,
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(response=response),
+        parse=lambda: parse_cached(_parse_response, client, response),
+        lazy=client.lazy_parsing,
+        keep_content=client.keep_content,
     )
 
 
@@ -71,6 +77,7 @@ def sync_detailed(
     search_query: str,
     page: Union[Unset, None, int] = 1,
     pagelen: Union[Unset, None, int] = 10,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Error]:
     """Search for code in a team's repositories
 
@@ -236,6 +243,8 @@ def sync_detailed(
         search_query (str):
         page (Union[Unset, None, int]):  Default: 1.
         pagelen (Union[Unset, None, int]):  Default: 10.
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Error]
@@ -247,14 +256,14 @@ def sync_detailed(
         search_query=search_query,
         page=page,
         pagelen=pagelen,
+        fields=fields,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 def sync(
@@ -264,6 +273,7 @@ def sync(
     search_query: str,
     page: Union[Unset, None, int] = 1,
     pagelen: Union[Unset, None, int] = 10,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Error]:
     """Search for code in a team's repositories
 
@@ -429,6 +439,8 @@ def sync(
         search_query (str):
         page (Union[Unset, None, int]):  Default: 1.
         pagelen (Union[Unset, None, int]):  Default: 10.
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Error]
@@ -440,6 +452,7 @@ def sync(
         search_query=search_query,
         page=page,
         pagelen=pagelen,
+        fields=fields,
     ).parsed
 
 
@@ -450,6 +463,7 @@ async def asyncio_detailed(
     search_query: str,
     page: Union[Unset, None, int] = 1,
     pagelen: Union[Unset, None, int] = 10,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Error]:
     """Search for code in a team's repositories
 
@@ -615,6 +629,8 @@ async def asyncio_detailed(
         search_query (str):
         page (Union[Unset, None, int]):  Default: 1.
         pagelen (Union[Unset, None, int]):  Default: 10.
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Error]
@@ -626,12 +642,12 @@ async def asyncio_detailed(
         search_query=search_query,
         page=page,
         pagelen=pagelen,
+        fields=fields,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 async def asyncio(
@@ -641,6 +657,7 @@ async def asyncio(
     search_query: str,
     page: Union[Unset, None, int] = 1,
     pagelen: Union[Unset, None, int] = 10,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Error]:
     """Search for code in a team's repositories
 
@@ -806,6 +823,8 @@ async def asyncio(
         search_query (str):
         page (Union[Unset, None, int]):  Default: 1.
         pagelen (Union[Unset, None, int]):  Default: 10.
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Error]
@@ -818,5 +837,6 @@ async def asyncio(
             search_query=search_query,
             page=page,
             pagelen=pagelen,
+            fields=fields,
         )
     ).parsed
@@ -2,6 +2,7 @@ from typing import Any, Dict, Optional, Union
 
 import httpx
 
+from ...cache import parse_cached
 from ...client import AuthenticatedClient
 from ...models.error import Error
 from ...models.get_snippets_role import GetSnippetsRole
@@ -13,6 +14,7 @@ def _get_kwargs(
     *,
     client: AuthenticatedClient,
     role: Union[Unset, None, GetSnippetsRole] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Dict[str, Any]:
     url = "{}/snippets".format(client.base_url)
 
@@ -26,6 +28,8 @@ def _get_kwargs(
 
     params["role"] = json_role
 
+    params["fields"] = fields
+
     params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
 
     return {
@@ -38,24 +42,30 @@ def _get_kwargs(
     }
 
 
-def _parse_response(*, response: httpx.Response) -> Optional[Union[Error, PaginatedSnippets]]:
+def _parse_response(
+    *, client: AuthenticatedClient, response: httpx.Response
+) -> Optional[Union[Error, PaginatedSnippets]]:
     if response.status_code == 200:
-        response_200 = PaginatedSnippets.from_dict(response.json())
+        response_200 = PaginatedSnippets.from_dict(client.json_codec.loads(response.content))
 
         return response_200
     if response.status_code == 404:
-        response_404 = Error.from_dict(response.json())
+        response_404 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_404
     return None
 
 
-def _build_response(*, response: httpx.Response) -> Response[Union[Error, PaginatedSnippets]]:
+def _build_response(
+    *, client: AuthenticatedClient, response: httpx.Response
+) -> Response[Union[Error, PaginatedSnippets]]:
     return Response(
         status_code=response.status_code,
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(response=response),
+        parse=lambda: parse_cached(_parse_response, client, response),
+        lazy=client.lazy_parsing,
+        keep_content=client.keep_content,
     )
 
 
@@ -63,6 +73,7 @@ def sync_detailed(
     *,
     client: AuthenticatedClient,
     role: Union[Unset, None, GetSnippetsRole] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Error, PaginatedSnippets]]:
     """List snippets
 
@@ -91,6 +102,8 @@ def sync_detailed(
 
     Args:
         role (Union[Unset, None, GetSnippetsRole]):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, PaginatedSnippets]]
@@ -99,20 +112,21 @@ def sync_detailed(
     kwargs = _get_kwargs(
         client=client,
         role=role,
+        fields=fields,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 def sync(
     *,
     client: AuthenticatedClient,
     role: Union[Unset, None, GetSnippetsRole] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Error, PaginatedSnippets]]:
     """List snippets
 
@@ -141,6 +155,8 @@ def sync(
 
     Args:
         role (Union[Unset, None, GetSnippetsRole]):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, PaginatedSnippets]]
@@ -149,6 +165,7 @@ def sync(
     return sync_detailed(
         client=client,
         role=role,
+        fields=fields,
     ).parsed
 
 
@@ -156,6 +173,7 @@ async def asyncio_detailed(
     *,
     client: AuthenticatedClient,
     role: Union[Unset, None, GetSnippetsRole] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Error, PaginatedSnippets]]:
     """List snippets
 
@@ -184,6 +202,8 @@ async def asyncio_detailed(
 
     Args:
         role (Union[Unset, None, GetSnippetsRole]):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, PaginatedSnippets]]
@@ -192,18 +212,19 @@ async def asyncio_detailed(
     kwargs = _get_kwargs(
         client=client,
         role=role,
+        fields=fields,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 async def asyncio(
     *,
     client: AuthenticatedClient,
     role: Union[Unset, None, GetSnippetsRole] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Error, PaginatedSnippets]]:
     """List snippets
 
@@ -232,6 +253,8 @@ async def asyncio(
 
     Args:
         role (Union[Unset, None, GetSnippetsRole]):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, PaginatedSnippets]]
@@ -241,5 +264,6 @@ async def asyncio(
         await asyncio_detailed(
             client=client,
             role=role,
+            fields=fields,
         )
     ).parsed
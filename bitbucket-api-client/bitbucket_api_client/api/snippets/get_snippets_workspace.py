@@ -2,6 +2,7 @@ from typing import Any, Dict, Optional, Union
 
 import httpx
 
+from ...cache import parse_cached
 from ...client import AuthenticatedClient
 from ...models.error import Error
 from ...models.get_snippets_workspace_role import GetSnippetsWorkspaceRole
@@ -14,6 +15,7 @@ def _get_kwargs(
     *,
     client: AuthenticatedClient,
     role: Union[Unset, None, GetSnippetsWorkspaceRole] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Dict[str, Any]:
     url = "{}/snippets/{workspace}".format(client.base_url, workspace=workspace)
 
@@ -27,6 +29,8 @@ def _get_kwargs(
 
     params["role"] = json_role
 
+    params["fields"] = fields
+
     params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
 
     return {
@@ -39,24 +43,30 @@ def _get_kwargs(
     }
 
 
-def _parse_response(*, response: httpx.Response) -> Optional[Union[Error, PaginatedSnippets]]:
+def _parse_response(
+    *, client: AuthenticatedClient, response: httpx.Response
+) -> Optional[Union[Error, PaginatedSnippets]]:
     if response.status_code == 200:
-        response_200 = PaginatedSnippets.from_dict(response.json())
+        response_200 = PaginatedSnippets.from_dict(client.json_codec.loads(response.content))
 
         return response_200
     if response.status_code == 404:
-        response_404 = Error.from_dict(response.json())
+        response_404 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_404
     return None
 
 
-def _build_response(*, response: httpx.Response) -> Response[Union[Error, PaginatedSnippets]]:
+def _build_response(
+    *, client: AuthenticatedClient, response: httpx.Response
+) -> Response[Union[Error, PaginatedSnippets]]:
     return Response(
         status_code=response.status_code,
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(response=response),
+        parse=lambda: parse_cached(_parse_response, client, response),
+        lazy=client.lazy_parsing,
+        keep_content=client.keep_content,
     )
 
 
@@ -65,6 +75,7 @@ def sync_detailed(
     *,
     client: AuthenticatedClient,
     role: Union[Unset, None, GetSnippetsWorkspaceRole] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Error, PaginatedSnippets]]:
     """List snippets in a workspace
 
@@ -76,6 +87,8 @@ def sync_detailed(
     Args:
         workspace (str):
         role (Union[Unset, None, GetSnippetsWorkspaceRole]):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, PaginatedSnippets]]
@@ -85,14 +98,14 @@ def sync_detailed(
         workspace=workspace,
         client=client,
         role=role,
+        fields=fields,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 def sync(
@@ -100,6 +113,7 @@ def sync(
     *,
     client: AuthenticatedClient,
     role: Union[Unset, None, GetSnippetsWorkspaceRole] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Error, PaginatedSnippets]]:
     """List snippets in a workspace
 
@@ -111,6 +125,8 @@ def sync(
     Args:
         workspace (str):
         role (Union[Unset, None, GetSnippetsWorkspaceRole]):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, PaginatedSnippets]]
@@ -120,6 +136,7 @@ def sync(
         workspace=workspace,
         client=client,
         role=role,
+        fields=fields,
     ).parsed
 
 
@@ -128,6 +145,7 @@ async def asyncio_detailed(
     *,
     client: AuthenticatedClient,
     role: Union[Unset, None, GetSnippetsWorkspaceRole] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Error, PaginatedSnippets]]:
     """List snippets in a workspace
 
@@ -139,6 +157,8 @@ async def asyncio_detailed(
     Args:
         workspace (str):
         role (Union[Unset, None, GetSnippetsWorkspaceRole]):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, PaginatedSnippets]]
@@ -148,12 +168,12 @@ async def asyncio_detailed(
         workspace=workspace,
         client=client,
         role=role,
+        fields=fields,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 async def asyncio(
@@ -161,6 +181,7 @@ async def asyncio(
     *,
     client: AuthenticatedClient,
     role: Union[Unset, None, GetSnippetsWorkspaceRole] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Error, PaginatedSnippets]]:
     """List snippets in a workspace
 
@@ -172,6 +193,8 @@ async def asyncio(
     Args:
         workspace (str):
         role (Union[Unset, None, GetSnippetsWorkspaceRole]):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, PaginatedSnippets]]
@@ -182,5 +205,6 @@ async def asyncio(
             workspace=workspace,
             client=client,
             role=role,
+            fields=fields,
         )
     ).parsed
@@ -2,10 +2,11 @@ from typing import Any, Dict, Optional, Union
 
 import httpx
 
+from ...cache import parse_cached
 from ...client import AuthenticatedClient
 from ...models.error import Error
 from ...models.snippet import Snippet
-from ...types import Response
+from ...types import UNSET, Response, Unset
 
 
 def _get_kwargs(
@@ -13,51 +14,60 @@ def _get_kwargs(
     encoded_id: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Dict[str, Any]:
     url = "{}/snippets/{workspace}/{encoded_id}".format(client.base_url, workspace=workspace, encoded_id=encoded_id)
 
     headers: Dict[str, str] = client.get_headers()
     cookies: Dict[str, Any] = client.get_cookies()
 
+    params: Dict[str, Any] = {}
+    params["fields"] = fields
+
+    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+
     return {
         "method": "get",
         "url": url,
         "headers": headers,
         "cookies": cookies,
         "timeout": client.get_timeout(),
+        "params": params,
     }
 
 
-def _parse_response(*, response: httpx.Response) -> Optional[Union[Error, Snippet]]:
+def _parse_response(*, client: AuthenticatedClient, response: httpx.Response) -> Optional[Union[Error, Snippet]]:
     if response.status_code == 200:
-        response_200 = Snippet.from_dict(response.json())
+        response_200 = Snippet.from_dict(client.json_codec.loads(response.content))
 
         return response_200
     if response.status_code == 401:
-        response_401 = Error.from_dict(response.json())
+        response_401 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_401
     if response.status_code == 403:
-        response_403 = Error.from_dict(response.json())
+        response_403 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_403
     if response.status_code == 404:
-        response_404 = Error.from_dict(response.json())
+        response_404 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_404
     if response.status_code == 410:
-        response_410 = Error.from_dict(response.json())
+        response_410 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_410
     return None
 
 
-def _build_response(*, response: httpx.Response) -> Response[Union[Error, Snippet]]:
+def _build_response(*, client: AuthenticatedClient, response: httpx.Response) -> Response[Union[Error, Snippet]]:
     return Response(
         status_code=response.status_code,
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(response=response),
+        parse=lambda: parse_cached(_parse_response, client, response),
+        lazy=client.lazy_parsing,
+        keep_content=client.keep_content,
     )
 
 
@@ -66,6 +76,7 @@ def sync_detailed(
     encoded_id: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Error, Snippet]]:
     """Get a snippet
 
@@ -264,6 +275,8 @@ def sync_detailed(
     Args:
         workspace (str):
         encoded_id (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, Snippet]]
@@ -273,14 +286,14 @@ def sync_detailed(
         workspace=workspace,
         encoded_id=encoded_id,
         client=client,
+        fields=fields,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 def sync(
@@ -288,6 +301,7 @@ def sync(
     encoded_id: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Error, Snippet]]:
     """Get a snippet
 
@@ -486,6 +500,8 @@ def sync(
     Args:
         workspace (str):
         encoded_id (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, Snippet]]
@@ -495,6 +511,7 @@ def sync(
         workspace=workspace,
         encoded_id=encoded_id,
         client=client,
+        fields=fields,
     ).parsed
 
 
@@ -503,6 +520,7 @@ async def asyncio_detailed(
     encoded_id: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Error, Snippet]]:
     """Get a snippet
 
@@ -701,6 +719,8 @@ async def asyncio_detailed(
     Args:
         workspace (str):
         encoded_id (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, Snippet]]
@@ -710,12 +730,12 @@ async def asyncio_detailed(
         workspace=workspace,
         encoded_id=encoded_id,
         client=client,
+        fields=fields,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 async def asyncio(
@@ -723,6 +743,7 @@ async def asyncio(
     encoded_id: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Error, Snippet]]:
     """Get a snippet
 
@@ -921,6 +942,8 @@ async def asyncio(
     Args:
         workspace (str):
         encoded_id (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, Snippet]]
@@ -931,5 +954,6 @@ async def asyncio(
             workspace=workspace,
             encoded_id=encoded_id,
             client=client,
+            fields=fields,
         )
     ).parsed
@@ -2,6 +2,7 @@ from typing import Any, Dict, Optional, Union
 
 import httpx
 
+from ...cache import parse_cached
 from ...client import AuthenticatedClient
 from ...models.error import Error
 from ...models.get_repositories_workspace_repo_slug_src_format import GetRepositoriesWorkspaceRepoSlugSrcFormat
@@ -14,6 +15,7 @@ def _get_kwargs(
     *,
     client: AuthenticatedClient,
     format_: Union[Unset, None, GetRepositoriesWorkspaceRepoSlugSrcFormat] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Dict[str, Any]:
     url = "{}/repositories/{workspace}/{repo_slug}/src".format(
         client.base_url, workspace=workspace, repo_slug=repo_slug
@@ -29,6 +31,8 @@ def _get_kwargs(
 
     params["format"] = json_format_
 
+    params["fields"] = fields
+
     params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
 
     return {
@@ -41,20 +45,22 @@ def _get_kwargs(
     }
 
 
-def _parse_response(*, response: httpx.Response) -> Optional[Error]:
+def _parse_response(*, client: AuthenticatedClient, response: httpx.Response) -> Optional[Error]:
     if response.status_code == 404:
-        response_404 = Error.from_dict(response.json())
+        response_404 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_404
     return None
 
 
-def _build_response(*, response: httpx.Response) -> Response[Error]:
+def _build_response(*, client: AuthenticatedClient, response: httpx.Response) -> Response[Error]:
     return Response(
         status_code=response.status_code,
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(response=response),
+        parse=lambda: parse_cached(_parse_response, client, response),
+        lazy=client.lazy_parsing,
+        keep_content=client.keep_content,
     )
 
 
@@ -64,6 +70,7 @@ def sync_detailed(
     *,
     client: AuthenticatedClient,
     format_: Union[Unset, None, GetRepositoriesWorkspaceRepoSlugSrcFormat] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Error]:
     """Get the root directory of the main branch
 
@@ -80,6 +87,8 @@ def sync_detailed(
         workspace (str):
         repo_slug (str):
         format_ (Union[Unset, None, GetRepositoriesWorkspaceRepoSlugSrcFormat]):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Error]
@@ -90,14 +99,14 @@ def sync_detailed(
         repo_slug=repo_slug,
         client=client,
         format_=format_,
+        fields=fields,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 def sync(
@@ -106,6 +115,7 @@ def sync(
     *,
     client: AuthenticatedClient,
     format_: Union[Unset, None, GetRepositoriesWorkspaceRepoSlugSrcFormat] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Error]:
     """Get the root directory of the main branch
 
@@ -122,6 +132,8 @@ def sync(
         workspace (str):
         repo_slug (str):
         format_ (Union[Unset, None, GetRepositoriesWorkspaceRepoSlugSrcFormat]):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Error]
@@ -132,6 +144,7 @@ def sync(
         repo_slug=repo_slug,
         client=client,
         format_=format_,
+        fields=fields,
     ).parsed
 
 
@@ -141,6 +154,7 @@ async def asyncio_detailed(
     *,
     client: AuthenticatedClient,
     format_: Union[Unset, None, GetRepositoriesWorkspaceRepoSlugSrcFormat] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Error]:
     """Get the root directory of the main branch
 
@@ -157,6 +171,8 @@ async def asyncio_detailed(
         workspace (str):
         repo_slug (str):
         format_ (Union[Unset, None, GetRepositoriesWorkspaceRepoSlugSrcFormat]):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Error]
@@ -167,12 +183,12 @@ async def asyncio_detailed(
         repo_slug=repo_slug,
         client=client,
         format_=format_,
+        fields=fields,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 async def asyncio(
@@ -181,6 +197,7 @@ async def asyncio(
     *,
     client: AuthenticatedClient,
     format_: Union[Unset, None, GetRepositoriesWorkspaceRepoSlugSrcFormat] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Error]:
     """Get the root directory of the main branch
 
@@ -197,6 +214,8 @@ async def asyncio(
         workspace (str):
         repo_slug (str):
         format_ (Union[Unset, None, GetRepositoriesWorkspaceRepoSlugSrcFormat]):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Error]
@@ -208,5 +227,6 @@ async def asyncio(
             repo_slug=repo_slug,
             client=client,
             format_=format_,
+            fields=fields,
         )
     ).parsed
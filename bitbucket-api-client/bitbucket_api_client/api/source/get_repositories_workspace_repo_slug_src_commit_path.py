@@ -2,6 +2,7 @@ from typing import Any, Dict, Optional, Union
 
 import httpx
 
+from ...cache import parse_cached
 from ...client import AuthenticatedClient
 from ...models.error import Error
 from ...models.get_repositories_workspace_repo_slug_src_commit_path_format import (
@@ -21,6 +22,7 @@ def _get_kwargs(
     q: Union[Unset, None, str] = UNSET,
     sort: Union[Unset, None, str] = UNSET,
     max_depth: Union[Unset, None, int] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Dict[str, Any]:
     url = "{}/repositories/{workspace}/{repo_slug}/src/{commit}/{path}".format(
         client.base_url, workspace=workspace, repo_slug=repo_slug, commit=commit, path=path
@@ -42,6 +44,8 @@ def _get_kwargs(
 
     params["max_depth"] = max_depth
 
+    params["fields"] = fields
+
     params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
 
     return {
@@ -54,24 +58,26 @@ def _get_kwargs(
     }
 
 
-def _parse_response(*, response: httpx.Response) -> Optional[Error]:
+def _parse_response(*, client: AuthenticatedClient, response: httpx.Response) -> Optional[Error]:
     if response.status_code == 404:
-        response_404 = Error.from_dict(response.json())
+        response_404 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_404
     if response.status_code == 555:
-        response_555 = Error.from_dict(response.json())
+        response_555 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_555
     return None
 
 
-def _build_response(*, response: httpx.Response) -> Response[Error]:
+def _build_response(*, client: AuthenticatedClient, response: httpx.Response) -> Response[Error]:
     return Response(
         status_code=response.status_code,
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(response=response),
+        parse=lambda: parse_cached(_parse_response, client, response),
+        lazy=client.lazy_parsing,
+        keep_content=client.keep_content,
     )
 
 
@@ -86,6 +92,7 @@ def sync_detailed(
     q: Union[Unset, None, str] = UNSET,
     sort: Union[Unset, None, str] = UNSET,
     max_depth: Union[Unset, None, int] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Error]:
     """Get file or directory contents
 
@@ -317,6 +324,8 @@ def sync_detailed(
         q (Union[Unset, None, str]):
         sort (Union[Unset, None, str]):
         max_depth (Union[Unset, None, int]):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Error]
@@ -332,14 +341,14 @@ def sync_detailed(
         q=q,
         sort=sort,
         max_depth=max_depth,
+        fields=fields,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 def sync(
@@ -353,6 +362,7 @@ def sync(
     q: Union[Unset, None, str] = UNSET,
     sort: Union[Unset, None, str] = UNSET,
     max_depth: Union[Unset, None, int] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Error]:
     """Get file or directory contents
 
@@ -584,6 +594,8 @@ def sync(
         q (Union[Unset, None, str]):
         sort (Union[Unset, None, str]):
         max_depth (Union[Unset, None, int]):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Error]
@@ -599,6 +611,7 @@ def sync(
         q=q,
         sort=sort,
         max_depth=max_depth,
+        fields=fields,
     ).parsed
 
 
@@ -613,6 +626,7 @@ async def asyncio_detailed(
     q: Union[Unset, None, str] = UNSET,
     sort: Union[Unset, None, str] = UNSET,
     max_depth: Union[Unset, None, int] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Error]:
     """Get file or directory contents
 
@@ -844,6 +858,8 @@ async def asyncio_detailed(
         q (Union[Unset, None, str]):
         sort (Union[Unset, None, str]):
         max_depth (Union[Unset, None, int]):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Error]
@@ -859,12 +875,12 @@ async def asyncio_detailed(
         q=q,
         sort=sort,
         max_depth=max_depth,
+        fields=fields,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 async def asyncio(
@@ -878,6 +894,7 @@ async def asyncio(
     q: Union[Unset, None, str] = UNSET,
     sort: Union[Unset, None, str] = UNSET,
     max_depth: Union[Unset, None, int] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Error]:
     """Get file or directory contents
 
@@ -1109,6 +1126,8 @@ async def asyncio(
         q (Union[Unset, None, str]):
         sort (Union[Unset, None, str]):
         max_depth (Union[Unset, None, int]):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Error]
@@ -1125,5 +1144,6 @@ async def asyncio(
             q=q,
             sort=sort,
             max_depth=max_depth,
+            fields=fields,
         )
     ).parsed
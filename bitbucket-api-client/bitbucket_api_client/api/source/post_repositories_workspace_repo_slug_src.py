@@ -2,6 +2,7 @@ from typing import Any, Dict, Optional, Union, cast
 
 import httpx
 
+from ...cache import parse_cached
 from ...client import AuthenticatedClient
 from ...models.error import Error
 from ...types import UNSET, Response, Unset
@@ -17,6 +18,7 @@ def _get_kwargs(
     parents: Union[Unset, None, str] = UNSET,
     files: Union[Unset, None, str] = UNSET,
     branch: Union[Unset, None, str] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Dict[str, Any]:
     url = "{}/repositories/{workspace}/{repo_slug}/src".format(
         client.base_url, workspace=workspace, repo_slug=repo_slug
@@ -36,6 +38,8 @@ def _get_kwargs(
 
     params["branch"] = branch
 
+    params["fields"] = fields
+
     params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
 
     return {
@@ -48,27 +52,29 @@ def _get_kwargs(
     }
 
 
-def _parse_response(*, response: httpx.Response) -> Optional[Union[Any, Error]]:
+def _parse_response(*, client: AuthenticatedClient, response: httpx.Response) -> Optional[Union[Any, Error]]:
     if response.status_code == 201:
         response_201 = cast(Any, None)
         return response_201
     if response.status_code == 403:
-        response_403 = Error.from_dict(response.json())
+        response_403 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_403
     if response.status_code == 404:
-        response_404 = Error.from_dict(response.json())
+        response_404 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_404
     return None
 
 
-def _build_response(*, response: httpx.Response) -> Response[Union[Any, Error]]:
+def _build_response(*, client: AuthenticatedClient, response: httpx.Response) -> Response[Union[Any, Error]]:
     return Response(
         status_code=response.status_code,
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(response=response),
+        parse=lambda: parse_cached(_parse_response, client, response),
+        lazy=client.lazy_parsing,
+        keep_content=client.keep_content,
     )
 
 
@@ -82,6 +88,7 @@ def sync_detailed(
     parents: Union[Unset, None, str] = UNSET,
     files: Union[Unset, None, str] = UNSET,
     branch: Union[Unset, None, str] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Any, Error]]:
     """Create a commit by uploading a file
 
@@ -215,6 +222,8 @@ def sync_detailed(
         parents (Union[Unset, None, str]):
         files (Union[Unset, None, str]):
         branch (Union[Unset, None, str]):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Any, Error]]
@@ -229,14 +238,14 @@ def sync_detailed(
         parents=parents,
         files=files,
         branch=branch,
+        fields=fields,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 def sync(
@@ -249,6 +258,7 @@ def sync(
     parents: Union[Unset, None, str] = UNSET,
     files: Union[Unset, None, str] = UNSET,
     branch: Union[Unset, None, str] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Any, Error]]:
     """Create a commit by uploading a file
 
@@ -382,6 +392,8 @@ def sync(
         parents (Union[Unset, None, str]):
         files (Union[Unset, None, str]):
         branch (Union[Unset, None, str]):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Any, Error]]
@@ -396,6 +408,7 @@ def sync(
         parents=parents,
         files=files,
         branch=branch,
+        fields=fields,
     ).parsed
 
 
@@ -409,6 +422,7 @@ async def asyncio_detailed(
     parents: Union[Unset, None, str] = UNSET,
     files: Union[Unset, None, str] = UNSET,
     branch: Union[Unset, None, str] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Any, Error]]:
     """Create a commit by uploading a file
 
@@ -542,6 +556,8 @@ async def asyncio_detailed(
         parents (Union[Unset, None, str]):
         files (Union[Unset, None, str]):
         branch (Union[Unset, None, str]):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Any, Error]]
@@ -556,12 +572,12 @@ async def asyncio_detailed(
         parents=parents,
         files=files,
         branch=branch,
+        fields=fields,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 async def asyncio(
@@ -574,6 +590,7 @@ async def asyncio(
     parents: Union[Unset, None, str] = UNSET,
     files: Union[Unset, None, str] = UNSET,
     branch: Union[Unset, None, str] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Any, Error]]:
     """Create a commit by uploading a file
 
@@ -707,6 +724,8 @@ async def asyncio(
         parents (Union[Unset, None, str]):
         files (Union[Unset, None, str]):
         branch (Union[Unset, None, str]):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Any, Error]]
@@ -722,5 +741,6 @@ async def asyncio(
             parents=parents,
             files=files,
             branch=branch,
+            fields=fields,
         )
     ).parsed
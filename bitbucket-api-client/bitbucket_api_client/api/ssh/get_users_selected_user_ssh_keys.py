@@ -2,52 +2,66 @@ from typing import Any, Dict, Optional, Union, cast
 
 import httpx
 
+from ...cache import parse_cached
 from ...client import AuthenticatedClient
 from ...models.error import Error
 from ...models.paginated_ssh_user_keys import PaginatedSSHUserKeys
-from ...types import Response
+from ...types import UNSET, Response, Unset
 
 
 def _get_kwargs(
     selected_user: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Dict[str, Any]:
     url = "{}/users/{selected_user}/ssh-keys".format(client.base_url, selected_user=selected_user)
 
     headers: Dict[str, str] = client.get_headers()
     cookies: Dict[str, Any] = client.get_cookies()
 
+    params: Dict[str, Any] = {}
+    params["fields"] = fields
+
+    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+
     return {
         "method": "get",
         "url": url,
         "headers": headers,
         "cookies": cookies,
         "timeout": client.get_timeout(),
+        "params": params,
     }
 
 
-def _parse_response(*, response: httpx.Response) -> Optional[Union[Any, Error, PaginatedSSHUserKeys]]:
+def _parse_response(
+    *, client: AuthenticatedClient, response: httpx.Response
+) -> Optional[Union[Any, Error, PaginatedSSHUserKeys]]:
     if response.status_code == 200:
-        response_200 = PaginatedSSHUserKeys.from_dict(response.json())
+        response_200 = PaginatedSSHUserKeys.from_dict(client.json_codec.loads(response.content))
 
         return response_200
     if response.status_code == 403:
         response_403 = cast(Any, None)
         return response_403
     if response.status_code == 404:
-        response_404 = Error.from_dict(response.json())
+        response_404 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_404
     return None
 
 
-def _build_response(*, response: httpx.Response) -> Response[Union[Any, Error, PaginatedSSHUserKeys]]:
+def _build_response(
+    *, client: AuthenticatedClient, response: httpx.Response
+) -> Response[Union[Any, Error, PaginatedSSHUserKeys]]:
     return Response(
         status_code=response.status_code,
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(response=response),
+        parse=lambda: parse_cached(_parse_response, client, response),
+        lazy=client.lazy_parsing,
+        keep_content=client.keep_content,
     )
 
 
@@ -55,6 +69,7 @@ def sync_detailed(
     selected_user: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Any, Error, PaginatedSSHUserKeys]]:
     """List SSH keys
 
@@ -111,6 +126,8 @@ def sync_detailed(
 
     Args:
         selected_user (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Any, Error, PaginatedSSHUserKeys]]
@@ -119,20 +136,21 @@ def sync_detailed(
     kwargs = _get_kwargs(
         selected_user=selected_user,
         client=client,
+        fields=fields,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 def sync(
     selected_user: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Any, Error, PaginatedSSHUserKeys]]:
     """List SSH keys
 
@@ -189,6 +207,8 @@ def sync(
 
     Args:
         selected_user (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Any, Error, PaginatedSSHUserKeys]]
@@ -197,6 +217,7 @@ def sync(
     return sync_detailed(
         selected_user=selected_user,
         client=client,
+        fields=fields,
     ).parsed
 
 
@@ -204,6 +225,7 @@ async def asyncio_detailed(
     selected_user: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Any, Error, PaginatedSSHUserKeys]]:
     """List SSH keys
 
@@ -260,6 +282,8 @@ async def asyncio_detailed(
 
     Args:
         selected_user (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Any, Error, PaginatedSSHUserKeys]]
@@ -268,18 +292,19 @@ async def asyncio_detailed(
     kwargs = _get_kwargs(
         selected_user=selected_user,
         client=client,
+        fields=fields,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 async def asyncio(
     selected_user: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Any, Error, PaginatedSSHUserKeys]]:
     """List SSH keys
 
@@ -336,6 +361,8 @@ async def asyncio(
 
     Args:
         selected_user (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Any, Error, PaginatedSSHUserKeys]]
@@ -345,5 +372,6 @@ async def asyncio(
         await asyncio_detailed(
             selected_user=selected_user,
             client=client,
+            fields=fields,
         )
     ).parsed
@@ -2,10 +2,11 @@ from typing import Any, Dict, Optional, Union, cast
 
 import httpx
 
+from ...cache import parse_cached
 from ...client import AuthenticatedClient
 from ...models.error import Error
 from ...models.ssh_account_key import SshAccountKey
-from ...types import Response
+from ...types import UNSET, Response, Unset
 
 
 def _get_kwargs(
@@ -13,6 +14,7 @@ def _get_kwargs(
     *,
     client: AuthenticatedClient,
     json_body: SshAccountKey,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Dict[str, Any]:
     url = "{}/users/{selected_user}/ssh-keys".format(client.base_url, selected_user=selected_user)
 
@@ -21,41 +23,55 @@ def _get_kwargs(
 
     json_json_body = json_body.to_dict()
 
+    headers["Content-Type"] = "application/json"
+
+    params: Dict[str, Any] = {}
+    params["fields"] = fields
+
+    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+
     return {
         "method": "post",
         "url": url,
         "headers": headers,
         "cookies": cookies,
         "timeout": client.get_timeout(),
-        "json": json_json_body,
+        "params": params,
+        "content": client.json_codec.dumps(json_json_body),
     }
 
 
-def _parse_response(*, response: httpx.Response) -> Optional[Union[Any, Error, SshAccountKey]]:
+def _parse_response(
+    *, client: AuthenticatedClient, response: httpx.Response
+) -> Optional[Union[Any, Error, SshAccountKey]]:
     if response.status_code == 201:
-        response_201 = SshAccountKey.from_dict(response.json())
+        response_201 = SshAccountKey.from_dict(client.json_codec.loads(response.content))
 
         return response_201
     if response.status_code == 400:
-        response_400 = Error.from_dict(response.json())
+        response_400 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_400
     if response.status_code == 403:
         response_403 = cast(Any, None)
         return response_403
     if response.status_code == 404:
-        response_404 = Error.from_dict(response.json())
+        response_404 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_404
     return None
 
 
-def _build_response(*, response: httpx.Response) -> Response[Union[Any, Error, SshAccountKey]]:
+def _build_response(
+    *, client: AuthenticatedClient, response: httpx.Response
+) -> Response[Union[Any, Error, SshAccountKey]]:
     return Response(
         status_code=response.status_code,
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(response=response),
+        parse=lambda: parse_cached(_parse_response, client, response),
+        lazy=client.lazy_parsing,
+        keep_content=client.keep_content,
     )
 
 
@@ -64,6 +80,7 @@ def sync_detailed(
     *,
     client: AuthenticatedClient,
     json_body: SshAccountKey,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Any, Error, SshAccountKey]]:
     """Add a new SSH key
 
@@ -115,6 +132,8 @@ def sync_detailed(
     Args:
         selected_user (str):
         json_body (SshAccountKey):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Any, Error, SshAccountKey]]
@@ -124,14 +143,14 @@ def sync_detailed(
         selected_user=selected_user,
         client=client,
         json_body=json_body,
+        fields=fields,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 def sync(
@@ -139,6 +158,7 @@ def sync(
     *,
     client: AuthenticatedClient,
     json_body: SshAccountKey,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Any, Error, SshAccountKey]]:
     """Add a new SSH key
 
@@ -190,6 +210,8 @@ def sync(
     Args:
         selected_user (str):
         json_body (SshAccountKey):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Any, Error, SshAccountKey]]
@@ -199,6 +221,7 @@ def sync(
         selected_user=selected_user,
         client=client,
         json_body=json_body,
+        fields=fields,
     ).parsed
 
 
@@ -207,6 +230,7 @@ async def asyncio_detailed(
     *,
     client: AuthenticatedClient,
     json_body: SshAccountKey,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Any, Error, SshAccountKey]]:
     """Add a new SSH key
 
@@ -258,6 +282,8 @@ async def asyncio_detailed(
     Args:
         selected_user (str):
         json_body (SshAccountKey):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Any, Error, SshAccountKey]]
@@ -267,12 +293,12 @@ async def asyncio_detailed(
         selected_user=selected_user,
         client=client,
         json_body=json_body,
+        fields=fields,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 async def asyncio(
@@ -280,6 +306,7 @@ async def asyncio(
     *,
     client: AuthenticatedClient,
     json_body: SshAccountKey,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Any, Error, SshAccountKey]]:
     """Add a new SSH key
 
@@ -331,6 +358,8 @@ async def asyncio(
     Args:
         selected_user (str):
         json_body (SshAccountKey):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Any, Error, SshAccountKey]]
@@ -341,5 +370,6 @@ async def asyncio(
             selected_user=selected_user,
             client=client,
             json_body=json_body,
+            fields=fields,
         )
     ).parsed
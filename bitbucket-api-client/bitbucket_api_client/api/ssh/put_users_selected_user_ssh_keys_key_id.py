@@ -2,10 +2,11 @@ from typing import Any, Dict, Optional, Union, cast
 
 import httpx
 
+from ...cache import parse_cached
 from ...client import AuthenticatedClient
 from ...models.error import Error
 from ...models.ssh_account_key import SshAccountKey
-from ...types import Response
+from ...types import UNSET, Response, Unset
 
 
 def _get_kwargs(
@@ -14,6 +15,7 @@ def _get_kwargs(
     *,
     client: AuthenticatedClient,
     json_body: SshAccountKey,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Dict[str, Any]:
     url = "{}/users/{selected_user}/ssh-keys/{key_id}".format(
         client.base_url, selected_user=selected_user, key_id=key_id
@@ -24,41 +26,55 @@ def _get_kwargs(
 
     json_json_body = json_body.to_dict()
 
+    headers["Content-Type"] = "application/json"
+
+    params: Dict[str, Any] = {}
+    params["fields"] = fields
+
+    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+
     return {
         "method": "put",
         "url": url,
         "headers": headers,
         "cookies": cookies,
         "timeout": client.get_timeout(),
-        "json": json_json_body,
+        "params": params,
+        "content": client.json_codec.dumps(json_json_body),
     }
 
 
-def _parse_response(*, response: httpx.Response) -> Optional[Union[Any, Error, SshAccountKey]]:
+def _parse_response(
+    *, client: AuthenticatedClient, response: httpx.Response
+) -> Optional[Union[Any, Error, SshAccountKey]]:
     if response.status_code == 200:
-        response_200 = SshAccountKey.from_dict(response.json())
+        response_200 = SshAccountKey.from_dict(client.json_codec.loads(response.content))
 
         return response_200
     if response.status_code == 400:
-        response_400 = Error.from_dict(response.json())
+        response_400 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_400
     if response.status_code == 403:
         response_403 = cast(Any, None)
         return response_403
     if response.status_code == 404:
-        response_404 = Error.from_dict(response.json())
+        response_404 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_404
     return None
 
 
-def _build_response(*, response: httpx.Response) -> Response[Union[Any, Error, SshAccountKey]]:
+def _build_response(
+    *, client: AuthenticatedClient, response: httpx.Response
+) -> Response[Union[Any, Error, SshAccountKey]]:
     return Response(
         status_code=response.status_code,
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(response=response),
+        parse=lambda: parse_cached(_parse_response, client, response),
+        lazy=client.lazy_parsing,
+        keep_content=client.keep_content,
     )
 
 
@@ -68,6 +84,7 @@ def sync_detailed(
     *,
     client: AuthenticatedClient,
     json_body: SshAccountKey,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Any, Error, SshAccountKey]]:
     """Update a SSH key
 
@@ -123,6 +140,8 @@ def sync_detailed(
         selected_user (str):
         key_id (str):
         json_body (SshAccountKey):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Any, Error, SshAccountKey]]
@@ -133,14 +152,14 @@ def sync_detailed(
         key_id=key_id,
         client=client,
         json_body=json_body,
+        fields=fields,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 def sync(
@@ -149,6 +168,7 @@ def sync(
     *,
     client: AuthenticatedClient,
     json_body: SshAccountKey,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Any, Error, SshAccountKey]]:
     """Update a SSH key
 
@@ -204,6 +224,8 @@ def sync(
         selected_user (str):
         key_id (str):
         json_body (SshAccountKey):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Any, Error, SshAccountKey]]
@@ -214,6 +236,7 @@ def sync(
         key_id=key_id,
         client=client,
         json_body=json_body,
+        fields=fields,
     ).parsed
 
 
@@ -223,6 +246,7 @@ async def asyncio_detailed(
     *,
     client: AuthenticatedClient,
     json_body: SshAccountKey,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Any, Error, SshAccountKey]]:
     """Update a SSH key
 
@@ -278,6 +302,8 @@ async def asyncio_detailed(
         selected_user (str):
         key_id (str):
         json_body (SshAccountKey):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Any, Error, SshAccountKey]]
@@ -288,12 +314,12 @@ async def asyncio_detailed(
         key_id=key_id,
         client=client,
         json_body=json_body,
+        fields=fields,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 async def asyncio(
@@ -302,6 +328,7 @@ async def asyncio(
     *,
     client: AuthenticatedClient,
     json_body: SshAccountKey,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Any, Error, SshAccountKey]]:
     """Update a SSH key
 
@@ -357,6 +384,8 @@ async def asyncio(
         selected_user (str):
         key_id (str):
         json_body (SshAccountKey):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Any, Error, SshAccountKey]]
@@ -368,5 +397,6 @@ async def asyncio(
             key_id=key_id,
             client=client,
             json_body=json_body,
+            fields=fields,
         )
     ).parsed
@@ -2,50 +2,64 @@ from typing import Any, Dict, Optional, Union
 
 import httpx
 
+from ...cache import parse_cached
 from ...client import AuthenticatedClient
 from ...models.error import Error
 from ...models.get_hook_events_subject_type_subject_type import GetHookEventsSubjectTypeSubjectType
 from ...models.paginated_hook_events import PaginatedHookEvents
-from ...types import Response
+from ...types import UNSET, Response, Unset
 
 
 def _get_kwargs(
     subject_type: GetHookEventsSubjectTypeSubjectType,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Dict[str, Any]:
     url = "{}/hook_events/{subject_type}".format(client.base_url, subject_type=subject_type)
 
     headers: Dict[str, str] = client.get_headers()
     cookies: Dict[str, Any] = client.get_cookies()
 
+    params: Dict[str, Any] = {}
+    params["fields"] = fields
+
+    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+
     return {
         "method": "get",
         "url": url,
         "headers": headers,
         "cookies": cookies,
         "timeout": client.get_timeout(),
+        "params": params,
     }
 
 
-def _parse_response(*, response: httpx.Response) -> Optional[Union[Error, PaginatedHookEvents]]:
+def _parse_response(
+    *, client: AuthenticatedClient, response: httpx.Response
+) -> Optional[Union[Error, PaginatedHookEvents]]:
     if response.status_code == 200:
-        response_200 = PaginatedHookEvents.from_dict(response.json())
+        response_200 = PaginatedHookEvents.from_dict(client.json_codec.loads(response.content))
 
         return response_200
     if response.status_code == 404:
-        response_404 = Error.from_dict(response.json())
+        response_404 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_404
     return None
 
 
-def _build_response(*, response: httpx.Response) -> Response[Union[Error, PaginatedHookEvents]]:
+def _build_response(
+    *, client: AuthenticatedClient, response: httpx.Response
+) -> Response[Union[Error, PaginatedHookEvents]]:
     return Response(
         status_code=response.status_code,
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(response=response),
+        parse=lambda: parse_cached(_parse_response, client, response),
+        lazy=client.lazy_parsing,
+        keep_content=client.keep_content,
     )
 
 
@@ -53,6 +67,7 @@ def sync_detailed(
     subject_type: GetHookEventsSubjectTypeSubjectType,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Error, PaginatedHookEvents]]:
     """List subscribable webhook types
 
@@ -107,6 +122,8 @@ def sync_detailed(
 
     Args:
         subject_type (GetHookEventsSubjectTypeSubjectType):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, PaginatedHookEvents]]
@@ -115,20 +132,21 @@ def sync_detailed(
     kwargs = _get_kwargs(
         subject_type=subject_type,
         client=client,
+        fields=fields,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 def sync(
     subject_type: GetHookEventsSubjectTypeSubjectType,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Error, PaginatedHookEvents]]:
     """List subscribable webhook types
 
@@ -183,6 +201,8 @@ def sync(
 
     Args:
         subject_type (GetHookEventsSubjectTypeSubjectType):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, PaginatedHookEvents]]
@@ -191,6 +211,7 @@ def sync(
     return sync_detailed(
         subject_type=subject_type,
         client=client,
+        fields=fields,
     ).parsed
 
 
@@ -198,6 +219,7 @@ async def asyncio_detailed(
     subject_type: GetHookEventsSubjectTypeSubjectType,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Error, PaginatedHookEvents]]:
     """List subscribable webhook types
 
@@ -252,6 +274,8 @@ async def asyncio_detailed(
 
     Args:
         subject_type (GetHookEventsSubjectTypeSubjectType):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, PaginatedHookEvents]]
@@ -260,18 +284,19 @@ async def asyncio_detailed(
     kwargs = _get_kwargs(
         subject_type=subject_type,
         client=client,
+        fields=fields,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 async def asyncio(
     subject_type: GetHookEventsSubjectTypeSubjectType,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Error, PaginatedHookEvents]]:
     """List subscribable webhook types
 
@@ -326,6 +351,8 @@ async def asyncio(
 
     Args:
         subject_type (GetHookEventsSubjectTypeSubjectType):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, PaginatedHookEvents]]
@@ -335,5 +362,6 @@ async def asyncio(
         await asyncio_detailed(
             subject_type=subject_type,
             client=client,
+            fields=fields,
         )
     ).parsed
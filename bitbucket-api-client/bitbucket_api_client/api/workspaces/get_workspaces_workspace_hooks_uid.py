@@ -2,10 +2,11 @@ from typing import Any, Dict, Optional, Union
 
 import httpx
 
+from ...cache import parse_cached
 from ...client import AuthenticatedClient
 from ...models.error import Error
 from ...models.webhook_subscription import WebhookSubscription
-from ...types import Response
+from ...types import UNSET, Response, Unset
 
 
 def _get_kwargs(
@@ -13,39 +14,52 @@ def _get_kwargs(
     uid: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Dict[str, Any]:
     url = "{}/workspaces/{workspace}/hooks/{uid}".format(client.base_url, workspace=workspace, uid=uid)
 
     headers: Dict[str, str] = client.get_headers()
     cookies: Dict[str, Any] = client.get_cookies()
 
+    params: Dict[str, Any] = {}
+    params["fields"] = fields
+
+    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+
     return {
         "method": "get",
         "url": url,
         "headers": headers,
         "cookies": cookies,
         "timeout": client.get_timeout(),
+        "params": params,
     }
 
 
-def _parse_response(*, response: httpx.Response) -> Optional[Union[Error, WebhookSubscription]]:
+def _parse_response(
+    *, client: AuthenticatedClient, response: httpx.Response
+) -> Optional[Union[Error, WebhookSubscription]]:
     if response.status_code == 200:
-        response_200 = WebhookSubscription.from_dict(response.json())
+        response_200 = WebhookSubscription.from_dict(client.json_codec.loads(response.content))
 
         return response_200
     if response.status_code == 404:
-        response_404 = Error.from_dict(response.json())
+        response_404 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_404
     return None
 
 
-def _build_response(*, response: httpx.Response) -> Response[Union[Error, WebhookSubscription]]:
+def _build_response(
+    *, client: AuthenticatedClient, response: httpx.Response
+) -> Response[Union[Error, WebhookSubscription]]:
     return Response(
         status_code=response.status_code,
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(response=response),
+        parse=lambda: parse_cached(_parse_response, client, response),
+        lazy=client.lazy_parsing,
+        keep_content=client.keep_content,
     )
 
 
@@ -54,6 +68,7 @@ def sync_detailed(
     uid: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Error, WebhookSubscription]]:
     """Get a webhook for a workspace
 
@@ -63,6 +78,8 @@ def sync_detailed(
     Args:
         workspace (str):
         uid (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, WebhookSubscription]]
@@ -72,14 +89,14 @@ def sync_detailed(
         workspace=workspace,
         uid=uid,
         client=client,
+        fields=fields,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 def sync(
@@ -87,6 +104,7 @@ def sync(
     uid: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Error, WebhookSubscription]]:
     """Get a webhook for a workspace
 
@@ -96,6 +114,8 @@ def sync(
     Args:
         workspace (str):
         uid (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, WebhookSubscription]]
@@ -105,6 +125,7 @@ def sync(
         workspace=workspace,
         uid=uid,
         client=client,
+        fields=fields,
     ).parsed
 
 
@@ -113,6 +134,7 @@ async def asyncio_detailed(
     uid: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Union[Error, WebhookSubscription]]:
     """Get a webhook for a workspace
 
@@ -122,6 +144,8 @@ async def asyncio_detailed(
     Args:
         workspace (str):
         uid (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, WebhookSubscription]]
@@ -131,12 +155,12 @@ async def asyncio_detailed(
         workspace=workspace,
         uid=uid,
         client=client,
+        fields=fields,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 async def asyncio(
@@ -144,6 +168,7 @@ async def asyncio(
     uid: str,
     *,
     client: AuthenticatedClient,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Union[Error, WebhookSubscription]]:
     """Get a webhook for a workspace
 
@@ -153,6 +178,8 @@ async def asyncio(
     Args:
         workspace (str):
         uid (str):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Union[Error, WebhookSubscription]]
@@ -163,5 +190,6 @@ async def asyncio(
             workspace=workspace,
             uid=uid,
             client=client,
+            fields=fields,
         )
     ).parsed
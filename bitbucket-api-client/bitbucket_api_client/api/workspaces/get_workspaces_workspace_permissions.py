@@ -2,6 +2,7 @@ from typing import Any, Dict, Optional, Union
 
 import httpx
 
+from ...cache import parse_cached
 from ...client import AuthenticatedClient
 from ...models.error import Error
 from ...types import UNSET, Response, Unset
@@ -12,6 +13,7 @@ def _get_kwargs(
     *,
     client: AuthenticatedClient,
     q: Union[Unset, None, str] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Dict[str, Any]:
     url = "{}/workspaces/{workspace}/permissions".format(client.base_url, workspace=workspace)
 
@@ -21,6 +23,8 @@ def _get_kwargs(
     params: Dict[str, Any] = {}
     params["q"] = q
 
+    params["fields"] = fields
+
     params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
 
     return {
@@ -33,20 +37,22 @@ def _get_kwargs(
     }
 
 
-def _parse_response(*, response: httpx.Response) -> Optional[Error]:
+def _parse_response(*, client: AuthenticatedClient, response: httpx.Response) -> Optional[Error]:
     if response.status_code == 401:
-        response_401 = Error.from_dict(response.json())
+        response_401 = Error.from_dict(client.json_codec.loads(response.content))
 
         return response_401
     return None
 
 
-def _build_response(*, response: httpx.Response) -> Response[Error]:
+def _build_response(*, client: AuthenticatedClient, response: httpx.Response) -> Response[Error]:
     return Response(
         status_code=response.status_code,
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(response=response),
+        parse=lambda: parse_cached(_parse_response, client, response),
+        lazy=client.lazy_parsing,
+        keep_content=client.keep_content,
     )
 
 
@@ -55,6 +61,7 @@ def sync_detailed(
     *,
     client: AuthenticatedClient,
     q: Union[Unset, None, str] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Error]:
     """List user permissions in a workspace
 
@@ -121,6 +128,8 @@ def sync_detailed(
     Args:
         workspace (str):
         q (Union[Unset, None, str]):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Error]
@@ -130,14 +139,14 @@ def sync_detailed(
         workspace=workspace,
         client=client,
         q=q,
+        fields=fields,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 def sync(
@@ -145,6 +154,7 @@ def sync(
     *,
     client: AuthenticatedClient,
     q: Union[Unset, None, str] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Error]:
     """List user permissions in a workspace
 
@@ -211,6 +221,8 @@ def sync(
     Args:
         workspace (str):
         q (Union[Unset, None, str]):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Error]
@@ -220,6 +232,7 @@ def sync(
         workspace=workspace,
         client=client,
         q=q,
+        fields=fields,
     ).parsed
 
 
@@ -228,6 +241,7 @@ async def asyncio_detailed(
     *,
     client: AuthenticatedClient,
     q: Union[Unset, None, str] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Response[Error]:
     """List user permissions in a workspace
 
@@ -294,6 +308,8 @@ async def asyncio_detailed(
     Args:
         workspace (str):
         q (Union[Unset, None, str]):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Error]
@@ -303,12 +319,12 @@ async def asyncio_detailed(
         workspace=workspace,
         client=client,
         q=q,
+        fields=fields,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response)
 
 
 async def asyncio(
@@ -316,6 +332,7 @@ async def asyncio(
     *,
     client: AuthenticatedClient,
     q: Union[Unset, None, str] = UNSET,
+    fields: Union[Unset, None, str] = UNSET,
 ) -> Optional[Error]:
     """List user permissions in a workspace
 
@@ -382,6 +399,8 @@ async def asyncio(
     Args:
         workspace (str):
         q (Union[Unset, None, str]):
+        fields (Union[Unset, None, str]): Partial response projection: a comma separated list of fields to add
+            (``+field``) to or remove (``-field``) from the response, e.g. ``-values.links,-values.owner``.
 
     Returns:
         Response[Error]
@@ -392,5 +411,6 @@ async def asyncio(
             workspace=workspace,
             client=client,
             q=q,
+            fields=fields,
         )
     ).parsed
@@ -0,0 +1,375 @@
+""" Contains the conditional GET cache used by a Client """
+import abc
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+import attr
+import httpx
+
+_INVALIDATING_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+# the extension of the responses served or stored by a cache transport, holding their CachedResponse
+_CACHED_RESPONSE_EXTENSION = "bitbucket_api_client.cached_response"
+# the stored responses are named after the SHA-256 of their key
+_DISK_NAME_LENGTH = 64
+
+T = TypeVar("T")
+
+
+@attr.s(auto_attribs=True)
+class CachedResponse:
+    """A response stored with the validators used to revalidate it
+
+    Attributes:
+        status_code: The status code of the stored response
+        headers: The raw headers of the stored response
+        content: The body exactly as received, before any content decoding
+        parsed: The models parsed from ``content`` by each endpoint's parser, reused by every response served from this
+            one while it stays in memory
+    """
+
+    status_code: int
+    headers: List[Tuple[str, str]]
+    content: bytes
+    parsed: Dict[Callable[..., Any], Any] = attr.ib(factory=dict, repr=False, eq=False)
+
+    @property
+    def etag(self) -> Optional[str]:
+        return self._get_header("etag")
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        return self._get_header("last-modified")
+
+    def _get_header(self, name: str) -> Optional[str]:
+        for key, value in self.headers:
+            if key.lower() == name:
+                return value
+        return None
+
+    def to_response(self, request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            status_code=self.status_code,
+            headers=self.headers,
+            stream=httpx.ByteStream(self.content),
+            request=request,
+            extensions={_CACHED_RESPONSE_EXTENSION: self},
+        )
+
+
+def parse_cached(parse: Callable[..., Optional[T]], client: Any, response: httpx.Response) -> Optional[T]:
+    """Parse ``response`` with an endpoint's ``_parse_response``, reusing the models of the cached response it is from
+
+    The models parsed from a cached response are shared by every call it serves, so they must not be modified.
+    """
+    entry = response.extensions.get(_CACHED_RESPONSE_EXTENSION)
+    if entry is None:
+        return parse(client=client, response=response)
+    try:
+        return entry.parsed[parse]
+    except KeyError:
+        pass
+    parsed = entry.parsed[parse] = parse(client=client, response=response)
+    return parsed
+
+
+class ResponseCache(abc.ABC):
+    """The interface of the stores used by ``CacheTransport``, which must be safe to use from several threads"""
+
+    @abc.abstractmethod
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Get the response stored under ``key``, None if there is none"""
+
+    @abc.abstractmethod
+    def set(self, key: str, value: CachedResponse) -> None:
+        """Store ``value`` under ``key``, replacing any response stored there"""
+
+    @abc.abstractmethod
+    def delete(self, key: str) -> None:
+        """Drop the response stored under ``key``, if any"""
+
+
+class DiskCache(ResponseCache):
+    """Stores responses as files in ``directory``, so that they survive the process
+
+    The least recently used responses are deleted beyond the size limits. Which were used last is told by the
+    modification time of their files, touched on each read, so that the order survives the process too.
+
+    Attributes:
+        directory: The directory of the stored responses, created if needed
+        max_entries: The maximum number of responses stored
+        max_bytes: The maximum total size of the bodies stored
+    """
+
+    def __init__(self, directory: str, max_entries: int = 16 * 1024, max_bytes: int = 1024 * 1024 * 1024) -> None:
+        self.directory = directory
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        # the size of each stored file by name, least recently used first
+        self._files: "OrderedDict[str, int]" = OrderedDict()
+        self._size = 0
+        stored = []
+        for entry in os.scandir(directory):
+            if len(entry.name) == _DISK_NAME_LENGTH and entry.is_file():
+                stat = entry.stat()
+                stored.append((stat.st_mtime, entry.name, stat.st_size))
+        for _, name, size in sorted(stored):
+            self._files[name] = size
+            self._size += size
+        with self._lock:
+            self._evict()
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    def _name(self, key: str) -> str:
+        return hashlib.sha256(key.encode()).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, self._name(key))
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as file:
+                meta = json.loads(file.readline())
+                content = file.read()
+        except (OSError, ValueError):
+            return None
+        name = self._name(key)
+        with self._lock:
+            if name in self._files:
+                self._files.move_to_end(name)
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        return CachedResponse(
+            status_code=meta["status_code"],
+            headers=[(name, value) for name, value in meta["headers"]],
+            content=content,
+        )
+
+    def set(self, key: str, value: CachedResponse) -> None:
+        if len(value.content) > self.max_bytes:
+            self.delete(key)
+            return
+        meta = json.dumps({"status_code": value.status_code, "headers": value.headers}).encode()
+        fd, temp_path = tempfile.mkstemp(dir=self.directory)
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(meta + b"\n")
+                file.write(value.content)
+                size = file.tell()
+            os.replace(temp_path, self._path(key))
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+        with self._lock:
+            self._forget(self._name(key))
+            self._files[self._name(key)] = size
+            self._size += size
+            self._evict()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._forget(self._name(key))
+        try:
+            os.unlink(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def _forget(self, name: str) -> None:
+        self._size -= self._files.pop(name, 0)
+
+    def _evict(self) -> None:
+        while len(self._files) > self.max_entries or self._size > self.max_bytes:
+            name, size = self._files.popitem(last=False)
+            self._size -= size
+            # another process sharing the directory may have deleted it already
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(os.path.join(self.directory, name))
+
+
+class LRUCache(ResponseCache):
+    """Keeps the most recently used responses in memory, evicting the least recently used beyond the size limits
+
+    Attributes:
+        max_entries: The maximum number of responses kept in memory
+        max_bytes: The maximum total size of the bodies kept in memory
+        backend: An optional second tier (e.g. a ``DiskCache``) which every response is written through to, and which
+            is read from when a response has been evicted from memory
+    """
+
+    def __init__(
+        self, max_entries: int = 1024, max_bytes: int = 64 * 1024 * 1024, backend: Optional[ResponseCache] = None
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.backend = backend
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                return value
+        if self.backend is None:
+            return None
+        value = self.backend.get(key)
+        if value is not None:
+            self._store(key, value)
+        return value
+
+    def set(self, key: str, value: CachedResponse) -> None:
+        self._store(key, value)
+        if self.backend is not None:
+            self.backend.set(key, value)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._pop(key)
+        if self.backend is not None:
+            self.backend.delete(key)
+
+    def _store(self, key: str, value: CachedResponse) -> None:
+        with self._lock:
+            self._pop(key)
+            if len(value.content) > self.max_bytes:
+                return
+            self._entries[key] = value
+            self._size += len(value.content)
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted.content)
+
+    def _pop(self, key: str) -> None:
+        value = self._entries.pop(key, None)
+        if value is not None:
+            self._size -= len(value.content)
+
+
+def _cache_key(request: httpx.Request) -> str:
+    # responses depend on who is asking, so never share them between credentials
+    authorization = request.headers.get("Authorization", "")
+    return f"{request.url}\0{hashlib.sha256(authorization.encode()).hexdigest()}"
+
+
+class _CachePlan:
+    """What ``CacheTransport`` does around a single request"""
+
+    def __init__(self, cache: ResponseCache, request: httpx.Request) -> None:
+        self.cache = cache
+        self.request = request
+        self.key = _cache_key(request)
+        self.cacheable = request.method == "GET" and not (
+            "If-None-Match" in request.headers
+            or "If-Modified-Since" in request.headers
+            or "Range" in request.headers
+            or "no-store" in request.headers.get("Cache-Control", "")
+        )
+        self.entry: Optional[CachedResponse] = None
+        if request.method in _INVALIDATING_METHODS:
+            cache.delete(self.key)
+        elif self.cacheable:
+            self.entry = cache.get(self.key)
+            if self.entry is not None:
+                if self.entry.etag is not None:
+                    request.headers["If-None-Match"] = self.entry.etag
+                if self.entry.last_modified is not None:
+                    request.headers["If-Modified-Since"] = self.entry.last_modified
+
+    def is_not_modified(self, response: httpx.Response) -> bool:
+        return self.entry is not None and response.status_code == 304
+
+    def should_store(self, response: httpx.Response) -> bool:
+        if not self.cacheable or response.status_code != 200:
+            return False
+        if "no-store" in response.headers.get("Cache-Control", ""):
+            return False
+        return "ETag" in response.headers or "Last-Modified" in response.headers
+
+    def store(self, response: httpx.Response, content: bytes) -> httpx.Response:
+        entry = CachedResponse(
+            status_code=response.status_code, headers=response.headers.multi_items(), content=content
+        )
+        self.cache.set(self.key, entry)
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=httpx.ByteStream(content),
+            extensions={**response.extensions, _CACHED_RESPONSE_EXTENSION: entry},
+        )
+
+
+class CacheTransport(httpx.BaseTransport):
+    """Revalidates GET requests through ``transport`` against the responses stored in ``cache``
+
+    Requests for a stored response are sent with ``If-None-Match`` / ``If-Modified-Since``, and a ``304 Not Modified``
+    is answered with the stored response. Any POST, PUT, PATCH or DELETE to a URL drops its stored response.
+    """
+
+    def __init__(self, transport: httpx.BaseTransport, cache: ResponseCache) -> None:
+        self._transport = transport
+        self._cache = cache
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        plan = _CachePlan(self._cache, request)
+        response = self._transport.handle_request(request)
+        if plan.is_not_modified(response):
+            response.close()
+            assert plan.entry is not None
+            return plan.entry.to_response(request)
+        if plan.should_store(response):
+            try:
+                assert isinstance(response.stream, httpx.SyncByteStream)
+                content = b"".join(response.stream)
+            finally:
+                response.close()
+            return plan.store(response, content)
+        return response
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncCacheTransport(httpx.AsyncBaseTransport):
+    """Revalidates GET requests through ``transport`` against the responses stored in ``cache``
+
+    Requests for a stored response are sent with ``If-None-Match`` / ``If-Modified-Since``, and a ``304 Not Modified``
+    is answered with the stored response. Any POST, PUT, PATCH or DELETE to a URL drops its stored response.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, cache: ResponseCache) -> None:
+        self._transport = transport
+        self._cache = cache
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        plan = _CachePlan(self._cache, request)
+        response = await self._transport.handle_async_request(request)
+        if plan.is_not_modified(response):
+            await response.aclose()
+            assert plan.entry is not None
+            return plan.entry.to_response(request)
+        if plan.should_store(response):
+            try:
+                assert isinstance(response.stream, httpx.AsyncByteStream)
+                content = b"".join([chunk async for chunk in response.stream])
+            finally:
+                await response.aclose()
+            return plan.store(response, content)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
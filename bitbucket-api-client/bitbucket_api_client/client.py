@@ -1,18 +1,83 @@
+import asyncio
+import contextlib
 import ssl
-from typing import Dict, Union
+import threading
+from typing import Any, Dict, List, Optional, Union
 
 import attr
+import httpx
+
+from .cache import AsyncCacheTransport, CacheTransport, ResponseCache
+from .codec import JSONCodec, get_default_codec
+from .rate_limit import AsyncRateLimitTransport, RateLimiter, RateLimitTransport
+from .retry import AsyncRetryTransport, RetryPolicy, RetryTransport
+from .transport import AsyncConcurrencyLimitTransport, ConcurrencyLimitTransport
+
+
+def _default_limits() -> httpx.Limits:
+    return httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0)
 
 
 @attr.s(auto_attribs=True)
 class Client:
-    """A class for keeping track of data related to the API"""
+    """A class for keeping track of data related to the API
+
+    The client owns a long-lived ``httpx.Client`` and ``httpx.AsyncClient``, created on first use and shared by every
+    endpoint module, so connections to the API are kept alive and reused between calls instead of paying DNS, TCP and
+    TLS setup on each request. Use the client as a context manager (``with`` / ``async with``) or call ``close`` /
+    ``aclose`` to release the pooled connections. The copies made by the ``with_*`` methods share the pools of this
+    client without owning them: closing a copy leaves the pools open, and only closing this client releases them.
+
+    Attributes:
+        base_url: The base URL for the API, all requests are made to a relative path to this URL
+        cookies: A dictionary of cookies to be sent with every request
+        headers: A dictionary of headers to be sent with every request
+        timeout: The maximum amount of a time in seconds a request can take
+        verify_ssl: Whether or not to verify the SSL certificate of the API server
+        limits: Connection pool limits (maximum connections, keep-alive connections and keep-alive expiry)
+        http2: Negotiate HTTP/2 with the API so that concurrent requests are multiplexed over a few connections
+            instead of opening one connection per request. Requires the ``h2`` package (the ``http2`` extra).
+        max_concurrent_streams: The maximum number of requests in flight at once through this client, across all
+            connections. Useful with ``http2`` to raise concurrency without exceeding the server's stream limit.
+        rate_limiter: A token bucket pacing every request made through this client (and the copies made by its
+            ``with_*`` methods) to the API's rate limit, shared between threads and asyncio tasks
+        retry_policy: Retries requests which failed with a transient error or status code, see ``RetryPolicy``
+        response_cache: Stores GET responses carrying an ``ETag`` or ``Last-Modified`` validator and revalidates them
+            with conditional requests, serving the stored response on ``304 Not Modified`` (e.g. an ``LRUCache``)
+        json_codec: Encodes the JSON request bodies and decodes the JSON responses of every endpoint, by default with
+            orjson when it is installed and the standard library otherwise
+        lazy_parsing: Build the ``parsed`` models of a ``Response`` on first access instead of when the response is
+            received, for callers which mostly look at ``status_code`` or forward ``content`` untouched
+        keep_content: Whether a ``Response`` keeps its raw ``content`` once its ``parsed`` models are built (a response
+            parsed to None always keeps it)
+        httpx_args: Additional keyword arguments passed to the ``httpx.Client`` / ``httpx.AsyncClient`` constructors.
+            A ``transport`` given here replaces the pooled HTTP transport but is still wrapped by this client's own.
+    """
 
     base_url: str
     cookies: Dict[str, str] = attr.ib(factory=dict, kw_only=True)
     headers: Dict[str, str] = attr.ib(factory=dict, kw_only=True)
     timeout: float = attr.ib(5.0, kw_only=True)
     verify_ssl: Union[str, bool, ssl.SSLContext] = attr.ib(True, kw_only=True)
+    limits: httpx.Limits = attr.ib(factory=_default_limits, kw_only=True)
+    http2: bool = attr.ib(False, kw_only=True)
+    max_concurrent_streams: Optional[int] = attr.ib(None, kw_only=True)
+    rate_limiter: Optional[RateLimiter] = attr.ib(None, kw_only=True)
+    retry_policy: Optional[RetryPolicy] = attr.ib(None, kw_only=True)
+    response_cache: Optional[ResponseCache] = attr.ib(None, kw_only=True)
+    json_codec: JSONCodec = attr.ib(factory=get_default_codec, kw_only=True)
+    lazy_parsing: bool = attr.ib(False, kw_only=True)
+    keep_content: bool = attr.ib(True, kw_only=True)
+    httpx_args: Dict[str, Any] = attr.ib(factory=dict, kw_only=True)
+    _client: Optional[httpx.Client] = attr.ib(default=None, init=False, repr=False, eq=False)
+    _async_client: Optional[httpx.AsyncClient] = attr.ib(default=None, init=False, repr=False, eq=False)
+    _async_client_loop: Optional[asyncio.AbstractEventLoop] = attr.ib(default=None, init=False, repr=False, eq=False)
+    # whether the pools were opened (or set) by this client rather than shared by the client it was copied from
+    _owns_client: bool = attr.ib(default=False, init=False, repr=False, eq=False)
+    _owns_async_client: bool = attr.ib(default=False, init=False, repr=False, eq=False)
+    # async clients replaced when the client moved to another event loop, closed by the next ``aclose``
+    _stale_async_clients: List[httpx.AsyncClient] = attr.ib(factory=list, init=False, repr=False, eq=False)
+    _lock: threading.Lock = attr.ib(factory=threading.Lock, init=False, repr=False, eq=False)
 
     def get_headers(self) -> Dict[str, str]:
         """Get headers to be used in all endpoints"""
@@ -20,21 +85,163 @@ class Client:
 
     def with_headers(self, headers: Dict[str, str]) -> "Client":
         """Get a new client matching this one with additional headers"""
-        return attr.evolve(self, headers={**self.headers, **headers})
+        return self._evolve(headers={**self.headers, **headers})
 
     def get_cookies(self) -> Dict[str, str]:
         return {**self.cookies}
 
     def with_cookies(self, cookies: Dict[str, str]) -> "Client":
         """Get a new client matching this one with additional cookies"""
-        return attr.evolve(self, cookies={**self.cookies, **cookies})
+        return self._evolve(cookies={**self.cookies, **cookies})
 
     def get_timeout(self) -> float:
         return self.timeout
 
     def with_timeout(self, timeout: float) -> "Client":
         """Get a new client matching this one with a new timeout (in seconds)"""
-        return attr.evolve(self, timeout=timeout)
+        return self._evolve(timeout=timeout)
+
+    def _evolve(self, **changes: Any) -> "Client":
+        """Get a copy of this client with ``changes`` applied, sharing any connection pools already opened.
+
+        Headers, cookies and the timeout are sent per request, so copies made by the ``with_*`` methods can safely
+        reuse the same pooled connections. The copy does not own the pools it shares, so closing it leaves them open.
+        """
+        client = attr.evolve(self, **changes)
+        client._client = self._client
+        client._async_client = self._async_client
+        client._async_client_loop = self._async_client_loop
+        return client
+
+    def set_httpx_client(self, client: httpx.Client) -> "Client":
+        """Manually set the underlying ``httpx.Client``
+
+        **NOTE**: This will override any other settings on the client, including SSL verification and pool limits.
+        """
+        self._client = client
+        self._owns_client = True
+        return self
+
+    def get_httpx_client(self) -> httpx.Client:
+        """Get the underlying ``httpx.Client``, constructing a new one if not previously set"""
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    httpx_args = {**self.httpx_args}
+                    self._client = httpx.Client(
+                        transport=self._build_transport(httpx_args.pop("transport", None)),
+                        **httpx_args,
+                    )
+                    self._owns_client = True
+        return self._client
+
+    def set_async_httpx_client(self, async_client: httpx.AsyncClient) -> "Client":
+        """Manually set the underlying ``httpx.AsyncClient``
+
+        **NOTE**: This will override any other settings on the client, including SSL verification and pool limits.
+        """
+        self._async_client = async_client
+        self._async_client_loop = None
+        self._owns_async_client = True
+        return self
+
+    def get_async_httpx_client(self) -> httpx.AsyncClient:
+        """Get the underlying ``httpx.AsyncClient``, constructing a new one if not previously set
+
+        Pooled connections are bound to the event loop that opened them, so a new ``httpx.AsyncClient`` is built when
+        the client is used from a different event loop (e.g. across several ``asyncio.run`` calls). The one it
+        replaces is closed by the next ``aclose``.
+        """
+        loop = _get_running_loop()
+        if self._async_client is None or (self._async_client_loop is not None and self._async_client_loop is not loop):
+            if self._async_client is not None and self._owns_async_client:
+                self._stale_async_clients.append(self._async_client)
+            httpx_args = {**self.httpx_args}
+            self._async_client = httpx.AsyncClient(
+                transport=self._build_async_transport(httpx_args.pop("transport", None)),
+                **httpx_args,
+            )
+            self._async_client_loop = loop
+            self._owns_async_client = True
+        return self._async_client
+
+    def _build_transport(self, transport: Optional[httpx.BaseTransport] = None) -> httpx.BaseTransport:
+        """Wrap ``transport`` (a pooled ``httpx.HTTPTransport`` by default) in the transports enabled here"""
+        if transport is None:
+            transport = httpx.HTTPTransport(
+                verify=self.verify_ssl,
+                http2=self.http2,
+                limits=self.limits,
+            )
+        if self.max_concurrent_streams is not None:
+            transport = ConcurrencyLimitTransport(transport, self.max_concurrent_streams)
+        if self.rate_limiter is not None:
+            transport = RateLimitTransport(transport, self.rate_limiter)
+        if self.retry_policy is not None:
+            transport = RetryTransport(transport, self.retry_policy)
+        if self.response_cache is not None:
+            transport = CacheTransport(transport, self.response_cache)
+        return transport
+
+    def _build_async_transport(self, transport: Optional[httpx.AsyncBaseTransport] = None) -> httpx.AsyncBaseTransport:
+        """Wrap ``transport`` (a pooled ``httpx.AsyncHTTPTransport`` by default) in the transports enabled here"""
+        if transport is None:
+            transport = httpx.AsyncHTTPTransport(
+                verify=self.verify_ssl,
+                http2=self.http2,
+                limits=self.limits,
+            )
+        if self.max_concurrent_streams is not None:
+            transport = AsyncConcurrencyLimitTransport(transport, self.max_concurrent_streams)
+        if self.rate_limiter is not None:
+            transport = AsyncRateLimitTransport(transport, self.rate_limiter)
+        if self.retry_policy is not None:
+            transport = AsyncRetryTransport(transport, self.retry_policy)
+        if self.response_cache is not None:
+            transport = AsyncCacheTransport(transport, self.response_cache)
+        return transport
+
+    def close(self) -> None:
+        """Close the pooled ``httpx.Client`` if this client opened it, or just stop using it if it is shared"""
+        if self._client is not None and self._owns_client:
+            self._client.close()
+        self._client = None
+        self._owns_client = False
+
+    async def aclose(self) -> None:
+        """Close the pooled ``httpx.AsyncClient`` if this client opened it, or just stop using it if it is shared"""
+        while self._stale_async_clients:
+            # the connections of a closed event loop are released, though closing them reports the loop closed
+            with contextlib.suppress(RuntimeError):
+                await self._stale_async_clients.pop().aclose()
+        if self._async_client is not None and self._owns_async_client:
+            await self._async_client.aclose()
+        self._async_client = None
+        self._async_client_loop = None
+        self._owns_async_client = False
+
+    def __enter__(self) -> "Client":
+        """Open the pooled ``httpx.Client``, closing it again on exit"""
+        self.get_httpx_client()
+        return self
+
+    def __exit__(self, *args: Any, **kwargs: Any) -> None:
+        self.close()
+
+    async def __aenter__(self) -> "Client":
+        """Open the pooled ``httpx.AsyncClient``, closing it again on exit"""
+        self.get_async_httpx_client()
+        return self
+
+    async def __aexit__(self, *args: Any, **kwargs: Any) -> None:
+        await self.aclose()
+
+
+def _get_running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
 
 
 @attr.s(auto_attribs=True)
@@ -0,0 +1,42 @@
+""" Contains the JSON codecs used to encode request bodies and decode response bodies """
+import json
+from typing import Any
+
+
+class JSONCodec:
+    """Encodes and decodes JSON with the standard library
+
+    Subclass it and override ``dumps`` / ``loads`` to plug another JSON library into a Client.
+    """
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    def loads(self, content: bytes) -> Any:
+        return json.loads(content)
+
+
+class OrjsonCodec(JSONCodec):
+    """Encodes and decodes JSON with orjson, raising ImportError on creation when it is not installed"""
+
+    def __init__(self) -> None:
+        import orjson  # pylint: disable=import-outside-toplevel
+
+        self._orjson = orjson
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._orjson.dumps(obj)
+
+    def loads(self, content: bytes) -> Any:
+        return self._orjson.loads(content)
+
+
+def get_default_codec() -> JSONCodec:
+    """Get the fastest codec available: orjson when it is installed, the standard library otherwise"""
+    try:
+        return OrjsonCodec()
+    except ImportError:
+        return JSONCodec()
+
+
+__all__ = ["JSONCodec", "OrjsonCodec", "get_default_codec"]
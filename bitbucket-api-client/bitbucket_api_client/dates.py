@@ -0,0 +1,29 @@
+""" Contains the parser used by the models for the timestamps sent by the API """
+import datetime
+import functools
+import sys
+
+from dateutil.parser import isoparse
+
+__all__ = ["parse_datetime"]
+
+# before Python 3.11, fromisoformat only reads what isoformat writes: no "Z", and 3 or 6 fractional digits
+_FROMISOFORMAT_READS_Z = sys.version_info >= (3, 11)
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_datetime(value: str) -> datetime.datetime:
+    """Parse an ISO 8601 timestamp, such as ``2022-10-07T08:33:12.123456+00:00`` or ``2022-10-07T08:33:12Z``
+
+    The formats sent by Bitbucket are read with ``datetime.fromisoformat``, which is much faster than
+    ``dateutil.parser.isoparse``, the fallback for anything else. UTC offsets are returned as ``datetime.timezone``
+    instances. Results are cached, as polling pipelines, steps or deployments parses the same timestamps again and
+    again.
+    """
+    fast_value = value
+    if not _FROMISOFORMAT_READS_Z and value.endswith("Z"):
+        fast_value = value[:-1] + "+00:00"
+    try:
+        return datetime.datetime.fromisoformat(fast_value)
+    except ValueError:
+        return isoparse(value)
@@ -0,0 +1,388 @@
+""" Contains helpers which follow the logs of pipeline steps while they run, and collect those of failed steps """
+import asyncio
+import gzip
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Mapping, Optional, Tuple, Union
+
+import attr
+import httpx
+
+from .api.pipelines import (
+    get_pipeline_container_log,
+    get_pipeline_step_for_repository,
+    get_pipeline_step_log_for_repository,
+    get_pipeline_steps_for_repository,
+)
+from .client import Client
+from .errors import UnexpectedStatus
+from .models.pipeline_step import PipelineStep
+from .models.pipeline_step_state_completed import PipelineStepStateCompleted
+from .models.pipeline_step_state_completed_error import PipelineStepStateCompletedError
+from .models.pipeline_step_state_completed_failed import PipelineStepStateCompletedFailed
+from .pagination import aiterate, iterate
+from .streaming import DEFAULT_CHUNK_SIZE, _AtomicFile, _get_stream_kwargs
+from .types import Response, Unset
+
+_LOG_STATUSES = (200, 206, 404, 416)
+BUILD_CONTAINER = "build"
+_STEP_FIELDS = "-values.setup_commands,-values.script_commands,-values.image"
+_UNSAFE_CHARACTERS = re.compile(r"[^\w.-]+")
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class LogPolling:
+    """How often ``follow_step_log`` polls a running step for new log output
+
+    The log is polled again after ``min_interval`` seconds as long as it keeps growing. Each poll which finds nothing
+    new multiplies the delay by ``backoff``, up to ``max_interval``, so that idle steps (waiting on a service, a long
+    test without output...) cost few requests.
+
+    Attributes:
+        min_interval: The delay in seconds after a poll which found new output
+        max_interval: The maximum delay in seconds between two polls
+        backoff: The factor applied to the delay after each poll which found nothing new
+    """
+
+    min_interval: float = 1.0
+    max_interval: float = 30.0
+    backoff: float = 2.0
+
+    def next_interval(self, interval: float, received: int) -> float:
+        if received:
+            return self.min_interval
+        return min(self.max_interval, interval * self.backoff)
+
+
+def _is_completed(response: Response[Any]) -> bool:
+    if response.status_code != 200 or not isinstance(response.parsed, PipelineStep):
+        raise UnexpectedStatus(response.status_code, response.content)
+    return isinstance(response.parsed.state, PipelineStepStateCompleted)
+
+
+def _get_log_kwargs(args: Any, client: Client, offset: int) -> Dict[str, Any]:
+    request_kwargs = _get_stream_kwargs(get_pipeline_step_log_for_repository, args, client, {})
+    # offsets count bytes as stored, which a compressed transfer would not match
+    request_kwargs["headers"] = {**request_kwargs["headers"], "Accept-Encoding": "identity"}
+    if offset:
+        request_kwargs["headers"]["Range"] = f"bytes={offset}-"
+    return request_kwargs
+
+
+def _get_skipped(status_code: int, offset: int) -> Optional[int]:
+    """Get how many bytes at the start of a log response were already yielded, or None if it has no new bytes"""
+    if status_code == 206:
+        return 0
+    if status_code == 200:
+        # the whole log, sent by a server ignoring the Range header
+        return offset
+    # 404 before the step has written any log, 416 when nothing was written past the offset
+    return None
+
+
+def _skip(chunk: bytes, skipped: int) -> Tuple[bytes, int]:
+    """Drop the first ``skipped`` bytes of ``chunk``, returning the rest and the number of bytes still to drop"""
+    return chunk[skipped:], max(0, skipped - len(chunk))
+
+
+def follow_step_log(
+    workspace: str,
+    repo_slug: str,
+    pipeline_uuid: str,
+    step_uuid: str,
+    *,
+    client: Client,
+    offset: int = 0,
+    polling: LogPolling = LogPolling(),
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[bytes]:
+    """Yield the log of a pipeline step as it is written, until the step completes
+
+    The log is fetched with ``Range`` requests starting where the previous one ended, so each byte is downloaded once
+    however long the step runs. The state of the step is read before each poll: once it is completed, the log is
+    fetched one last time and the generator returns.
+
+    Args:
+        workspace: The workspace of the repository
+        repo_slug: The slug of the repository
+        pipeline_uuid: The UUID of the pipeline
+        step_uuid: The UUID of the step
+        client: The client used for every request
+        offset: The number of bytes of the log to skip, e.g. to resume following a log
+        polling: How often to poll the step while it runs
+        chunk_size: The maximum size in bytes of the chunks yielded
+
+    Raises:
+        UnexpectedStatus: If the step or its log is answered with an unexpected status
+
+    Yields:
+        The new bytes of the log
+    """
+    args = (workspace, repo_slug, pipeline_uuid, step_uuid)
+    http_client = client.get_httpx_client()
+    interval = polling.min_interval
+    while True:
+        completed = _is_completed(get_pipeline_step_for_repository.sync_detailed(*args, client=client, fields="state"))
+        received = 0
+        with http_client.stream(**_get_log_kwargs(args, client, offset)) as response:
+            if response.status_code not in _LOG_STATUSES:
+                raise UnexpectedStatus(response.status_code, response.read())
+            skipped = _get_skipped(response.status_code, offset)
+            if skipped is not None:
+                for chunk in response.iter_bytes(chunk_size):
+                    chunk, skipped = _skip(chunk, skipped)
+                    if chunk:
+                        received += len(chunk)
+                        offset += len(chunk)
+                        yield chunk
+        if completed:
+            return
+        interval = polling.next_interval(interval, received)
+        time.sleep(interval)
+
+
+async def afollow_step_log(
+    workspace: str,
+    repo_slug: str,
+    pipeline_uuid: str,
+    step_uuid: str,
+    *,
+    client: Client,
+    offset: int = 0,
+    polling: LogPolling = LogPolling(),
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> AsyncIterator[bytes]:
+    """Like ``follow_step_log`` but async"""
+    args = (workspace, repo_slug, pipeline_uuid, step_uuid)
+    http_client = client.get_async_httpx_client()
+    interval = polling.min_interval
+    while True:
+        step = await get_pipeline_step_for_repository.asyncio_detailed(*args, client=client, fields="state")
+        completed = _is_completed(step)
+        received = 0
+        async with http_client.stream(**_get_log_kwargs(args, client, offset)) as response:
+            if response.status_code not in _LOG_STATUSES:
+                raise UnexpectedStatus(response.status_code, await response.aread())
+            skipped = _get_skipped(response.status_code, offset)
+            if skipped is not None:
+                async for chunk in response.aiter_bytes(chunk_size):
+                    chunk, skipped = _skip(chunk, skipped)
+                    if chunk:
+                        received += len(chunk)
+                        offset += len(chunk)
+                        yield chunk
+        if completed:
+            return
+        interval = polling.next_interval(interval, received)
+        await asyncio.sleep(interval)
+
+
+@attr.s(auto_attribs=True)
+class CollectedLog:
+    """The log of a container of a failed step, as collected by ``collect_failed_logs``
+
+    Attributes:
+        step: The step
+        container: The name of the container
+        path: The path of the compressed log, None if the container has no log or it could not be downloaded
+        size: The size in bytes of the log before compression
+        error: The error which kept the log from being downloaded, an ``UnexpectedStatus`` or an ``httpx.HTTPError``
+    """
+
+    step: PipelineStep
+    container: str
+    path: Optional[str] = None
+    size: int = 0
+    error: Optional[Exception] = None
+
+
+def build_container_log(step: PipelineStep) -> Dict[str, str]:
+    """Get the log UUID of the build container of a step, which is the UUID of the step itself"""
+    return {BUILD_CONTAINER: str(step.uuid)}
+
+
+def _is_failed(step: PipelineStep) -> bool:
+    if not isinstance(step.state, PipelineStepStateCompleted):
+        return False
+    return isinstance(step.state.result, (PipelineStepStateCompletedFailed, PipelineStepStateCompletedError))
+
+
+def _get_log_path(directory: Union[str, "os.PathLike[str]"], number: int, step: PipelineStep, container: str) -> str:
+    name = step.additional_properties.get("name") or ("" if isinstance(step.uuid, Unset) else step.uuid)
+    name = _UNSAFE_CHARACTERS.sub("_", f"{number:02}-{name}-{container}").strip("_")
+    return os.path.join(directory, name + ".log.gz")
+
+
+def _get_collected(
+    steps: List[PipelineStep],
+    directory: Union[str, "os.PathLike[str]"],
+    containers: Callable[[PipelineStep], Mapping[str, str]],
+) -> List[Tuple[CollectedLog, str, str]]:
+    """Get the logs to collect, with the log UUID and the path of each"""
+    collected = []
+    for number, step in enumerate(steps, 1):
+        if _is_failed(step):
+            for container, log_uuid in containers(step).items():
+                path = _get_log_path(directory, number, step, container)
+                collected.append((CollectedLog(step, container), log_uuid, path))
+    return collected
+
+
+def _get_container_log_kwargs(
+    args: Tuple[str, ...], log: CollectedLog, log_uuid: str, client: Client
+) -> Dict[str, Any]:
+    return _get_stream_kwargs(get_pipeline_container_log, (*args, str(log.step.uuid), log_uuid), client, {})
+
+
+def _write_log(
+    args: Tuple[str, ...], log: CollectedLog, log_uuid: str, path: str, client: Client, compresslevel: int
+) -> None:
+    with client.get_httpx_client().stream(**_get_container_log_kwargs(args, log, log_uuid, client)) as response:
+        if response.status_code != 200:
+            # a container which never started has no log
+            if response.status_code != 404:
+                log.error = UnexpectedStatus(response.status_code, response.read())
+            return
+        with _AtomicFile(path) as file, gzip.GzipFile(
+            fileobj=file, mode="wb", compresslevel=compresslevel
+        ) as gzip_file:
+            for chunk in response.iter_bytes(DEFAULT_CHUNK_SIZE):
+                gzip_file.write(chunk)
+                log.size += len(chunk)
+    log.path = path
+
+
+async def _awrite_log(
+    args: Tuple[str, ...],
+    log: CollectedLog,
+    log_uuid: str,
+    path: str,
+    client: Client,
+    compresslevel: int,
+    semaphore: asyncio.Semaphore,
+) -> None:
+    http_client = client.get_async_httpx_client()
+    async with semaphore, http_client.stream(**_get_container_log_kwargs(args, log, log_uuid, client)) as response:
+        if response.status_code != 200:
+            if response.status_code != 404:
+                log.error = UnexpectedStatus(response.status_code, await response.aread())
+            return
+        with _AtomicFile(path) as file, gzip.GzipFile(
+            fileobj=file, mode="wb", compresslevel=compresslevel
+        ) as gzip_file:
+            async for chunk in response.aiter_bytes(DEFAULT_CHUNK_SIZE):
+                gzip_file.write(chunk)
+                log.size += len(chunk)
+    log.path = path
+
+
+def _download(
+    args: Tuple[str, ...], log: CollectedLog, log_uuid: str, path: str, client: Client, compresslevel: int
+) -> None:
+    try:
+        _write_log(args, log, log_uuid, path, client, compresslevel)
+    except httpx.HTTPError as error:
+        # the partial file is gone, and the logs of the other containers are still collected
+        log.error = error
+        log.size = 0
+
+
+async def _adownload(
+    args: Tuple[str, ...],
+    log: CollectedLog,
+    log_uuid: str,
+    path: str,
+    client: Client,
+    compresslevel: int,
+    semaphore: asyncio.Semaphore,
+) -> None:
+    try:
+        await _awrite_log(args, log, log_uuid, path, client, compresslevel, semaphore)
+    except httpx.HTTPError as error:
+        log.error = error
+        log.size = 0
+
+
+def collect_failed_logs(
+    workspace: str,
+    repo_slug: str,
+    pipeline_uuid: str,
+    *,
+    client: Client,
+    directory: Union[str, "os.PathLike[str]"],
+    containers: Callable[[PipelineStep], Mapping[str, str]] = build_container_log,
+    workers: int = 8,
+    compresslevel: int = 6,
+) -> List[CollectedLog]:
+    """Download the container logs of the failed steps of a pipeline, gzip-compressed, to ``directory``
+
+    The steps of the pipeline are listed once, and the logs of the containers of every step which failed or errored
+    are then downloaded concurrently, in up to ``workers`` threads. Each log is compressed as it streams to
+    ``<number>-<step name>-<container>.log.gz``, numbered in the order of the steps, so no log is ever held in
+    memory whole. A log which cannot be downloaded, whether for its status or for a transport error, is recorded in
+    its ``CollectedLog`` rather than raised.
+
+    Args:
+        workspace: The workspace of the repository
+        repo_slug: The slug of the repository
+        pipeline_uuid: The UUID of the pipeline
+        client: The client used for every request
+        directory: The existing directory the logs are written to
+        containers: Get the log UUID of each container of a step by container name; the build container only by
+            default, pass a function also returning the service containers to collect their logs too
+        workers: The maximum number of logs downloaded at once
+        compresslevel: The gzip compression level, from 1 (fastest) to 9 (smallest)
+
+    Raises:
+        UnexpectedStatus: If the steps of the pipeline are answered with an unexpected status
+
+    Returns:
+        The logs of the containers of the failed steps, in the order of the steps
+    """
+    args = (workspace, repo_slug, pipeline_uuid)
+    steps = list(iterate(get_pipeline_steps_for_repository, *args, client=client, fields=_STEP_FIELDS))
+    collected = _get_collected(steps, directory, containers)
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+        downloads = [
+            executor.submit(_download, args, log, log_uuid, path, client, compresslevel)
+            for log, log_uuid, path in collected
+        ]
+        for download in downloads:
+            download.result()
+    return [log for log, _, _ in collected]
+
+
+async def acollect_failed_logs(
+    workspace: str,
+    repo_slug: str,
+    pipeline_uuid: str,
+    *,
+    client: Client,
+    directory: Union[str, "os.PathLike[str]"],
+    containers: Callable[[PipelineStep], Mapping[str, str]] = build_container_log,
+    workers: int = 8,
+    compresslevel: int = 6,
+) -> List[CollectedLog]:
+    """Like ``collect_failed_logs`` but async (the logs are still compressed and written synchronously)"""
+    args = (workspace, repo_slug, pipeline_uuid)
+    pages = aiterate(get_pipeline_steps_for_repository, *args, client=client, fields=_STEP_FIELDS)
+    collected = _get_collected([step async for step in pages], directory, containers)
+    semaphore = asyncio.Semaphore(workers)
+    await asyncio.gather(
+        *(_adownload(args, log, log_uuid, path, client, compresslevel, semaphore) for log, log_uuid, path in collected)
+    )
+    return [log for log, _, _ in collected]
+
+
+__all__ = [
+    "BUILD_CONTAINER",
+    "CollectedLog",
+    "LogPolling",
+    "acollect_failed_logs",
+    "afollow_step_log",
+    "build_container_log",
+    "collect_failed_logs",
+    "follow_step_log",
+]
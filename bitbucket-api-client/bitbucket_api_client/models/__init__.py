@@ -1,204 +1,431 @@
 """ Contains all the data models used in inputs/outputs """
 
-from .account import Account
-from .account_links import AccountLinks
-from .app_user import AppUser
-from .application_property import ApplicationProperty
-from .application_property_attributes_item import ApplicationPropertyAttributesItem
-from .author import Author
-from .branching_model_settings import BranchingModelSettings
-from .branching_model_settings_branch_types_item import BranchingModelSettingsBranchTypesItem
-from .branching_model_settings_branch_types_item_kind import BranchingModelSettingsBranchTypesItemKind
-from .branching_model_settings_development import BranchingModelSettingsDevelopment
-from .branching_model_settings_links import BranchingModelSettingsLinks
-from .branching_model_settings_links_link import BranchingModelSettingsLinksLink
-from .branching_model_settings_production import BranchingModelSettingsProduction
-from .component import Component
-from .component_links import ComponentLinks
-from .component_links_link import ComponentLinksLink
-from .ddev_report import DdevReport
-from .deployment_environment import DeploymentEnvironment
-from .deployment_environment_lock import DeploymentEnvironmentLock
-from .deployment_state import DeploymentState
-from .deployment_state_completed import DeploymentStateCompleted
-from .deployment_state_completed_name import DeploymentStateCompletedName
-from .deployment_state_completed_status import DeploymentStateCompletedStatus
-from .deployment_state_completed_status_failed import DeploymentStateCompletedStatusFailed
-from .deployment_state_completed_status_failed_name import DeploymentStateCompletedStatusFailedName
-from .deployment_state_completed_status_stopped import DeploymentStateCompletedStatusStopped
-from .deployment_state_completed_status_stopped_name import DeploymentStateCompletedStatusStoppedName
-from .deployment_state_completed_status_successful import DeploymentStateCompletedStatusSuccessful
-from .deployment_state_completed_status_successful_name import DeploymentStateCompletedStatusSuccessfulName
-from .deployment_state_in_progress import DeploymentStateInProgress
-from .deployment_state_in_progress_name import DeploymentStateInProgressName
-from .deployment_state_undeployed import DeploymentStateUndeployed
-from .deployment_state_undeployed_name import DeploymentStateUndeployedName
-from .deployment_variable import DeploymentVariable
-from .deployments_ddev_deployment_environment import DeploymentsDdevDeploymentEnvironment
-from .deployments_ddev_deployment_environment_lock import DeploymentsDdevDeploymentEnvironmentLock
-from .deployments_stg_west_deployment_environment import DeploymentsStgWestDeploymentEnvironment
-from .deployments_stg_west_deployment_environment_lock import DeploymentsStgWestDeploymentEnvironmentLock
-from .error import Error
-from .error_error import ErrorError
-from .error_error_data import ErrorErrorData
-from .export_options import ExportOptions
-from .get_hook_events_subject_type_subject_type import GetHookEventsSubjectTypeSubjectType
-from .get_pullrequests_selected_user_state import GetPullrequestsSelectedUserState
-from .get_repositories_role import GetRepositoriesRole
-from .get_repositories_workspace_repo_slug_forks_role import GetRepositoriesWorkspaceRepoSlugForksRole
-from .get_repositories_workspace_repo_slug_pullrequests_state import GetRepositoriesWorkspaceRepoSlugPullrequestsState
-from .get_repositories_workspace_repo_slug_src_commit_path_format import (
-    GetRepositoriesWorkspaceRepoSlugSrcCommitPathFormat,
-)
-from .get_repositories_workspace_repo_slug_src_format import GetRepositoriesWorkspaceRepoSlugSrcFormat
-from .get_repositories_workspace_role import GetRepositoriesWorkspaceRole
-from .get_snippets_role import GetSnippetsRole
-from .get_snippets_workspace_role import GetSnippetsWorkspaceRole
-from .get_workspaces_role import GetWorkspacesRole
-from .hook_event import HookEvent
-from .hook_event_event import HookEventEvent
-from .issue_attachment import IssueAttachment
-from .issue_attachment_links import IssueAttachmentLinks
-from .issue_attachment_links_link import IssueAttachmentLinksLink
-from .issue_job_status import IssueJobStatus
-from .issue_job_status_status import IssueJobStatusStatus
-from .jira_project import JiraProject
-from .jira_site import JiraSite
-from .link import Link
-from .milestone import Milestone
-from .milestone_links import MilestoneLinks
-from .milestone_links_link import MilestoneLinksLink
-from .object_ import Object
-from .page import Page
-from .paginated_accounts import PaginatedAccounts
-from .paginated_annotations import PaginatedAnnotations
-from .paginated_components import PaginatedComponents
-from .paginated_deployment_environments import PaginatedDeploymentEnvironments
-from .paginated_deployment_variables import PaginatedDeploymentVariables
-from .paginated_hook_events import PaginatedHookEvents
-from .paginated_issue_attachment import PaginatedIssueAttachment
-from .paginated_milestones import PaginatedMilestones
-from .paginated_pipeline_cache import PaginatedPipelineCache
-from .paginated_pipeline_known_hosts import PaginatedPipelineKnownHosts
-from .paginated_pipeline_schedule import PaginatedPipelineSchedule
-from .paginated_pipeline_schedule_executions import PaginatedPipelineScheduleExecutions
-from .paginated_pipeline_steps import PaginatedPipelineSteps
-from .paginated_pipeline_variables import PaginatedPipelineVariables
-from .paginated_reports import PaginatedReports
-from .paginated_snippets import PaginatedSnippets
-from .paginated_ssh_user_keys import PaginatedSSHUserKeys
-from .paginated_versions import PaginatedVersions
-from .paginated_webhook_subscriptions import PaginatedWebhookSubscriptions
-from .participant import Participant
-from .participant_role import ParticipantRole
-from .participant_state import ParticipantState
-from .pipeline_build_number import PipelineBuildNumber
-from .pipeline_cache import PipelineCache
-from .pipeline_cache_content_uri import PipelineCacheContentURI
-from .pipeline_command import PipelineCommand
-from .pipeline_error import PipelineError
-from .pipeline_image import PipelineImage
-from .pipeline_known_host import PipelineKnownHost
-from .pipeline_schedule import PipelineSchedule
-from .pipeline_schedule_execution import PipelineScheduleExecution
-from .pipeline_schedule_execution_errored import PipelineScheduleExecutionErrored
-from .pipeline_selector import PipelineSelector
-from .pipeline_selector_type import PipelineSelectorType
-from .pipeline_ssh_key_pair import PipelineSshKeyPair
-from .pipeline_ssh_public_key import PipelineSshPublicKey
-from .pipeline_state import PipelineState
-from .pipeline_state_completed import PipelineStateCompleted
-from .pipeline_state_completed_error import PipelineStateCompletedError
-from .pipeline_state_completed_error_name import PipelineStateCompletedErrorName
-from .pipeline_state_completed_expired import PipelineStateCompletedExpired
-from .pipeline_state_completed_expired_name import PipelineStateCompletedExpiredName
-from .pipeline_state_completed_failed import PipelineStateCompletedFailed
-from .pipeline_state_completed_failed_name import PipelineStateCompletedFailedName
-from .pipeline_state_completed_name import PipelineStateCompletedName
-from .pipeline_state_completed_result import PipelineStateCompletedResult
-from .pipeline_state_completed_stopped import PipelineStateCompletedStopped
-from .pipeline_state_completed_stopped_name import PipelineStateCompletedStoppedName
-from .pipeline_state_completed_successful import PipelineStateCompletedSuccessful
-from .pipeline_state_completed_successful_name import PipelineStateCompletedSuccessfulName
-from .pipeline_state_in_progress import PipelineStateInProgress
-from .pipeline_state_in_progress_name import PipelineStateInProgressName
-from .pipeline_state_in_progress_paused import PipelineStateInProgressPaused
-from .pipeline_state_in_progress_paused_name import PipelineStateInProgressPausedName
-from .pipeline_state_in_progress_running import PipelineStateInProgressRunning
-from .pipeline_state_in_progress_running_name import PipelineStateInProgressRunningName
-from .pipeline_state_in_progress_stage import PipelineStateInProgressStage
-from .pipeline_state_pending import PipelineStatePending
-from .pipeline_state_pending_name import PipelineStatePendingName
-from .pipeline_step import PipelineStep
-from .pipeline_step_error import PipelineStepError
-from .pipeline_step_state import PipelineStepState
-from .pipeline_step_state_completed import PipelineStepStateCompleted
-from .pipeline_step_state_completed_error import PipelineStepStateCompletedError
-from .pipeline_step_state_completed_error_name import PipelineStepStateCompletedErrorName
-from .pipeline_step_state_completed_expired import PipelineStepStateCompletedExpired
-from .pipeline_step_state_completed_expired_name import PipelineStepStateCompletedExpiredName
-from .pipeline_step_state_completed_failed import PipelineStepStateCompletedFailed
-from .pipeline_step_state_completed_failed_name import PipelineStepStateCompletedFailedName
-from .pipeline_step_state_completed_name import PipelineStepStateCompletedName
-from .pipeline_step_state_completed_not_run import PipelineStepStateCompletedNotRun
-from .pipeline_step_state_completed_not_run_name import PipelineStepStateCompletedNotRunName
-from .pipeline_step_state_completed_result import PipelineStepStateCompletedResult
-from .pipeline_step_state_completed_stopped import PipelineStepStateCompletedStopped
-from .pipeline_step_state_completed_stopped_name import PipelineStepStateCompletedStoppedName
-from .pipeline_step_state_completed_successful import PipelineStepStateCompletedSuccessful
-from .pipeline_step_state_completed_successful_name import PipelineStepStateCompletedSuccessfulName
-from .pipeline_step_state_in_progress import PipelineStepStateInProgress
-from .pipeline_step_state_in_progress_name import PipelineStepStateInProgressName
-from .pipeline_step_state_pending import PipelineStepStatePending
-from .pipeline_step_state_pending_name import PipelineStepStatePendingName
-from .pipeline_step_state_ready import PipelineStepStateReady
-from .pipeline_step_state_ready_name import PipelineStepStateReadyName
-from .pipeline_target import PipelineTarget
-from .pipeline_trigger import PipelineTrigger
-from .pipeline_trigger_manual import PipelineTriggerManual
-from .pipeline_trigger_push import PipelineTriggerPush
-from .pipeline_variable import PipelineVariable
-from .pipelines_ddev_pipeline_step import PipelinesDdevPipelineStep
-from .pipelines_stg_west_pipeline_step import PipelinesStgWestPipelineStep
-from .project_branching_model import ProjectBranchingModel
-from .project_branching_model_branch_types_item import ProjectBranchingModelBranchTypesItem
-from .project_branching_model_branch_types_item_kind import ProjectBranchingModelBranchTypesItemKind
-from .project_branching_model_development import ProjectBranchingModelDevelopment
-from .project_branching_model_production import ProjectBranchingModelProduction
-from .pull_request_merge_parameters import PullRequestMergeParameters
-from .pull_request_merge_parameters_merge_strategy import PullRequestMergeParametersMergeStrategy
-from .report import Report
-from .report_annotation import ReportAnnotation
-from .report_annotation_annotation_type import ReportAnnotationAnnotationType
-from .report_annotation_result import ReportAnnotationResult
-from .report_annotation_severity import ReportAnnotationSeverity
-from .report_data import ReportData
-from .report_data_type import ReportDataType
-from .report_data_value import ReportDataValue
-from .report_report_type import ReportReportType
-from .report_result import ReportResult
-from .repository_inheritance_state import RepositoryInheritanceState
-from .repository_inheritance_state_override_settings import RepositoryInheritanceStateOverrideSettings
-from .search_content_match import SearchContentMatch
-from .search_line import SearchLine
-from .search_segment import SearchSegment
-from .snippet import Snippet
-from .snippet_scm import SnippetScm
-from .ssh_account_key import SshAccountKey
-from .ssh_key import SshKey
-from .ssh_key_links import SshKeyLinks
-from .ssh_key_links_link import SshKeyLinksLink
-from .stg_west_report import StgWestReport
-from .subject_types import SubjectTypes
-from .subject_types_repository import SubjectTypesRepository
-from .subject_types_repository_link import SubjectTypesRepositoryLink
-from .subject_types_workspace import SubjectTypesWorkspace
-from .subject_types_workspace_link import SubjectTypesWorkspaceLink
-from .team_links import TeamLinks
-from .user_links import UserLinks
-from .version import Version
-from .version_links import VersionLinks
-from .version_links_link import VersionLinksLink
-from .webhook_subscription import WebhookSubscription
-from .webhook_subscription_events_item import WebhookSubscriptionEventsItem
-from .webhook_subscription_subject_type import WebhookSubscriptionSubjectType
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from .account import Account
+    from .account_links import AccountLinks
+    from .app_user import AppUser
+    from .application_property import ApplicationProperty
+    from .application_property_attributes_item import ApplicationPropertyAttributesItem
+    from .author import Author
+    from .branching_model_settings import BranchingModelSettings
+    from .branching_model_settings_branch_types_item import BranchingModelSettingsBranchTypesItem
+    from .branching_model_settings_branch_types_item_kind import BranchingModelSettingsBranchTypesItemKind
+    from .branching_model_settings_development import BranchingModelSettingsDevelopment
+    from .branching_model_settings_links import BranchingModelSettingsLinks
+    from .branching_model_settings_links_link import BranchingModelSettingsLinksLink
+    from .branching_model_settings_production import BranchingModelSettingsProduction
+    from .component import Component
+    from .component_links import ComponentLinks
+    from .component_links_link import ComponentLinksLink
+    from .ddev_report import DdevReport
+    from .deployment_environment import DeploymentEnvironment
+    from .deployment_environment_lock import DeploymentEnvironmentLock
+    from .deployment_state import DeploymentState
+    from .deployment_state_completed import DeploymentStateCompleted
+    from .deployment_state_completed_name import DeploymentStateCompletedName
+    from .deployment_state_completed_status import DeploymentStateCompletedStatus
+    from .deployment_state_completed_status_failed import DeploymentStateCompletedStatusFailed
+    from .deployment_state_completed_status_failed_name import DeploymentStateCompletedStatusFailedName
+    from .deployment_state_completed_status_stopped import DeploymentStateCompletedStatusStopped
+    from .deployment_state_completed_status_stopped_name import DeploymentStateCompletedStatusStoppedName
+    from .deployment_state_completed_status_successful import DeploymentStateCompletedStatusSuccessful
+    from .deployment_state_completed_status_successful_name import DeploymentStateCompletedStatusSuccessfulName
+    from .deployment_state_in_progress import DeploymentStateInProgress
+    from .deployment_state_in_progress_name import DeploymentStateInProgressName
+    from .deployment_state_undeployed import DeploymentStateUndeployed
+    from .deployment_state_undeployed_name import DeploymentStateUndeployedName
+    from .deployment_variable import DeploymentVariable
+    from .deployments_ddev_deployment_environment import DeploymentsDdevDeploymentEnvironment
+    from .deployments_ddev_deployment_environment_lock import DeploymentsDdevDeploymentEnvironmentLock
+    from .deployments_stg_west_deployment_environment import DeploymentsStgWestDeploymentEnvironment
+    from .deployments_stg_west_deployment_environment_lock import DeploymentsStgWestDeploymentEnvironmentLock
+    from .error import Error
+    from .error_error import ErrorError
+    from .error_error_data import ErrorErrorData
+    from .export_options import ExportOptions
+    from .get_hook_events_subject_type_subject_type import GetHookEventsSubjectTypeSubjectType
+    from .get_pullrequests_selected_user_state import GetPullrequestsSelectedUserState
+    from .get_repositories_role import GetRepositoriesRole
+    from .get_repositories_workspace_repo_slug_forks_role import GetRepositoriesWorkspaceRepoSlugForksRole
+    from .get_repositories_workspace_repo_slug_pullrequests_state import (
+        GetRepositoriesWorkspaceRepoSlugPullrequestsState,
+    )
+    from .get_repositories_workspace_repo_slug_src_commit_path_format import (
+        GetRepositoriesWorkspaceRepoSlugSrcCommitPathFormat,
+    )
+    from .get_repositories_workspace_repo_slug_src_format import GetRepositoriesWorkspaceRepoSlugSrcFormat
+    from .get_repositories_workspace_role import GetRepositoriesWorkspaceRole
+    from .get_snippets_role import GetSnippetsRole
+    from .get_snippets_workspace_role import GetSnippetsWorkspaceRole
+    from .get_workspaces_role import GetWorkspacesRole
+    from .hook_event import HookEvent
+    from .hook_event_event import HookEventEvent
+    from .issue_attachment import IssueAttachment
+    from .issue_attachment_links import IssueAttachmentLinks
+    from .issue_attachment_links_link import IssueAttachmentLinksLink
+    from .issue_job_status import IssueJobStatus
+    from .issue_job_status_status import IssueJobStatusStatus
+    from .jira_project import JiraProject
+    from .jira_site import JiraSite
+    from .link import Link
+    from .milestone import Milestone
+    from .milestone_links import MilestoneLinks
+    from .milestone_links_link import MilestoneLinksLink
+    from .object_ import Object
+    from .page import Page
+    from .paginated_accounts import PaginatedAccounts
+    from .paginated_annotations import PaginatedAnnotations
+    from .paginated_components import PaginatedComponents
+    from .paginated_deployment_environments import PaginatedDeploymentEnvironments
+    from .paginated_deployment_variables import PaginatedDeploymentVariables
+    from .paginated_hook_events import PaginatedHookEvents
+    from .paginated_issue_attachment import PaginatedIssueAttachment
+    from .paginated_milestones import PaginatedMilestones
+    from .paginated_pipeline_cache import PaginatedPipelineCache
+    from .paginated_pipeline_known_hosts import PaginatedPipelineKnownHosts
+    from .paginated_pipeline_schedule import PaginatedPipelineSchedule
+    from .paginated_pipeline_schedule_executions import PaginatedPipelineScheduleExecutions
+    from .paginated_pipeline_steps import PaginatedPipelineSteps
+    from .paginated_pipeline_variables import PaginatedPipelineVariables
+    from .paginated_reports import PaginatedReports
+    from .paginated_snippets import PaginatedSnippets
+    from .paginated_ssh_user_keys import PaginatedSSHUserKeys
+    from .paginated_versions import PaginatedVersions
+    from .paginated_webhook_subscriptions import PaginatedWebhookSubscriptions
+    from .participant import Participant
+    from .participant_role import ParticipantRole
+    from .participant_state import ParticipantState
+    from .pipeline_build_number import PipelineBuildNumber
+    from .pipeline_cache import PipelineCache
+    from .pipeline_cache_content_uri import PipelineCacheContentURI
+    from .pipeline_command import PipelineCommand
+    from .pipeline_error import PipelineError
+    from .pipeline_image import PipelineImage
+    from .pipeline_known_host import PipelineKnownHost
+    from .pipeline_schedule import PipelineSchedule
+    from .pipeline_schedule_execution import PipelineScheduleExecution
+    from .pipeline_schedule_execution_errored import PipelineScheduleExecutionErrored
+    from .pipeline_selector import PipelineSelector
+    from .pipeline_selector_type import PipelineSelectorType
+    from .pipeline_ssh_key_pair import PipelineSshKeyPair
+    from .pipeline_ssh_public_key import PipelineSshPublicKey
+    from .pipeline_state import PipelineState
+    from .pipeline_state_completed import PipelineStateCompleted
+    from .pipeline_state_completed_error import PipelineStateCompletedError
+    from .pipeline_state_completed_error_name import PipelineStateCompletedErrorName
+    from .pipeline_state_completed_expired import PipelineStateCompletedExpired
+    from .pipeline_state_completed_expired_name import PipelineStateCompletedExpiredName
+    from .pipeline_state_completed_failed import PipelineStateCompletedFailed
+    from .pipeline_state_completed_failed_name import PipelineStateCompletedFailedName
+    from .pipeline_state_completed_name import PipelineStateCompletedName
+    from .pipeline_state_completed_result import PipelineStateCompletedResult
+    from .pipeline_state_completed_stopped import PipelineStateCompletedStopped
+    from .pipeline_state_completed_stopped_name import PipelineStateCompletedStoppedName
+    from .pipeline_state_completed_successful import PipelineStateCompletedSuccessful
+    from .pipeline_state_completed_successful_name import PipelineStateCompletedSuccessfulName
+    from .pipeline_state_in_progress import PipelineStateInProgress
+    from .pipeline_state_in_progress_name import PipelineStateInProgressName
+    from .pipeline_state_in_progress_paused import PipelineStateInProgressPaused
+    from .pipeline_state_in_progress_paused_name import PipelineStateInProgressPausedName
+    from .pipeline_state_in_progress_running import PipelineStateInProgressRunning
+    from .pipeline_state_in_progress_running_name import PipelineStateInProgressRunningName
+    from .pipeline_state_in_progress_stage import PipelineStateInProgressStage
+    from .pipeline_state_pending import PipelineStatePending
+    from .pipeline_state_pending_name import PipelineStatePendingName
+    from .pipeline_step import PipelineStep
+    from .pipeline_step_error import PipelineStepError
+    from .pipeline_step_state import PipelineStepState
+    from .pipeline_step_state_completed import PipelineStepStateCompleted
+    from .pipeline_step_state_completed_error import PipelineStepStateCompletedError
+    from .pipeline_step_state_completed_error_name import PipelineStepStateCompletedErrorName
+    from .pipeline_step_state_completed_expired import PipelineStepStateCompletedExpired
+    from .pipeline_step_state_completed_expired_name import PipelineStepStateCompletedExpiredName
+    from .pipeline_step_state_completed_failed import PipelineStepStateCompletedFailed
+    from .pipeline_step_state_completed_failed_name import PipelineStepStateCompletedFailedName
+    from .pipeline_step_state_completed_name import PipelineStepStateCompletedName
+    from .pipeline_step_state_completed_not_run import PipelineStepStateCompletedNotRun
+    from .pipeline_step_state_completed_not_run_name import PipelineStepStateCompletedNotRunName
+    from .pipeline_step_state_completed_result import PipelineStepStateCompletedResult
+    from .pipeline_step_state_completed_stopped import PipelineStepStateCompletedStopped
+    from .pipeline_step_state_completed_stopped_name import PipelineStepStateCompletedStoppedName
+    from .pipeline_step_state_completed_successful import PipelineStepStateCompletedSuccessful
+    from .pipeline_step_state_completed_successful_name import PipelineStepStateCompletedSuccessfulName
+    from .pipeline_step_state_in_progress import PipelineStepStateInProgress
+    from .pipeline_step_state_in_progress_name import PipelineStepStateInProgressName
+    from .pipeline_step_state_pending import PipelineStepStatePending
+    from .pipeline_step_state_pending_name import PipelineStepStatePendingName
+    from .pipeline_step_state_ready import PipelineStepStateReady
+    from .pipeline_step_state_ready_name import PipelineStepStateReadyName
+    from .pipeline_target import PipelineTarget
+    from .pipeline_trigger import PipelineTrigger
+    from .pipeline_trigger_manual import PipelineTriggerManual
+    from .pipeline_trigger_push import PipelineTriggerPush
+    from .pipeline_variable import PipelineVariable
+    from .pipelines_ddev_pipeline_step import PipelinesDdevPipelineStep
+    from .pipelines_stg_west_pipeline_step import PipelinesStgWestPipelineStep
+    from .project_branching_model import ProjectBranchingModel
+    from .project_branching_model_branch_types_item import ProjectBranchingModelBranchTypesItem
+    from .project_branching_model_branch_types_item_kind import ProjectBranchingModelBranchTypesItemKind
+    from .project_branching_model_development import ProjectBranchingModelDevelopment
+    from .project_branching_model_production import ProjectBranchingModelProduction
+    from .pull_request_merge_parameters import PullRequestMergeParameters
+    from .pull_request_merge_parameters_merge_strategy import PullRequestMergeParametersMergeStrategy
+    from .report import Report
+    from .report_annotation import ReportAnnotation
+    from .report_annotation_annotation_type import ReportAnnotationAnnotationType
+    from .report_annotation_result import ReportAnnotationResult
+    from .report_annotation_severity import ReportAnnotationSeverity
+    from .report_data import ReportData
+    from .report_data_type import ReportDataType
+    from .report_data_value import ReportDataValue
+    from .report_report_type import ReportReportType
+    from .report_result import ReportResult
+    from .repository_inheritance_state import RepositoryInheritanceState
+    from .repository_inheritance_state_override_settings import RepositoryInheritanceStateOverrideSettings
+    from .search_content_match import SearchContentMatch
+    from .search_line import SearchLine
+    from .search_segment import SearchSegment
+    from .snippet import Snippet
+    from .snippet_scm import SnippetScm
+    from .ssh_account_key import SshAccountKey
+    from .ssh_key import SshKey
+    from .ssh_key_links import SshKeyLinks
+    from .ssh_key_links_link import SshKeyLinksLink
+    from .stg_west_report import StgWestReport
+    from .subject_types import SubjectTypes
+    from .subject_types_repository import SubjectTypesRepository
+    from .subject_types_repository_link import SubjectTypesRepositoryLink
+    from .subject_types_workspace import SubjectTypesWorkspace
+    from .subject_types_workspace_link import SubjectTypesWorkspaceLink
+    from .team_links import TeamLinks
+    from .user_links import UserLinks
+    from .version import Version
+    from .version_links import VersionLinks
+    from .version_links_link import VersionLinksLink
+    from .webhook_subscription import WebhookSubscription
+    from .webhook_subscription_events_item import WebhookSubscriptionEventsItem
+    from .webhook_subscription_subject_type import WebhookSubscriptionSubjectType
+
+# The module defining each model. Models are imported on first access rather than all at once with the package, so
+# importing an endpoint (or a single model) does not pay for loading the ~200 others.
+_MODEL_MODULES: Dict[str, str] = {
+    "Account": "account",
+    "AccountLinks": "account_links",
+    "AppUser": "app_user",
+    "ApplicationProperty": "application_property",
+    "ApplicationPropertyAttributesItem": "application_property_attributes_item",
+    "Author": "author",
+    "BranchingModelSettings": "branching_model_settings",
+    "BranchingModelSettingsBranchTypesItem": "branching_model_settings_branch_types_item",
+    "BranchingModelSettingsBranchTypesItemKind": "branching_model_settings_branch_types_item_kind",
+    "BranchingModelSettingsDevelopment": "branching_model_settings_development",
+    "BranchingModelSettingsLinks": "branching_model_settings_links",
+    "BranchingModelSettingsLinksLink": "branching_model_settings_links_link",
+    "BranchingModelSettingsProduction": "branching_model_settings_production",
+    "Component": "component",
+    "ComponentLinks": "component_links",
+    "ComponentLinksLink": "component_links_link",
+    "DdevReport": "ddev_report",
+    "DeploymentEnvironment": "deployment_environment",
+    "DeploymentEnvironmentLock": "deployment_environment_lock",
+    "DeploymentState": "deployment_state",
+    "DeploymentStateCompleted": "deployment_state_completed",
+    "DeploymentStateCompletedName": "deployment_state_completed_name",
+    "DeploymentStateCompletedStatus": "deployment_state_completed_status",
+    "DeploymentStateCompletedStatusFailed": "deployment_state_completed_status_failed",
+    "DeploymentStateCompletedStatusFailedName": "deployment_state_completed_status_failed_name",
+    "DeploymentStateCompletedStatusStopped": "deployment_state_completed_status_stopped",
+    "DeploymentStateCompletedStatusStoppedName": "deployment_state_completed_status_stopped_name",
+    "DeploymentStateCompletedStatusSuccessful": "deployment_state_completed_status_successful",
+    "DeploymentStateCompletedStatusSuccessfulName": "deployment_state_completed_status_successful_name",
+    "DeploymentStateInProgress": "deployment_state_in_progress",
+    "DeploymentStateInProgressName": "deployment_state_in_progress_name",
+    "DeploymentStateUndeployed": "deployment_state_undeployed",
+    "DeploymentStateUndeployedName": "deployment_state_undeployed_name",
+    "DeploymentVariable": "deployment_variable",
+    "DeploymentsDdevDeploymentEnvironment": "deployments_ddev_deployment_environment",
+    "DeploymentsDdevDeploymentEnvironmentLock": "deployments_ddev_deployment_environment_lock",
+    "DeploymentsStgWestDeploymentEnvironment": "deployments_stg_west_deployment_environment",
+    "DeploymentsStgWestDeploymentEnvironmentLock": "deployments_stg_west_deployment_environment_lock",
+    "Error": "error",
+    "ErrorError": "error_error",
+    "ErrorErrorData": "error_error_data",
+    "ExportOptions": "export_options",
+    "GetHookEventsSubjectTypeSubjectType": "get_hook_events_subject_type_subject_type",
+    "GetPullrequestsSelectedUserState": "get_pullrequests_selected_user_state",
+    "GetRepositoriesRole": "get_repositories_role",
+    "GetRepositoriesWorkspaceRepoSlugForksRole": "get_repositories_workspace_repo_slug_forks_role",
+    "GetRepositoriesWorkspaceRepoSlugPullrequestsState": "get_repositories_workspace_repo_slug_pullrequests_state",
+    "GetRepositoriesWorkspaceRepoSlugSrcCommitPathFormat": "get_repositories_workspace_repo_slug_src_commit_path_format",
+    "GetRepositoriesWorkspaceRepoSlugSrcFormat": "get_repositories_workspace_repo_slug_src_format",
+    "GetRepositoriesWorkspaceRole": "get_repositories_workspace_role",
+    "GetSnippetsRole": "get_snippets_role",
+    "GetSnippetsWorkspaceRole": "get_snippets_workspace_role",
+    "GetWorkspacesRole": "get_workspaces_role",
+    "HookEvent": "hook_event",
+    "HookEventEvent": "hook_event_event",
+    "IssueAttachment": "issue_attachment",
+    "IssueAttachmentLinks": "issue_attachment_links",
+    "IssueAttachmentLinksLink": "issue_attachment_links_link",
+    "IssueJobStatus": "issue_job_status",
+    "IssueJobStatusStatus": "issue_job_status_status",
+    "JiraProject": "jira_project",
+    "JiraSite": "jira_site",
+    "Link": "link",
+    "Milestone": "milestone",
+    "MilestoneLinks": "milestone_links",
+    "MilestoneLinksLink": "milestone_links_link",
+    "Object": "object_",
+    "Page": "page",
+    "PaginatedAccounts": "paginated_accounts",
+    "PaginatedAnnotations": "paginated_annotations",
+    "PaginatedComponents": "paginated_components",
+    "PaginatedDeploymentEnvironments": "paginated_deployment_environments",
+    "PaginatedDeploymentVariables": "paginated_deployment_variables",
+    "PaginatedHookEvents": "paginated_hook_events",
+    "PaginatedIssueAttachment": "paginated_issue_attachment",
+    "PaginatedMilestones": "paginated_milestones",
+    "PaginatedPipelineCache": "paginated_pipeline_cache",
+    "PaginatedPipelineKnownHosts": "paginated_pipeline_known_hosts",
+    "PaginatedPipelineSchedule": "paginated_pipeline_schedule",
+    "PaginatedPipelineScheduleExecutions": "paginated_pipeline_schedule_executions",
+    "PaginatedPipelineSteps": "paginated_pipeline_steps",
+    "PaginatedPipelineVariables": "paginated_pipeline_variables",
+    "PaginatedReports": "paginated_reports",
+    "PaginatedSnippets": "paginated_snippets",
+    "PaginatedSSHUserKeys": "paginated_ssh_user_keys",
+    "PaginatedVersions": "paginated_versions",
+    "PaginatedWebhookSubscriptions": "paginated_webhook_subscriptions",
+    "Participant": "participant",
+    "ParticipantRole": "participant_role",
+    "ParticipantState": "participant_state",
+    "PipelineBuildNumber": "pipeline_build_number",
+    "PipelineCache": "pipeline_cache",
+    "PipelineCacheContentURI": "pipeline_cache_content_uri",
+    "PipelineCommand": "pipeline_command",
+    "PipelineError": "pipeline_error",
+    "PipelineImage": "pipeline_image",
+    "PipelineKnownHost": "pipeline_known_host",
+    "PipelineSchedule": "pipeline_schedule",
+    "PipelineScheduleExecution": "pipeline_schedule_execution",
+    "PipelineScheduleExecutionErrored": "pipeline_schedule_execution_errored",
+    "PipelineSelector": "pipeline_selector",
+    "PipelineSelectorType": "pipeline_selector_type",
+    "PipelineSshKeyPair": "pipeline_ssh_key_pair",
+    "PipelineSshPublicKey": "pipeline_ssh_public_key",
+    "PipelineState": "pipeline_state",
+    "PipelineStateCompleted": "pipeline_state_completed",
+    "PipelineStateCompletedError": "pipeline_state_completed_error",
+    "PipelineStateCompletedErrorName": "pipeline_state_completed_error_name",
+    "PipelineStateCompletedExpired": "pipeline_state_completed_expired",
+    "PipelineStateCompletedExpiredName": "pipeline_state_completed_expired_name",
+    "PipelineStateCompletedFailed": "pipeline_state_completed_failed",
+    "PipelineStateCompletedFailedName": "pipeline_state_completed_failed_name",
+    "PipelineStateCompletedName": "pipeline_state_completed_name",
+    "PipelineStateCompletedResult": "pipeline_state_completed_result",
+    "PipelineStateCompletedStopped": "pipeline_state_completed_stopped",
+    "PipelineStateCompletedStoppedName": "pipeline_state_completed_stopped_name",
+    "PipelineStateCompletedSuccessful": "pipeline_state_completed_successful",
+    "PipelineStateCompletedSuccessfulName": "pipeline_state_completed_successful_name",
+    "PipelineStateInProgress": "pipeline_state_in_progress",
+    "PipelineStateInProgressName": "pipeline_state_in_progress_name",
+    "PipelineStateInProgressPaused": "pipeline_state_in_progress_paused",
+    "PipelineStateInProgressPausedName": "pipeline_state_in_progress_paused_name",
+    "PipelineStateInProgressRunning": "pipeline_state_in_progress_running",
+    "PipelineStateInProgressRunningName": "pipeline_state_in_progress_running_name",
+    "PipelineStateInProgressStage": "pipeline_state_in_progress_stage",
+    "PipelineStatePending": "pipeline_state_pending",
+    "PipelineStatePendingName": "pipeline_state_pending_name",
+    "PipelineStep": "pipeline_step",
+    "PipelineStepError": "pipeline_step_error",
+    "PipelineStepState": "pipeline_step_state",
+    "PipelineStepStateCompleted": "pipeline_step_state_completed",
+    "PipelineStepStateCompletedError": "pipeline_step_state_completed_error",
+    "PipelineStepStateCompletedErrorName": "pipeline_step_state_completed_error_name",
+    "PipelineStepStateCompletedExpired": "pipeline_step_state_completed_expired",
+    "PipelineStepStateCompletedExpiredName": "pipeline_step_state_completed_expired_name",
+    "PipelineStepStateCompletedFailed": "pipeline_step_state_completed_failed",
+    "PipelineStepStateCompletedFailedName": "pipeline_step_state_completed_failed_name",
+    "PipelineStepStateCompletedName": "pipeline_step_state_completed_name",
+    "PipelineStepStateCompletedNotRun": "pipeline_step_state_completed_not_run",
+    "PipelineStepStateCompletedNotRunName": "pipeline_step_state_completed_not_run_name",
+    "PipelineStepStateCompletedResult": "pipeline_step_state_completed_result",
+    "PipelineStepStateCompletedStopped": "pipeline_step_state_completed_stopped",
+    "PipelineStepStateCompletedStoppedName": "pipeline_step_state_completed_stopped_name",
+    "PipelineStepStateCompletedSuccessful": "pipeline_step_state_completed_successful",
+    "PipelineStepStateCompletedSuccessfulName": "pipeline_step_state_completed_successful_name",
+    "PipelineStepStateInProgress": "pipeline_step_state_in_progress",
+    "PipelineStepStateInProgressName": "pipeline_step_state_in_progress_name",
+    "PipelineStepStatePending": "pipeline_step_state_pending",
+    "PipelineStepStatePendingName": "pipeline_step_state_pending_name",
+    "PipelineStepStateReady": "pipeline_step_state_ready",
+    "PipelineStepStateReadyName": "pipeline_step_state_ready_name",
+    "PipelineTarget": "pipeline_target",
+    "PipelineTrigger": "pipeline_trigger",
+    "PipelineTriggerManual": "pipeline_trigger_manual",
+    "PipelineTriggerPush": "pipeline_trigger_push",
+    "PipelineVariable": "pipeline_variable",
+    "PipelinesDdevPipelineStep": "pipelines_ddev_pipeline_step",
+    "PipelinesStgWestPipelineStep": "pipelines_stg_west_pipeline_step",
+    "ProjectBranchingModel": "project_branching_model",
+    "ProjectBranchingModelBranchTypesItem": "project_branching_model_branch_types_item",
+    "ProjectBranchingModelBranchTypesItemKind": "project_branching_model_branch_types_item_kind",
+    "ProjectBranchingModelDevelopment": "project_branching_model_development",
+    "ProjectBranchingModelProduction": "project_branching_model_production",
+    "PullRequestMergeParameters": "pull_request_merge_parameters",
+    "PullRequestMergeParametersMergeStrategy": "pull_request_merge_parameters_merge_strategy",
+    "Report": "report",
+    "ReportAnnotation": "report_annotation",
+    "ReportAnnotationAnnotationType": "report_annotation_annotation_type",
+    "ReportAnnotationResult": "report_annotation_result",
+    "ReportAnnotationSeverity": "report_annotation_severity",
+    "ReportData": "report_data",
+    "ReportDataType": "report_data_type",
+    "ReportDataValue": "report_data_value",
+    "ReportReportType": "report_report_type",
+    "ReportResult": "report_result",
+    "RepositoryInheritanceState": "repository_inheritance_state",
+    "RepositoryInheritanceStateOverrideSettings": "repository_inheritance_state_override_settings",
+    "SearchContentMatch": "search_content_match",
+    "SearchLine": "search_line",
+    "SearchSegment": "search_segment",
+    "Snippet": "snippet",
+    "SnippetScm": "snippet_scm",
+    "SshAccountKey": "ssh_account_key",
+    "SshKey": "ssh_key",
+    "SshKeyLinks": "ssh_key_links",
+    "SshKeyLinksLink": "ssh_key_links_link",
+    "StgWestReport": "stg_west_report",
+    "SubjectTypes": "subject_types",
+    "SubjectTypesRepository": "subject_types_repository",
+    "SubjectTypesRepositoryLink": "subject_types_repository_link",
+    "SubjectTypesWorkspace": "subject_types_workspace",
+    "SubjectTypesWorkspaceLink": "subject_types_workspace_link",
+    "TeamLinks": "team_links",
+    "UserLinks": "user_links",
+    "Version": "version",
+    "VersionLinks": "version_links",
+    "VersionLinksLink": "version_links_link",
+    "WebhookSubscription": "webhook_subscription",
+    "WebhookSubscriptionEventsItem": "webhook_subscription_events_item",
+    "WebhookSubscriptionSubjectType": "webhook_subscription_subject_type",
+}
+
+__all__ = list(_MODEL_MODULES)
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _MODEL_MODULES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    model = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = model
+    return model
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *_MODEL_MODULES})
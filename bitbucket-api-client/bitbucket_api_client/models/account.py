@@ -2,19 +2,20 @@ import datetime
 from typing import Any, Dict, List, Type, TypeVar, Union
 
 import attr
-from dateutil.parser import isoparse
 
+from ..dates import parse_datetime
 from ..models.account_links import AccountLinks
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="Account")
+_KNOWN_KEYS = frozenset({"type", "links", "created_on", "display_name", "username", "uuid"})
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class Account:
     """
     Attributes:
-        type (str):
+        type (Union[Unset, str]):
         links (Union[Unset, AccountLinks]): Links related to an Account.
         created_on (Union[Unset, datetime.datetime]):
         display_name (Union[Unset, str]):
@@ -22,7 +23,7 @@ class Account:
         uuid (Union[Unset, str]):
     """
 
-    type: str
+    type: Union[Unset, str]
     links: Union[Unset, AccountLinks] = UNSET
     created_on: Union[Unset, datetime.datetime] = UNSET
     display_name: Union[Unset, str] = UNSET
@@ -46,11 +47,8 @@ class Account:
 
         field_dict: Dict[str, Any] = {}
         field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "type": type,
-            }
-        )
+        if type is not UNSET:
+            field_dict["type"] = type
         if links is not UNSET:
             field_dict["links"] = links
         if created_on is not UNSET:
@@ -66,28 +64,28 @@ class Account:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        type = d.pop("type")
+        d = src_dict
+        type = d.get("type", UNSET)
 
-        _links = d.pop("links", UNSET)
+        _links = d.get("links", UNSET)
         links: Union[Unset, AccountLinks]
         if isinstance(_links, Unset):
             links = UNSET
         else:
             links = AccountLinks.from_dict(_links)
 
-        _created_on = d.pop("created_on", UNSET)
+        _created_on = d.get("created_on", UNSET)
         created_on: Union[Unset, datetime.datetime]
         if isinstance(_created_on, Unset):
             created_on = UNSET
         else:
-            created_on = isoparse(_created_on)
+            created_on = parse_datetime(_created_on)
 
-        display_name = d.pop("display_name", UNSET)
+        display_name = d.get("display_name", UNSET)
 
-        username = d.pop("username", UNSET)
+        username = d.get("username", UNSET)
 
-        uuid = d.pop("uuid", UNSET)
+        uuid = d.get("uuid", UNSET)
 
         account = cls(
             type=type,
@@ -98,7 +96,10 @@ class Account:
             uuid=uuid,
         )
 
-        account.additional_properties = d
+        if _KNOWN_KEYS.issuperset(d):
+            account.additional_properties = EMPTY_PROPERTIES
+        else:
+            account.additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return account
 
     @property
@@ -109,6 +110,8 @@ class Account:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -3,12 +3,13 @@ from typing import Any, Dict, List, Type, TypeVar, Union
 import attr
 
 from ..models.link import Link
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="AccountLinks")
+_KNOWN_KEYS = frozenset({"avatar"})
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class AccountLinks:
     """Links related to an Account.
 
@@ -34,8 +35,8 @@ class AccountLinks:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        _avatar = d.pop("avatar", UNSET)
+        d = src_dict
+        _avatar = d.get("avatar", UNSET)
         avatar: Union[Unset, Link]
         if isinstance(_avatar, Unset):
             avatar = UNSET
@@ -46,7 +47,10 @@ class AccountLinks:
             avatar=avatar,
         )
 
-        account_links.additional_properties = d
+        if _KNOWN_KEYS.issuperset(d):
+            account_links.additional_properties = EMPTY_PROPERTIES
+        else:
+            account_links.additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return account_links
 
     @property
@@ -57,6 +61,8 @@ class AccountLinks:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
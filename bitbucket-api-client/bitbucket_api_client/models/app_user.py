@@ -2,19 +2,22 @@ import datetime
 from typing import Any, Dict, List, Type, TypeVar, Union
 
 import attr
-from dateutil.parser import isoparse
 
+from ..dates import parse_datetime
 from ..models.account_links import AccountLinks
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="AppUser")
+_KNOWN_KEYS = frozenset(
+    {"type", "links", "created_on", "display_name", "username", "uuid", "account_id", "account_status", "kind"}
+)
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class AppUser:
     """
     Attributes:
-        type (str):
+        type (Union[Unset, str]):
         links (Union[Unset, AccountLinks]): Links related to an Account.
         created_on (Union[Unset, datetime.datetime]):
         display_name (Union[Unset, str]):
@@ -26,7 +29,7 @@ class AppUser:
         kind (Union[Unset, str]): The kind of App User.
     """
 
-    type: str
+    type: Union[Unset, str]
     links: Union[Unset, AccountLinks] = UNSET
     created_on: Union[Unset, datetime.datetime] = UNSET
     display_name: Union[Unset, str] = UNSET
@@ -56,11 +59,8 @@ class AppUser:
 
         field_dict: Dict[str, Any] = {}
         field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "type": type,
-            }
-        )
+        if type is not UNSET:
+            field_dict["type"] = type
         if links is not UNSET:
             field_dict["links"] = links
         if created_on is not UNSET:
@@ -82,34 +82,34 @@ class AppUser:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        type = d.pop("type")
+        d = src_dict
+        type = d.get("type", UNSET)
 
-        _links = d.pop("links", UNSET)
+        _links = d.get("links", UNSET)
         links: Union[Unset, AccountLinks]
         if isinstance(_links, Unset):
             links = UNSET
         else:
             links = AccountLinks.from_dict(_links)
 
-        _created_on = d.pop("created_on", UNSET)
+        _created_on = d.get("created_on", UNSET)
         created_on: Union[Unset, datetime.datetime]
         if isinstance(_created_on, Unset):
             created_on = UNSET
         else:
-            created_on = isoparse(_created_on)
+            created_on = parse_datetime(_created_on)
 
-        display_name = d.pop("display_name", UNSET)
+        display_name = d.get("display_name", UNSET)
 
-        username = d.pop("username", UNSET)
+        username = d.get("username", UNSET)
 
-        uuid = d.pop("uuid", UNSET)
+        uuid = d.get("uuid", UNSET)
 
-        account_id = d.pop("account_id", UNSET)
+        account_id = d.get("account_id", UNSET)
 
-        account_status = d.pop("account_status", UNSET)
+        account_status = d.get("account_status", UNSET)
 
-        kind = d.pop("kind", UNSET)
+        kind = d.get("kind", UNSET)
 
         app_user = cls(
             type=type,
@@ -123,7 +123,10 @@ class AppUser:
             kind=kind,
         )
 
-        app_user.additional_properties = d
+        if _KNOWN_KEYS.issuperset(d):
+            app_user.additional_properties = EMPTY_PROPERTIES
+        else:
+            app_user.additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return app_user
 
     @property
@@ -134,6 +137,8 @@ class AppUser:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
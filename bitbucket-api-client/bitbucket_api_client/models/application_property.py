@@ -3,12 +3,13 @@ from typing import Any, Dict, List, Type, TypeVar, Union
 import attr
 
 from ..models.application_property_attributes_item import ApplicationPropertyAttributesItem
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="ApplicationProperty")
+_KNOWN_KEYS = frozenset({"_attributes"})
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class ApplicationProperty:
     """An application property. It is a caller defined JSON object that Bitbucket will store and return.
     The `_attributes` field at its top level can be used to control who is allowed to read and update the property.
@@ -41,9 +42,9 @@ class ApplicationProperty:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
+        d = src_dict
         attributes = []
-        _attributes = d.pop("_attributes", UNSET)
+        _attributes = d.get("_attributes", UNSET)
         for attributes_item_data in _attributes or []:
             attributes_item = ApplicationPropertyAttributesItem(attributes_item_data)
 
@@ -53,7 +54,10 @@ class ApplicationProperty:
             attributes=attributes,
         )
 
-        application_property.additional_properties = d
+        if _KNOWN_KEYS.issuperset(d):
+            application_property.additional_properties = EMPTY_PROPERTIES
+        else:
+            application_property.additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return application_property
 
     @property
@@ -64,6 +68,8 @@ class ApplicationProperty:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -3,22 +3,23 @@ from typing import Any, Dict, List, Type, TypeVar, Union
 import attr
 
 from ..models.account import Account
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="Author")
+_KNOWN_KEYS = frozenset({"type", "raw", "user"})
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class Author:
     """
     Attributes:
-        type (str):
+        type (Union[Unset, str]):
         raw (Union[Unset, str]): The raw author value from the repository. This may be the only value available if the
             author does not match a user in Bitbucket.
         user (Union[Unset, Account]):
     """
 
-    type: str
+    type: Union[Unset, str]
     raw: Union[Unset, str] = UNSET
     user: Union[Unset, Account] = UNSET
     additional_properties: Dict[str, Any] = attr.ib(init=False, factory=dict)
@@ -32,11 +33,8 @@ class Author:
 
         field_dict: Dict[str, Any] = {}
         field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "type": type,
-            }
-        )
+        if type is not UNSET:
+            field_dict["type"] = type
         if raw is not UNSET:
             field_dict["raw"] = raw
         if user is not UNSET:
@@ -46,12 +44,12 @@ class Author:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        type = d.pop("type")
+        d = src_dict
+        type = d.get("type", UNSET)
 
-        raw = d.pop("raw", UNSET)
+        raw = d.get("raw", UNSET)
 
-        _user = d.pop("user", UNSET)
+        _user = d.get("user", UNSET)
         user: Union[Unset, Account]
         if isinstance(_user, Unset):
             user = UNSET
@@ -64,7 +62,10 @@ class Author:
             user=user,
         )
 
-        author.additional_properties = d
+        if _KNOWN_KEYS.issuperset(d):
+            author.additional_properties = EMPTY_PROPERTIES
+        else:
+            author.additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return author
 
     @property
@@ -75,6 +76,8 @@ class Author:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
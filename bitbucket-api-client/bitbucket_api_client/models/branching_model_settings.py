@@ -6,23 +6,24 @@ from ..models.branching_model_settings_branch_types_item import BranchingModelSe
 from ..models.branching_model_settings_development import BranchingModelSettingsDevelopment
 from ..models.branching_model_settings_links import BranchingModelSettingsLinks
 from ..models.branching_model_settings_production import BranchingModelSettingsProduction
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="BranchingModelSettings")
+_KNOWN_KEYS = frozenset({"type", "links", "branch_types", "development", "production"})
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class BranchingModelSettings:
     """
     Attributes:
-        type (str):
+        type (Union[Unset, str]):
         links (Union[Unset, BranchingModelSettingsLinks]):
         branch_types (Union[Unset, List[BranchingModelSettingsBranchTypesItem]]):
         development (Union[Unset, BranchingModelSettingsDevelopment]):
         production (Union[Unset, BranchingModelSettingsProduction]):
     """
 
-    type: str
+    type: Union[Unset, str]
     links: Union[Unset, BranchingModelSettingsLinks] = UNSET
     branch_types: Union[Unset, List[BranchingModelSettingsBranchTypesItem]] = UNSET
     development: Union[Unset, BranchingModelSettingsDevelopment] = UNSET
@@ -53,11 +54,8 @@ class BranchingModelSettings:
 
         field_dict: Dict[str, Any] = {}
         field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "type": type,
-            }
-        )
+        if type is not UNSET:
+            field_dict["type"] = type
         if links is not UNSET:
             field_dict["links"] = links
         if branch_types is not UNSET:
@@ -71,10 +69,10 @@ class BranchingModelSettings:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        type = d.pop("type")
+        d = src_dict
+        type = d.get("type", UNSET)
 
-        _links = d.pop("links", UNSET)
+        _links = d.get("links", UNSET)
         links: Union[Unset, BranchingModelSettingsLinks]
         if isinstance(_links, Unset):
             links = UNSET
@@ -82,20 +80,20 @@ class BranchingModelSettings:
             links = BranchingModelSettingsLinks.from_dict(_links)
 
         branch_types = []
-        _branch_types = d.pop("branch_types", UNSET)
+        _branch_types = d.get("branch_types", UNSET)
         for branch_types_item_data in _branch_types or []:
             branch_types_item = BranchingModelSettingsBranchTypesItem.from_dict(branch_types_item_data)
 
             branch_types.append(branch_types_item)
 
-        _development = d.pop("development", UNSET)
+        _development = d.get("development", UNSET)
         development: Union[Unset, BranchingModelSettingsDevelopment]
         if isinstance(_development, Unset):
             development = UNSET
         else:
             development = BranchingModelSettingsDevelopment.from_dict(_development)
 
-        _production = d.pop("production", UNSET)
+        _production = d.get("production", UNSET)
         production: Union[Unset, BranchingModelSettingsProduction]
         if isinstance(_production, Unset):
             production = UNSET
@@ -110,7 +108,10 @@ class BranchingModelSettings:
             production=production,
         )
 
-        branching_model_settings.additional_properties = d
+        if _KNOWN_KEYS.issuperset(d):
+            branching_model_settings.additional_properties = EMPTY_PROPERTIES
+        else:
+            branching_model_settings.additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return branching_model_settings
 
     @property
@@ -121,6 +122,8 @@ class BranchingModelSettings:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
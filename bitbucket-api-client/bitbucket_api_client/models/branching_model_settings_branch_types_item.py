@@ -8,11 +8,11 @@ from ..types import UNSET, Unset
 T = TypeVar("T", bound="BranchingModelSettingsBranchTypesItem")
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class BranchingModelSettingsBranchTypesItem:
     """
     Attributes:
-        kind (BranchingModelSettingsBranchTypesItemKind): The kind of the branch type.
+        kind (Union[Unset, BranchingModelSettingsBranchTypesItemKind]): The kind of the branch type.
         enabled (Union[Unset, bool]): Whether the branch type is enabled or not. A disabled branch type may contain an
             invalid `prefix`.
         prefix (Union[Unset, str]): The prefix for this branch type. A branch with this prefix will be classified as per
@@ -20,22 +20,21 @@ class BranchingModelSettingsBranchTypesItem:
             empty or `null`. The `prefix` for a disabled branch type can be empty or invalid.
     """
 
-    kind: BranchingModelSettingsBranchTypesItemKind
+    kind: Union[Unset, BranchingModelSettingsBranchTypesItemKind]
     enabled: Union[Unset, bool] = UNSET
     prefix: Union[Unset, str] = UNSET
 
     def to_dict(self) -> Dict[str, Any]:
-        kind = self.kind.value
+        kind: Union[Unset, str] = UNSET
+        if not isinstance(self.kind, Unset):
+            kind = self.kind.value
 
         enabled = self.enabled
         prefix = self.prefix
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(
-            {
-                "kind": kind,
-            }
-        )
+        if kind is not UNSET:
+            field_dict["kind"] = kind
         if enabled is not UNSET:
             field_dict["enabled"] = enabled
         if prefix is not UNSET:
@@ -45,12 +44,17 @@ class BranchingModelSettingsBranchTypesItem:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        kind = BranchingModelSettingsBranchTypesItemKind(d.pop("kind"))
+        d = src_dict
+        _kind = d.get("kind", UNSET)
+        kind: Union[Unset, BranchingModelSettingsBranchTypesItemKind]
+        if isinstance(_kind, Unset):
+            kind = UNSET
+        else:
+            kind = BranchingModelSettingsBranchTypesItemKind(_kind)
 
-        enabled = d.pop("enabled", UNSET)
+        enabled = d.get("enabled", UNSET)
 
-        prefix = d.pop("prefix", UNSET)
+        prefix = d.get("prefix", UNSET)
 
         branching_model_settings_branch_types_item = cls(
             kind=kind,
@@ -7,7 +7,7 @@ from ..types import UNSET, Unset
 T = TypeVar("T", bound="BranchingModelSettingsDevelopment")
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class BranchingModelSettingsDevelopment:
     """
     Attributes:
@@ -45,12 +45,12 @@ class BranchingModelSettingsDevelopment:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        is_valid = d.pop("is_valid", UNSET)
+        d = src_dict
+        is_valid = d.get("is_valid", UNSET)
 
-        name = d.pop("name", UNSET)
+        name = d.get("name", UNSET)
 
-        use_mainbranch = d.pop("use_mainbranch", UNSET)
+        use_mainbranch = d.get("use_mainbranch", UNSET)
 
         branching_model_settings_development = cls(
             is_valid=is_valid,
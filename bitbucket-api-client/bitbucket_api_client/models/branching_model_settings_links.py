@@ -8,7 +8,7 @@ from ..types import UNSET, Unset
 T = TypeVar("T", bound="BranchingModelSettingsLinks")
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class BranchingModelSettingsLinks:
     """
     Attributes:
@@ -31,8 +31,8 @@ class BranchingModelSettingsLinks:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        _self_ = d.pop("self", UNSET)
+        d = src_dict
+        _self_ = d.get("self", UNSET)
         self_: Union[Unset, BranchingModelSettingsLinksLink]
         if isinstance(_self_, Unset):
             self_ = UNSET
@@ -3,22 +3,23 @@ from typing import Any, Dict, List, Type, TypeVar, Union
 import attr
 
 from ..models.component_links import ComponentLinks
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="Component")
+_KNOWN_KEYS = frozenset({"type", "links", "name", "id"})
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class Component:
     """
     Attributes:
-        type (str):
+        type (Union[Unset, str]):
         links (Union[Unset, ComponentLinks]):
         name (Union[Unset, str]):
         id (Union[Unset, int]):
     """
 
-    type: str
+    type: Union[Unset, str]
     links: Union[Unset, ComponentLinks] = UNSET
     name: Union[Unset, str] = UNSET
     id: Union[Unset, int] = UNSET
@@ -35,11 +36,8 @@ class Component:
 
         field_dict: Dict[str, Any] = {}
         field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "type": type,
-            }
-        )
+        if type is not UNSET:
+            field_dict["type"] = type
         if links is not UNSET:
             field_dict["links"] = links
         if name is not UNSET:
@@ -51,19 +49,19 @@ class Component:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        type = d.pop("type")
+        d = src_dict
+        type = d.get("type", UNSET)
 
-        _links = d.pop("links", UNSET)
+        _links = d.get("links", UNSET)
         links: Union[Unset, ComponentLinks]
         if isinstance(_links, Unset):
             links = UNSET
         else:
             links = ComponentLinks.from_dict(_links)
 
-        name = d.pop("name", UNSET)
+        name = d.get("name", UNSET)
 
-        id = d.pop("id", UNSET)
+        id = d.get("id", UNSET)
 
         component = cls(
             type=type,
@@ -72,7 +70,10 @@ class Component:
             id=id,
         )
 
-        component.additional_properties = d
+        if _KNOWN_KEYS.issuperset(d):
+            component.additional_properties = EMPTY_PROPERTIES
+        else:
+            component.additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return component
 
     @property
@@ -83,6 +84,8 @@ class Component:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -7,7 +7,7 @@ from ..types import UNSET, Unset
 T = TypeVar("T", bound="ComponentLinksLink")
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class ComponentLinksLink:
     """A link to a resource related to this object.
 
@@ -34,10 +34,10 @@ class ComponentLinksLink:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        href = d.pop("href", UNSET)
+        d = src_dict
+        href = d.get("href", UNSET)
 
-        name = d.pop("name", UNSET)
+        name = d.get("name", UNSET)
 
         component_links_link = cls(
             href=href,
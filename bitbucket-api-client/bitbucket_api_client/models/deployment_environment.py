@@ -2,21 +2,22 @@ from typing import Any, Dict, List, Type, TypeVar, Union
 
 import attr
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="DeploymentEnvironment")
+_KNOWN_KEYS = frozenset({"type", "uuid", "name"})
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class DeploymentEnvironment:
     """
     Attributes:
-        type (str):
+        type (Union[Unset, str]):
         uuid (Union[Unset, str]): The UUID identifying the environment.
         name (Union[Unset, str]): The name of the environment.
     """
 
-    type: str
+    type: Union[Unset, str]
     uuid: Union[Unset, str] = UNSET
     name: Union[Unset, str] = UNSET
     additional_properties: Dict[str, Any] = attr.ib(init=False, factory=dict)
@@ -28,11 +29,8 @@ class DeploymentEnvironment:
 
         field_dict: Dict[str, Any] = {}
         field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "type": type,
-            }
-        )
+        if type is not UNSET:
+            field_dict["type"] = type
         if uuid is not UNSET:
             field_dict["uuid"] = uuid
         if name is not UNSET:
@@ -42,12 +40,12 @@ class DeploymentEnvironment:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        type = d.pop("type")
+        d = src_dict
+        type = d.get("type", UNSET)
 
-        uuid = d.pop("uuid", UNSET)
+        uuid = d.get("uuid", UNSET)
 
-        name = d.pop("name", UNSET)
+        name = d.get("name", UNSET)
 
         deployment_environment = cls(
             type=type,
@@ -55,7 +53,10 @@ class DeploymentEnvironment:
             name=name,
         )
 
-        deployment_environment.additional_properties = d
+        if _KNOWN_KEYS.issuperset(d):
+            deployment_environment.additional_properties = EMPTY_PROPERTIES
+        else:
+            deployment_environment.additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return deployment_environment
 
     @property
@@ -66,6 +67,8 @@ class DeploymentEnvironment:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -1,18 +1,30 @@
-from typing import Any, Dict, List, Type, TypeVar
+from typing import Any, Callable, Dict, List, Type, TypeVar, Union
 
 import attr
 
+from ..models.deployment_state_completed import DeploymentStateCompleted
+from ..models.deployment_state_in_progress import DeploymentStateInProgress
+from ..models.deployment_state_undeployed import DeploymentStateUndeployed
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
+
 T = TypeVar("T", bound="DeploymentState")
+_KNOWN_KEYS = frozenset({"type"})
+# the model built for each value of the ``type`` discriminator
+_FROM_DICT_BY_TYPE: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    "deployment_state_completed": DeploymentStateCompleted.from_dict,
+    "deployment_state_in_progress": DeploymentStateInProgress.from_dict,
+    "deployment_state_undeployed": DeploymentStateUndeployed.from_dict,
+}
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class DeploymentState:
     """
     Attributes:
-        type (str):
+        type (Union[Unset, str]):
     """
 
-    type: str
+    type: Union[Unset, str]
     additional_properties: Dict[str, Any] = attr.ib(init=False, factory=dict)
 
     def to_dict(self) -> Dict[str, Any]:
@@ -20,26 +32,37 @@ class DeploymentState:
 
         field_dict: Dict[str, Any] = {}
         field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "type": type,
-            }
-        )
+        if type is not UNSET:
+            field_dict["type"] = type
 
         return field_dict
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        type = d.pop("type")
+        d = src_dict
+        type = d.get("type", UNSET)
 
         deployment_state = cls(
             type=type,
         )
 
-        deployment_state.additional_properties = d
+        if _KNOWN_KEYS.issuperset(d):
+            deployment_state.additional_properties = EMPTY_PROPERTIES
+        else:
+            deployment_state.additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return deployment_state
 
+    @classmethod
+    def from_dict_by_type(
+        cls, src_dict: Dict[str, Any]
+    ) -> Union["DeploymentState", DeploymentStateCompleted, DeploymentStateInProgress, DeploymentStateUndeployed]:
+        """Build the model of the concrete type named by the ``type`` of ``src_dict``, or of this class for
+        unknown types"""
+        from_dict = _FROM_DICT_BY_TYPE.get(src_dict.get("type"))
+        if from_dict is None:
+            return cls.from_dict(src_dict)
+        return from_dict(src_dict)
+
     @property
     def additional_keys(self) -> List[str]:
         return list(self.additional_properties.keys())
@@ -48,6 +71,8 @@ class DeploymentState:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -2,34 +2,45 @@ import datetime
 from typing import Any, Dict, List, Type, TypeVar, Union
 
 import attr
-from dateutil.parser import isoparse
 
+from ..dates import parse_datetime
 from ..models.account import Account
 from ..models.deployment_state_completed_name import DeploymentStateCompletedName
 from ..models.deployment_state_completed_status import DeploymentStateCompletedStatus
-from ..types import UNSET, Unset
+from ..models.deployment_state_completed_status_failed import DeploymentStateCompletedStatusFailed
+from ..models.deployment_state_completed_status_stopped import DeploymentStateCompletedStatusStopped
+from ..models.deployment_state_completed_status_successful import DeploymentStateCompletedStatusSuccessful
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="DeploymentStateCompleted")
+_KNOWN_KEYS = frozenset({"type", "name", "url", "deployer", "status", "start_date", "completion_date"})
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class DeploymentStateCompleted:
     """
     Attributes:
-        type (str):
+        type (Union[Unset, str]):
         name (Union[Unset, DeploymentStateCompletedName]): The name of deployment state (COMPLETED).
         url (Union[Unset, str]): Link to the deployment result.
         deployer (Union[Unset, Account]):
-        status (Union[Unset, DeploymentStateCompletedStatus]):
+        status (Union[Unset, DeploymentStateCompletedStatus, DeploymentStateCompletedStatusFailed,
+            DeploymentStateCompletedStatusStopped, DeploymentStateCompletedStatusSuccessful]):
         start_date (Union[Unset, datetime.datetime]): The timestamp when the deployment was started.
         completion_date (Union[Unset, datetime.datetime]): The timestamp when the deployment completed.
     """
 
-    type: str
+    type: Union[Unset, str]
     name: Union[Unset, DeploymentStateCompletedName] = UNSET
     url: Union[Unset, str] = UNSET
     deployer: Union[Unset, Account] = UNSET
-    status: Union[Unset, DeploymentStateCompletedStatus] = UNSET
+    status: Union[
+        Unset,
+        DeploymentStateCompletedStatus,
+        DeploymentStateCompletedStatusFailed,
+        DeploymentStateCompletedStatusStopped,
+        DeploymentStateCompletedStatusSuccessful,
+    ] = UNSET
     start_date: Union[Unset, datetime.datetime] = UNSET
     completion_date: Union[Unset, datetime.datetime] = UNSET
     additional_properties: Dict[str, Any] = attr.ib(init=False, factory=dict)
@@ -59,11 +70,8 @@ class DeploymentStateCompleted:
 
         field_dict: Dict[str, Any] = {}
         field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "type": type,
-            }
-        )
+        if type is not UNSET:
+            field_dict["type"] = type
         if name is not UNSET:
             field_dict["name"] = name
         if url is not UNSET:
@@ -81,45 +89,51 @@ class DeploymentStateCompleted:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        type = d.pop("type")
+        d = src_dict
+        type = d.get("type", UNSET)
 
-        _name = d.pop("name", UNSET)
+        _name = d.get("name", UNSET)
         name: Union[Unset, DeploymentStateCompletedName]
         if isinstance(_name, Unset):
             name = UNSET
         else:
             name = DeploymentStateCompletedName(_name)
 
-        url = d.pop("url", UNSET)
+        url = d.get("url", UNSET)
 
-        _deployer = d.pop("deployer", UNSET)
+        _deployer = d.get("deployer", UNSET)
         deployer: Union[Unset, Account]
         if isinstance(_deployer, Unset):
             deployer = UNSET
         else:
             deployer = Account.from_dict(_deployer)
 
-        _status = d.pop("status", UNSET)
-        status: Union[Unset, DeploymentStateCompletedStatus]
+        _status = d.get("status", UNSET)
+        status: Union[
+            Unset,
+            DeploymentStateCompletedStatus,
+            DeploymentStateCompletedStatusFailed,
+            DeploymentStateCompletedStatusStopped,
+            DeploymentStateCompletedStatusSuccessful,
+        ]
         if isinstance(_status, Unset):
             status = UNSET
         else:
-            status = DeploymentStateCompletedStatus.from_dict(_status)
+            status = DeploymentStateCompletedStatus.from_dict_by_type(_status)
 
-        _start_date = d.pop("start_date", UNSET)
+        _start_date = d.get("start_date", UNSET)
         start_date: Union[Unset, datetime.datetime]
         if isinstance(_start_date, Unset):
             start_date = UNSET
         else:
-            start_date = isoparse(_start_date)
+            start_date = parse_datetime(_start_date)
 
-        _completion_date = d.pop("completion_date", UNSET)
+        _completion_date = d.get("completion_date", UNSET)
         completion_date: Union[Unset, datetime.datetime]
         if isinstance(_completion_date, Unset):
             completion_date = UNSET
         else:
-            completion_date = isoparse(_completion_date)
+            completion_date = parse_datetime(_completion_date)
 
         deployment_state_completed = cls(
             type=type,
@@ -131,7 +145,10 @@ class DeploymentStateCompleted:
             completion_date=completion_date,
         )
 
-        deployment_state_completed.additional_properties = d
+        if _KNOWN_KEYS.issuperset(d):
+            deployment_state_completed.additional_properties = EMPTY_PROPERTIES
+        else:
+            deployment_state_completed.additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return deployment_state_completed
 
     @property
@@ -142,6 +159,8 @@ class DeploymentStateCompleted:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
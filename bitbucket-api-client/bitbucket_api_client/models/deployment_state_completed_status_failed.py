@@ -3,21 +3,22 @@ from typing import Any, Dict, List, Type, TypeVar, Union
 import attr
 
 from ..models.deployment_state_completed_status_failed_name import DeploymentStateCompletedStatusFailedName
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="DeploymentStateCompletedStatusFailed")
+_KNOWN_KEYS = frozenset({"type", "name"})
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class DeploymentStateCompletedStatusFailed:
     """
     Attributes:
-        type (str):
+        type (Union[Unset, str]):
         name (Union[Unset, DeploymentStateCompletedStatusFailedName]): The name of the completed deployment status
             (FAILED).
     """
 
-    type: str
+    type: Union[Unset, str]
     name: Union[Unset, DeploymentStateCompletedStatusFailedName] = UNSET
     additional_properties: Dict[str, Any] = attr.ib(init=False, factory=dict)
 
@@ -29,11 +30,8 @@ class DeploymentStateCompletedStatusFailed:
 
         field_dict: Dict[str, Any] = {}
         field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "type": type,
-            }
-        )
+        if type is not UNSET:
+            field_dict["type"] = type
         if name is not UNSET:
             field_dict["name"] = name
 
@@ -41,10 +39,10 @@ class DeploymentStateCompletedStatusFailed:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        type = d.pop("type")
+        d = src_dict
+        type = d.get("type", UNSET)
 
-        _name = d.pop("name", UNSET)
+        _name = d.get("name", UNSET)
         name: Union[Unset, DeploymentStateCompletedStatusFailedName]
         if isinstance(_name, Unset):
             name = UNSET
@@ -56,7 +54,12 @@ class DeploymentStateCompletedStatusFailed:
             name=name,
         )
 
-        deployment_state_completed_status_failed.additional_properties = d
+        if _KNOWN_KEYS.issuperset(d):
+            deployment_state_completed_status_failed.additional_properties = EMPTY_PROPERTIES
+        else:
+            deployment_state_completed_status_failed.additional_properties = {
+                k: v for k, v in d.items() if k not in _KNOWN_KEYS
+            }
         return deployment_state_completed_status_failed
 
     @property
@@ -67,6 +70,8 @@ class DeploymentStateCompletedStatusFailed:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -3,21 +3,22 @@ from typing import Any, Dict, List, Type, TypeVar, Union
 import attr
 
 from ..models.deployment_state_completed_status_successful_name import DeploymentStateCompletedStatusSuccessfulName
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="DeploymentStateCompletedStatusSuccessful")
+_KNOWN_KEYS = frozenset({"type", "name"})
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class DeploymentStateCompletedStatusSuccessful:
     """
     Attributes:
-        type (str):
+        type (Union[Unset, str]):
         name (Union[Unset, DeploymentStateCompletedStatusSuccessfulName]): The name of the completed deployment status
             (SUCCESSFUL).
     """
 
-    type: str
+    type: Union[Unset, str]
     name: Union[Unset, DeploymentStateCompletedStatusSuccessfulName] = UNSET
     additional_properties: Dict[str, Any] = attr.ib(init=False, factory=dict)
 
@@ -29,11 +30,8 @@ class DeploymentStateCompletedStatusSuccessful:
 
         field_dict: Dict[str, Any] = {}
         field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "type": type,
-            }
-        )
+        if type is not UNSET:
+            field_dict["type"] = type
         if name is not UNSET:
             field_dict["name"] = name
 
@@ -41,10 +39,10 @@ class DeploymentStateCompletedStatusSuccessful:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        type = d.pop("type")
+        d = src_dict
+        type = d.get("type", UNSET)
 
-        _name = d.pop("name", UNSET)
+        _name = d.get("name", UNSET)
         name: Union[Unset, DeploymentStateCompletedStatusSuccessfulName]
         if isinstance(_name, Unset):
             name = UNSET
@@ -56,7 +54,12 @@ class DeploymentStateCompletedStatusSuccessful:
             name=name,
         )
 
-        deployment_state_completed_status_successful.additional_properties = d
+        if _KNOWN_KEYS.issuperset(d):
+            deployment_state_completed_status_successful.additional_properties = EMPTY_PROPERTIES
+        else:
+            deployment_state_completed_status_successful.additional_properties = {
+                k: v for k, v in d.items() if k not in _KNOWN_KEYS
+            }
         return deployment_state_completed_status_successful
 
     @property
@@ -67,6 +70,8 @@ class DeploymentStateCompletedStatusSuccessful:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
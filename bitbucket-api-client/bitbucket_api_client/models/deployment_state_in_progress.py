@@ -2,27 +2,28 @@ import datetime
 from typing import Any, Dict, List, Type, TypeVar, Union
 
 import attr
-from dateutil.parser import isoparse
 
+from ..dates import parse_datetime
 from ..models.account import Account
 from ..models.deployment_state_in_progress_name import DeploymentStateInProgressName
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="DeploymentStateInProgress")
+_KNOWN_KEYS = frozenset({"type", "name", "url", "deployer", "start_date"})
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class DeploymentStateInProgress:
     """
     Attributes:
-        type (str):
+        type (Union[Unset, str]):
         name (Union[Unset, DeploymentStateInProgressName]): The name of deployment state (IN_PROGRESS).
         url (Union[Unset, str]): Link to the deployment result.
         deployer (Union[Unset, Account]):
         start_date (Union[Unset, datetime.datetime]): The timestamp when the deployment was started.
     """
 
-    type: str
+    type: Union[Unset, str]
     name: Union[Unset, DeploymentStateInProgressName] = UNSET
     url: Union[Unset, str] = UNSET
     deployer: Union[Unset, Account] = UNSET
@@ -46,11 +47,8 @@ class DeploymentStateInProgress:
 
         field_dict: Dict[str, Any] = {}
         field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "type": type,
-            }
-        )
+        if type is not UNSET:
+            field_dict["type"] = type
         if name is not UNSET:
             field_dict["name"] = name
         if url is not UNSET:
@@ -64,31 +62,31 @@ class DeploymentStateInProgress:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        type = d.pop("type")
+        d = src_dict
+        type = d.get("type", UNSET)
 
-        _name = d.pop("name", UNSET)
+        _name = d.get("name", UNSET)
         name: Union[Unset, DeploymentStateInProgressName]
         if isinstance(_name, Unset):
             name = UNSET
         else:
             name = DeploymentStateInProgressName(_name)
 
-        url = d.pop("url", UNSET)
+        url = d.get("url", UNSET)
 
-        _deployer = d.pop("deployer", UNSET)
+        _deployer = d.get("deployer", UNSET)
         deployer: Union[Unset, Account]
         if isinstance(_deployer, Unset):
             deployer = UNSET
         else:
             deployer = Account.from_dict(_deployer)
 
-        _start_date = d.pop("start_date", UNSET)
+        _start_date = d.get("start_date", UNSET)
         start_date: Union[Unset, datetime.datetime]
         if isinstance(_start_date, Unset):
             start_date = UNSET
         else:
-            start_date = isoparse(_start_date)
+            start_date = parse_datetime(_start_date)
 
         deployment_state_in_progress = cls(
             type=type,
@@ -98,7 +96,10 @@ class DeploymentStateInProgress:
             start_date=start_date,
         )
 
-        deployment_state_in_progress.additional_properties = d
+        if _KNOWN_KEYS.issuperset(d):
+            deployment_state_in_progress.additional_properties = EMPTY_PROPERTIES
+        else:
+            deployment_state_in_progress.additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return deployment_state_in_progress
 
     @property
@@ -109,6 +110,8 @@ class DeploymentStateInProgress:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -3,21 +3,22 @@ from typing import Any, Dict, List, Type, TypeVar, Union
 import attr
 
 from ..models.deployment_state_undeployed_name import DeploymentStateUndeployedName
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="DeploymentStateUndeployed")
+_KNOWN_KEYS = frozenset({"type", "name", "trigger_url"})
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class DeploymentStateUndeployed:
     """
     Attributes:
-        type (str):
+        type (Union[Unset, str]):
         name (Union[Unset, DeploymentStateUndeployedName]): The name of deployment state (UNDEPLOYED).
         trigger_url (Union[Unset, str]): Link to trigger the deployment.
     """
 
-    type: str
+    type: Union[Unset, str]
     name: Union[Unset, DeploymentStateUndeployedName] = UNSET
     trigger_url: Union[Unset, str] = UNSET
     additional_properties: Dict[str, Any] = attr.ib(init=False, factory=dict)
@@ -32,11 +33,8 @@ class DeploymentStateUndeployed:
 
         field_dict: Dict[str, Any] = {}
         field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "type": type,
-            }
-        )
+        if type is not UNSET:
+            field_dict["type"] = type
         if name is not UNSET:
             field_dict["name"] = name
         if trigger_url is not UNSET:
@@ -46,17 +44,17 @@ class DeploymentStateUndeployed:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        type = d.pop("type")
+        d = src_dict
+        type = d.get("type", UNSET)
 
-        _name = d.pop("name", UNSET)
+        _name = d.get("name", UNSET)
         name: Union[Unset, DeploymentStateUndeployedName]
         if isinstance(_name, Unset):
             name = UNSET
         else:
             name = DeploymentStateUndeployedName(_name)
 
-        trigger_url = d.pop("trigger_url", UNSET)
+        trigger_url = d.get("trigger_url", UNSET)
 
         deployment_state_undeployed = cls(
             type=type,
@@ -64,7 +62,10 @@ class DeploymentStateUndeployed:
             trigger_url=trigger_url,
         )
 
-        deployment_state_undeployed.additional_properties = d
+        if _KNOWN_KEYS.issuperset(d):
+            deployment_state_undeployed.additional_properties = EMPTY_PROPERTIES
+        else:
+            deployment_state_undeployed.additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return deployment_state_undeployed
 
     @property
@@ -75,6 +76,8 @@ class DeploymentStateUndeployed:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -2,16 +2,17 @@ from typing import Any, Dict, List, Type, TypeVar, Union
 
 import attr
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="DeploymentVariable")
+_KNOWN_KEYS = frozenset({"type", "uuid", "key", "value", "secured"})
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class DeploymentVariable:
     """
     Attributes:
-        type (str):
+        type (Union[Unset, str]):
         uuid (Union[Unset, str]): The UUID identifying the variable.
         key (Union[Unset, str]): The unique name of the variable.
         value (Union[Unset, str]): The value of the variable. If the variable is secured, this will be empty.
@@ -19,7 +20,7 @@ class DeploymentVariable:
             in the logs or the REST API.
     """
 
-    type: str
+    type: Union[Unset, str]
     uuid: Union[Unset, str] = UNSET
     key: Union[Unset, str] = UNSET
     value: Union[Unset, str] = UNSET
@@ -35,11 +36,8 @@ class DeploymentVariable:
 
         field_dict: Dict[str, Any] = {}
         field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "type": type,
-            }
-        )
+        if type is not UNSET:
+            field_dict["type"] = type
         if uuid is not UNSET:
             field_dict["uuid"] = uuid
         if key is not UNSET:
@@ -53,16 +51,16 @@ class DeploymentVariable:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        type = d.pop("type")
+        d = src_dict
+        type = d.get("type", UNSET)
 
-        uuid = d.pop("uuid", UNSET)
+        uuid = d.get("uuid", UNSET)
 
-        key = d.pop("key", UNSET)
+        key = d.get("key", UNSET)
 
-        value = d.pop("value", UNSET)
+        value = d.get("value", UNSET)
 
-        secured = d.pop("secured", UNSET)
+        secured = d.get("secured", UNSET)
 
         deployment_variable = cls(
             type=type,
@@ -72,7 +70,10 @@ class DeploymentVariable:
             secured=secured,
         )
 
-        deployment_variable.additional_properties = d
+        if _KNOWN_KEYS.issuperset(d):
+            deployment_variable.additional_properties = EMPTY_PROPERTIES
+        else:
+            deployment_variable.additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return deployment_variable
 
     @property
@@ -83,6 +84,8 @@ class DeploymentVariable:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -2,20 +2,21 @@ from typing import Any, Dict, List, Type, TypeVar, Union
 
 import attr
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="DeploymentsDdevDeploymentEnvironmentLock")
+_KNOWN_KEYS = frozenset({"type", "environmentUuid"})
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class DeploymentsDdevDeploymentEnvironmentLock:
     """
     Attributes:
-        type (str):
+        type (Union[Unset, str]):
         environment_uuid (Union[Unset, str]): The UUID identifying the environment.
     """
 
-    type: str
+    type: Union[Unset, str]
     environment_uuid: Union[Unset, str] = UNSET
     additional_properties: Dict[str, Any] = attr.ib(init=False, factory=dict)
 
@@ -25,11 +26,8 @@ class DeploymentsDdevDeploymentEnvironmentLock:
 
         field_dict: Dict[str, Any] = {}
         field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "type": type,
-            }
-        )
+        if type is not UNSET:
+            field_dict["type"] = type
         if environment_uuid is not UNSET:
             field_dict["environmentUuid"] = environment_uuid
 
@@ -37,17 +35,22 @@ class DeploymentsDdevDeploymentEnvironmentLock:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        type = d.pop("type")
+        d = src_dict
+        type = d.get("type", UNSET)
 
-        environment_uuid = d.pop("environmentUuid", UNSET)
+        environment_uuid = d.get("environmentUuid", UNSET)
 
         deployments_ddev_deployment_environment_lock = cls(
             type=type,
             environment_uuid=environment_uuid,
         )
 
-        deployments_ddev_deployment_environment_lock.additional_properties = d
+        if _KNOWN_KEYS.issuperset(d):
+            deployments_ddev_deployment_environment_lock.additional_properties = EMPTY_PROPERTIES
+        else:
+            deployments_ddev_deployment_environment_lock.additional_properties = {
+                k: v for k, v in d.items() if k not in _KNOWN_KEYS
+            }
         return deployments_ddev_deployment_environment_lock
 
     @property
@@ -58,6 +61,8 @@ class DeploymentsDdevDeploymentEnvironmentLock:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -3,12 +3,13 @@ from typing import Any, Dict, List, Type, TypeVar, Union
 import attr
 
 from ..models.error_error import ErrorError
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="Error")
+_KNOWN_KEYS = frozenset({"type", "error"})
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class Error:
     """Base type for most resource objects. It defines the common `type` element that identifies an object's type. It also
     identifies the element as Swagger's `discriminator`.
@@ -18,7 +19,7 @@ class Error:
             error (Union[Unset, ErrorError]):
     """
 
-    type: str
+    type: Union[Unset, str]
     error: Union[Unset, ErrorError] = UNSET
     additional_properties: Dict[str, Any] = attr.ib(init=False, factory=dict)
 
@@ -30,11 +31,8 @@ class Error:
 
         field_dict: Dict[str, Any] = {}
         field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "type": type,
-            }
-        )
+        if type is not UNSET:
+            field_dict["type"] = type
         if error is not UNSET:
             field_dict["error"] = error
 
@@ -42,10 +40,10 @@ class Error:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        type = d.pop("type")
+        d = src_dict
+        type = d.get("type", UNSET)
 
-        _error = d.pop("error", UNSET)
+        _error = d.get("error", UNSET)
         error: Union[Unset, ErrorError]
         if isinstance(_error, Unset):
             error = UNSET
@@ -57,7 +55,10 @@ class Error:
             error=error,
         )
 
-        error.additional_properties = d
+        if _KNOWN_KEYS.issuperset(d):
+            error.additional_properties = EMPTY_PROPERTIES
+        else:
+            error.additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return error
 
     @property
@@ -68,6 +69,8 @@ class Error:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
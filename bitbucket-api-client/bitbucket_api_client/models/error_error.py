@@ -8,16 +8,16 @@ from ..types import UNSET, Unset
 T = TypeVar("T", bound="ErrorError")
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class ErrorError:
     """
     Attributes:
-        message (str):
+        message (Union[Unset, str]):
         detail (Union[Unset, str]):
         data (Union[Unset, ErrorErrorData]): Optional structured data that is endpoint-specific.
     """
 
-    message: str
+    message: Union[Unset, str]
     detail: Union[Unset, str] = UNSET
     data: Union[Unset, ErrorErrorData] = UNSET
 
@@ -29,11 +29,8 @@ class ErrorError:
             data = self.data.to_dict()
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(
-            {
-                "message": message,
-            }
-        )
+        if message is not UNSET:
+            field_dict["message"] = message
         if detail is not UNSET:
             field_dict["detail"] = detail
         if data is not UNSET:
@@ -43,12 +40,12 @@ class ErrorError:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        message = d.pop("message")
+        d = src_dict
+        message = d.get("message", UNSET)
 
-        detail = d.pop("detail", UNSET)
+        detail = d.get("detail", UNSET)
 
-        _data = d.pop("data", UNSET)
+        _data = d.get("data", UNSET)
         data: Union[Unset, ErrorErrorData]
         if isinstance(_data, Unset):
             data = UNSET
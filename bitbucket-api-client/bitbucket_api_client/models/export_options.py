@@ -2,24 +2,25 @@ from typing import Any, Dict, List, Type, TypeVar, Union
 
 import attr
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="ExportOptions")
+_KNOWN_KEYS = frozenset({"type", "project_key", "project_name", "send_email", "include_attachments"})
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class ExportOptions:
     """Options for issue export.
 
     Attributes:
-        type (str):
+        type (Union[Unset, str]):
         project_key (Union[Unset, str]):
         project_name (Union[Unset, str]):
         send_email (Union[Unset, bool]):
         include_attachments (Union[Unset, bool]):
     """
 
-    type: str
+    type: Union[Unset, str]
     project_key: Union[Unset, str] = UNSET
     project_name: Union[Unset, str] = UNSET
     send_email: Union[Unset, bool] = UNSET
@@ -35,11 +36,8 @@ class ExportOptions:
 
         field_dict: Dict[str, Any] = {}
         field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "type": type,
-            }
-        )
+        if type is not UNSET:
+            field_dict["type"] = type
         if project_key is not UNSET:
             field_dict["project_key"] = project_key
         if project_name is not UNSET:
@@ -53,16 +51,16 @@ class ExportOptions:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        type = d.pop("type")
+        d = src_dict
+        type = d.get("type", UNSET)
 
-        project_key = d.pop("project_key", UNSET)
+        project_key = d.get("project_key", UNSET)
 
-        project_name = d.pop("project_name", UNSET)
+        project_name = d.get("project_name", UNSET)
 
-        send_email = d.pop("send_email", UNSET)
+        send_email = d.get("send_email", UNSET)
 
-        include_attachments = d.pop("include_attachments", UNSET)
+        include_attachments = d.get("include_attachments", UNSET)
 
         export_options = cls(
             type=type,
@@ -72,7 +70,10 @@ class ExportOptions:
             include_attachments=include_attachments,
         )
 
-        export_options.additional_properties = d
+        if _KNOWN_KEYS.issuperset(d):
+            export_options.additional_properties = EMPTY_PROPERTIES
+        else:
+            export_options.additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return export_options
 
     @property
@@ -83,6 +84,8 @@ class ExportOptions:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
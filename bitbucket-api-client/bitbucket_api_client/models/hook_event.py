@@ -8,7 +8,7 @@ from ..types import UNSET, Unset
 T = TypeVar("T", bound="HookEvent")
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class HookEvent:
     """An event, associated with a resource or subject type.
 
@@ -48,19 +48,19 @@ class HookEvent:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        _event = d.pop("event", UNSET)
+        d = src_dict
+        _event = d.get("event", UNSET)
         event: Union[Unset, HookEventEvent]
         if isinstance(_event, Unset):
             event = UNSET
         else:
             event = HookEventEvent(_event)
 
-        category = d.pop("category", UNSET)
+        category = d.get("category", UNSET)
 
-        label = d.pop("label", UNSET)
+        label = d.get("label", UNSET)
 
-        description = d.pop("description", UNSET)
+        description = d.get("description", UNSET)
 
         hook_event = cls(
             event=event,
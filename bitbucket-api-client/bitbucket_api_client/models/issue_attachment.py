@@ -3,21 +3,22 @@ from typing import Any, Dict, List, Type, TypeVar, Union
 import attr
 
 from ..models.issue_attachment_links import IssueAttachmentLinks
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="IssueAttachment")
+_KNOWN_KEYS = frozenset({"type", "links", "name"})
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class IssueAttachment:
     """
     Attributes:
-        type (str):
+        type (Union[Unset, str]):
         links (Union[Unset, IssueAttachmentLinks]):
         name (Union[Unset, str]):
     """
 
-    type: str
+    type: Union[Unset, str]
     links: Union[Unset, IssueAttachmentLinks] = UNSET
     name: Union[Unset, str] = UNSET
     additional_properties: Dict[str, Any] = attr.ib(init=False, factory=dict)
@@ -32,11 +33,8 @@ class IssueAttachment:
 
         field_dict: Dict[str, Any] = {}
         field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "type": type,
-            }
-        )
+        if type is not UNSET:
+            field_dict["type"] = type
         if links is not UNSET:
             field_dict["links"] = links
         if name is not UNSET:
@@ -46,17 +44,17 @@ class IssueAttachment:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        type = d.pop("type")
+        d = src_dict
+        type = d.get("type", UNSET)
 
-        _links = d.pop("links", UNSET)
+        _links = d.get("links", UNSET)
         links: Union[Unset, IssueAttachmentLinks]
         if isinstance(_links, Unset):
             links = UNSET
         else:
             links = IssueAttachmentLinks.from_dict(_links)
 
-        name = d.pop("name", UNSET)
+        name = d.get("name", UNSET)
 
         issue_attachment = cls(
             type=type,
@@ -64,7 +62,10 @@ class IssueAttachment:
             name=name,
         )
 
-        issue_attachment.additional_properties = d
+        if _KNOWN_KEYS.issuperset(d):
+            issue_attachment.additional_properties = EMPTY_PROPERTIES
+        else:
+            issue_attachment.additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return issue_attachment
 
     @property
@@ -75,6 +76,8 @@ class IssueAttachment:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -8,7 +8,7 @@ from ..types import UNSET, Unset
 T = TypeVar("T", bound="IssueAttachmentLinks")
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class IssueAttachmentLinks:
     """
     Attributes:
@@ -31,8 +31,8 @@ class IssueAttachmentLinks:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        _self_ = d.pop("self", UNSET)
+        d = src_dict
+        _self_ = d.get("self", UNSET)
         self_: Union[Unset, IssueAttachmentLinksLink]
         if isinstance(_self_, Unset):
             self_ = UNSET
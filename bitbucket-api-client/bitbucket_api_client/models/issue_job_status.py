@@ -8,7 +8,7 @@ from ..types import UNSET, Unset
 T = TypeVar("T", bound="IssueJobStatus")
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class IssueJobStatus:
     """The status of an import or export job
 
@@ -58,23 +58,23 @@ class IssueJobStatus:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        type = d.pop("type", UNSET)
+        d = src_dict
+        type = d.get("type", UNSET)
 
-        _status = d.pop("status", UNSET)
+        _status = d.get("status", UNSET)
         status: Union[Unset, IssueJobStatusStatus]
         if isinstance(_status, Unset):
             status = UNSET
         else:
             status = IssueJobStatusStatus(_status)
 
-        phase = d.pop("phase", UNSET)
+        phase = d.get("phase", UNSET)
 
-        total = d.pop("total", UNSET)
+        total = d.get("total", UNSET)
 
-        count = d.pop("count", UNSET)
+        count = d.get("count", UNSET)
 
-        pct = d.pop("pct", UNSET)
+        pct = d.get("pct", UNSET)
 
         issue_job_status = cls(
             type=type,
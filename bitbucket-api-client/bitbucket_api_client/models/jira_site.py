@@ -1,18 +1,21 @@
-from typing import Any, Dict, List, Type, TypeVar
+from typing import Any, Dict, List, Type, TypeVar, Union
 
 import attr
 
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
+
 T = TypeVar("T", bound="JiraSite")
+_KNOWN_KEYS = frozenset({"type"})
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class JiraSite:
     """
     Attributes:
-        type (str):
+        type (Union[Unset, str]):
     """
 
-    type: str
+    type: Union[Unset, str]
     additional_properties: Dict[str, Any] = attr.ib(init=False, factory=dict)
 
     def to_dict(self) -> Dict[str, Any]:
@@ -20,24 +23,24 @@ class JiraSite:
 
         field_dict: Dict[str, Any] = {}
         field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "type": type,
-            }
-        )
+        if type is not UNSET:
+            field_dict["type"] = type
 
         return field_dict
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        type = d.pop("type")
+        d = src_dict
+        type = d.get("type", UNSET)
 
         jira_site = cls(
             type=type,
         )
 
-        jira_site.additional_properties = d
+        if _KNOWN_KEYS.issuperset(d):
+            jira_site.additional_properties = EMPTY_PROPERTIES
+        else:
+            jira_site.additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return jira_site
 
     @property
@@ -48,6 +51,8 @@ class JiraSite:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -7,7 +7,7 @@ from ..types import UNSET, Unset
 T = TypeVar("T", bound="Page")
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class Page:
     """
     Attributes:
@@ -55,16 +55,16 @@ class Page:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        size = d.pop("size", UNSET)
+        d = src_dict
+        size = d.get("size", UNSET)
 
-        page = d.pop("page", UNSET)
+        page = d.get("page", UNSET)
 
-        pagelen = d.pop("pagelen", UNSET)
+        pagelen = d.get("pagelen", UNSET)
 
-        next_ = d.pop("next", UNSET)
+        next_ = d.get("next", UNSET)
 
-        previous = d.pop("previous", UNSET)
+        previous = d.get("previous", UNSET)
 
         page = cls(
             size=size,
@@ -8,7 +8,7 @@ from ..types import UNSET, Unset
 T = TypeVar("T", bound="PaginatedComponents")
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class PaginatedComponents:
     """A paginated list of issue tracker components.
 
@@ -68,19 +68,19 @@ class PaginatedComponents:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        size = d.pop("size", UNSET)
+        d = src_dict
+        size = d.get("size", UNSET)
 
-        page = d.pop("page", UNSET)
+        page = d.get("page", UNSET)
 
-        pagelen = d.pop("pagelen", UNSET)
+        pagelen = d.get("pagelen", UNSET)
 
-        next_ = d.pop("next", UNSET)
+        next_ = d.get("next", UNSET)
 
-        previous = d.pop("previous", UNSET)
+        previous = d.get("previous", UNSET)
 
         values = []
-        _values = d.pop("values", UNSET)
+        _values = d.get("values", UNSET)
         for values_item_data in _values or []:
             values_item = Component.from_dict(values_item_data)
 
@@ -3,12 +3,13 @@ from typing import Any, Dict, List, Type, TypeVar, Union
 import attr
 
 from ..models.pipeline_variable import PipelineVariable
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="PaginatedPipelineVariables")
+_KNOWN_KEYS = frozenset({"page", "values", "size", "pagelen", "next", "previous"})
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class PaginatedPipelineVariables:
     """A paged list of variables.
 
@@ -71,23 +72,23 @@ class PaginatedPipelineVariables:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        page = d.pop("page", UNSET)
+        d = src_dict
+        page = d.get("page", UNSET)
 
         values = []
-        _values = d.pop("values", UNSET)
+        _values = d.get("values", UNSET)
         for values_item_data in _values or []:
             values_item = PipelineVariable.from_dict(values_item_data)
 
             values.append(values_item)
 
-        size = d.pop("size", UNSET)
+        size = d.get("size", UNSET)
 
-        pagelen = d.pop("pagelen", UNSET)
+        pagelen = d.get("pagelen", UNSET)
 
-        next_ = d.pop("next", UNSET)
+        next_ = d.get("next", UNSET)
 
-        previous = d.pop("previous", UNSET)
+        previous = d.get("previous", UNSET)
 
         paginated_pipeline_variables = cls(
             page=page,
@@ -98,7 +99,10 @@ class PaginatedPipelineVariables:
             previous=previous,
         )
 
-        paginated_pipeline_variables.additional_properties = d
+        if _KNOWN_KEYS.issuperset(d):
+            paginated_pipeline_variables.additional_properties = EMPTY_PROPERTIES
+        else:
+            paginated_pipeline_variables.additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return paginated_pipeline_variables
 
     @property
@@ -109,6 +113,8 @@ class PaginatedPipelineVariables:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -2,21 +2,22 @@ import datetime
 from typing import Any, Dict, List, Type, TypeVar, Union
 
 import attr
-from dateutil.parser import isoparse
 
+from ..dates import parse_datetime
 from ..models.account import Account
 from ..models.participant_role import ParticipantRole
 from ..models.participant_state import ParticipantState
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="Participant")
+_KNOWN_KEYS = frozenset({"type", "user", "role", "approved", "state", "participated_on"})
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class Participant:
     """
     Attributes:
-        type (str):
+        type (Union[Unset, str]):
         user (Union[Unset, Account]):
         role (Union[Unset, ParticipantRole]):
         approved (Union[Unset, bool]):
@@ -26,7 +27,7 @@ class Participant:
             this is the time they last commented, or null if they have not commented.
     """
 
-    type: str
+    type: Union[Unset, str]
     user: Union[Unset, Account] = UNSET
     role: Union[Unset, ParticipantRole] = UNSET
     approved: Union[Unset, bool] = UNSET
@@ -55,11 +56,8 @@ class Participant:
 
         field_dict: Dict[str, Any] = {}
         field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "type": type,
-            }
-        )
+        if type is not UNSET:
+            field_dict["type"] = type
         if user is not UNSET:
             field_dict["user"] = user
         if role is not UNSET:
@@ -75,26 +73,26 @@ class Participant:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        type = d.pop("type")
+        d = src_dict
+        type = d.get("type", UNSET)
 
-        _user = d.pop("user", UNSET)
+        _user = d.get("user", UNSET)
         user: Union[Unset, Account]
         if isinstance(_user, Unset):
             user = UNSET
         else:
             user = Account.from_dict(_user)
 
-        _role = d.pop("role", UNSET)
+        _role = d.get("role", UNSET)
         role: Union[Unset, ParticipantRole]
         if isinstance(_role, Unset):
             role = UNSET
         else:
             role = ParticipantRole(_role)
 
-        approved = d.pop("approved", UNSET)
+        approved = d.get("approved", UNSET)
 
-        _state = d.pop("state", UNSET)
+        _state = d.get("state", UNSET)
         state: Union[Unset, None, ParticipantState]
         if _state is None:
             state = None
@@ -103,12 +101,12 @@ class Participant:
         else:
             state = ParticipantState(_state)
 
-        _participated_on = d.pop("participated_on", UNSET)
+        _participated_on = d.get("participated_on", UNSET)
         participated_on: Union[Unset, datetime.datetime]
         if isinstance(_participated_on, Unset):
             participated_on = UNSET
         else:
-            participated_on = isoparse(_participated_on)
+            participated_on = parse_datetime(_participated_on)
 
         participant = cls(
             type=type,
@@ -119,7 +117,10 @@ class Participant:
             participated_on=participated_on,
         )
 
-        participant.additional_properties = d
+        if _KNOWN_KEYS.issuperset(d):
+            participant.additional_properties = EMPTY_PROPERTIES
+        else:
+            participant.additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return participant
 
     @property
@@ -130,6 +131,8 @@ class Participant:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
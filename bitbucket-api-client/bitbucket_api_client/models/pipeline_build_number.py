@@ -2,20 +2,21 @@ from typing import Any, Dict, List, Type, TypeVar, Union
 
 import attr
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="PipelineBuildNumber")
+_KNOWN_KEYS = frozenset({"type", "next"})
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class PipelineBuildNumber:
     """
     Attributes:
-        type (str):
+        type (Union[Unset, str]):
         next_ (Union[Unset, int]): The next number that will be used as build number.
     """
 
-    type: str
+    type: Union[Unset, str]
     next_: Union[Unset, int] = UNSET
     additional_properties: Dict[str, Any] = attr.ib(init=False, factory=dict)
 
@@ -25,11 +26,8 @@ class PipelineBuildNumber:
 
         field_dict: Dict[str, Any] = {}
         field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "type": type,
-            }
-        )
+        if type is not UNSET:
+            field_dict["type"] = type
         if next_ is not UNSET:
             field_dict["next"] = next_
 
@@ -37,17 +35,20 @@ class PipelineBuildNumber:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        type = d.pop("type")
+        d = src_dict
+        type = d.get("type", UNSET)
 
-        next_ = d.pop("next", UNSET)
+        next_ = d.get("next", UNSET)
 
         pipeline_build_number = cls(
             type=type,
             next_=next_,
         )
 
-        pipeline_build_number.additional_properties = d
+        if _KNOWN_KEYS.issuperset(d):
+            pipeline_build_number.additional_properties = EMPTY_PROPERTIES
+        else:
+            pipeline_build_number.additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return pipeline_build_number
 
     @property
@@ -58,6 +59,8 @@ class PipelineBuildNumber:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
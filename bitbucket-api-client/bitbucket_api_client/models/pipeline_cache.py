@@ -2,18 +2,19 @@ import datetime
 from typing import Any, Dict, List, Type, TypeVar, Union
 
 import attr
-from dateutil.parser import isoparse
 
-from ..types import UNSET, Unset
+from ..dates import parse_datetime
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="PipelineCache")
+_KNOWN_KEYS = frozenset({"type", "uuid", "pipeline_uuid", "step_uuid", "name", "path", "file_size_bytes", "created_on"})
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class PipelineCache:
     """
     Attributes:
-        type (str):
+        type (Union[Unset, str]):
         uuid (Union[Unset, str]): The UUID identifying the pipeline cache.
         pipeline_uuid (Union[Unset, str]): The UUID of the pipeline that created the cache.
         step_uuid (Union[Unset, str]): The uuid of the step that created the cache.
@@ -23,7 +24,7 @@ class PipelineCache:
         created_on (Union[Unset, datetime.datetime]): The timestamp when the cache was created.
     """
 
-    type: str
+    type: Union[Unset, str]
     uuid: Union[Unset, str] = UNSET
     pipeline_uuid: Union[Unset, str] = UNSET
     step_uuid: Union[Unset, str] = UNSET
@@ -47,11 +48,8 @@ class PipelineCache:
 
         field_dict: Dict[str, Any] = {}
         field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "type": type,
-            }
-        )
+        if type is not UNSET:
+            field_dict["type"] = type
         if uuid is not UNSET:
             field_dict["uuid"] = uuid
         if pipeline_uuid is not UNSET:
@@ -71,27 +69,27 @@ class PipelineCache:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        type = d.pop("type")
+        d = src_dict
+        type = d.get("type", UNSET)
 
-        uuid = d.pop("uuid", UNSET)
+        uuid = d.get("uuid", UNSET)
 
-        pipeline_uuid = d.pop("pipeline_uuid", UNSET)
+        pipeline_uuid = d.get("pipeline_uuid", UNSET)
 
-        step_uuid = d.pop("step_uuid", UNSET)
+        step_uuid = d.get("step_uuid", UNSET)
 
-        name = d.pop("name", UNSET)
+        name = d.get("name", UNSET)
 
-        path = d.pop("path", UNSET)
+        path = d.get("path", UNSET)
 
-        file_size_bytes = d.pop("file_size_bytes", UNSET)
+        file_size_bytes = d.get("file_size_bytes", UNSET)
 
-        _created_on = d.pop("created_on", UNSET)
+        _created_on = d.get("created_on", UNSET)
         created_on: Union[Unset, datetime.datetime]
         if isinstance(_created_on, Unset):
             created_on = UNSET
         else:
-            created_on = isoparse(_created_on)
+            created_on = parse_datetime(_created_on)
 
         pipeline_cache = cls(
             type=type,
@@ -104,7 +102,10 @@ class PipelineCache:
             created_on=created_on,
         )
 
-        pipeline_cache.additional_properties = d
+        if _KNOWN_KEYS.issuperset(d):
+            pipeline_cache.additional_properties = EMPTY_PROPERTIES
+        else:
+            pipeline_cache.additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return pipeline_cache
 
     @property
@@ -115,6 +116,8 @@ class PipelineCache:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
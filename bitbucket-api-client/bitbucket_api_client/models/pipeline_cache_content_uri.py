@@ -2,12 +2,13 @@ from typing import Any, Dict, List, Type, TypeVar, Union
 
 import attr
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="PipelineCacheContentURI")
+_KNOWN_KEYS = frozenset({"uri"})
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class PipelineCacheContentURI:
     """A representation of the location of pipeline cache content.
 
@@ -31,14 +32,17 @@ class PipelineCacheContentURI:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        uri = d.pop("uri", UNSET)
+        d = src_dict
+        uri = d.get("uri", UNSET)
 
         pipeline_cache_content_uri = cls(
             uri=uri,
         )
 
-        pipeline_cache_content_uri.additional_properties = d
+        if _KNOWN_KEYS.issuperset(d):
+            pipeline_cache_content_uri.additional_properties = EMPTY_PROPERTIES
+        else:
+            pipeline_cache_content_uri.additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return pipeline_cache_content_uri
 
     @property
@@ -49,6 +53,8 @@ class PipelineCacheContentURI:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -2,12 +2,13 @@ from typing import Any, Dict, List, Type, TypeVar, Union
 
 import attr
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="PipelineCommand")
+_KNOWN_KEYS = frozenset({"name", "command"})
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class PipelineCommand:
     """An executable pipeline command.
 
@@ -36,17 +37,20 @@ class PipelineCommand:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        name = d.pop("name", UNSET)
+        d = src_dict
+        name = d.get("name", UNSET)
 
-        command = d.pop("command", UNSET)
+        command = d.get("command", UNSET)
 
         pipeline_command = cls(
             name=name,
             command=command,
         )
 
-        pipeline_command.additional_properties = d
+        if _KNOWN_KEYS.issuperset(d):
+            pipeline_command.additional_properties = EMPTY_PROPERTIES
+        else:
+            pipeline_command.additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return pipeline_command
 
     @property
@@ -57,6 +61,8 @@ class PipelineCommand:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -2,21 +2,22 @@ from typing import Any, Dict, List, Type, TypeVar, Union
 
 import attr
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="PipelineError")
+_KNOWN_KEYS = frozenset({"type", "key", "message"})
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class PipelineError:
     """
     Attributes:
-        type (str):
+        type (Union[Unset, str]):
         key (Union[Unset, str]): The error key.
         message (Union[Unset, str]): The error message.
     """
 
-    type: str
+    type: Union[Unset, str]
     key: Union[Unset, str] = UNSET
     message: Union[Unset, str] = UNSET
     additional_properties: Dict[str, Any] = attr.ib(init=False, factory=dict)
@@ -28,11 +29,8 @@ class PipelineError:
 
         field_dict: Dict[str, Any] = {}
         field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "type": type,
-            }
-        )
+        if type is not UNSET:
+            field_dict["type"] = type
         if key is not UNSET:
             field_dict["key"] = key
         if message is not UNSET:
@@ -42,12 +40,12 @@ class PipelineError:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        type = d.pop("type")
+        d = src_dict
+        type = d.get("type", UNSET)
 
-        key = d.pop("key", UNSET)
+        key = d.get("key", UNSET)
 
-        message = d.pop("message", UNSET)
+        message = d.get("message", UNSET)
 
         pipeline_error = cls(
             type=type,
@@ -55,7 +53,10 @@ class PipelineError:
             message=message,
         )
 
-        pipeline_error.additional_properties = d
+        if _KNOWN_KEYS.issuperset(d):
+            pipeline_error.additional_properties = EMPTY_PROPERTIES
+        else:
+            pipeline_error.additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return pipeline_error
 
     @property
@@ -66,6 +67,8 @@ class PipelineError:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -2,12 +2,13 @@ from typing import Any, Dict, List, Type, TypeVar, Union
 
 import attr
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="PipelineImage")
+_KNOWN_KEYS = frozenset({"name", "username", "password", "email"})
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class PipelineImage:
     """The definition of a Docker image that can be used for a Bitbucket Pipelines step execution context.
 
@@ -50,14 +51,14 @@ class PipelineImage:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        name = d.pop("name", UNSET)
+        d = src_dict
+        name = d.get("name", UNSET)
 
-        username = d.pop("username", UNSET)
+        username = d.get("username", UNSET)
 
-        password = d.pop("password", UNSET)
+        password = d.get("password", UNSET)
 
-        email = d.pop("email", UNSET)
+        email = d.get("email", UNSET)
 
         pipeline_image = cls(
             name=name,
@@ -66,7 +67,10 @@ class PipelineImage:
             email=email,
         )
 
-        pipeline_image.additional_properties = d
+        if _KNOWN_KEYS.issuperset(d):
+            pipeline_image.additional_properties = EMPTY_PROPERTIES
+        else:
+            pipeline_image.additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return pipeline_image
 
     @property
@@ -77,6 +81,8 @@ class PipelineImage:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -3,22 +3,23 @@ from typing import Any, Dict, List, Type, TypeVar, Union
 import attr
 
 from ..models.pipeline_ssh_public_key import PipelineSshPublicKey
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="PipelineKnownHost")
+_KNOWN_KEYS = frozenset({"type", "uuid", "hostname", "public_key"})
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class PipelineKnownHost:
     """
     Attributes:
-        type (str):
+        type (Union[Unset, str]):
         uuid (Union[Unset, str]): The UUID identifying the known host.
         hostname (Union[Unset, str]): The hostname of the known host.
         public_key (Union[Unset, PipelineSshPublicKey]):
     """
 
-    type: str
+    type: Union[Unset, str]
     uuid: Union[Unset, str] = UNSET
     hostname: Union[Unset, str] = UNSET
     public_key: Union[Unset, PipelineSshPublicKey] = UNSET
@@ -34,11 +35,8 @@ class PipelineKnownHost:
 
         field_dict: Dict[str, Any] = {}
         field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "type": type,
-            }
-        )
+        if type is not UNSET:
+            field_dict["type"] = type
         if uuid is not UNSET:
             field_dict["uuid"] = uuid
         if hostname is not UNSET:
@@ -50,14 +48,14 @@ class PipelineKnownHost:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        type = d.pop("type")
+        d = src_dict
+        type = d.get("type", UNSET)
 
-        uuid = d.pop("uuid", UNSET)
+        uuid = d.get("uuid", UNSET)
 
-        hostname = d.pop("hostname", UNSET)
+        hostname = d.get("hostname", UNSET)
 
-        _public_key = d.pop("public_key", UNSET)
+        _public_key = d.get("public_key", UNSET)
         public_key: Union[Unset, PipelineSshPublicKey]
         if isinstance(_public_key, Unset):
             public_key = UNSET
@@ -71,7 +69,10 @@ class PipelineKnownHost:
             public_key=public_key,
         )
 
-        pipeline_known_host.additional_properties = d
+        if _KNOWN_KEYS.issuperset(d):
+            pipeline_known_host.additional_properties = EMPTY_PROPERTIES
+        else:
+            pipeline_known_host.additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return pipeline_known_host
 
     @property
@@ -82,6 +83,8 @@ class PipelineKnownHost:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
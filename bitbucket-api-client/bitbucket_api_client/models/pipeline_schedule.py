@@ -2,20 +2,21 @@ import datetime
 from typing import Any, Dict, List, Type, TypeVar, Union
 
 import attr
-from dateutil.parser import isoparse
 
+from ..dates import parse_datetime
 from ..models.pipeline_selector import PipelineSelector
 from ..models.pipeline_target import PipelineTarget
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="PipelineSchedule")
+_KNOWN_KEYS = frozenset({"type", "uuid", "enabled", "target", "selector", "cron_pattern", "created_on", "updated_on"})
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class PipelineSchedule:
     """
     Attributes:
-        type (str):
+        type (Union[Unset, str]):
         uuid (Union[Unset, str]): The UUID identifying the schedule.
         enabled (Union[Unset, bool]): Whether the schedule is enabled.
         target (Union[Unset, PipelineTarget]):
@@ -25,7 +26,7 @@ class PipelineSchedule:
         updated_on (Union[Unset, datetime.datetime]): The timestamp when the schedule was updated.
     """
 
-    type: str
+    type: Union[Unset, str]
     uuid: Union[Unset, str] = UNSET
     enabled: Union[Unset, bool] = UNSET
     target: Union[Unset, PipelineTarget] = UNSET
@@ -58,11 +59,8 @@ class PipelineSchedule:
 
         field_dict: Dict[str, Any] = {}
         field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "type": type,
-            }
-        )
+        if type is not UNSET:
+            field_dict["type"] = type
         if uuid is not UNSET:
             field_dict["uuid"] = uuid
         if enabled is not UNSET:
@@ -82,42 +80,42 @@ class PipelineSchedule:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        type = d.pop("type")
+        d = src_dict
+        type = d.get("type", UNSET)
 
-        uuid = d.pop("uuid", UNSET)
+        uuid = d.get("uuid", UNSET)
 
-        enabled = d.pop("enabled", UNSET)
+        enabled = d.get("enabled", UNSET)
 
-        _target = d.pop("target", UNSET)
+        _target = d.get("target", UNSET)
         target: Union[Unset, PipelineTarget]
         if isinstance(_target, Unset):
             target = UNSET
         else:
             target = PipelineTarget.from_dict(_target)
 
-        _selector = d.pop("selector", UNSET)
+        _selector = d.get("selector", UNSET)
         selector: Union[Unset, PipelineSelector]
         if isinstance(_selector, Unset):
             selector = UNSET
         else:
             selector = PipelineSelector.from_dict(_selector)
 
-        cron_pattern = d.pop("cron_pattern", UNSET)
+        cron_pattern = d.get("cron_pattern", UNSET)
 
-        _created_on = d.pop("created_on", UNSET)
+        _created_on = d.get("created_on", UNSET)
         created_on: Union[Unset, datetime.datetime]
         if isinstance(_created_on, Unset):
             created_on = UNSET
         else:
-            created_on = isoparse(_created_on)
+            created_on = parse_datetime(_created_on)
 
-        _updated_on = d.pop("updated_on", UNSET)
+        _updated_on = d.get("updated_on", UNSET)
         updated_on: Union[Unset, datetime.datetime]
         if isinstance(_updated_on, Unset):
             updated_on = UNSET
         else:
-            updated_on = isoparse(_updated_on)
+            updated_on = parse_datetime(_updated_on)
 
         pipeline_schedule = cls(
             type=type,
@@ -130,7 +128,10 @@ class PipelineSchedule:
             updated_on=updated_on,
         )
 
-        pipeline_schedule.additional_properties = d
+        if _KNOWN_KEYS.issuperset(d):
+            pipeline_schedule.additional_properties = EMPTY_PROPERTIES
+        else:
+            pipeline_schedule.additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return pipeline_schedule
 
     @property
@@ -141,6 +142,8 @@ class PipelineSchedule:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -3,20 +3,21 @@ from typing import Any, Dict, List, Type, TypeVar, Union
 import attr
 
 from ..models.pipeline_error import PipelineError
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="PipelineScheduleExecutionErrored")
+_KNOWN_KEYS = frozenset({"type", "error"})
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class PipelineScheduleExecutionErrored:
     """
     Attributes:
-        type (str):
+        type (Union[Unset, str]):
         error (Union[Unset, PipelineError]):
     """
 
-    type: str
+    type: Union[Unset, str]
     error: Union[Unset, PipelineError] = UNSET
     additional_properties: Dict[str, Any] = attr.ib(init=False, factory=dict)
 
@@ -28,11 +29,8 @@ class PipelineScheduleExecutionErrored:
 
         field_dict: Dict[str, Any] = {}
         field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "type": type,
-            }
-        )
+        if type is not UNSET:
+            field_dict["type"] = type
         if error is not UNSET:
             field_dict["error"] = error
 
@@ -40,10 +38,10 @@ class PipelineScheduleExecutionErrored:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        type = d.pop("type")
+        d = src_dict
+        type = d.get("type", UNSET)
 
-        _error = d.pop("error", UNSET)
+        _error = d.get("error", UNSET)
         error: Union[Unset, PipelineError]
         if isinstance(_error, Unset):
             error = UNSET
@@ -55,7 +53,12 @@ class PipelineScheduleExecutionErrored:
             error=error,
         )
 
-        pipeline_schedule_execution_errored.additional_properties = d
+        if _KNOWN_KEYS.issuperset(d):
+            pipeline_schedule_execution_errored.additional_properties = EMPTY_PROPERTIES
+        else:
+            pipeline_schedule_execution_errored.additional_properties = {
+                k: v for k, v in d.items() if k not in _KNOWN_KEYS
+            }
         return pipeline_schedule_execution_errored
 
     @property
@@ -66,6 +69,8 @@ class PipelineScheduleExecutionErrored:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
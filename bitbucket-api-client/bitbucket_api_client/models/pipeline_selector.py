@@ -3,35 +3,35 @@ from typing import Any, Dict, List, Type, TypeVar, Union
 import attr
 
 from ..models.pipeline_selector_type import PipelineSelectorType
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="PipelineSelector")
+_KNOWN_KEYS = frozenset({"type", "pattern"})
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class PipelineSelector:
     """
     Attributes:
-        type (PipelineSelectorType): The type of selector.
+        type (Union[Unset, PipelineSelectorType]): The type of selector.
         pattern (Union[Unset, str]): The name of the matching pipeline definition.
     """
 
-    type: PipelineSelectorType
+    type: Union[Unset, PipelineSelectorType]
     pattern: Union[Unset, str] = UNSET
     additional_properties: Dict[str, Any] = attr.ib(init=False, factory=dict)
 
     def to_dict(self) -> Dict[str, Any]:
-        type = self.type.value
+        type: Union[Unset, str] = UNSET
+        if not isinstance(self.type, Unset):
+            type = self.type.value
 
         pattern = self.pattern
 
         field_dict: Dict[str, Any] = {}
         field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "type": type,
-            }
-        )
+        if type is not UNSET:
+            field_dict["type"] = type
         if pattern is not UNSET:
             field_dict["pattern"] = pattern
 
@@ -39,17 +39,25 @@ class PipelineSelector:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        type = PipelineSelectorType(d.pop("type"))
+        d = src_dict
+        _type = d.get("type", UNSET)
+        type: Union[Unset, PipelineSelectorType]
+        if isinstance(_type, Unset):
+            type = UNSET
+        else:
+            type = PipelineSelectorType(_type)
 
-        pattern = d.pop("pattern", UNSET)
+        pattern = d.get("pattern", UNSET)
 
         pipeline_selector = cls(
             type=type,
             pattern=pattern,
         )
 
-        pipeline_selector.additional_properties = d
+        if _KNOWN_KEYS.issuperset(d):
+            pipeline_selector.additional_properties = EMPTY_PROPERTIES
+        else:
+            pipeline_selector.additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return pipeline_selector
 
     @property
@@ -60,6 +68,8 @@ class PipelineSelector:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -2,21 +2,22 @@ from typing import Any, Dict, List, Type, TypeVar, Union
 
 import attr
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="PipelineSshKeyPair")
+_KNOWN_KEYS = frozenset({"type", "private_key", "public_key"})
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class PipelineSshKeyPair:
     """
     Attributes:
-        type (str):
+        type (Union[Unset, str]):
         private_key (Union[Unset, str]): The SSH private key. This value will be empty when retrieving the SSH key pair.
         public_key (Union[Unset, str]): The SSH public key.
     """
 
-    type: str
+    type: Union[Unset, str]
     private_key: Union[Unset, str] = UNSET
     public_key: Union[Unset, str] = UNSET
     additional_properties: Dict[str, Any] = attr.ib(init=False, factory=dict)
@@ -28,11 +29,8 @@ class PipelineSshKeyPair:
 
         field_dict: Dict[str, Any] = {}
         field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "type": type,
-            }
-        )
+        if type is not UNSET:
+            field_dict["type"] = type
         if private_key is not UNSET:
             field_dict["private_key"] = private_key
         if public_key is not UNSET:
@@ -42,12 +40,12 @@ class PipelineSshKeyPair:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        type = d.pop("type")
+        d = src_dict
+        type = d.get("type", UNSET)
 
-        private_key = d.pop("private_key", UNSET)
+        private_key = d.get("private_key", UNSET)
 
-        public_key = d.pop("public_key", UNSET)
+        public_key = d.get("public_key", UNSET)
 
         pipeline_ssh_key_pair = cls(
             type=type,
@@ -55,7 +53,10 @@ class PipelineSshKeyPair:
             public_key=public_key,
         )
 
-        pipeline_ssh_key_pair.additional_properties = d
+        if _KNOWN_KEYS.issuperset(d):
+            pipeline_ssh_key_pair.additional_properties = EMPTY_PROPERTIES
+        else:
+            pipeline_ssh_key_pair.additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return pipeline_ssh_key_pair
 
     @property
@@ -66,6 +67,8 @@ class PipelineSshKeyPair:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -2,23 +2,24 @@ from typing import Any, Dict, List, Type, TypeVar, Union
 
 import attr
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="PipelineSshPublicKey")
+_KNOWN_KEYS = frozenset({"type", "key_type", "key", "md5_fingerprint", "sha256_fingerprint"})
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class PipelineSshPublicKey:
     """
     Attributes:
-        type (str):
+        type (Union[Unset, str]):
         key_type (Union[Unset, str]): The type of the public key.
         key (Union[Unset, str]): The base64 encoded public key.
         md5_fingerprint (Union[Unset, str]): The MD5 fingerprint of the public key.
         sha256_fingerprint (Union[Unset, str]): The SHA-256 fingerprint of the public key.
     """
 
-    type: str
+    type: Union[Unset, str]
     key_type: Union[Unset, str] = UNSET
     key: Union[Unset, str] = UNSET
     md5_fingerprint: Union[Unset, str] = UNSET
@@ -34,11 +35,8 @@ class PipelineSshPublicKey:
 
         field_dict: Dict[str, Any] = {}
         field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "type": type,
-            }
-        )
+        if type is not UNSET:
+            field_dict["type"] = type
         if key_type is not UNSET:
             field_dict["key_type"] = key_type
         if key is not UNSET:
@@ -52,16 +50,16 @@ class PipelineSshPublicKey:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        type = d.pop("type")
+        d = src_dict
+        type = d.get("type", UNSET)
 
-        key_type = d.pop("key_type", UNSET)
+        key_type = d.get("key_type", UNSET)
 
-        key = d.pop("key", UNSET)
+        key = d.get("key", UNSET)
 
-        md5_fingerprint = d.pop("md5_fingerprint", UNSET)
+        md5_fingerprint = d.get("md5_fingerprint", UNSET)
 
-        sha256_fingerprint = d.pop("sha256_fingerprint", UNSET)
+        sha256_fingerprint = d.get("sha256_fingerprint", UNSET)
 
         pipeline_ssh_public_key = cls(
             type=type,
@@ -71,7 +69,10 @@ class PipelineSshPublicKey:
             sha256_fingerprint=sha256_fingerprint,
         )
 
-        pipeline_ssh_public_key.additional_properties = d
+        if _KNOWN_KEYS.issuperset(d):
+            pipeline_ssh_public_key.additional_properties = EMPTY_PROPERTIES
+        else:
+            pipeline_ssh_public_key.additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return pipeline_ssh_public_key
 
     @property
@@ -82,6 +83,8 @@ class PipelineSshPublicKey:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -2,25 +2,40 @@ from typing import Any, Dict, List, Type, TypeVar, Union
 
 import attr
 
+from ..models.pipeline_state_completed_error import PipelineStateCompletedError
+from ..models.pipeline_state_completed_expired import PipelineStateCompletedExpired
+from ..models.pipeline_state_completed_failed import PipelineStateCompletedFailed
 from ..models.pipeline_state_completed_name import PipelineStateCompletedName
 from ..models.pipeline_state_completed_result import PipelineStateCompletedResult
-from ..types import UNSET, Unset
+from ..models.pipeline_state_completed_stopped import PipelineStateCompletedStopped
+from ..models.pipeline_state_completed_successful import PipelineStateCompletedSuccessful
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="PipelineStateCompleted")
+_KNOWN_KEYS = frozenset({"type", "name", "result"})
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class PipelineStateCompleted:
     """
     Attributes:
-        type (str):
+        type (Union[Unset, str]):
         name (Union[Unset, PipelineStateCompletedName]): The name of pipeline state (COMPLETED).
-        result (Union[Unset, PipelineStateCompletedResult]):
+        result (Union[Unset, PipelineStateCompletedResult, PipelineStateCompletedError, PipelineStateCompletedExpired,
+            PipelineStateCompletedFailed, PipelineStateCompletedStopped, PipelineStateCompletedSuccessful]):
     """
 
-    type: str
+    type: Union[Unset, str]
     name: Union[Unset, PipelineStateCompletedName] = UNSET
-    result: Union[Unset, PipelineStateCompletedResult] = UNSET
+    result: Union[
+        Unset,
+        PipelineStateCompletedResult,
+        PipelineStateCompletedError,
+        PipelineStateCompletedExpired,
+        PipelineStateCompletedFailed,
+        PipelineStateCompletedStopped,
+        PipelineStateCompletedSuccessful,
+    ] = UNSET
     additional_properties: Dict[str, Any] = attr.ib(init=False, factory=dict)
 
     def to_dict(self) -> Dict[str, Any]:
@@ -35,11 +50,8 @@ class PipelineStateCompleted:
 
         field_dict: Dict[str, Any] = {}
         field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "type": type,
-            }
-        )
+        if type is not UNSET:
+            field_dict["type"] = type
         if name is not UNSET:
             field_dict["name"] = name
         if result is not UNSET:
@@ -49,22 +61,30 @@ class PipelineStateCompleted:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        type = d.pop("type")
+        d = src_dict
+        type = d.get("type", UNSET)
 
-        _name = d.pop("name", UNSET)
+        _name = d.get("name", UNSET)
         name: Union[Unset, PipelineStateCompletedName]
         if isinstance(_name, Unset):
             name = UNSET
         else:
             name = PipelineStateCompletedName(_name)
 
-        _result = d.pop("result", UNSET)
-        result: Union[Unset, PipelineStateCompletedResult]
+        _result = d.get("result", UNSET)
+        result: Union[
+            Unset,
+            PipelineStateCompletedResult,
+            PipelineStateCompletedError,
+            PipelineStateCompletedExpired,
+            PipelineStateCompletedFailed,
+            PipelineStateCompletedStopped,
+            PipelineStateCompletedSuccessful,
+        ]
         if isinstance(_result, Unset):
             result = UNSET
         else:
-            result = PipelineStateCompletedResult.from_dict(_result)
+            result = PipelineStateCompletedResult.from_dict_by_type(_result)
 
         pipeline_state_completed = cls(
             type=type,
@@ -72,7 +92,10 @@ class PipelineStateCompleted:
             result=result,
         )
 
-        pipeline_state_completed.additional_properties = d
+        if _KNOWN_KEYS.issuperset(d):
+            pipeline_state_completed.additional_properties = EMPTY_PROPERTIES
+        else:
+            pipeline_state_completed.additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return pipeline_state_completed
 
     @property
@@ -83,6 +106,8 @@ class PipelineStateCompleted:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -1,18 +1,34 @@
-from typing import Any, Dict, List, Type, TypeVar
+from typing import Any, Callable, Dict, List, Type, TypeVar, Union
 
 import attr
 
-T = TypeVar("T", bound="PipelineStateCompletedResult")
-
+from ..models.pipeline_state_completed_error import PipelineStateCompletedError
+from ..models.pipeline_state_completed_expired import PipelineStateCompletedExpired
+from ..models.pipeline_state_completed_failed import PipelineStateCompletedFailed
+from ..models.pipeline_state_completed_stopped import PipelineStateCompletedStopped
+from ..models.pipeline_state_completed_successful import PipelineStateCompletedSuccessful
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
-@attr.s(auto_attribs=True)
+T = TypeVar("T", bound="PipelineStateCompletedResult")
+_KNOWN_KEYS = frozenset({"type"})
+# the model built for each value of the ``type`` discriminator
+_FROM_DICT_BY_TYPE: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    "pipeline_state_completed_error": PipelineStateCompletedError.from_dict,
+    "pipeline_state_completed_expired": PipelineStateCompletedExpired.from_dict,
+    "pipeline_state_completed_failed": PipelineStateCompletedFailed.from_dict,
+    "pipeline_state_completed_stopped": PipelineStateCompletedStopped.from_dict,
+    "pipeline_state_completed_successful": PipelineStateCompletedSuccessful.from_dict,
+}
+
+
+@attr.s(auto_attribs=True, slots=True)
 class PipelineStateCompletedResult:
     """
     Attributes:
-        type (str):
+        type (Union[Unset, str]):
     """
 
-    type: str
+    type: Union[Unset, str]
     additional_properties: Dict[str, Any] = attr.ib(init=False, factory=dict)
 
     def to_dict(self) -> Dict[str, Any]:
@@ -20,26 +36,42 @@ class PipelineStateCompletedResult:
 
         field_dict: Dict[str, Any] = {}
         field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "type": type,
-            }
-        )
+        if type is not UNSET:
+            field_dict["type"] = type
 
         return field_dict
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        type = d.pop("type")
+        d = src_dict
+        type = d.get("type", UNSET)
 
         pipeline_state_completed_result = cls(
             type=type,
         )
 
-        pipeline_state_completed_result.additional_properties = d
+        if _KNOWN_KEYS.issuperset(d):
+            pipeline_state_completed_result.additional_properties = EMPTY_PROPERTIES
+        else:
+            pipeline_state_completed_result.additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return pipeline_state_completed_result
 
+    @classmethod
+    def from_dict_by_type(cls, src_dict: Dict[str, Any]) -> Union[
+        "PipelineStateCompletedResult",
+        PipelineStateCompletedError,
+        PipelineStateCompletedExpired,
+        PipelineStateCompletedFailed,
+        PipelineStateCompletedStopped,
+        PipelineStateCompletedSuccessful,
+    ]:
+        """Build the model of the concrete type named by the ``type`` of ``src_dict``, or of this class for
+        unknown types"""
+        from_dict = _FROM_DICT_BY_TYPE.get(src_dict.get("type"))
+        if from_dict is None:
+            return cls.from_dict(src_dict)
+        return from_dict(src_dict)
+
     @property
     def additional_keys(self) -> List[str]:
         return list(self.additional_properties.keys())
@@ -48,6 +80,8 @@ class PipelineStateCompletedResult:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
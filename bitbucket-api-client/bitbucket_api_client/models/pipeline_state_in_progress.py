@@ -3,24 +3,30 @@ from typing import Any, Dict, List, Type, TypeVar, Union
 import attr
 
 from ..models.pipeline_state_in_progress_name import PipelineStateInProgressName
+from ..models.pipeline_state_in_progress_paused import PipelineStateInProgressPaused
+from ..models.pipeline_state_in_progress_running import PipelineStateInProgressRunning
 from ..models.pipeline_state_in_progress_stage import PipelineStateInProgressStage
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="PipelineStateInProgress")
+_KNOWN_KEYS = frozenset({"type", "name", "stage"})
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class PipelineStateInProgress:
     """
     Attributes:
-        type (str):
+        type (Union[Unset, str]):
         name (Union[Unset, PipelineStateInProgressName]): The name of pipeline state (IN_PROGRESS).
-        stage (Union[Unset, PipelineStateInProgressStage]):
+        stage (Union[Unset, PipelineStateInProgressStage, PipelineStateInProgressPaused,
+            PipelineStateInProgressRunning]):
     """
 
-    type: str
+    type: Union[Unset, str]
     name: Union[Unset, PipelineStateInProgressName] = UNSET
-    stage: Union[Unset, PipelineStateInProgressStage] = UNSET
+    stage: Union[Unset, PipelineStateInProgressStage, PipelineStateInProgressPaused, PipelineStateInProgressRunning] = (
+        UNSET
+    )
     additional_properties: Dict[str, Any] = attr.ib(init=False, factory=dict)
 
     def to_dict(self) -> Dict[str, Any]:
@@ -35,11 +41,8 @@ class PipelineStateInProgress:
 
         field_dict: Dict[str, Any] = {}
         field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "type": type,
-            }
-        )
+        if type is not UNSET:
+            field_dict["type"] = type
         if name is not UNSET:
             field_dict["name"] = name
         if stage is not UNSET:
@@ -49,22 +52,22 @@ class PipelineStateInProgress:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        type = d.pop("type")
+        d = src_dict
+        type = d.get("type", UNSET)
 
-        _name = d.pop("name", UNSET)
+        _name = d.get("name", UNSET)
         name: Union[Unset, PipelineStateInProgressName]
         if isinstance(_name, Unset):
             name = UNSET
         else:
             name = PipelineStateInProgressName(_name)
 
-        _stage = d.pop("stage", UNSET)
-        stage: Union[Unset, PipelineStateInProgressStage]
+        _stage = d.get("stage", UNSET)
+        stage: Union[Unset, PipelineStateInProgressStage, PipelineStateInProgressPaused, PipelineStateInProgressRunning]
         if isinstance(_stage, Unset):
             stage = UNSET
         else:
-            stage = PipelineStateInProgressStage.from_dict(_stage)
+            stage = PipelineStateInProgressStage.from_dict_by_type(_stage)
 
         pipeline_state_in_progress = cls(
             type=type,
@@ -72,7 +75,10 @@ class PipelineStateInProgress:
             stage=stage,
         )
 
-        pipeline_state_in_progress.additional_properties = d
+        if _KNOWN_KEYS.issuperset(d):
+            pipeline_state_in_progress.additional_properties = EMPTY_PROPERTIES
+        else:
+            pipeline_state_in_progress.additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return pipeline_state_in_progress
 
     @property
@@ -83,6 +89,8 @@ class PipelineStateInProgress:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -3,20 +3,21 @@ from typing import Any, Dict, List, Type, TypeVar, Union
 import attr
 
 from ..models.pipeline_state_in_progress_running_name import PipelineStateInProgressRunningName
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="PipelineStateInProgressRunning")
+_KNOWN_KEYS = frozenset({"type", "name"})
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class PipelineStateInProgressRunning:
     """
     Attributes:
-        type (str):
+        type (Union[Unset, str]):
         name (Union[Unset, PipelineStateInProgressRunningName]): The name of the stage (RUNNING)
     """
 
-    type: str
+    type: Union[Unset, str]
     name: Union[Unset, PipelineStateInProgressRunningName] = UNSET
     additional_properties: Dict[str, Any] = attr.ib(init=False, factory=dict)
 
@@ -28,11 +29,8 @@ class PipelineStateInProgressRunning:
 
         field_dict: Dict[str, Any] = {}
         field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "type": type,
-            }
-        )
+        if type is not UNSET:
+            field_dict["type"] = type
         if name is not UNSET:
             field_dict["name"] = name
 
@@ -40,10 +38,10 @@ class PipelineStateInProgressRunning:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        type = d.pop("type")
+        d = src_dict
+        type = d.get("type", UNSET)
 
-        _name = d.pop("name", UNSET)
+        _name = d.get("name", UNSET)
         name: Union[Unset, PipelineStateInProgressRunningName]
         if isinstance(_name, Unset):
             name = UNSET
@@ -55,7 +53,12 @@ class PipelineStateInProgressRunning:
             name=name,
         )
 
-        pipeline_state_in_progress_running.additional_properties = d
+        if _KNOWN_KEYS.issuperset(d):
+            pipeline_state_in_progress_running.additional_properties = EMPTY_PROPERTIES
+        else:
+            pipeline_state_in_progress_running.additional_properties = {
+                k: v for k, v in d.items() if k not in _KNOWN_KEYS
+            }
         return pipeline_state_in_progress_running
 
     @property
@@ -66,6 +69,8 @@ class PipelineStateInProgressRunning:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
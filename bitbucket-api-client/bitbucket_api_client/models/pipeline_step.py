@@ -2,27 +2,35 @@ import datetime
 from typing import Any, Dict, List, Type, TypeVar, Union
 
 import attr
-from dateutil.parser import isoparse
 
+from ..dates import parse_datetime
 from ..models.pipeline_command import PipelineCommand
 from ..models.pipeline_image import PipelineImage
 from ..models.pipeline_step_state import PipelineStepState
-from ..types import UNSET, Unset
+from ..models.pipeline_step_state_completed import PipelineStepStateCompleted
+from ..models.pipeline_step_state_in_progress import PipelineStepStateInProgress
+from ..models.pipeline_step_state_pending import PipelineStepStatePending
+from ..models.pipeline_step_state_ready import PipelineStepStateReady
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="PipelineStep")
+_KNOWN_KEYS = frozenset(
+    {"type", "uuid", "started_on", "completed_on", "state", "image", "setup_commands", "script_commands"}
+)
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class PipelineStep:
     """
     Attributes:
-        type (str):
+        type (Union[Unset, str]):
         uuid (Union[Unset, str]): The UUID identifying the step.
         started_on (Union[Unset, datetime.datetime]): The timestamp when the step execution was started. This is not set
             when the step hasn't executed yet.
         completed_on (Union[Unset, datetime.datetime]): The timestamp when the step execution was completed. This is not
             set if the step is still in progress.
-        state (Union[Unset, PipelineStepState]):
+        state (Union[Unset, PipelineStepState, PipelineStepStateCompleted, PipelineStepStateInProgress,
+            PipelineStepStatePending, PipelineStepStateReady]):
         image (Union[Unset, PipelineImage]): The definition of a Docker image that can be used for a Bitbucket Pipelines
             step execution context.
         setup_commands (Union[Unset, List[PipelineCommand]]): The list of commands that are executed as part of the
@@ -31,11 +39,18 @@ class PipelineStep:
             in the build container.
     """
 
-    type: str
+    type: Union[Unset, str]
     uuid: Union[Unset, str] = UNSET
     started_on: Union[Unset, datetime.datetime] = UNSET
     completed_on: Union[Unset, datetime.datetime] = UNSET
-    state: Union[Unset, PipelineStepState] = UNSET
+    state: Union[
+        Unset,
+        PipelineStepState,
+        PipelineStepStateCompleted,
+        PipelineStepStateInProgress,
+        PipelineStepStatePending,
+        PipelineStepStateReady,
+    ] = UNSET
     image: Union[Unset, PipelineImage] = UNSET
     setup_commands: Union[Unset, List[PipelineCommand]] = UNSET
     script_commands: Union[Unset, List[PipelineCommand]] = UNSET
@@ -78,11 +93,8 @@ class PipelineStep:
 
         field_dict: Dict[str, Any] = {}
         field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "type": type,
-            }
-        )
+        if type is not UNSET:
+            field_dict["type"] = type
         if uuid is not UNSET:
             field_dict["uuid"] = uuid
         if started_on is not UNSET:
@@ -102,33 +114,40 @@ class PipelineStep:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        type = d.pop("type")
+        d = src_dict
+        type = d.get("type", UNSET)
 
-        uuid = d.pop("uuid", UNSET)
+        uuid = d.get("uuid", UNSET)
 
-        _started_on = d.pop("started_on", UNSET)
+        _started_on = d.get("started_on", UNSET)
         started_on: Union[Unset, datetime.datetime]
         if isinstance(_started_on, Unset):
             started_on = UNSET
         else:
-            started_on = isoparse(_started_on)
+            started_on = parse_datetime(_started_on)
 
-        _completed_on = d.pop("completed_on", UNSET)
+        _completed_on = d.get("completed_on", UNSET)
         completed_on: Union[Unset, datetime.datetime]
         if isinstance(_completed_on, Unset):
             completed_on = UNSET
         else:
-            completed_on = isoparse(_completed_on)
-
-        _state = d.pop("state", UNSET)
-        state: Union[Unset, PipelineStepState]
+            completed_on = parse_datetime(_completed_on)
+
+        _state = d.get("state", UNSET)
+        state: Union[
+            Unset,
+            PipelineStepState,
+            PipelineStepStateCompleted,
+            PipelineStepStateInProgress,
+            PipelineStepStatePending,
+            PipelineStepStateReady,
+        ]
         if isinstance(_state, Unset):
             state = UNSET
         else:
-            state = PipelineStepState.from_dict(_state)
+            state = PipelineStepState.from_dict_by_type(_state)
 
-        _image = d.pop("image", UNSET)
+        _image = d.get("image", UNSET)
         image: Union[Unset, PipelineImage]
         if isinstance(_image, Unset):
             image = UNSET
@@ -136,14 +155,14 @@ class PipelineStep:
             image = PipelineImage.from_dict(_image)
 
         setup_commands = []
-        _setup_commands = d.pop("setup_commands", UNSET)
+        _setup_commands = d.get("setup_commands", UNSET)
         for setup_commands_item_data in _setup_commands or []:
             setup_commands_item = PipelineCommand.from_dict(setup_commands_item_data)
 
             setup_commands.append(setup_commands_item)
 
         script_commands = []
-        _script_commands = d.pop("script_commands", UNSET)
+        _script_commands = d.get("script_commands", UNSET)
         for script_commands_item_data in _script_commands or []:
             script_commands_item = PipelineCommand.from_dict(script_commands_item_data)
 
@@ -160,7 +179,10 @@ class PipelineStep:
             script_commands=script_commands,
         )
 
-        pipeline_step.additional_properties = d
+        if _KNOWN_KEYS.issuperset(d):
+            pipeline_step.additional_properties = EMPTY_PROPERTIES
+        else:
+            pipeline_step.additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return pipeline_step
 
     @property
@@ -171,6 +193,8 @@ class PipelineStep:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -2,25 +2,43 @@ from typing import Any, Dict, List, Type, TypeVar, Union
 
 import attr
 
+from ..models.pipeline_step_state_completed_error import PipelineStepStateCompletedError
+from ..models.pipeline_step_state_completed_expired import PipelineStepStateCompletedExpired
+from ..models.pipeline_step_state_completed_failed import PipelineStepStateCompletedFailed
 from ..models.pipeline_step_state_completed_name import PipelineStepStateCompletedName
+from ..models.pipeline_step_state_completed_not_run import PipelineStepStateCompletedNotRun
 from ..models.pipeline_step_state_completed_result import PipelineStepStateCompletedResult
-from ..types import UNSET, Unset
+from ..models.pipeline_step_state_completed_stopped import PipelineStepStateCompletedStopped
+from ..models.pipeline_step_state_completed_successful import PipelineStepStateCompletedSuccessful
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="PipelineStepStateCompleted")
+_KNOWN_KEYS = frozenset({"type", "name", "result"})
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class PipelineStepStateCompleted:
     """
     Attributes:
-        type (str):
+        type (Union[Unset, str]):
         name (Union[Unset, PipelineStepStateCompletedName]): The name of pipeline step state (COMPLETED).
-        result (Union[Unset, PipelineStepStateCompletedResult]):
+        result (Union[Unset, PipelineStepStateCompletedResult, PipelineStepStateCompletedError,
+            PipelineStepStateCompletedExpired, PipelineStepStateCompletedFailed, PipelineStepStateCompletedNotRun,
+            PipelineStepStateCompletedStopped, PipelineStepStateCompletedSuccessful]):
     """
 
-    type: str
+    type: Union[Unset, str]
     name: Union[Unset, PipelineStepStateCompletedName] = UNSET
-    result: Union[Unset, PipelineStepStateCompletedResult] = UNSET
+    result: Union[
+        Unset,
+        PipelineStepStateCompletedResult,
+        PipelineStepStateCompletedError,
+        PipelineStepStateCompletedExpired,
+        PipelineStepStateCompletedFailed,
+        PipelineStepStateCompletedNotRun,
+        PipelineStepStateCompletedStopped,
+        PipelineStepStateCompletedSuccessful,
+    ] = UNSET
     additional_properties: Dict[str, Any] = attr.ib(init=False, factory=dict)
 
     def to_dict(self) -> Dict[str, Any]:
@@ -35,11 +53,8 @@ class PipelineStepStateCompleted:
 
         field_dict: Dict[str, Any] = {}
         field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "type": type,
-            }
-        )
+        if type is not UNSET:
+            field_dict["type"] = type
         if name is not UNSET:
             field_dict["name"] = name
         if result is not UNSET:
@@ -49,22 +64,31 @@ class PipelineStepStateCompleted:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        type = d.pop("type")
+        d = src_dict
+        type = d.get("type", UNSET)
 
-        _name = d.pop("name", UNSET)
+        _name = d.get("name", UNSET)
         name: Union[Unset, PipelineStepStateCompletedName]
         if isinstance(_name, Unset):
             name = UNSET
         else:
             name = PipelineStepStateCompletedName(_name)
 
-        _result = d.pop("result", UNSET)
-        result: Union[Unset, PipelineStepStateCompletedResult]
+        _result = d.get("result", UNSET)
+        result: Union[
+            Unset,
+            PipelineStepStateCompletedResult,
+            PipelineStepStateCompletedError,
+            PipelineStepStateCompletedExpired,
+            PipelineStepStateCompletedFailed,
+            PipelineStepStateCompletedNotRun,
+            PipelineStepStateCompletedStopped,
+            PipelineStepStateCompletedSuccessful,
+        ]
         if isinstance(_result, Unset):
             result = UNSET
         else:
-            result = PipelineStepStateCompletedResult.from_dict(_result)
+            result = PipelineStepStateCompletedResult.from_dict_by_type(_result)
 
         pipeline_step_state_completed = cls(
             type=type,
@@ -72,7 +96,10 @@ class PipelineStepStateCompleted:
             result=result,
         )
 
-        pipeline_step_state_completed.additional_properties = d
+        if _KNOWN_KEYS.issuperset(d):
+            pipeline_step_state_completed.additional_properties = EMPTY_PROPERTIES
+        else:
+            pipeline_step_state_completed.additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return pipeline_step_state_completed
 
     @property
@@ -83,6 +110,8 @@ class PipelineStepStateCompleted:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -4,21 +4,22 @@ import attr
 
 from ..models.pipeline_step_error import PipelineStepError
 from ..models.pipeline_step_state_completed_error_name import PipelineStepStateCompletedErrorName
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="PipelineStepStateCompletedError")
+_KNOWN_KEYS = frozenset({"type", "name", "error"})
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class PipelineStepStateCompletedError:
     """
     Attributes:
-        type (str):
+        type (Union[Unset, str]):
         name (Union[Unset, PipelineStepStateCompletedErrorName]): The name of the result (ERROR)
         error (Union[Unset, PipelineStepError]):
     """
 
-    type: str
+    type: Union[Unset, str]
     name: Union[Unset, PipelineStepStateCompletedErrorName] = UNSET
     error: Union[Unset, PipelineStepError] = UNSET
     additional_properties: Dict[str, Any] = attr.ib(init=False, factory=dict)
@@ -35,11 +36,8 @@ class PipelineStepStateCompletedError:
 
         field_dict: Dict[str, Any] = {}
         field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "type": type,
-            }
-        )
+        if type is not UNSET:
+            field_dict["type"] = type
         if name is not UNSET:
             field_dict["name"] = name
         if error is not UNSET:
@@ -49,17 +47,17 @@ class PipelineStepStateCompletedError:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        type = d.pop("type")
+        d = src_dict
+        type = d.get("type", UNSET)
 
-        _name = d.pop("name", UNSET)
+        _name = d.get("name", UNSET)
         name: Union[Unset, PipelineStepStateCompletedErrorName]
         if isinstance(_name, Unset):
             name = UNSET
         else:
             name = PipelineStepStateCompletedErrorName(_name)
 
-        _error = d.pop("error", UNSET)
+        _error = d.get("error", UNSET)
         error: Union[Unset, PipelineStepError]
         if isinstance(_error, Unset):
             error = UNSET
@@ -72,7 +70,12 @@ class PipelineStepStateCompletedError:
             error=error,
         )
 
-        pipeline_step_state_completed_error.additional_properties = d
+        if _KNOWN_KEYS.issuperset(d):
+            pipeline_step_state_completed_error.additional_properties = EMPTY_PROPERTIES
+        else:
+            pipeline_step_state_completed_error.additional_properties = {
+                k: v for k, v in d.items() if k not in _KNOWN_KEYS
+            }
         return pipeline_step_state_completed_error
 
     @property
@@ -83,6 +86,8 @@ class PipelineStepStateCompletedError:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -5,22 +5,23 @@ import attr
 from ..models.project_branching_model_branch_types_item import ProjectBranchingModelBranchTypesItem
 from ..models.project_branching_model_development import ProjectBranchingModelDevelopment
 from ..models.project_branching_model_production import ProjectBranchingModelProduction
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="ProjectBranchingModel")
+_KNOWN_KEYS = frozenset({"type", "branch_types", "development", "production"})
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class ProjectBranchingModel:
     """
     Attributes:
-        type (str):
+        type (Union[Unset, str]):
         branch_types (Union[Unset, List[ProjectBranchingModelBranchTypesItem]]): The active branch types.
         development (Union[Unset, ProjectBranchingModelDevelopment]):
         production (Union[Unset, ProjectBranchingModelProduction]):
     """
 
-    type: str
+    type: Union[Unset, str]
     branch_types: Union[Unset, List[ProjectBranchingModelBranchTypesItem]] = UNSET
     development: Union[Unset, ProjectBranchingModelDevelopment] = UNSET
     production: Union[Unset, ProjectBranchingModelProduction] = UNSET
@@ -46,11 +47,8 @@ class ProjectBranchingModel:
 
         field_dict: Dict[str, Any] = {}
         field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "type": type,
-            }
-        )
+        if type is not UNSET:
+            field_dict["type"] = type
         if branch_types is not UNSET:
             field_dict["branch_types"] = branch_types
         if development is not UNSET:
@@ -62,24 +60,24 @@ class ProjectBranchingModel:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        type = d.pop("type")
+        d = src_dict
+        type = d.get("type", UNSET)
 
         branch_types = []
-        _branch_types = d.pop("branch_types", UNSET)
+        _branch_types = d.get("branch_types", UNSET)
         for branch_types_item_data in _branch_types or []:
             branch_types_item = ProjectBranchingModelBranchTypesItem.from_dict(branch_types_item_data)
 
             branch_types.append(branch_types_item)
 
-        _development = d.pop("development", UNSET)
+        _development = d.get("development", UNSET)
         development: Union[Unset, ProjectBranchingModelDevelopment]
         if isinstance(_development, Unset):
             development = UNSET
         else:
             development = ProjectBranchingModelDevelopment.from_dict(_development)
 
-        _production = d.pop("production", UNSET)
+        _production = d.get("production", UNSET)
         production: Union[Unset, ProjectBranchingModelProduction]
         if isinstance(_production, Unset):
             production = UNSET
@@ -93,7 +91,10 @@ class ProjectBranchingModel:
             production=production,
         )
 
-        project_branching_model.additional_properties = d
+        if _KNOWN_KEYS.issuperset(d):
+            project_branching_model.additional_properties = EMPTY_PROPERTIES
+        else:
+            project_branching_model.additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return project_branching_model
 
     @property
@@ -104,6 +105,8 @@ class ProjectBranchingModel:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -1,45 +1,52 @@
-from typing import Any, Dict, Type, TypeVar
+from typing import Any, Dict, Type, TypeVar, Union
 
 import attr
 
 from ..models.project_branching_model_branch_types_item_kind import ProjectBranchingModelBranchTypesItemKind
+from ..types import UNSET, Unset
 
 T = TypeVar("T", bound="ProjectBranchingModelBranchTypesItem")
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class ProjectBranchingModelBranchTypesItem:
     """
     Attributes:
-        kind (ProjectBranchingModelBranchTypesItemKind): The kind of branch.
-        prefix (str): The prefix for this branch type. A branch with this prefix will be classified as per `kind`. The
-            prefix must be a valid prefix for a branch and must always exist. It cannot be blank, empty or `null`.
+        kind (Union[Unset, ProjectBranchingModelBranchTypesItemKind]): The kind of branch.
+        prefix (Union[Unset, str]): The prefix for this branch type. A branch with this prefix will be classified as per
+            `kind`. The prefix must be a valid prefix for a branch and must always exist. It cannot be blank, empty or
+            `null`.
     """
 
-    kind: ProjectBranchingModelBranchTypesItemKind
-    prefix: str
+    kind: Union[Unset, ProjectBranchingModelBranchTypesItemKind]
+    prefix: Union[Unset, str]
 
     def to_dict(self) -> Dict[str, Any]:
-        kind = self.kind.value
+        kind: Union[Unset, str] = UNSET
+        if not isinstance(self.kind, Unset):
+            kind = self.kind.value
 
         prefix = self.prefix
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(
-            {
-                "kind": kind,
-                "prefix": prefix,
-            }
-        )
+        if kind is not UNSET:
+            field_dict["kind"] = kind
+        if prefix is not UNSET:
+            field_dict["prefix"] = prefix
 
         return field_dict
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        kind = ProjectBranchingModelBranchTypesItemKind(d.pop("kind"))
-
-        prefix = d.pop("prefix")
+        d = src_dict
+        _kind = d.get("kind", UNSET)
+        kind: Union[Unset, ProjectBranchingModelBranchTypesItemKind]
+        if isinstance(_kind, Unset):
+            kind = UNSET
+        else:
+            kind = ProjectBranchingModelBranchTypesItemKind(_kind)
+
+        prefix = d.get("prefix", UNSET)
 
         project_branching_model_branch_types_item = cls(
             kind=kind,
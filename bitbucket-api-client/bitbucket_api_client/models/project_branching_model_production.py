@@ -1,43 +1,43 @@
-from typing import Any, Dict, Type, TypeVar
+from typing import Any, Dict, Type, TypeVar, Union
 
 import attr
 
+from ..types import UNSET, Unset
+
 T = TypeVar("T", bound="ProjectBranchingModelProduction")
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class ProjectBranchingModelProduction:
     """
     Attributes:
-        name (str): Name of the target branch. If inherited by a repository, it will default to the main branch if the
-            specified branch does not exist.
-        use_mainbranch (bool): Indicates if the setting points at an explicit branch (`false`) or tracks the main branch
-            (`true`).
+        name (Union[Unset, str]): Name of the target branch. If inherited by a repository, it will default to the main
+            branch if the specified branch does not exist.
+        use_mainbranch (Union[Unset, bool]): Indicates if the setting points at an explicit branch (`false`) or tracks
+            the main branch (`true`).
     """
 
-    name: str
-    use_mainbranch: bool
+    name: Union[Unset, str]
+    use_mainbranch: Union[Unset, bool]
 
     def to_dict(self) -> Dict[str, Any]:
         name = self.name
         use_mainbranch = self.use_mainbranch
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(
-            {
-                "name": name,
-                "use_mainbranch": use_mainbranch,
-            }
-        )
+        if name is not UNSET:
+            field_dict["name"] = name
+        if use_mainbranch is not UNSET:
+            field_dict["use_mainbranch"] = use_mainbranch
 
         return field_dict
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        name = d.pop("name")
+        d = src_dict
+        name = d.get("name", UNSET)
 
-        use_mainbranch = d.pop("use_mainbranch")
+        use_mainbranch = d.get("use_mainbranch", UNSET)
 
         project_branching_model_production = cls(
             name=name,
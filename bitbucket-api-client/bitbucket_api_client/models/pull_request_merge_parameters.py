@@ -3,17 +3,18 @@ from typing import Any, Dict, List, Type, TypeVar, Union
 import attr
 
 from ..models.pull_request_merge_parameters_merge_strategy import PullRequestMergeParametersMergeStrategy
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="PullRequestMergeParameters")
+_KNOWN_KEYS = frozenset({"type", "message", "close_source_branch", "merge_strategy"})
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class PullRequestMergeParameters:
     """The metadata that describes a pull request merge.
 
     Attributes:
-        type (str):
+        type (Union[Unset, str]):
         message (Union[Unset, str]): The commit message that will be used on the resulting commit.
         close_source_branch (Union[Unset, bool]): Whether the source branch should be deleted. If this is not provided,
             we fallback to the value used when the pull request was created, which defaults to False
@@ -21,7 +22,7 @@ class PullRequestMergeParameters:
             merge the pull request. Default: PullRequestMergeParametersMergeStrategy.MERGE_COMMIT.
     """
 
-    type: str
+    type: Union[Unset, str]
     message: Union[Unset, str] = UNSET
     close_source_branch: Union[Unset, bool] = UNSET
     merge_strategy: Union[
@@ -39,11 +40,8 @@ class PullRequestMergeParameters:
 
         field_dict: Dict[str, Any] = {}
         field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "type": type,
-            }
-        )
+        if type is not UNSET:
+            field_dict["type"] = type
         if message is not UNSET:
             field_dict["message"] = message
         if close_source_branch is not UNSET:
@@ -55,14 +53,14 @@ class PullRequestMergeParameters:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        type = d.pop("type")
+        d = src_dict
+        type = d.get("type", UNSET)
 
-        message = d.pop("message", UNSET)
+        message = d.get("message", UNSET)
 
-        close_source_branch = d.pop("close_source_branch", UNSET)
+        close_source_branch = d.get("close_source_branch", UNSET)
 
-        _merge_strategy = d.pop("merge_strategy", UNSET)
+        _merge_strategy = d.get("merge_strategy", UNSET)
         merge_strategy: Union[Unset, PullRequestMergeParametersMergeStrategy]
         if isinstance(_merge_strategy, Unset):
             merge_strategy = UNSET
@@ -76,7 +74,10 @@ class PullRequestMergeParameters:
             merge_strategy=merge_strategy,
         )
 
-        pull_request_merge_parameters.additional_properties = d
+        if _KNOWN_KEYS.issuperset(d):
+            pull_request_merge_parameters.additional_properties = EMPTY_PROPERTIES
+        else:
+            pull_request_merge_parameters.additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return pull_request_merge_parameters
 
     @property
@@ -87,6 +88,8 @@ class PullRequestMergeParameters:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
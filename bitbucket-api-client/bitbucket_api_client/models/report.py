@@ -2,21 +2,39 @@ import datetime
 from typing import Any, Dict, List, Type, TypeVar, Union
 
 import attr
-from dateutil.parser import isoparse
 
+from ..dates import parse_datetime
 from ..models.report_data import ReportData
 from ..models.report_report_type import ReportReportType
 from ..models.report_result import ReportResult
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="Report")
-
-
-@attr.s(auto_attribs=True)
+_KNOWN_KEYS = frozenset(
+    {
+        "type",
+        "uuid",
+        "title",
+        "details",
+        "external_id",
+        "reporter",
+        "link",
+        "remote_link_enabled",
+        "logo_url",
+        "report_type",
+        "result",
+        "data",
+        "created_on",
+        "updated_on",
+    }
+)
+
+
+@attr.s(auto_attribs=True, slots=True)
 class Report:
     """
     Attributes:
-        type (str):
+        type (Union[Unset, str]):
         uuid (Union[Unset, str]): The UUID that can be used to identify the report.
         title (Union[Unset, str]): The title of the report.
         details (Union[Unset, str]): A string to describe the purpose of the report.
@@ -36,7 +54,7 @@ class Report:
         updated_on (Union[Unset, datetime.datetime]): The timestamp when the report was updated.
     """
 
-    type: str
+    type: Union[Unset, str]
     uuid: Union[Unset, str] = UNSET
     title: Union[Unset, str] = UNSET
     details: Union[Unset, str] = UNSET
@@ -88,11 +106,8 @@ class Report:
 
         field_dict: Dict[str, Any] = {}
         field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "type": type,
-            }
-        )
+        if type is not UNSET:
+            field_dict["type"] = type
         if uuid is not UNSET:
             field_dict["uuid"] = uuid
         if title is not UNSET:
@@ -124,33 +139,33 @@ class Report:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        type = d.pop("type")
+        d = src_dict
+        type = d.get("type", UNSET)
 
-        uuid = d.pop("uuid", UNSET)
+        uuid = d.get("uuid", UNSET)
 
-        title = d.pop("title", UNSET)
+        title = d.get("title", UNSET)
 
-        details = d.pop("details", UNSET)
+        details = d.get("details", UNSET)
 
-        external_id = d.pop("external_id", UNSET)
+        external_id = d.get("external_id", UNSET)
 
-        reporter = d.pop("reporter", UNSET)
+        reporter = d.get("reporter", UNSET)
 
-        link = d.pop("link", UNSET)
+        link = d.get("link", UNSET)
 
-        remote_link_enabled = d.pop("remote_link_enabled", UNSET)
+        remote_link_enabled = d.get("remote_link_enabled", UNSET)
 
-        logo_url = d.pop("logo_url", UNSET)
+        logo_url = d.get("logo_url", UNSET)
 
-        _report_type = d.pop("report_type", UNSET)
+        _report_type = d.get("report_type", UNSET)
         report_type: Union[Unset, ReportReportType]
         if isinstance(_report_type, Unset):
             report_type = UNSET
         else:
             report_type = ReportReportType(_report_type)
 
-        _result = d.pop("result", UNSET)
+        _result = d.get("result", UNSET)
         result: Union[Unset, ReportResult]
         if isinstance(_result, Unset):
             result = UNSET
@@ -158,25 +173,25 @@ class Report:
             result = ReportResult(_result)
 
         data = []
-        _data = d.pop("data", UNSET)
+        _data = d.get("data", UNSET)
         for data_item_data in _data or []:
             data_item = ReportData.from_dict(data_item_data)
 
             data.append(data_item)
 
-        _created_on = d.pop("created_on", UNSET)
+        _created_on = d.get("created_on", UNSET)
         created_on: Union[Unset, datetime.datetime]
         if isinstance(_created_on, Unset):
             created_on = UNSET
         else:
-            created_on = isoparse(_created_on)
+            created_on = parse_datetime(_created_on)
 
-        _updated_on = d.pop("updated_on", UNSET)
+        _updated_on = d.get("updated_on", UNSET)
         updated_on: Union[Unset, datetime.datetime]
         if isinstance(_updated_on, Unset):
             updated_on = UNSET
         else:
-            updated_on = isoparse(_updated_on)
+            updated_on = parse_datetime(_updated_on)
 
         report = cls(
             type=type,
@@ -195,7 +210,10 @@ class Report:
             updated_on=updated_on,
         )
 
-        report.additional_properties = d
+        if _KNOWN_KEYS.issuperset(d):
+            report.additional_properties = EMPTY_PROPERTIES
+        else:
+            report.additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return report
 
     @property
@@ -206,6 +224,8 @@ class Report:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
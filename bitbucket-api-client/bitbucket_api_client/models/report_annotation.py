@@ -2,21 +2,38 @@ import datetime
 from typing import Any, Dict, List, Type, TypeVar, Union
 
 import attr
-from dateutil.parser import isoparse
 
+from ..dates import parse_datetime
 from ..models.report_annotation_annotation_type import ReportAnnotationAnnotationType
 from ..models.report_annotation_result import ReportAnnotationResult
 from ..models.report_annotation_severity import ReportAnnotationSeverity
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="ReportAnnotation")
-
-
-@attr.s(auto_attribs=True)
+_KNOWN_KEYS = frozenset(
+    {
+        "type",
+        "external_id",
+        "uuid",
+        "annotation_type",
+        "path",
+        "line",
+        "summary",
+        "details",
+        "result",
+        "severity",
+        "link",
+        "created_on",
+        "updated_on",
+    }
+)
+
+
+@attr.s(auto_attribs=True, slots=True)
 class ReportAnnotation:
     """
     Attributes:
-        type (str):
+        type (Union[Unset, str]):
         external_id (Union[Unset, str]): ID of the annotation provided by the annotation creator. It can be used to
             identify the annotation as an alternative to it's generated uuid. It is not used by Bitbucket, but only by the
             annotation creator for updating or deleting this specific annotation. Needs to be unique.
@@ -37,7 +54,7 @@ class ReportAnnotation:
         updated_on (Union[Unset, datetime.datetime]): The timestamp when the report was updated.
     """
 
-    type: str
+    type: Union[Unset, str]
     external_id: Union[Unset, str] = UNSET
     uuid: Union[Unset, str] = UNSET
     annotation_type: Union[Unset, ReportAnnotationAnnotationType] = UNSET
@@ -83,11 +100,8 @@ class ReportAnnotation:
 
         field_dict: Dict[str, Any] = {}
         field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "type": type,
-            }
-        )
+        if type is not UNSET:
+            field_dict["type"] = type
         if external_id is not UNSET:
             field_dict["external_id"] = external_id
         if uuid is not UNSET:
@@ -117,57 +131,57 @@ class ReportAnnotation:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        type = d.pop("type")
+        d = src_dict
+        type = d.get("type", UNSET)
 
-        external_id = d.pop("external_id", UNSET)
+        external_id = d.get("external_id", UNSET)
 
-        uuid = d.pop("uuid", UNSET)
+        uuid = d.get("uuid", UNSET)
 
-        _annotation_type = d.pop("annotation_type", UNSET)
+        _annotation_type = d.get("annotation_type", UNSET)
         annotation_type: Union[Unset, ReportAnnotationAnnotationType]
         if isinstance(_annotation_type, Unset):
             annotation_type = UNSET
         else:
             annotation_type = ReportAnnotationAnnotationType(_annotation_type)
 
-        path = d.pop("path", UNSET)
+        path = d.get("path", UNSET)
 
-        line = d.pop("line", UNSET)
+        line = d.get("line", UNSET)
 
-        summary = d.pop("summary", UNSET)
+        summary = d.get("summary", UNSET)
 
-        details = d.pop("details", UNSET)
+        details = d.get("details", UNSET)
 
-        _result = d.pop("result", UNSET)
+        _result = d.get("result", UNSET)
         result: Union[Unset, ReportAnnotationResult]
         if isinstance(_result, Unset):
             result = UNSET
         else:
             result = ReportAnnotationResult(_result)
 
-        _severity = d.pop("severity", UNSET)
+        _severity = d.get("severity", UNSET)
         severity: Union[Unset, ReportAnnotationSeverity]
         if isinstance(_severity, Unset):
             severity = UNSET
         else:
             severity = ReportAnnotationSeverity(_severity)
 
-        link = d.pop("link", UNSET)
+        link = d.get("link", UNSET)
 
-        _created_on = d.pop("created_on", UNSET)
+        _created_on = d.get("created_on", UNSET)
         created_on: Union[Unset, datetime.datetime]
         if isinstance(_created_on, Unset):
             created_on = UNSET
         else:
-            created_on = isoparse(_created_on)
+            created_on = parse_datetime(_created_on)
 
-        _updated_on = d.pop("updated_on", UNSET)
+        _updated_on = d.get("updated_on", UNSET)
         updated_on: Union[Unset, datetime.datetime]
         if isinstance(_updated_on, Unset):
             updated_on = UNSET
         else:
-            updated_on = isoparse(_updated_on)
+            updated_on = parse_datetime(_updated_on)
 
         report_annotation = cls(
             type=type,
@@ -185,7 +199,10 @@ class ReportAnnotation:
             updated_on=updated_on,
         )
 
-        report_annotation.additional_properties = d
+        if _KNOWN_KEYS.issuperset(d):
+            report_annotation.additional_properties = EMPTY_PROPERTIES
+        else:
+            report_annotation.additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return report_annotation
 
     @property
@@ -196,6 +213,8 @@ class ReportAnnotation:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
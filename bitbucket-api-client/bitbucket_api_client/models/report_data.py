@@ -4,12 +4,13 @@ import attr
 
 from ..models.report_data_type import ReportDataType
 from ..models.report_data_value import ReportDataValue
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="ReportData")
+_KNOWN_KEYS = frozenset({"type", "title", "value"})
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class ReportData:
     """A key-value element that will be displayed along with the report.
 
@@ -49,17 +50,17 @@ class ReportData:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        _type = d.pop("type", UNSET)
+        d = src_dict
+        _type = d.get("type", UNSET)
         type: Union[Unset, ReportDataType]
         if isinstance(_type, Unset):
             type = UNSET
         else:
             type = ReportDataType(_type)
 
-        title = d.pop("title", UNSET)
+        title = d.get("title", UNSET)
 
-        _value = d.pop("value", UNSET)
+        _value = d.get("value", UNSET)
         value: Union[Unset, ReportDataValue]
         if isinstance(_value, Unset):
             value = UNSET
@@ -72,7 +73,10 @@ class ReportData:
             value=value,
         )
 
-        report_data.additional_properties = d
+        if _KNOWN_KEYS.issuperset(d):
+            report_data.additional_properties = EMPTY_PROPERTIES
+        else:
+            report_data.additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return report_data
 
     @property
@@ -83,6 +87,8 @@ class ReportData:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -1,11 +1,14 @@
-from typing import Any, Dict, List, Type, TypeVar
+from typing import Any, Dict, FrozenSet, List, Type, TypeVar
 
 import attr
 
+from ..types import EMPTY_PROPERTIES
+
 T = TypeVar("T", bound="ReportDataValue")
+_KNOWN_KEYS: FrozenSet[str] = frozenset()
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class ReportDataValue:
     """The value of the data element."""
 
@@ -21,10 +24,13 @@ class ReportDataValue:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
+        d = src_dict
         report_data_value = cls()
 
-        report_data_value.additional_properties = d
+        if _KNOWN_KEYS.issuperset(d):
+            report_data_value.additional_properties = EMPTY_PROPERTIES
+        else:
+            report_data_value.additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return report_data_value
 
     @property
@@ -35,6 +41,8 @@ class ReportDataValue:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
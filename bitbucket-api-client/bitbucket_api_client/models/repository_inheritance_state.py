@@ -3,21 +3,22 @@ from typing import Any, Dict, List, Type, TypeVar, Union
 import attr
 
 from ..models.repository_inheritance_state_override_settings import RepositoryInheritanceStateOverrideSettings
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="RepositoryInheritanceState")
+_KNOWN_KEYS = frozenset({"type", "override_settings"})
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class RepositoryInheritanceState:
     """A json object representing the repository's inheritance state values
 
     Attributes:
-        type (str):
+        type (Union[Unset, str]):
         override_settings (Union[Unset, RepositoryInheritanceStateOverrideSettings]):
     """
 
-    type: str
+    type: Union[Unset, str]
     override_settings: Union[Unset, RepositoryInheritanceStateOverrideSettings] = UNSET
     additional_properties: Dict[str, Any] = attr.ib(init=False, factory=dict)
 
@@ -29,11 +30,8 @@ class RepositoryInheritanceState:
 
         field_dict: Dict[str, Any] = {}
         field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "type": type,
-            }
-        )
+        if type is not UNSET:
+            field_dict["type"] = type
         if override_settings is not UNSET:
             field_dict["override_settings"] = override_settings
 
@@ -41,10 +39,10 @@ class RepositoryInheritanceState:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        type = d.pop("type")
+        d = src_dict
+        type = d.get("type", UNSET)
 
-        _override_settings = d.pop("override_settings", UNSET)
+        _override_settings = d.get("override_settings", UNSET)
         override_settings: Union[Unset, RepositoryInheritanceStateOverrideSettings]
         if isinstance(_override_settings, Unset):
             override_settings = UNSET
@@ -56,7 +54,10 @@ class RepositoryInheritanceState:
             override_settings=override_settings,
         )
 
-        repository_inheritance_state.additional_properties = d
+        if _KNOWN_KEYS.issuperset(d):
+            repository_inheritance_state.additional_properties = EMPTY_PROPERTIES
+        else:
+            repository_inheritance_state.additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return repository_inheritance_state
 
     @property
@@ -67,6 +68,8 @@ class RepositoryInheritanceState:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
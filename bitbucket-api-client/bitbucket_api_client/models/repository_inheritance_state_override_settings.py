@@ -1,11 +1,14 @@
-from typing import Any, Dict, List, Type, TypeVar
+from typing import Any, Dict, FrozenSet, List, Type, TypeVar
 
 import attr
 
+from ..types import EMPTY_PROPERTIES
+
 T = TypeVar("T", bound="RepositoryInheritanceStateOverrideSettings")
+_KNOWN_KEYS: FrozenSet[str] = frozenset()
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class RepositoryInheritanceStateOverrideSettings:
     """ """
 
@@ -21,10 +24,15 @@ class RepositoryInheritanceStateOverrideSettings:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
+        d = src_dict
         repository_inheritance_state_override_settings = cls()
 
-        repository_inheritance_state_override_settings.additional_properties = d
+        if _KNOWN_KEYS.issuperset(d):
+            repository_inheritance_state_override_settings.additional_properties = EMPTY_PROPERTIES
+        else:
+            repository_inheritance_state_override_settings.additional_properties = {
+                k: v for k, v in d.items() if k not in _KNOWN_KEYS
+            }
         return repository_inheritance_state_override_settings
 
     @property
@@ -35,6 +43,8 @@ class RepositoryInheritanceStateOverrideSettings:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
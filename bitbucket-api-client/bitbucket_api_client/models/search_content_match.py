@@ -3,12 +3,13 @@ from typing import Any, Dict, List, Type, TypeVar, Union
 import attr
 
 from ..models.search_line import SearchLine
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="SearchContentMatch")
+_KNOWN_KEYS = frozenset({"lines"})
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class SearchContentMatch:
     """
     Attributes:
@@ -37,9 +38,9 @@ class SearchContentMatch:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
+        d = src_dict
         lines = []
-        _lines = d.pop("lines", UNSET)
+        _lines = d.get("lines", UNSET)
         for lines_item_data in _lines or []:
             lines_item = SearchLine.from_dict(lines_item_data)
 
@@ -49,7 +50,10 @@ class SearchContentMatch:
             lines=lines,
         )
 
-        search_content_match.additional_properties = d
+        if _KNOWN_KEYS.issuperset(d):
+            search_content_match.additional_properties = EMPTY_PROPERTIES
+        else:
+            search_content_match.additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return search_content_match
 
     @property
@@ -60,6 +64,8 @@ class SearchContentMatch:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -3,12 +3,13 @@ from typing import Any, Dict, List, Type, TypeVar, Union
 import attr
 
 from ..models.search_segment import SearchSegment
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="SearchLine")
+_KNOWN_KEYS = frozenset({"line", "segments"})
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class SearchLine:
     """
     Attributes:
@@ -42,11 +43,11 @@ class SearchLine:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        line = d.pop("line", UNSET)
+        d = src_dict
+        line = d.get("line", UNSET)
 
         segments = []
-        _segments = d.pop("segments", UNSET)
+        _segments = d.get("segments", UNSET)
         for segments_item_data in _segments or []:
             segments_item = SearchSegment.from_dict(segments_item_data)
 
@@ -57,7 +58,10 @@ class SearchLine:
             segments=segments,
         )
 
-        search_line.additional_properties = d
+        if _KNOWN_KEYS.issuperset(d):
+            search_line.additional_properties = EMPTY_PROPERTIES
+        else:
+            search_line.additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return search_line
 
     @property
@@ -68,6 +72,8 @@ class SearchLine:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
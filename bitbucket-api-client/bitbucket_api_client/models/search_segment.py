@@ -2,12 +2,13 @@ from typing import Any, Dict, List, Type, TypeVar, Union
 
 import attr
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="SearchSegment")
+_KNOWN_KEYS = frozenset({"text", "match"})
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class SearchSegment:
     """
     Attributes:
@@ -35,17 +36,20 @@ class SearchSegment:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        text = d.pop("text", UNSET)
+        d = src_dict
+        text = d.get("text", UNSET)
 
-        match = d.pop("match", UNSET)
+        match = d.get("match", UNSET)
 
         search_segment = cls(
             text=text,
             match=match,
         )
 
-        search_segment.additional_properties = d
+        if _KNOWN_KEYS.issuperset(d):
+            search_segment.additional_properties = EMPTY_PROPERTIES
+        else:
+            search_segment.additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return search_segment
 
     @property
@@ -56,6 +60,8 @@ class SearchSegment:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -2,20 +2,21 @@ import datetime
 from typing import Any, Dict, List, Type, TypeVar, Union
 
 import attr
-from dateutil.parser import isoparse
 
+from ..dates import parse_datetime
 from ..models.account import Account
 from ..models.snippet_scm import SnippetScm
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="Snippet")
+_KNOWN_KEYS = frozenset({"type", "id", "title", "scm", "created_on", "updated_on", "owner", "creator", "is_private"})
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class Snippet:
     """
     Attributes:
-        type (str):
+        type (Union[Unset, str]):
         id (Union[Unset, int]):
         title (Union[Unset, str]):
         scm (Union[Unset, SnippetScm]): The DVCS used to store the snippet.
@@ -26,7 +27,7 @@ class Snippet:
         is_private (Union[Unset, bool]):
     """
 
-    type: str
+    type: Union[Unset, str]
     id: Union[Unset, int] = UNSET
     title: Union[Unset, str] = UNSET
     scm: Union[Unset, SnippetScm] = UNSET
@@ -65,11 +66,8 @@ class Snippet:
 
         field_dict: Dict[str, Any] = {}
         field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "type": type,
-            }
-        )
+        if type is not UNSET:
+            field_dict["type"] = type
         if id is not UNSET:
             field_dict["id"] = id
         if title is not UNSET:
@@ -91,49 +89,49 @@ class Snippet:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        type = d.pop("type")
+        d = src_dict
+        type = d.get("type", UNSET)
 
-        id = d.pop("id", UNSET)
+        id = d.get("id", UNSET)
 
-        title = d.pop("title", UNSET)
+        title = d.get("title", UNSET)
 
-        _scm = d.pop("scm", UNSET)
+        _scm = d.get("scm", UNSET)
         scm: Union[Unset, SnippetScm]
         if isinstance(_scm, Unset):
             scm = UNSET
         else:
             scm = SnippetScm(_scm)
 
-        _created_on = d.pop("created_on", UNSET)
+        _created_on = d.get("created_on", UNSET)
         created_on: Union[Unset, datetime.datetime]
         if isinstance(_created_on, Unset):
             created_on = UNSET
         else:
-            created_on = isoparse(_created_on)
+            created_on = parse_datetime(_created_on)
 
-        _updated_on = d.pop("updated_on", UNSET)
+        _updated_on = d.get("updated_on", UNSET)
         updated_on: Union[Unset, datetime.datetime]
         if isinstance(_updated_on, Unset):
             updated_on = UNSET
         else:
-            updated_on = isoparse(_updated_on)
+            updated_on = parse_datetime(_updated_on)
 
-        _owner = d.pop("owner", UNSET)
+        _owner = d.get("owner", UNSET)
         owner: Union[Unset, Account]
         if isinstance(_owner, Unset):
             owner = UNSET
         else:
             owner = Account.from_dict(_owner)
 
-        _creator = d.pop("creator", UNSET)
+        _creator = d.get("creator", UNSET)
         creator: Union[Unset, Account]
         if isinstance(_creator, Unset):
             creator = UNSET
         else:
             creator = Account.from_dict(_creator)
 
-        is_private = d.pop("is_private", UNSET)
+        is_private = d.get("is_private", UNSET)
 
         snippet = cls(
             type=type,
@@ -147,7 +145,10 @@ class Snippet:
             is_private=is_private,
         )
 
-        snippet.additional_properties = d
+        if _KNOWN_KEYS.issuperset(d):
+            snippet.additional_properties = EMPTY_PROPERTIES
+        else:
+            snippet.additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return snippet
 
     @property
@@ -158,6 +159,8 @@ class Snippet:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
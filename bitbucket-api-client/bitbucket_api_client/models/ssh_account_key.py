@@ -2,20 +2,21 @@ import datetime
 from typing import Any, Dict, List, Type, TypeVar, Union
 
 import attr
-from dateutil.parser import isoparse
 
+from ..dates import parse_datetime
 from ..models.account import Account
 from ..models.ssh_key_links import SshKeyLinks
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="SshAccountKey")
+_KNOWN_KEYS = frozenset({"type", "uuid", "key", "comment", "label", "created_on", "last_used", "links", "owner"})
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class SshAccountKey:
     """
     Attributes:
-        type (str):
+        type (Union[Unset, str]):
         uuid (Union[Unset, str]): The SSH key's immutable ID.
         key (Union[Unset, str]): The SSH public key value in OpenSSH format.
         comment (Union[Unset, str]): The comment parsed from the SSH key (if present)
@@ -26,7 +27,7 @@ class SshAccountKey:
         owner (Union[Unset, Account]):
     """
 
-    type: str
+    type: Union[Unset, str]
     uuid: Union[Unset, str] = UNSET
     key: Union[Unset, str] = UNSET
     comment: Union[Unset, str] = UNSET
@@ -61,11 +62,8 @@ class SshAccountKey:
 
         field_dict: Dict[str, Any] = {}
         field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "type": type,
-            }
-        )
+        if type is not UNSET:
+            field_dict["type"] = type
         if uuid is not UNSET:
             field_dict["uuid"] = uuid
         if key is not UNSET:
@@ -87,39 +85,39 @@ class SshAccountKey:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        type = d.pop("type")
+        d = src_dict
+        type = d.get("type", UNSET)
 
-        uuid = d.pop("uuid", UNSET)
+        uuid = d.get("uuid", UNSET)
 
-        key = d.pop("key", UNSET)
+        key = d.get("key", UNSET)
 
-        comment = d.pop("comment", UNSET)
+        comment = d.get("comment", UNSET)
 
-        label = d.pop("label", UNSET)
+        label = d.get("label", UNSET)
 
-        _created_on = d.pop("created_on", UNSET)
+        _created_on = d.get("created_on", UNSET)
         created_on: Union[Unset, datetime.datetime]
         if isinstance(_created_on, Unset):
             created_on = UNSET
         else:
-            created_on = isoparse(_created_on)
+            created_on = parse_datetime(_created_on)
 
-        _last_used = d.pop("last_used", UNSET)
+        _last_used = d.get("last_used", UNSET)
         last_used: Union[Unset, datetime.datetime]
         if isinstance(_last_used, Unset):
             last_used = UNSET
         else:
-            last_used = isoparse(_last_used)
+            last_used = parse_datetime(_last_used)
 
-        _links = d.pop("links", UNSET)
+        _links = d.get("links", UNSET)
         links: Union[Unset, SshKeyLinks]
         if isinstance(_links, Unset):
             links = UNSET
         else:
             links = SshKeyLinks.from_dict(_links)
 
-        _owner = d.pop("owner", UNSET)
+        _owner = d.get("owner", UNSET)
         owner: Union[Unset, Account]
         if isinstance(_owner, Unset):
             owner = UNSET
@@ -138,7 +136,10 @@ class SshAccountKey:
             owner=owner,
         )
 
-        ssh_account_key.additional_properties = d
+        if _KNOWN_KEYS.issuperset(d):
+            ssh_account_key.additional_properties = EMPTY_PROPERTIES
+        else:
+            ssh_account_key.additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return ssh_account_key
 
     @property
@@ -149,6 +150,8 @@ class SshAccountKey:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
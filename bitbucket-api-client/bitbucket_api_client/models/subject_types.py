@@ -9,7 +9,7 @@ from ..types import UNSET, Unset
 T = TypeVar("T", bound="SubjectTypes")
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class SubjectTypes:
     """The mapping of resource/subject types pointing to their individual event types.
 
@@ -41,15 +41,15 @@ class SubjectTypes:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        _repository = d.pop("repository", UNSET)
+        d = src_dict
+        _repository = d.get("repository", UNSET)
         repository: Union[Unset, SubjectTypesRepository]
         if isinstance(_repository, Unset):
             repository = UNSET
         else:
             repository = SubjectTypesRepository.from_dict(_repository)
 
-        _workspace = d.pop("workspace", UNSET)
+        _workspace = d.get("workspace", UNSET)
         workspace: Union[Unset, SubjectTypesWorkspace]
         if isinstance(_workspace, Unset):
             workspace = UNSET
@@ -8,7 +8,7 @@ from ..types import UNSET, Unset
 T = TypeVar("T", bound="SubjectTypesWorkspace")
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class SubjectTypesWorkspace:
     """
     Attributes:
@@ -31,8 +31,8 @@ class SubjectTypesWorkspace:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        _events = d.pop("events", UNSET)
+        d = src_dict
+        _events = d.get("events", UNSET)
         events: Union[Unset, SubjectTypesWorkspaceLink]
         if isinstance(_events, Unset):
             events = UNSET
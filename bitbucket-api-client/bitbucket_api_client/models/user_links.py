@@ -3,12 +3,13 @@ from typing import Any, Dict, List, Type, TypeVar, Union
 import attr
 
 from ..models.link import Link
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="UserLinks")
+_KNOWN_KEYS = frozenset({"avatar", "self", "html", "repositories"})
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class UserLinks:
     """
     Attributes:
@@ -57,29 +58,29 @@ class UserLinks:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        _avatar = d.pop("avatar", UNSET)
+        d = src_dict
+        _avatar = d.get("avatar", UNSET)
         avatar: Union[Unset, Link]
         if isinstance(_avatar, Unset):
             avatar = UNSET
         else:
             avatar = Link.from_dict(_avatar)
 
-        _self_ = d.pop("self", UNSET)
+        _self_ = d.get("self", UNSET)
         self_: Union[Unset, Link]
         if isinstance(_self_, Unset):
             self_ = UNSET
         else:
             self_ = Link.from_dict(_self_)
 
-        _html = d.pop("html", UNSET)
+        _html = d.get("html", UNSET)
         html: Union[Unset, Link]
         if isinstance(_html, Unset):
             html = UNSET
         else:
             html = Link.from_dict(_html)
 
-        _repositories = d.pop("repositories", UNSET)
+        _repositories = d.get("repositories", UNSET)
         repositories: Union[Unset, Link]
         if isinstance(_repositories, Unset):
             repositories = UNSET
@@ -93,7 +94,10 @@ class UserLinks:
             repositories=repositories,
         )
 
-        user_links.additional_properties = d
+        if _KNOWN_KEYS.issuperset(d):
+            user_links.additional_properties = EMPTY_PROPERTIES
+        else:
+            user_links.additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return user_links
 
     @property
@@ -104,6 +108,8 @@ class UserLinks:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
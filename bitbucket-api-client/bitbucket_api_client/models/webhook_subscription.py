@@ -2,21 +2,24 @@ import datetime
 from typing import Any, Dict, List, Type, TypeVar, Union
 
 import attr
-from dateutil.parser import isoparse
 
+from ..dates import parse_datetime
 from ..models.object_ import Object
 from ..models.webhook_subscription_events_item import WebhookSubscriptionEventsItem
 from ..models.webhook_subscription_subject_type import WebhookSubscriptionSubjectType
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="WebhookSubscription")
+_KNOWN_KEYS = frozenset(
+    {"type", "uuid", "url", "description", "subject_type", "subject", "active", "created_at", "events"}
+)
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class WebhookSubscription:
     """
     Attributes:
-        type (str):
+        type (Union[Unset, str]):
         uuid (Union[Unset, str]): The webhook's id
         url (Union[Unset, str]): The URL events get delivered to.
         description (Union[Unset, str]): A user-defined description of the webhook.
@@ -29,7 +32,7 @@ class WebhookSubscription:
         events (Union[Unset, List[WebhookSubscriptionEventsItem]]): The events this webhook is subscribed to.
     """
 
-    type: str
+    type: Union[Unset, str]
     uuid: Union[Unset, str] = UNSET
     url: Union[Unset, str] = UNSET
     description: Union[Unset, str] = UNSET
@@ -68,11 +71,8 @@ class WebhookSubscription:
 
         field_dict: Dict[str, Any] = {}
         field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "type": type,
-            }
-        )
+        if type is not UNSET:
+            field_dict["type"] = type
         if uuid is not UNSET:
             field_dict["uuid"] = uuid
         if url is not UNSET:
@@ -94,40 +94,40 @@ class WebhookSubscription:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        type = d.pop("type")
+        d = src_dict
+        type = d.get("type", UNSET)
 
-        uuid = d.pop("uuid", UNSET)
+        uuid = d.get("uuid", UNSET)
 
-        url = d.pop("url", UNSET)
+        url = d.get("url", UNSET)
 
-        description = d.pop("description", UNSET)
+        description = d.get("description", UNSET)
 
-        _subject_type = d.pop("subject_type", UNSET)
+        _subject_type = d.get("subject_type", UNSET)
         subject_type: Union[Unset, WebhookSubscriptionSubjectType]
         if isinstance(_subject_type, Unset):
             subject_type = UNSET
         else:
             subject_type = WebhookSubscriptionSubjectType(_subject_type)
 
-        _subject = d.pop("subject", UNSET)
+        _subject = d.get("subject", UNSET)
         subject: Union[Unset, Object]
         if isinstance(_subject, Unset):
             subject = UNSET
         else:
             subject = Object.from_dict(_subject)
 
-        active = d.pop("active", UNSET)
+        active = d.get("active", UNSET)
 
-        _created_at = d.pop("created_at", UNSET)
+        _created_at = d.get("created_at", UNSET)
         created_at: Union[Unset, datetime.datetime]
         if isinstance(_created_at, Unset):
             created_at = UNSET
         else:
-            created_at = isoparse(_created_at)
+            created_at = parse_datetime(_created_at)
 
         events = []
-        _events = d.pop("events", UNSET)
+        _events = d.get("events", UNSET)
         for events_item_data in _events or []:
             events_item = WebhookSubscriptionEventsItem(events_item_data)
 
@@ -145,7 +145,10 @@ class WebhookSubscription:
             events=events,
         )
 
-        webhook_subscription.additional_properties = d
+        if _KNOWN_KEYS.issuperset(d):
+            webhook_subscription.additional_properties = EMPTY_PROPERTIES
+        else:
+            webhook_subscription.additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return webhook_subscription
 
     @property
@@ -156,6 +159,8 @@ class WebhookSubscription:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
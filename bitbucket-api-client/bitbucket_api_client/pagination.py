@@ -0,0 +1,301 @@
+""" Contains helpers which walk through the pages of paginated endpoints """
+import asyncio
+import collections
+import contextlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from types import ModuleType
+from typing import Any, AsyncGenerator, AsyncIterator, Deque, Dict, Generator, Iterator, List, Optional
+
+import attr
+import httpx
+
+from .client import Client
+from .errors import UnexpectedStatus
+from .types import Unset
+
+
+@attr.s(auto_attribs=True)
+class Page:
+    """A single page of results from a paginated endpoint
+
+    Attributes:
+        values (List[Any]): The items of the page, as models when the endpoint parses its responses and as
+            dictionaries otherwise.
+        next_ (Optional[str]): Link to the next page, None on the last page.
+        page (Optional[int]): Page number of the current results, when provided by the endpoint.
+        size (Optional[int]): Total number of objects in the response, when provided by the endpoint.
+        pagelen (Optional[int]): Maximum number of objects on a page, when provided by the endpoint.
+    """
+
+    values: List[Any]
+    next_: Optional[str] = None
+    page: Optional[int] = None
+    size: Optional[int] = None
+    pagelen: Optional[int] = None
+
+
+def _none_if_unset(value: Any) -> Any:
+    return None if isinstance(value, Unset) else value
+
+
+def _get_page(endpoint: ModuleType, client: Client, response: httpx.Response) -> Page:
+    if response.status_code != 200:
+        raise UnexpectedStatus(response.status_code, response.content)
+    parsed = endpoint._build_response(client=client, response=response).parsed
+    if parsed is None or not hasattr(parsed, "values"):
+        data = client.json_codec.loads(response.content)
+        return Page(
+            values=data.get("values", []),
+            next_=data.get("next"),
+            page=data.get("page"),
+            size=data.get("size"),
+            pagelen=data.get("pagelen"),
+        )
+    return Page(
+        values=_none_if_unset(parsed.values) or [],
+        next_=_none_if_unset(parsed.next_),
+        page=_none_if_unset(parsed.page),
+        size=_none_if_unset(parsed.size),
+        pagelen=_none_if_unset(parsed.pagelen),
+    )
+
+
+def _get_first_kwargs(
+    endpoint: ModuleType, args: Any, client: Client, pagelen: Optional[int], kwargs: Dict[str, Any]
+) -> Dict[str, Any]:
+    request_kwargs = endpoint._get_kwargs(*args, client=client, **kwargs)
+    if pagelen is not None:
+        request_kwargs["params"] = {**request_kwargs.get("params", {}), "pagelen": pagelen}
+    return request_kwargs
+
+
+def _get_next_kwargs(request_kwargs: Dict[str, Any], url: str) -> Dict[str, Any]:
+    # the link to the next page already carries every query parameter
+    next_kwargs = {**request_kwargs, "url": url}
+    next_kwargs.pop("params", None)
+    return next_kwargs
+
+
+def _get_numbered_kwargs(request_kwargs: Dict[str, Any], number: int, pagelen: int) -> Dict[str, Any]:
+    return {**request_kwargs, "params": {**request_kwargs.get("params", {}), "page": number, "pagelen": pagelen}}
+
+
+def _has_next(page: Page, count: int, max_pages: Optional[int]) -> bool:
+    return page.next_ is not None and (max_pages is None or count < max_pages)
+
+
+def _get_page_numbers(page: Page, max_pages: Optional[int]) -> Optional[range]:
+    """Get the numbers of the pages following ``page`` when they can be predicted from its ``size`` and ``pagelen``"""
+    if page.next_ is None or page.page is None or page.size is None or not page.pagelen:
+        return None
+    last = -(-page.size // page.pagelen)
+    if max_pages is not None:
+        last = min(last, page.page + max_pages - 1)
+    return range(page.page + 1, last + 1)
+
+
+def iterate_pages(
+    endpoint: ModuleType,
+    *args: Any,
+    client: Client,
+    max_pages: Optional[int] = None,
+    pagelen: Optional[int] = None,
+    prefetch: bool = True,
+    workers: int = 1,
+    **kwargs: Any,
+) -> Generator[Page, None, None]:
+    """Walk through the pages of a paginated endpoint by following their ``next`` links
+
+    When ``workers`` is more than 1 and the first page reports the ``size`` of the collection, the URLs of the
+    remaining pages are predictable and up to ``workers`` of them are fetched concurrently, still yielded in order.
+    Collections which do not report their size are walked one page after the other.
+
+    Args:
+        endpoint: The endpoint module, e.g. ``bitbucket_api_client.api.pipelines.get_pipeline_steps_for_repository``
+        *args: The positional (path) arguments of the endpoint
+        client: The client used for every request
+        max_pages: Stop after this many pages
+        pagelen: The number of items to request per page (Bitbucket allows up to 100 on most endpoints)
+        prefetch: Fetch the next page in a background thread while the current one is consumed
+        workers: The maximum number of pages fetched concurrently when their URLs are predictable
+        **kwargs: The keyword (query) arguments of the endpoint
+
+    Raises:
+        UnexpectedStatus: If a page is not answered with a 200
+
+    Yields:
+        Page
+    """
+    request_kwargs = _get_first_kwargs(endpoint, args, client, pagelen, kwargs)
+    http_client = client.get_httpx_client()
+
+    def fetch(page_kwargs: Dict[str, Any]) -> Page:
+        return _get_page(endpoint, client, http_client.request(**page_kwargs))
+
+    executor = ThreadPoolExecutor(max_workers=max(workers, 1)) if prefetch or workers > 1 else None
+    pending: Deque["Future[Page]"] = collections.deque()
+    try:
+        page = fetch(request_kwargs)
+        numbers = _get_page_numbers(page, max_pages) if workers > 1 else None
+        if executor is not None and numbers is not None:
+            assert page.pagelen is not None
+            yield page
+            for number in numbers:
+                pending.append(executor.submit(fetch, _get_numbered_kwargs(request_kwargs, number, page.pagelen)))
+                if len(pending) >= workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+            return
+
+        count = 1
+        while True:
+            has_next = _has_next(page, count, max_pages)
+            if has_next and executor is not None:
+                pending.append(executor.submit(fetch, _get_next_kwargs(request_kwargs, page.next_)))
+            yield page
+            if not has_next:
+                return
+            page = pending.popleft().result() if pending else fetch(_get_next_kwargs(request_kwargs, page.next_))
+            count += 1
+    finally:
+        for following in pending:
+            following.cancel()
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+def iterate(
+    endpoint: ModuleType,
+    *args: Any,
+    client: Client,
+    max_items: Optional[int] = None,
+    max_pages: Optional[int] = None,
+    pagelen: Optional[int] = None,
+    prefetch: bool = True,
+    workers: int = 1,
+    **kwargs: Any,
+) -> Iterator[Any]:
+    """Lazily yield every item of a paginated endpoint, across all of its pages
+
+    Args:
+        endpoint: The endpoint module, e.g. ``bitbucket_api_client.api.pipelines.get_pipeline_steps_for_repository``
+        *args: The positional (path) arguments of the endpoint
+        client: The client used for every request
+        max_items: Stop after this many items
+        max_pages: Stop after this many pages
+        pagelen: The number of items to request per page (Bitbucket allows up to 100 on most endpoints)
+        prefetch: Fetch the next page in a background thread while the current one is consumed
+        workers: The maximum number of pages fetched concurrently when their URLs are predictable, see
+            ``iterate_pages``
+        **kwargs: The keyword (query) arguments of the endpoint
+
+    Raises:
+        UnexpectedStatus: If a page is not answered with a 200
+
+    Yields:
+        The items of each page, as models when the endpoint parses its responses and as dictionaries otherwise
+    """
+    if max_items is not None and max_items <= 0:
+        return
+    count = 0
+    pages = iterate_pages(
+        endpoint,
+        *args,
+        client=client,
+        max_pages=max_pages,
+        pagelen=pagelen,
+        prefetch=prefetch,
+        workers=workers,
+        **kwargs,
+    )
+    with contextlib.closing(pages):
+        for page in pages:
+            for item in page.values:
+                yield item
+                count += 1
+                if max_items is not None and count >= max_items:
+                    return
+
+
+async def aiterate_pages(
+    endpoint: ModuleType,
+    *args: Any,
+    client: Client,
+    max_pages: Optional[int] = None,
+    pagelen: Optional[int] = None,
+    prefetch: bool = True,
+    workers: int = 1,
+    **kwargs: Any,
+) -> AsyncGenerator[Page, None]:
+    """Like ``iterate_pages`` but async, fetching pages ahead in tasks instead of threads"""
+    request_kwargs = _get_first_kwargs(endpoint, args, client, pagelen, kwargs)
+    http_client = client.get_async_httpx_client()
+
+    async def fetch(page_kwargs: Dict[str, Any]) -> Page:
+        return _get_page(endpoint, client, await http_client.request(**page_kwargs))
+
+    pending: Deque["asyncio.Future[Page]"] = collections.deque()
+    try:
+        page = await fetch(request_kwargs)
+        numbers = _get_page_numbers(page, max_pages) if workers > 1 else None
+        if numbers is not None:
+            assert page.pagelen is not None
+            yield page
+            for number in numbers:
+                pending.append(asyncio.ensure_future(fetch(_get_numbered_kwargs(request_kwargs, number, page.pagelen))))
+                if len(pending) >= workers:
+                    yield await pending.popleft()
+            while pending:
+                yield await pending.popleft()
+            return
+
+        count = 1
+        while True:
+            has_next = _has_next(page, count, max_pages)
+            if has_next and prefetch:
+                pending.append(asyncio.ensure_future(fetch(_get_next_kwargs(request_kwargs, page.next_))))
+            yield page
+            if not has_next:
+                return
+            page = await pending.popleft() if pending else await fetch(_get_next_kwargs(request_kwargs, page.next_))
+            count += 1
+    finally:
+        for following in pending:
+            following.cancel()
+
+
+async def aiterate(
+    endpoint: ModuleType,
+    *args: Any,
+    client: Client,
+    max_items: Optional[int] = None,
+    max_pages: Optional[int] = None,
+    pagelen: Optional[int] = None,
+    prefetch: bool = True,
+    workers: int = 1,
+    **kwargs: Any,
+) -> AsyncIterator[Any]:
+    """Like ``iterate`` but async, fetching pages ahead in tasks instead of threads"""
+    if max_items is not None and max_items <= 0:
+        return
+    count = 0
+    pages = aiterate_pages(
+        endpoint,
+        *args,
+        client=client,
+        max_pages=max_pages,
+        pagelen=pagelen,
+        prefetch=prefetch,
+        workers=workers,
+        **kwargs,
+    )
+    try:
+        async for page in pages:
+            for item in page.values:
+                yield item
+                count += 1
+                if max_items is not None and count >= max_items:
+                    return
+    finally:
+        await pages.aclose()
@@ -0,0 +1,287 @@
+""" Contains a pruner of the pipeline caches of every repository of a workspace """
+import asyncio
+import datetime
+import fnmatch
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import attr
+import httpx
+
+from .api.pipelines import delete_repository_pipeline_cache, get_repository_pipeline_caches
+from .api.repositories import get_repositories_workspace
+from .client import AuthenticatedClient
+from .errors import UnexpectedStatus
+from .models.pipeline_cache import PipelineCache
+from .pagination import aiterate, iterate
+from .types import Unset
+
+_REPOSITORY_FIELDS = "values.slug,next,page,pagelen,size"
+# a cache already gone is as good as deleted
+_DELETED_STATUSES = (204, 404)
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class CacheSelector:
+    """Which pipeline caches to prune: a cache is selected when it matches all of the criteria given
+
+    Attributes:
+        older_than: Select the caches created longer ago than this
+        larger_than: Select the caches whose archive is larger than this many bytes
+        name_pattern: Select the caches whose name matches this shell-style pattern, e.g. ``node*`` or ``gradle``
+    """
+
+    older_than: Optional[datetime.timedelta] = None
+    larger_than: Optional[int] = None
+    name_pattern: Optional[str] = None
+
+    def matches(self, cache: PipelineCache, now: datetime.datetime) -> bool:
+        if self.older_than is not None:
+            if isinstance(cache.created_on, Unset) or now - cache.created_on <= self.older_than:
+                return False
+        if self.larger_than is not None:
+            if isinstance(cache.file_size_bytes, Unset) or cache.file_size_bytes <= self.larger_than:
+                return False
+        if self.name_pattern is not None:
+            if isinstance(cache.name, Unset) or not fnmatch.fnmatchcase(cache.name, self.name_pattern):
+                return False
+        return True
+
+
+@attr.s(auto_attribs=True)
+class PrunedCache:
+    """A cache selected for pruning
+
+    Attributes:
+        repo_slug: The slug of the repository of the cache
+        cache: The cache
+        deleted: Whether the cache was deleted, always False in a dry run
+        error: The error which kept the cache from being deleted, an ``UnexpectedStatus`` or an ``httpx.HTTPError``
+    """
+
+    repo_slug: str
+    cache: PipelineCache
+    deleted: bool = False
+    error: Optional[Exception] = None
+
+    @property
+    def size(self) -> int:
+        return 0 if isinstance(self.cache.file_size_bytes, Unset) else self.cache.file_size_bytes
+
+
+@attr.s(auto_attribs=True)
+class PruneReport:
+    """What a pruning of pipeline caches selected and deleted
+
+    Attributes:
+        workspace: The workspace pruned
+        dry_run: Whether the selected caches were only reported, not deleted
+        repositories: The number of repositories scanned
+        caches: The number of caches scanned
+        selected: The caches selected, ordered by repository and name
+        scan_errors: The error which stopped the listing of the caches of a repository, by repository slug
+    """
+
+    workspace: str
+    dry_run: bool
+    repositories: int = 0
+    caches: int = 0
+    selected: List[PrunedCache] = attr.ib(factory=list)
+    scan_errors: Dict[str, Exception] = attr.ib(factory=dict)
+
+    @property
+    def selected_bytes(self) -> int:
+        return sum(pruned.size for pruned in self.selected)
+
+    @property
+    def deleted_bytes(self) -> int:
+        return sum(pruned.size for pruned in self.selected if pruned.deleted)
+
+    @property
+    def failed(self) -> List[PrunedCache]:
+        return [pruned for pruned in self.selected if pruned.error is not None]
+
+    def format_report(self) -> str:
+        """Format the caches selected as a plain text report"""
+        action = "would delete" if self.dry_run else "deleted"
+        lines = []
+        for pruned in self.selected:
+            status = "failed: " + str(pruned.error) if pruned.error is not None else action
+            created_on = (
+                "" if isinstance(pruned.cache.created_on, Unset) else pruned.cache.created_on.date().isoformat()
+            )
+            lines.append(
+                f"{pruned.repo_slug:<30} {pruned.cache.name!s:<20} {pruned.size:>14,} {created_on:<10}  {status}"
+            )
+        summary = (
+            f"{self.workspace}: {len(self.selected)} of {self.caches} caches selected in {self.repositories} "
+            f"repositories, {self.selected_bytes:,} bytes"
+        )
+        if self.dry_run:
+            summary += " (dry run, nothing deleted)"
+        else:
+            summary += f", {self.deleted_bytes:,} bytes deleted"
+        lines.append(summary)
+        if self.failed:
+            lines.append(f"{len(self.failed)} caches could not be deleted")
+        for repo_slug in sorted(self.scan_errors):
+            lines.append(f"{repo_slug:<30} could not be scanned: {self.scan_errors[repo_slug]}")
+        return "\n".join(lines)
+
+
+def _list_caches(workspace: str, repo_slug: str, client: AuthenticatedClient) -> List[PipelineCache]:
+    try:
+        return list(iterate(get_repository_pipeline_caches, workspace, repo_slug, client=client, prefetch=False))
+    except UnexpectedStatus as error:
+        # repositories without pipelines answer 404
+        if error.status_code == 404:
+            return []
+        raise
+
+
+async def _alist_caches(workspace: str, repo_slug: str, client: AuthenticatedClient) -> List[PipelineCache]:
+    try:
+        return [cache async for cache in aiterate(get_repository_pipeline_caches, workspace, repo_slug, client=client)]
+    except UnexpectedStatus as error:
+        if error.status_code == 404:
+            return []
+        raise
+
+
+def _delete(workspace: str, pruned: PrunedCache, client: AuthenticatedClient) -> None:
+    try:
+        response = delete_repository_pipeline_cache.sync_detailed(
+            workspace, pruned.repo_slug, pruned.cache.uuid, client=client
+        )
+    except httpx.HTTPError as error:
+        pruned.error = error
+        return
+    _record_deletion(pruned, response.status_code, response.content)
+
+
+async def _adelete(
+    workspace: str, pruned: PrunedCache, client: AuthenticatedClient, semaphore: asyncio.Semaphore
+) -> None:
+    try:
+        async with semaphore:
+            response = await delete_repository_pipeline_cache.asyncio_detailed(
+                workspace, pruned.repo_slug, pruned.cache.uuid, client=client
+            )
+    except httpx.HTTPError as error:
+        pruned.error = error
+        return
+    _record_deletion(pruned, response.status_code, response.content)
+
+
+def _record_deletion(pruned: PrunedCache, status_code: int, content: bytes) -> None:
+    if status_code in _DELETED_STATUSES:
+        pruned.deleted = True
+    else:
+        pruned.error = UnexpectedStatus(status_code, content)
+
+
+def _select(
+    report: PruneReport, repo_slug: str, caches: List[PipelineCache], selector: CacheSelector, now: datetime.datetime
+) -> List[PrunedCache]:
+    report.repositories += 1
+    report.caches += len(caches)
+    selected = [PrunedCache(repo_slug, cache) for cache in caches if selector.matches(cache, now)]
+    report.selected.extend(selected)
+    return selected
+
+
+def _sort_key(pruned: PrunedCache) -> Tuple[str, str]:
+    return pruned.repo_slug, str(pruned.cache.name)
+
+
+def prune_caches(
+    workspace: str,
+    selector: CacheSelector,
+    *,
+    client: AuthenticatedClient,
+    dry_run: bool = True,
+    repositories: Optional[Iterable[str]] = None,
+    workers: int = 8,
+) -> PruneReport:
+    """Select the pipeline caches of the repositories of a workspace, and delete them unless ``dry_run`` is set
+
+    The caches of up to ``workers`` repositories are listed concurrently, in threads, and the caches selected are
+    deleted by the same threads as soon as their repository has been scanned. Listing and deletion failures, whether
+    unexpected statuses or transport errors, are recorded in the report rather than raised, so that one failure does not
+    stop the pruning of the rest of the workspace.
+
+    Args:
+        workspace: The workspace
+        selector: Which caches to select
+        client: The client used for every request
+        dry_run: Only report the caches selected, without deleting them
+        repositories: The slugs of the repositories to scan, every repository of the workspace by default
+        workers: The maximum number of requests in flight at once
+
+    Raises:
+        UnexpectedStatus: If the repositories of the workspace are answered with an unexpected status
+
+    Returns:
+        The report of the caches selected and deleted
+    """
+    if repositories is None:
+        repositories = (
+            repository["slug"]
+            for repository in iterate(get_repositories_workspace, workspace, client=client, fields=_REPOSITORY_FIELDS)
+        )
+    now = datetime.datetime.now(datetime.timezone.utc)
+    report = PruneReport(workspace=workspace, dry_run=dry_run)
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+        scans: Dict["Future[List[PipelineCache]]", str] = {
+            executor.submit(_list_caches, workspace, repo_slug, client): repo_slug for repo_slug in repositories
+        }
+        deletions: List["Future[None]"] = []
+        for scan in as_completed(scans):
+            try:
+                caches = scan.result()
+            except (UnexpectedStatus, httpx.HTTPError) as error:
+                report.scan_errors[scans[scan]] = error
+                continue
+            for pruned in _select(report, scans[scan], caches, selector, now):
+                if not dry_run:
+                    deletions.append(executor.submit(_delete, workspace, pruned, client))
+        for deletion in deletions:
+            deletion.result()
+    report.selected.sort(key=_sort_key)
+    return report
+
+
+async def aprune_caches(
+    workspace: str,
+    selector: CacheSelector,
+    *,
+    client: AuthenticatedClient,
+    dry_run: bool = True,
+    repositories: Optional[Iterable[str]] = None,
+    workers: int = 8,
+) -> PruneReport:
+    """Like ``prune_caches`` but async, with up to ``workers`` requests in flight in tasks"""
+    if repositories is None:
+        pages = aiterate(get_repositories_workspace, workspace, client=client, fields=_REPOSITORY_FIELDS)
+        repositories = [repository["slug"] async for repository in pages]
+    now = datetime.datetime.now(datetime.timezone.utc)
+    report = PruneReport(workspace=workspace, dry_run=dry_run)
+    semaphore = asyncio.Semaphore(workers)
+
+    async def prune(repo_slug: str) -> None:
+        try:
+            async with semaphore:
+                caches = await _alist_caches(workspace, repo_slug, client)
+        except (UnexpectedStatus, httpx.HTTPError) as error:
+            report.scan_errors[repo_slug] = error
+            return
+        selected = _select(report, repo_slug, caches, selector, now)
+        if not dry_run:
+            await asyncio.gather(*(_adelete(workspace, pruned, client, semaphore) for pruned in selected))
+
+    await asyncio.gather(*(prune(repo_slug) for repo_slug in repositories))
+    report.selected.sort(key=_sort_key)
+    return report
+
+
+__all__ = ["CacheSelector", "PruneReport", "PrunedCache", "aprune_caches", "prune_caches"]
@@ -0,0 +1,159 @@
+""" Contains a token bucket which paces requests to the API's rate limit """
+import asyncio
+import email.utils
+import threading
+import time
+from typing import Callable, Mapping, Optional
+
+import attr
+import httpx
+
+
+def _parse_retry_after(value: str, now: float) -> Optional[float]:
+    """Parse a ``Retry-After`` header (delay in seconds or HTTP date) into a delay in seconds"""
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        date = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, date.timestamp() - now)
+
+
+def _parse_float(headers: Mapping[str, str], name: str) -> Optional[float]:
+    try:
+        return float(headers[name])
+    except (KeyError, ValueError):
+        return None
+
+
+@attr.s(auto_attribs=True)
+class RateLimiter:
+    """A token bucket shared by every request made through a Client, from any thread or asyncio task
+
+    Each request takes one token; tokens are refilled at ``rate`` per second up to ``burst``. The rate is learned from
+    the rate limit headers returned by the API (``X-RateLimit-Limit`` over ``window`` seconds, or
+    ``X-RateLimit-Remaining`` until ``X-RateLimit-Reset`` when sent), relearned from every response; the rate enforced
+    is the lower of ``rate`` and the learned one. Once ``X-RateLimit-Remaining`` reaches 0, all requests are paused
+    until ``X-RateLimit-Reset``, or for ``default_retry_after`` seconds without it. A 429 response pauses all requests
+    for its ``Retry-After`` delay, or ``default_retry_after`` seconds without one.
+
+    Attributes:
+        rate: The maximum sustained number of requests per second, or None to rely on the API's headers alone
+        burst: The number of requests which may be sent back to back before pacing kicks in
+        window: The period in seconds over which ``X-RateLimit-Limit`` applies (an hour for Bitbucket Cloud)
+        default_retry_after: The delay in seconds after a 429 response which has no ``Retry-After`` header
+        clock: The monotonic clock used to refill the bucket
+    """
+
+    rate: Optional[float] = None
+    burst: int = 10
+    window: float = 3600.0
+    default_retry_after: float = 10.0
+    clock: Callable[[], float] = attr.ib(default=time.monotonic, repr=False)
+    _learned_rate: Optional[float] = attr.ib(default=None, init=False, repr=False)
+    _tokens: float = attr.ib(init=False, repr=False)
+    _updated_at: float = attr.ib(init=False, repr=False)
+    _blocked_until: float = attr.ib(default=0.0, init=False, repr=False)
+    _lock: threading.Lock = attr.ib(factory=threading.Lock, init=False, repr=False, eq=False)
+
+    def __attrs_post_init__(self) -> None:
+        self._tokens = float(self.burst)
+        self._updated_at = self.clock()
+
+    @property
+    def effective_rate(self) -> Optional[float]:
+        """The rate currently enforced, in requests per second (None when unlimited)"""
+        rates = [rate for rate in (self.rate, self._learned_rate) if rate is not None]
+        return min(rates) if rates else None
+
+    def reserve(self) -> float:
+        """Take a token from the bucket, returning how long (in seconds) the caller must wait before sending"""
+        with self._lock:
+            now = self.clock()
+            rate = self.effective_rate
+            if rate is None or rate <= 0:
+                # nothing refills the bucket: only a pause set by ``update`` holds requests back
+                delay = 0.0
+            else:
+                self._tokens = min(float(self.burst), self._tokens + (now - self._updated_at) * rate)
+                self._tokens -= 1
+                delay = -self._tokens / rate if self._tokens < 0 else 0.0
+            self._updated_at = now
+            return max(delay, self._blocked_until - now)
+
+    def acquire(self) -> None:
+        """Block the current thread until a request may be sent"""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def async_acquire(self) -> None:
+        """Wait, without blocking the event loop, until a request may be sent"""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def update(self, status_code: int, headers: Mapping[str, str]) -> None:
+        """Adjust the bucket to the rate limit headers of a response"""
+        with self._lock:
+            now = self.clock()
+            limit = _parse_float(headers, "X-RateLimit-Limit")
+            remaining = _parse_float(headers, "X-RateLimit-Remaining")
+            reset = _parse_float(headers, "X-RateLimit-Reset")
+            seconds_to_reset = None
+            if reset is not None:
+                # the reset is sent either as a UNIX timestamp or as a number of seconds from now
+                seconds_to_reset = max(reset - time.time() if reset > self.window else reset, 0.0)
+            if remaining is not None and remaining <= 0:
+                # the quota is spent: keep the learned rate for after the reset, and pause until then
+                delay = self.default_retry_after if seconds_to_reset is None else seconds_to_reset
+                self._blocked_until = max(self._blocked_until, now + delay)
+                self._tokens = min(self._tokens, 0.0)
+            elif remaining is not None and seconds_to_reset is not None:
+                self._learned_rate = remaining / max(seconds_to_reset, 1.0)
+            elif limit is not None:
+                self._learned_rate = limit / self.window
+            if status_code == 429:
+                retry_after = headers.get("Retry-After")
+                delay = _parse_retry_after(retry_after, time.time()) if retry_after is not None else None
+                if delay is None:
+                    delay = self.default_retry_after
+                self._blocked_until = max(self._blocked_until, now + delay)
+                self._tokens = min(self._tokens, 0.0)
+
+
+class RateLimitTransport(httpx.BaseTransport):
+    """Paces requests through ``transport`` with ``limiter``"""
+
+    def __init__(self, transport: httpx.BaseTransport, limiter: RateLimiter) -> None:
+        self._transport = transport
+        self._limiter = limiter
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        self._limiter.acquire()
+        response = self._transport.handle_request(request)
+        self._limiter.update(response.status_code, response.headers)
+        return response
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncRateLimitTransport(httpx.AsyncBaseTransport):
+    """Paces requests through ``transport`` with ``limiter``"""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, limiter: RateLimiter) -> None:
+        self._transport = transport
+        self._limiter = limiter
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await self._limiter.async_acquire()
+        response = await self._transport.handle_async_request(request)
+        self._limiter.update(response.status_code, response.headers)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
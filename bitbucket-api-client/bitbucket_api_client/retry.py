@@ -0,0 +1,137 @@
+""" Contains the policy used to retry requests which failed transiently """
+import asyncio
+import random
+import time
+from typing import Callable, FrozenSet, Optional
+
+import attr
+import httpx
+
+from .rate_limit import _parse_retry_after
+
+# Errors raised before any byte of the request reached the server, which makes any method safe to retry
+_NOT_SENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+# Errors which may not happen again, unlike e.g. an unsupported URL scheme or an invalid request
+_TRANSIENT_ERRORS = (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError)
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class RetryPolicy:
+    """Decides whether and when a failed request is sent again
+
+    Idempotent methods (``retry_methods``) are retried on transient transport errors (timeouts, network errors and
+    connections dropped by the server) and on ``retry_statuses`` responses, waiting a random ("full jitter") delay of
+    up to ``backoff_factor * 2 ** attempt`` seconds, capped at ``max_backoff``, or the response's ``Retry-After``
+    delay. Other methods, such as the POSTs uploading files or creating commits, are only retried when the connection
+    could not be established, since the server never saw the request.
+
+    Attributes:
+        max_attempts: The maximum number of times a request is sent, including the first attempt
+        backoff_factor: The base delay in seconds of the exponential backoff
+        max_backoff: The maximum delay in seconds between two attempts
+        deadline: The maximum time in seconds spent on a request across all attempts, or None for no limit
+        retry_methods: The HTTP methods which are safe to send again after a failure
+        retry_statuses: The response status codes which are retried
+        respect_retry_after: Whether to wait for the ``Retry-After`` delay sent with a retried response
+        random: The source of jitter, returning a float in [0, 1)
+    """
+
+    max_attempts: int = 4
+    backoff_factor: float = 0.5
+    max_backoff: float = 30.0
+    deadline: Optional[float] = 120.0
+    retry_methods: FrozenSet[str] = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+    retry_statuses: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+    respect_retry_after: bool = True
+    random: Callable[[], float] = attr.ib(default=random.random, repr=False)
+
+    def is_idempotent(self, request: httpx.Request) -> bool:
+        return request.method.upper() in self.retry_methods
+
+    def should_retry_response(self, request: httpx.Request, response: httpx.Response) -> bool:
+        return response.status_code in self.retry_statuses and self.is_idempotent(request)
+
+    def should_retry_error(self, request: httpx.Request, error: httpx.TransportError) -> bool:
+        return isinstance(error, _NOT_SENT_ERRORS) or (
+            isinstance(error, _TRANSIENT_ERRORS) and self.is_idempotent(request)
+        )
+
+    def get_delay(self, attempt: int, response: Optional[httpx.Response] = None) -> float:
+        """Get the delay in seconds before sending attempt number ``attempt + 1``"""
+        if self.respect_retry_after and response is not None and "Retry-After" in response.headers:
+            retry_after = _parse_retry_after(response.headers["Retry-After"], time.time())
+            if retry_after is not None:
+                return retry_after
+        return self.random() * min(self.max_backoff, self.backoff_factor * 2 ** (attempt - 1))
+
+    def has_time_for(self, attempt: int, delay: float, started_at: float) -> bool:
+        """Whether attempt number ``attempt + 1`` may be sent after ``delay`` seconds"""
+        if attempt >= self.max_attempts:
+            return False
+        return self.deadline is None or time.monotonic() + delay - started_at <= self.deadline
+
+
+class RetryTransport(httpx.BaseTransport):
+    """Retries requests through ``transport`` according to ``policy``"""
+
+    def __init__(self, transport: httpx.BaseTransport, policy: RetryPolicy) -> None:
+        self._transport = transport
+        self._policy = policy
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        started_at = time.monotonic()
+        attempt = 1
+        while True:
+            try:
+                response = self._transport.handle_request(request)
+            except httpx.TransportError as error:
+                delay = self._policy.get_delay(attempt)
+                if not self._policy.should_retry_error(request, error) or not self._policy.has_time_for(
+                    attempt, delay, started_at
+                ):
+                    raise
+            else:
+                if not self._policy.should_retry_response(request, response):
+                    return response
+                delay = self._policy.get_delay(attempt, response)
+                if not self._policy.has_time_for(attempt, delay, started_at):
+                    return response
+                response.close()
+            time.sleep(delay)
+            attempt += 1
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncRetryTransport(httpx.AsyncBaseTransport):
+    """Retries requests through ``transport`` according to ``policy``"""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, policy: RetryPolicy) -> None:
+        self._transport = transport
+        self._policy = policy
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        started_at = time.monotonic()
+        attempt = 1
+        while True:
+            try:
+                response = await self._transport.handle_async_request(request)
+            except httpx.TransportError as error:
+                delay = self._policy.get_delay(attempt)
+                if not self._policy.should_retry_error(request, error) or not self._policy.has_time_for(
+                    attempt, delay, started_at
+                ):
+                    raise
+            else:
+                if not self._policy.should_retry_response(request, response):
+                    return response
+                delay = self._policy.get_delay(attempt, response)
+                if not self._policy.has_time_for(attempt, delay, started_at):
+                    return response
+                await response.aclose()
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
@@ -0,0 +1,133 @@
+""" Contains helpers which stream large response bodies (logs, diffs, patches, files...) instead of buffering them """
+import os
+import tempfile
+from types import ModuleType
+from typing import Any, AsyncIterator, BinaryIO, Dict, Iterator, Union
+
+from .client import Client
+from .errors import UnexpectedStatus
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+def _get_stream_kwargs(endpoint: ModuleType, args: Any, client: Client, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    request_kwargs = endpoint._get_kwargs(*args, client=client, **kwargs)
+    # keep the response cache from buffering the body to store it
+    request_kwargs["headers"] = {**request_kwargs["headers"], "Cache-Control": "no-store"}
+    # downloads redirect to the storage actually serving the file
+    request_kwargs["follow_redirects"] = True
+    return request_kwargs
+
+
+def iter_bytes(
+    endpoint: ModuleType,
+    *args: Any,
+    client: Client,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    **kwargs: Any,
+) -> Iterator[bytes]:
+    """Lazily yield the body of an endpoint's response in chunks, without ever holding all of it in memory
+
+    Args:
+        endpoint: The endpoint module, e.g. ``bitbucket_api_client.api.pipelines.get_pipeline_step_log_for_repository``
+        *args: The positional (path) arguments of the endpoint
+        client: The client used for the request
+        chunk_size: The size in bytes of the chunks yielded
+        **kwargs: The keyword (query) arguments of the endpoint
+
+    Raises:
+        UnexpectedStatus: If the response is not successful (2xx)
+
+    Yields:
+        The chunks of the body, decoded according to its ``Content-Encoding``
+    """
+    with client.get_httpx_client().stream(**_get_stream_kwargs(endpoint, args, client, kwargs)) as response:
+        if not response.is_success:
+            raise UnexpectedStatus(response.status_code, response.read())
+        for chunk in response.iter_bytes(chunk_size):
+            yield chunk
+
+
+async def aiter_bytes(
+    endpoint: ModuleType,
+    *args: Any,
+    client: Client,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    **kwargs: Any,
+) -> AsyncIterator[bytes]:
+    """Like ``iter_bytes`` but async"""
+    async with client.get_async_httpx_client().stream(**_get_stream_kwargs(endpoint, args, client, kwargs)) as response:
+        if not response.is_success:
+            raise UnexpectedStatus(response.status_code, await response.aread())
+        async for chunk in response.aiter_bytes(chunk_size):
+            yield chunk
+
+
+def write_to_file(
+    endpoint: ModuleType,
+    *args: Any,
+    client: Client,
+    destination: Union[str, "os.PathLike[str]"],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    **kwargs: Any,
+) -> int:
+    """Stream the body of an endpoint's response to ``destination``
+
+    The body is written to a temporary file next to ``destination`` which replaces it once complete, so that
+    ``destination`` never holds a partial body.
+
+    Args:
+        endpoint: The endpoint module, e.g. ``bitbucket_api_client.api.pipelines.get_pipeline_step_log_for_repository``
+        *args: The positional (path) arguments of the endpoint
+        client: The client used for the request
+        destination: The path of the file written
+        chunk_size: The size in bytes of the chunks read from the response and written to the file
+        **kwargs: The keyword (query) arguments of the endpoint
+
+    Raises:
+        UnexpectedStatus: If the response is not successful (2xx)
+
+    Returns:
+        The number of bytes written
+    """
+    with _AtomicFile(destination) as file:
+        for chunk in iter_bytes(endpoint, *args, client=client, chunk_size=chunk_size, **kwargs):
+            file.write(chunk)
+        return file.tell()
+
+
+async def awrite_to_file(
+    endpoint: ModuleType,
+    *args: Any,
+    client: Client,
+    destination: Union[str, "os.PathLike[str]"],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    **kwargs: Any,
+) -> int:
+    """Like ``write_to_file`` but async (the chunks are still written to the file synchronously)"""
+    with _AtomicFile(destination) as file:
+        async for chunk in aiter_bytes(endpoint, *args, client=client, chunk_size=chunk_size, **kwargs):
+            file.write(chunk)
+        return file.tell()
+
+
+class _AtomicFile:
+    """A binary file written under a temporary name, renamed to ``destination`` on success and removed on failure"""
+
+    def __init__(self, destination: Union[str, "os.PathLike[str]"]) -> None:
+        self.destination = os.fspath(destination)
+
+    def __enter__(self) -> BinaryIO:
+        fd, self.temp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(self.destination)))
+        self.file = os.fdopen(fd, "wb")
+        return self.file
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        self.file.close()
+        if exc_type is None:
+            os.replace(self.temp_path, self.destination)
+        else:
+            os.unlink(self.temp_path)
+
+
+__all__ = ["aiter_bytes", "awrite_to_file", "iter_bytes", "write_to_file"]
@@ -0,0 +1,370 @@
+""" Contains an aggregator of the test reports of many pipelines into compact per-test counters """
+import asyncio
+import collections
+import math
+import re
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, AsyncIterable, Deque, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+import attr
+
+from .api.pipelines import (
+    get_pipeline_steps_for_repository,
+    get_pipeline_test_report_test_case_reasons,
+    get_pipeline_test_report_test_cases,
+)
+from .client import Client
+from .errors import UnexpectedStatus
+from .pagination import aiterate, iterate
+
+PASSED = "PASSED"
+FAILED = "FAILED"
+SKIPPED = "SKIPPED"
+
+# the statuses reported by the test case parsers of Bitbucket, by outcome
+_OUTCOMES = {
+    "PASSED": PASSED,
+    "SUCCESS": PASSED,
+    "SUCCESSFUL": PASSED,
+    "FAILED": FAILED,
+    "FAILURE": FAILED,
+    "ERROR": FAILED,
+    "SKIPPED": SKIPPED,
+    "IGNORED": SKIPPED,
+}
+_DURATION = re.compile(
+    r"^P(?:(?P<days>[\d.]+)D)?(?:T(?:(?P<hours>[\d.]+)H)?(?:(?P<minutes>[\d.]+)M)?(?:(?P<seconds>[\d.]+)S)?)?$"
+)
+_STEP_FIELDS = "-values.setup_commands,-values.script_commands,-values.image,-values.state"
+
+PipelineArg = Union[str, Mapping[str, Any]]
+# a run of a test case: its name, outcome, duration in seconds and, for failures, the reason given
+_Run = Tuple[str, str, float, Optional[str]]
+
+
+def _parse_duration(value: Any) -> float:
+    """Parse the duration of a test case, in seconds or as an ISO 8601 duration such as ``PT1M2.5S``"""
+    if isinstance(value, (int, float)):
+        return float(value)
+    match = _DURATION.match(value) if isinstance(value, str) else None
+    if match is None:
+        return math.nan
+    parts = {unit: float(amount) for unit, amount in match.groupdict().items() if amount}
+    return (
+        parts.get("days", 0.0) * 86400
+        + parts.get("hours", 0.0) * 3600
+        + parts.get("minutes", 0.0) * 60
+        + parts.get("seconds", 0.0)
+    )
+
+
+def _get_name(test_case: Mapping[str, Any]) -> str:
+    return test_case.get("fully_qualified_name") or test_case.get("name") or test_case.get("uuid") or "?"
+
+
+def _get_outcome(test_case: Mapping[str, Any]) -> str:
+    status = test_case.get("status") or test_case.get("result") or ""
+    return _OUTCOMES.get(str(status).upper(), SKIPPED)
+
+
+def _get_reason(reasons: Any) -> Optional[str]:
+    if isinstance(reasons, Mapping) and "values" in reasons:
+        reasons = reasons["values"][0] if reasons["values"] else None
+    if isinstance(reasons, Mapping):
+        return reasons.get("message") or reasons.get("output")
+    return None
+
+
+def _get_pipeline_uuid(pipeline: PipelineArg) -> str:
+    return pipeline if isinstance(pipeline, str) else pipeline["uuid"]
+
+
+@attr.s(auto_attribs=True, slots=True)
+class TestCaseStats:
+    """Counters of the runs of a test case across pipelines
+
+    Attributes:
+        name: The fully qualified name of the test case
+        passed: The number of runs which passed
+        failed: The number of runs which failed or errored
+        skipped: The number of runs which were skipped
+        flips: The number of times the outcome of a run differed from the outcome of the previous run, skipped runs
+            aside
+        total_duration: The total duration in seconds of the runs which reported one
+        timed: The number of runs which reported a duration
+        max_duration: The longest duration of a run in seconds
+        last_failure: The reason given for the latest failure, when reasons are fetched
+        last_outcome: The outcome of the latest run which passed or failed
+    """
+
+    __test__ = False  # not a test class, for pytest
+
+    name: str
+    passed: int = 0
+    failed: int = 0
+    skipped: int = 0
+    flips: int = 0
+    total_duration: float = 0.0
+    timed: int = 0
+    max_duration: float = 0.0
+    last_failure: Optional[str] = None
+    last_outcome: Optional[str] = attr.ib(default=None, repr=False)
+
+    @property
+    def runs(self) -> int:
+        return self.passed + self.failed + self.skipped
+
+    @property
+    def failure_rate(self) -> float:
+        """The share of the runs which failed among those which passed or failed, NaN if there are none"""
+        outcomes = self.passed + self.failed
+        return self.failed / outcomes if outcomes else math.nan
+
+    @property
+    def flip_rate(self) -> float:
+        """The share of the runs which changed outcome, 0 for a test which always passes or always fails and up to 1
+        for one alternating between both, NaN with less than two runs"""
+        outcomes = self.passed + self.failed
+        return self.flips / (outcomes - 1) if outcomes > 1 else math.nan
+
+    @property
+    def mean_duration(self) -> float:
+        return self.total_duration / self.timed if self.timed else math.nan
+
+    def add_run(self, outcome: str, duration: float, reason: Optional[str] = None) -> None:
+        if outcome == SKIPPED:
+            self.skipped += 1
+            return
+        if outcome == PASSED:
+            self.passed += 1
+        else:
+            self.failed += 1
+            if reason is not None:
+                self.last_failure = reason
+        if self.last_outcome is not None and outcome != self.last_outcome:
+            self.flips += 1
+        self.last_outcome = outcome
+        if not math.isnan(duration):
+            self.total_duration += duration
+            self.timed += 1
+            self.max_duration = max(self.max_duration, duration)
+
+
+@attr.s(auto_attribs=True)
+class TestReportAggregator:
+    """Fold the test cases of pipelines into one ``TestCaseStats`` per test case
+
+    Only the counters are kept: the memory used grows with the number of distinct test cases, not with the number of
+    pipelines. Pipelines should be added in the order they ran, oldest or newest first, for ``flips`` to count
+    changes of outcome from one build to the next.
+
+    Attributes:
+        tests: The counters of each test case, by name
+        pipelines: The number of pipelines added
+        runs: The number of test case runs added
+    """
+
+    __test__ = False  # not a test class, for pytest
+
+    tests: Dict[str, TestCaseStats] = attr.ib(factory=dict)
+    pipelines: int = 0
+    runs: int = 0
+
+    def add_runs(self, runs: Iterable[_Run]) -> None:
+        """Add the runs of the test cases of a pipeline, as (name, outcome, duration, reason) tuples"""
+        self.pipelines += 1
+        for name, outcome, duration, reason in runs:
+            stats = self.tests.get(name)
+            if stats is None:
+                stats = self.tests[name] = TestCaseStats(name)
+            stats.add_run(outcome, duration, reason)
+            self.runs += 1
+
+    def flaky(self, limit: int = 20, min_runs: int = 5) -> List[TestCaseStats]:
+        """Get the test cases which change outcome most often, among those which ran at least ``min_runs`` times"""
+        candidates = [stats for stats in self.tests.values() if stats.flips and stats.passed + stats.failed >= min_runs]
+        return sorted(candidates, key=lambda stats: (-stats.flip_rate, -stats.failed, stats.name))[:limit]
+
+    def slowest(self, limit: int = 20) -> List[TestCaseStats]:
+        """Get the test cases with the longest mean duration"""
+        timed = [stats for stats in self.tests.values() if stats.timed]
+        return sorted(timed, key=lambda stats: (-stats.mean_duration, stats.name))[:limit]
+
+    def format_report(self, limit: int = 20, min_runs: int = 5) -> str:
+        """Format the flakiest and slowest test cases as a plain text report"""
+        lines = [f"{self.runs} runs of {len(self.tests)} test cases in {self.pipelines} pipelines", ""]
+        lines.append(f"Flakiest test cases (at least {min_runs} runs):")
+        lines.append(f"{'flip rate':>10} {'failed':>7} {'runs':>6}  name")
+        for stats in self.flaky(limit, min_runs):
+            lines.append(f"{stats.flip_rate:>10.1%} {stats.failed:>7} {stats.runs:>6}  {stats.name}")
+        lines.append("")
+        lines.append("Slowest test cases:")
+        lines.append(f"{'mean (s)':>10} {'max (s)':>9} {'runs':>6}  name")
+        for stats in self.slowest(limit):
+            lines.append(f"{stats.mean_duration:>10.2f} {stats.max_duration:>9.2f} {stats.runs:>6}  {stats.name}")
+        return "\n".join(lines)
+
+
+def _list_runs(workspace: str, repo_slug: str, pipeline_uuid: str, client: Client, reasons: bool) -> List[_Run]:
+    """Get the runs of the test cases of every step of a pipeline, reduced to tuples"""
+    runs: List[_Run] = []
+    steps = iterate(
+        get_pipeline_steps_for_repository,
+        workspace,
+        repo_slug,
+        pipeline_uuid,
+        client=client,
+        prefetch=False,
+        fields=_STEP_FIELDS,
+    )
+    for step in steps:
+        args = (workspace, repo_slug, pipeline_uuid, step.uuid)
+        test_cases = iterate(get_pipeline_test_report_test_cases, *args, client=client, pagelen=100, prefetch=False)
+        try:
+            for test_case in test_cases:
+                outcome = _get_outcome(test_case)
+                reason = None
+                if reasons and outcome == FAILED and "uuid" in test_case:
+                    request_kwargs = get_pipeline_test_report_test_case_reasons._get_kwargs(
+                        *args, test_case["uuid"], client=client
+                    )
+                    # read the body directly, as the endpoint parses no model and a client may drop Response.content
+                    response = client.get_httpx_client().request(**request_kwargs)
+                    if response.status_code == 200:
+                        reason = _get_reason(client.json_codec.loads(response.content))
+                runs.append((_get_name(test_case), outcome, _parse_duration(test_case.get("duration")), reason))
+        except UnexpectedStatus as error:
+            # steps without test reports answer 404
+            if error.status_code != 404:
+                raise
+    return runs
+
+
+async def _alist_runs(workspace: str, repo_slug: str, pipeline_uuid: str, client: Client, reasons: bool) -> List[_Run]:
+    """Like ``_list_runs`` but async"""
+    runs: List[_Run] = []
+    steps = aiterate(
+        get_pipeline_steps_for_repository,
+        workspace,
+        repo_slug,
+        pipeline_uuid,
+        client=client,
+        prefetch=False,
+        fields=_STEP_FIELDS,
+    )
+    async for step in steps:
+        args = (workspace, repo_slug, pipeline_uuid, step.uuid)
+        test_cases = aiterate(get_pipeline_test_report_test_cases, *args, client=client, pagelen=100, prefetch=False)
+        try:
+            async for test_case in test_cases:
+                outcome = _get_outcome(test_case)
+                reason = None
+                if reasons and outcome == FAILED and "uuid" in test_case:
+                    request_kwargs = get_pipeline_test_report_test_case_reasons._get_kwargs(
+                        *args, test_case["uuid"], client=client
+                    )
+                    response = await client.get_async_httpx_client().request(**request_kwargs)
+                    if response.status_code == 200:
+                        reason = _get_reason(client.json_codec.loads(response.content))
+                runs.append((_get_name(test_case), outcome, _parse_duration(test_case.get("duration")), reason))
+        except UnexpectedStatus as error:
+            if error.status_code != 404:
+                raise
+    return runs
+
+
+def aggregate_test_reports(
+    workspace: str,
+    repo_slug: str,
+    pipelines: Iterable[PipelineArg],
+    *,
+    client: Client,
+    workers: int = 8,
+    reasons: bool = False,
+    aggregator: Optional[TestReportAggregator] = None,
+) -> TestReportAggregator:
+    """Fold the test cases of every step of many pipelines into a ``TestReportAggregator``
+
+    The test cases of up to ``workers`` pipelines are fetched concurrently, in threads. Each pipeline is reduced to
+    one small tuple per test case run as soon as it is fetched and folded into the counters in the order of
+    ``pipelines``, so memory use stays flat however many pipelines are aggregated. Steps without test reports are
+    skipped.
+
+    Args:
+        workspace: The workspace of the repository
+        repo_slug: The slug of the repository
+        pipelines: The pipelines, as UUIDs or as dictionaries with their ``uuid``, e.g. from
+            ``iterate(get_pipelines_for_repository, workspace, repo_slug, client=client, max_items=5000)``
+        client: The client used for every request
+        workers: The maximum number of pipelines fetched concurrently
+        reasons: Fetch the reason of every failure (one request per failed test case) to keep the latest one
+        aggregator: The aggregator to add the test cases to, a new one by default
+
+    Raises:
+        UnexpectedStatus: If the steps or test cases of a pipeline are answered with an unexpected status
+
+    Returns:
+        The aggregator
+    """
+    aggregator = TestReportAggregator() if aggregator is None else aggregator
+    pending: Deque["Future[List[_Run]]"] = collections.deque()
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+        try:
+            for pipeline in pipelines:
+                uuid = _get_pipeline_uuid(pipeline)
+                pending.append(executor.submit(_list_runs, workspace, repo_slug, uuid, client, reasons))
+                if len(pending) >= workers:
+                    aggregator.add_runs(pending.popleft().result())
+            while pending:
+                aggregator.add_runs(pending.popleft().result())
+        finally:
+            for runs in pending:
+                runs.cancel()
+    return aggregator
+
+
+async def aaggregate_test_reports(
+    workspace: str,
+    repo_slug: str,
+    pipelines: Union[Iterable[PipelineArg], AsyncIterable[PipelineArg]],
+    *,
+    client: Client,
+    workers: int = 8,
+    reasons: bool = False,
+    aggregator: Optional[TestReportAggregator] = None,
+) -> TestReportAggregator:
+    """Like ``aggregate_test_reports`` but async, fetching in tasks instead of threads. ``pipelines`` may be an async
+    iterable, e.g. from ``aiterate``."""
+    aggregator = TestReportAggregator() if aggregator is None else aggregator
+    pending: Deque["asyncio.Future[List[_Run]]"] = collections.deque()
+
+    async def add(pipeline: PipelineArg) -> None:
+        uuid = _get_pipeline_uuid(pipeline)
+        pending.append(asyncio.ensure_future(_alist_runs(workspace, repo_slug, uuid, client, reasons)))
+        if len(pending) >= workers:
+            aggregator.add_runs(await pending.popleft())
+
+    try:
+        if isinstance(pipelines, AsyncIterable):
+            async for pipeline in pipelines:
+                await add(pipeline)
+        else:
+            for pipeline in pipelines:
+                await add(pipeline)
+        while pending:
+            aggregator.add_runs(await pending.popleft())
+    finally:
+        for runs in pending:
+            runs.cancel()
+    return aggregator
+
+
+__all__ = [
+    "FAILED",
+    "PASSED",
+    "SKIPPED",
+    "TestCaseStats",
+    "TestReportAggregator",
+    "aaggregate_test_reports",
+    "aggregate_test_reports",
+]
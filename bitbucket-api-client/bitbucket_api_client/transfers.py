@@ -0,0 +1,448 @@
+""" Contains helpers which transfer large files: segmented downloads and streamed uploads """
+import asyncio
+import json
+import mimetypes
+import mmap
+import os
+import re
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from types import ModuleType
+from typing import (
+    Any,
+    AsyncIterator,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+import attr
+import httpx
+
+from .client import Client
+from .errors import UnexpectedStatus
+from .streaming import DEFAULT_CHUNK_SIZE, _AtomicFile, _get_stream_kwargs
+from .types import Response
+
+DEFAULT_SEGMENT_SIZE = 16 * 1024 * 1024
+
+_CONTENT_RANGE = re.compile(r"bytes (\d+)-(\d+)/(\d+)")
+
+
+def _parse_content_range(value: str) -> Optional[Tuple[int, int, int]]:
+    """Parse a ``Content-Range`` header into the first and last byte sent and the size of the whole file"""
+    match = _CONTENT_RANGE.fullmatch(value.strip())
+    if match is None:
+        return None
+    first, last, size = (int(group) for group in match.groups())
+    return first, last, size
+
+
+@attr.s(auto_attribs=True)
+class _DownloadState:
+    """The progress of a download, saved next to its partial file to resume it after an interruption"""
+
+    size: int
+    validator: str
+    segment_size: int
+    done: Set[int] = attr.ib(factory=set)
+
+    @classmethod
+    def load(cls, path: str) -> Optional["_DownloadState"]:
+        try:
+            with open(path) as file:
+                data = json.load(file)
+            return cls(
+                size=data["size"],
+                validator=data["validator"],
+                segment_size=data["segment_size"],
+                done=set(data["done"]),
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def save(self, path: str) -> None:
+        with _AtomicFile(path) as file:
+            file.write(
+                json.dumps(
+                    {
+                        "size": self.size,
+                        "validator": self.validator,
+                        "segment_size": self.segment_size,
+                        "done": sorted(self.done),
+                    }
+                ).encode()
+            )
+
+
+def _get_segment_kwargs(request_kwargs: Dict[str, Any], response: httpx.Response) -> Dict[str, Any]:
+    if not response.history:
+        return request_kwargs
+    # request the segments straight from where the redirects led (e.g. a pre-signed storage URL), without the
+    # credentials of the API, but still unencoded so that the ranges count the bytes of the file
+    return {
+        "method": "get",
+        "url": str(response.url),
+        "headers": {"Accept-Encoding": request_kwargs["headers"]["Accept-Encoding"]},
+        "timeout": request_kwargs.get("timeout"),
+    }
+
+
+def _download(
+    client: Client,
+    request_kwargs: Dict[str, Any],
+    destination: Union[str, "os.PathLike[str]"],
+    workers: int,
+    segment_size: int,
+) -> int:
+    destination = os.fspath(destination)
+    part_path = destination + ".part"
+    state_path = destination + ".part.json"
+    http_client = client.get_httpx_client()
+    # segments are written through a memory map, whose flushes must start on a multiple of the granularity
+    segment_size = -(-segment_size // mmap.ALLOCATIONGRANULARITY) * mmap.ALLOCATIONGRANULARITY
+
+    headers = {**request_kwargs["headers"], "Accept-Encoding": "identity"}
+    with http_client.stream(**{**request_kwargs, "headers": {**headers, "Range": "bytes=0-0"}}) as response:
+        if response.status_code == 200:
+            # the server does not support ranges, and sent the whole file
+            with _AtomicFile(destination) as file:
+                for chunk in response.iter_bytes(DEFAULT_CHUNK_SIZE):
+                    file.write(chunk)
+                return file.tell()
+        content_range = _parse_content_range(response.headers.get("Content-Range", ""))
+        if response.status_code != 206 or content_range is None:
+            raise UnexpectedStatus(response.status_code, response.read())
+        size = content_range[2]
+        validator = response.headers.get("ETag") or response.headers.get("Last-Modified")
+        segment_kwargs = _get_segment_kwargs({**request_kwargs, "headers": headers}, response)
+
+    if size == 0:
+        with _AtomicFile(destination):
+            return 0
+
+    state = _DownloadState.load(state_path) if validator is not None else None
+    resumed = (
+        state is not None
+        and (state.size, state.validator, state.segment_size) == (size, validator, segment_size)
+        and os.path.exists(part_path)
+    )
+    if state is None or not resumed:
+        state = _DownloadState(size=size, validator=validator or "", segment_size=segment_size)
+    lock = threading.Lock()
+
+    with open(part_path, "r+b" if resumed else "w+b") as file:
+        # allocate the whole file up front, so that every segment is written in place
+        file.truncate(size)
+        with mmap.mmap(file.fileno(), size) as memory:
+
+            def fetch(index: int) -> None:
+                first = index * segment_size
+                last = min(size, first + segment_size) - 1
+                segment_headers = {**segment_kwargs.get("headers", {}), "Range": f"bytes={first}-{last}"}
+                if validator is not None:
+                    # answered with the whole file instead of the segment if the file changed since the first request
+                    segment_headers["If-Range"] = validator
+                with http_client.stream(**{**segment_kwargs, "headers": segment_headers}) as segment:
+                    content_range = _parse_content_range(segment.headers.get("Content-Range", ""))
+                    if segment.status_code != 206 or content_range != (first, last, size):
+                        # do not read the body, which is the whole file when it changed
+                        raise UnexpectedStatus(segment.status_code, b"")
+                    position = first
+                    for chunk in segment.iter_bytes(DEFAULT_CHUNK_SIZE):
+                        if position + len(chunk) > last + 1:
+                            break
+                        memory[position : position + len(chunk)] = chunk
+                        position += len(chunk)
+                if position != last + 1:
+                    raise httpx.RemoteProtocolError(f"Received {position - first} bytes for segment {first}-{last}")
+                memory.flush(first, last + 1 - first)
+                if validator is not None:
+                    with lock:
+                        state.done.add(index)
+                        state.save(state_path)
+
+            segments = [index for index in range(-(-size // segment_size)) if index not in state.done]
+            with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+                futures: List["Future[None]"] = [executor.submit(fetch, index) for index in segments]
+                try:
+                    for future in futures:
+                        future.result()
+                except BaseException:
+                    for future in futures:
+                        future.cancel()
+                    raise
+
+    if os.path.getsize(part_path) != size:
+        raise httpx.RemoteProtocolError(f"Downloaded {os.path.getsize(part_path)} bytes instead of {size}")
+    os.replace(part_path, destination)
+    if os.path.exists(state_path):
+        os.unlink(state_path)
+    return size
+
+
+def download_file(
+    endpoint: ModuleType,
+    *args: Any,
+    client: Client,
+    destination: Union[str, "os.PathLike[str]"],
+    workers: int = 4,
+    segment_size: int = DEFAULT_SEGMENT_SIZE,
+    **kwargs: Any,
+) -> int:
+    """Download the body of an endpoint's response to ``destination`` in segments fetched concurrently
+
+    The size of the file is learned with a first ``Range`` request, after following any redirect (the downloads
+    endpoints redirect to the storage serving the file). The file is then preallocated under ``<destination>.part``
+    and its segments are requested in parallel with ``Range`` / ``If-Range`` headers and written in place through a
+    memory map. Completed segments are recorded in ``<destination>.part.json``: after an interruption, calling
+    ``download_file`` again only fetches the missing segments, provided the file did not change in between (same
+    size and ``ETag`` or ``Last-Modified``). The complete file replaces ``destination`` once its size is verified.
+
+    Servers which do not support ranges are downloaded in a single request.
+
+    Args:
+        endpoint: The endpoint module, e.g.
+            ``bitbucket_api_client.api.downloads.get_repositories_workspace_repo_slug_downloads_filename``
+        *args: The positional (path) arguments of the endpoint
+        client: The client used for every request
+        destination: The path of the file written
+        workers: The maximum number of segments fetched concurrently
+        segment_size: The size in bytes of the segments, rounded up to the memory map granularity
+        **kwargs: The keyword (query) arguments of the endpoint
+
+    Raises:
+        UnexpectedStatus: If the file or one of its segments is answered with an unexpected status, or the file
+            changed during the download
+        httpx.HTTPError: If a segment could not be downloaded completely, in which case calling ``download_file``
+            again resumes the download
+
+    Returns:
+        The size of the file in bytes
+    """
+    return _download(client, _get_stream_kwargs(endpoint, args, client, kwargs), destination, workers, segment_size)
+
+
+def download_url(
+    url: str,
+    *,
+    client: Client,
+    destination: Union[str, "os.PathLike[str]"],
+    workers: int = 4,
+    segment_size: int = DEFAULT_SEGMENT_SIZE,
+) -> int:
+    """Like ``download_file``, for a URL outside of the API such as the pre-signed ``uri`` returned by
+    ``get_repository_pipeline_cache_content_uri``, which is requested without the client's headers and cookies
+    """
+    request_kwargs = {
+        "method": "get",
+        "url": url,
+        "headers": {},
+        "timeout": client.get_timeout(),
+        "follow_redirects": True,
+    }
+    return _download(client, request_kwargs, destination, workers, segment_size)
+
+
+@attr.s(auto_attribs=True)
+class UploadFile:
+    """A file sent by ``upload_files``, read from ``source`` one chunk at a time
+
+    Attributes:
+        source: The path of the file, a binary file object read from its current position, or an iterable of bytes
+            (e.g. a generator). The size of an iterable is unknown, so a body including one is sent chunked.
+        file_name: The name of the file sent to the API, by default the name of the path or file object
+        mime_type: The content type of the file, by default guessed from its name
+    """
+
+    source: Union[str, "os.PathLike[str]", BinaryIO, Iterable[bytes]]
+    file_name: Optional[str] = None
+    mime_type: Optional[str] = None
+
+    def get_file_name(self) -> str:
+        if self.file_name is not None:
+            return self.file_name
+        if isinstance(self.source, (str, os.PathLike)):
+            return os.path.basename(os.fspath(self.source))
+        return os.path.basename(str(getattr(self.source, "name", "upload")))
+
+    def get_size(self) -> Optional[int]:
+        if isinstance(self.source, (str, os.PathLike)):
+            return os.path.getsize(self.source)
+        if hasattr(self.source, "seek"):
+            source: BinaryIO = self.source  # type: ignore[assignment]
+            try:
+                position = source.tell()
+            except OSError:  # not seekable after all, e.g. a pipe
+                return None
+            size = source.seek(0, os.SEEK_END) - position
+            source.seek(position)
+            return size
+        return None
+
+    def iter_chunks(self, chunk_size: int) -> Iterator[bytes]:
+        if isinstance(self.source, (str, os.PathLike)):
+            with open(self.source, "rb") as file:
+                yield from iter(lambda: file.read(chunk_size), b"")
+        elif hasattr(self.source, "read"):
+            source: BinaryIO = self.source  # type: ignore[assignment]
+            yield from iter(lambda: source.read(chunk_size), b"")
+        else:
+            yield from self.source  # type: ignore[misc]
+
+
+def _quote(value: str) -> str:
+    # as browsers do, since header values cannot carry line breaks and quotes delimit the value
+    return value.replace('"', "%22").replace("\r", "%0D").replace("\n", "%0A")
+
+
+class _MultipartBody:
+    """A ``multipart/form-data`` body generated part by part, so that files are never held in memory"""
+
+    def __init__(
+        self,
+        parts: Sequence[Tuple[str, Union[str, UploadFile]]],
+        chunk_size: int,
+        progress: Optional[Callable[[int, Optional[int]], None]],
+    ) -> None:
+        self.parts = parts
+        self.chunk_size = chunk_size
+        self.progress = progress
+        self.boundary = os.urandom(16).hex()
+        self.sent = 0
+        self.size = self._get_size()
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        headers = {"Content-Type": f"multipart/form-data; boundary={self.boundary}"}
+        if self.size is not None:
+            headers["Content-Length"] = str(self.size)
+        return headers
+
+    def _get_part_header(self, name: str, value: Union[str, UploadFile]) -> bytes:
+        disposition = f'form-data; name="{_quote(name)}"'
+        if isinstance(value, str):
+            return f"--{self.boundary}\r\nContent-Disposition: {disposition}\r\n\r\n".encode()
+        file_name = value.get_file_name()
+        mime_type = value.mime_type or mimetypes.guess_type(file_name)[0] or "application/octet-stream"
+        return (
+            f'--{self.boundary}\r\nContent-Disposition: {disposition}; filename="{_quote(file_name)}"\r\n'
+            f"Content-Type: {mime_type}\r\n\r\n"
+        ).encode()
+
+    def _get_closing(self) -> bytes:
+        return f"--{self.boundary}--\r\n".encode()
+
+    def _get_size(self) -> Optional[int]:
+        size = len(self._get_closing())
+        for name, value in self.parts:
+            size += len(self._get_part_header(name, value)) + 2
+            value_size = len(value.encode()) if isinstance(value, str) else value.get_size()
+            if value_size is None:
+                return None
+            size += value_size
+        return size
+
+    def _sent(self, chunk: bytes) -> bytes:
+        self.sent += len(chunk)
+        if self.progress is not None:
+            self.progress(self.sent, self.size)
+        return chunk
+
+    def __iter__(self) -> Iterator[bytes]:
+        for name, value in self.parts:
+            yield self._sent(self._get_part_header(name, value))
+            if isinstance(value, str):
+                yield self._sent(value.encode())
+            else:
+                for chunk in value.iter_chunks(self.chunk_size):
+                    yield self._sent(chunk)
+            yield self._sent(b"\r\n")
+        yield self._sent(self._get_closing())
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        # files are read in a thread, to keep disk reads from blocking the event loop
+        loop = asyncio.get_running_loop()
+        chunks = iter(self)
+        while True:
+            chunk = await loop.run_in_executor(None, next, chunks, None)
+            if chunk is None:
+                return
+            yield chunk
+
+
+def _get_upload_kwargs(
+    endpoint: ModuleType, args: Any, client: Client, body: _MultipartBody, kwargs: Dict[str, Any]
+) -> Dict[str, Any]:
+    request_kwargs = endpoint._get_kwargs(*args, client=client, **kwargs)
+    request_kwargs["headers"] = {**request_kwargs["headers"], **body.headers}
+    return request_kwargs
+
+
+def _get_parts(
+    parts: Union[Mapping[str, Union[str, UploadFile]], Sequence[Tuple[str, Union[str, UploadFile]]]],
+) -> Sequence[Tuple[str, Union[str, UploadFile]]]:
+    return list(parts.items()) if isinstance(parts, Mapping) else parts
+
+
+def upload_files(
+    endpoint: ModuleType,
+    *args: Any,
+    client: Client,
+    parts: Union[Mapping[str, Union[str, UploadFile]], Sequence[Tuple[str, Union[str, UploadFile]]]],
+    progress: Optional[Callable[[int, Optional[int]], None]] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    **kwargs: Any,
+) -> Response[Any]:
+    """Send ``parts`` as the ``multipart/form-data`` body of an endpoint, streaming the files
+
+    Files are read and sent one chunk at a time, so memory use does not depend on their size. Uploads share the
+    client's connection pool and can run in parallel threads, or tasks with ``aupload_files``.
+
+    Args:
+        endpoint: The endpoint module, e.g.
+            ``bitbucket_api_client.api.downloads.post_repositories_workspace_repo_slug_downloads``
+        *args: The positional (path) arguments of the endpoint
+        client: The client used for the request
+        parts: The form fields (strings) and files (``UploadFile``) of the body, by field name. A sequence of pairs
+            can repeat a field name, e.g. to upload several ``files`` to the downloads endpoint.
+        progress: Called with the number of bytes sent so far and the size of the whole body (None when unknown)
+            after each chunk
+        chunk_size: The size in bytes of the chunks read from the files
+        **kwargs: The keyword (query) arguments of the endpoint
+
+    Returns:
+        The response of the endpoint, as returned by its ``sync_detailed``
+    """
+    body = _MultipartBody(_get_parts(parts), chunk_size, progress)
+    request_kwargs = _get_upload_kwargs(endpoint, args, client, body, kwargs)
+    response = client.get_httpx_client().request(**request_kwargs, content=iter(body))
+    return endpoint._build_response(client=client, response=response)
+
+
+async def aupload_files(
+    endpoint: ModuleType,
+    *args: Any,
+    client: Client,
+    parts: Union[Mapping[str, Union[str, UploadFile]], Sequence[Tuple[str, Union[str, UploadFile]]]],
+    progress: Optional[Callable[[int, Optional[int]], None]] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    **kwargs: Any,
+) -> Response[Any]:
+    """Like ``upload_files`` but async"""
+    body = _MultipartBody(_get_parts(parts), chunk_size, progress)
+    request_kwargs = _get_upload_kwargs(endpoint, args, client, body, kwargs)
+    response = await client.get_async_httpx_client().request(**request_kwargs, content=body.__aiter__())
+    return endpoint._build_response(client=client, response=response)
+
+
+__all__ = ["UploadFile", "aupload_files", "download_file", "download_url", "upload_files"]
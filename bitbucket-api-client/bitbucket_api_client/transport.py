@@ -0,0 +1,109 @@
+""" Contains httpx transports wrapped around the pooled connections of a Client """
+import asyncio
+import threading
+from typing import AsyncIterator, Callable, Iterator, Union
+
+import httpx
+
+
+class _ReleasingStream(httpx.SyncByteStream):
+    """A response stream which calls ``release`` exactly once when it is closed"""
+
+    def __init__(self, stream: httpx.SyncByteStream, release: Callable[[], None]) -> None:
+        self._stream = stream
+        self._release = release
+        self._released = False
+
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in self._stream:
+            yield chunk
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            if not self._released:
+                self._released = True
+                self._release()
+
+
+class _AsyncReleasingStream(httpx.AsyncByteStream):
+    """A response stream which calls ``release`` exactly once when it is closed"""
+
+    def __init__(self, stream: httpx.AsyncByteStream, release: Callable[[], None]) -> None:
+        self._stream = stream
+        self._release = release
+        self._released = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if not self._released:
+                self._released = True
+                self._release()
+
+
+def _with_stream(
+    response: httpx.Response, stream: Union[httpx.SyncByteStream, httpx.AsyncByteStream]
+) -> httpx.Response:
+    return httpx.Response(
+        status_code=response.status_code,
+        headers=response.headers,
+        stream=stream,
+        extensions=response.extensions,
+    )
+
+
+class ConcurrencyLimitTransport(httpx.BaseTransport):
+    """Caps the number of requests in flight through ``transport``
+
+    A slot is held from sending the request until its response body has been closed, which for HTTP/2 is the lifetime
+    of the stream on the multiplexed connection.
+    """
+
+    def __init__(self, transport: httpx.BaseTransport, max_concurrent: int) -> None:
+        self._transport = transport
+        self._semaphore = threading.BoundedSemaphore(max_concurrent)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        self._semaphore.acquire()
+        try:
+            response = self._transport.handle_request(request)
+        except BaseException:
+            self._semaphore.release()
+            raise
+        assert isinstance(response.stream, httpx.SyncByteStream)
+        return _with_stream(response, _ReleasingStream(response.stream, self._semaphore.release))
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncConcurrencyLimitTransport(httpx.AsyncBaseTransport):
+    """Caps the number of requests in flight through ``transport``
+
+    A slot is held from sending the request until its response body has been closed, which for HTTP/2 is the lifetime
+    of the stream on the multiplexed connection.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, max_concurrent: int) -> None:
+        self._transport = transport
+        self._semaphore = asyncio.BoundedSemaphore(max_concurrent)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await self._semaphore.acquire()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            self._semaphore.release()
+            raise
+        assert isinstance(response.stream, httpx.AsyncByteStream)
+        return _with_stream(response, _AsyncReleasingStream(response.stream, self._semaphore.release))
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
@@ -1,5 +1,5 @@
 """ Contains some shared types for properties """
-from typing import BinaryIO, Generic, MutableMapping, Optional, Tuple, TypeVar
+from typing import Any, BinaryIO, Callable, Dict, Generic, MutableMapping, NoReturn, Optional, Tuple, TypeVar
 
 import attr
 
@@ -11,6 +11,30 @@ class Unset:
 
 UNSET: Unset = Unset()
 
+
+class _EmptyProperties(Dict[str, Any]):
+    """An always empty, read-only dict
+
+    Shared as the ``additional_properties`` of every model parsed without additional properties, so that large result
+    sets do not hold one empty dict per model. Models replace it with a dict of their own on the first
+    ``model[key] = value``.
+    """
+
+    def _read_only(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError("additional_properties is shared by models without any, use model[key] = value to set one")
+
+    __setitem__ = _read_only
+    __ior__ = _read_only
+    setdefault = _read_only
+    update = _read_only
+
+    def __reduce__(self) -> str:
+        # pickle and copy the shared instance by reference
+        return "EMPTY_PROPERTIES"
+
+
+EMPTY_PROPERTIES: Dict[str, Any] = _EmptyProperties()
+
 FileJsonType = Tuple[Optional[str], BinaryIO, Optional[str]]
 
 
@@ -32,12 +56,44 @@ T = TypeVar("T")
 
 @attr.s(auto_attribs=True)
 class Response(Generic[T]):
-    """A response from an endpoint"""
+    """A response from an endpoint
+
+    ``parsed`` is either given as is, or computed by ``parse``: right away, or on first access when ``lazy`` is set, so
+    that callers which only look at ``status_code`` or ``content`` never build the models. When ``keep_content`` is
+    unset, ``content`` is emptied once ``parsed`` is computed to a model, to avoid keeping both the raw body and the
+    models alive.
+    """
 
     status_code: int
     content: bytes
     headers: MutableMapping[str, str]
-    parsed: Optional[T]
-
-
-__all__ = ["File", "Response", "FileJsonType"]
+    _parsed: Optional[T] = None
+    _parse: Optional[Callable[[], Optional[T]]] = attr.ib(default=None, repr=False, eq=False)
+    lazy: bool = attr.ib(default=False, repr=False, eq=False)
+    keep_content: bool = attr.ib(default=True, repr=False, eq=False)
+
+    def __attrs_post_init__(self) -> None:
+        if not self.lazy:
+            self._run_parse()
+
+    def _run_parse(self) -> None:
+        if self._parse is not None:
+            self._parsed = self._parse()
+            # also releases the httpx response held by parse
+            self._parse = None
+            # a response parsed to nothing (a log, a diff, an error body) has no other copy of its payload
+            if not self.keep_content and self._parsed is not None:
+                self.content = b""
+
+    @property
+    def parsed(self) -> Optional[T]:
+        self._run_parse()
+        return self._parsed
+
+    @parsed.setter
+    def parsed(self, value: Optional[T]) -> None:
+        self._parsed = value
+        self._parse = None
+
+
+__all__ = ["File", "Response", "FileJsonType", "EMPTY_PROPERTIES"]
@@ -0,0 +1,373 @@
+""" Contains a reconciler of the pipeline variables of workspaces, repositories and deployment environments """
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from types import ModuleType
+from typing import Any, Collection, Dict, List, Mapping, Optional, Tuple, Union
+
+import attr
+import httpx
+
+from .api.pipelines import (
+    create_deployment_variable,
+    create_pipeline_variable_for_workspace,
+    create_repository_pipeline_variable,
+    delete_deployment_variable,
+    delete_pipeline_variable_for_workspace,
+    delete_repository_pipeline_variable,
+    get_deployment_variables,
+    get_pipeline_variables_for_workspace,
+    get_repository_pipeline_variables,
+    update_deployment_variable,
+    update_pipeline_variable_for_workspace,
+    update_repository_pipeline_variable,
+)
+from .client import Client
+from .errors import UnexpectedStatus
+from .models.deployment_variable import DeploymentVariable
+from .models.pipeline_variable import PipelineVariable
+from .pagination import aiterate, iterate
+from .types import Unset
+
+CREATE = "create"
+UPDATE = "update"
+DELETE = "delete"
+
+# the list, create, update and delete endpoints of each kind of scope
+_WORKSPACE_ENDPOINTS = (
+    get_pipeline_variables_for_workspace,
+    create_pipeline_variable_for_workspace,
+    update_pipeline_variable_for_workspace,
+    delete_pipeline_variable_for_workspace,
+)
+_REPOSITORY_ENDPOINTS = (
+    get_repository_pipeline_variables,
+    create_repository_pipeline_variable,
+    update_repository_pipeline_variable,
+    delete_repository_pipeline_variable,
+)
+_DEPLOYMENT_ENDPOINTS = (
+    get_deployment_variables,
+    create_deployment_variable,
+    update_deployment_variable,
+    delete_deployment_variable,
+)
+# a variable already gone is as good as deleted
+_APPLIED_STATUSES = {CREATE: (201,), UPDATE: (200,), DELETE: (204, 404)}
+
+Variable = Union[PipelineVariable, DeploymentVariable]
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class VariableScope:
+    """Where pipeline variables are defined: a workspace, a repository, or a deployment environment of a repository
+
+    Attributes:
+        workspace: The workspace
+        repo_slug: The slug of the repository, None for the variables of the workspace itself
+        environment_uuid: The UUID of the deployment environment of the repository, None for the variables of the
+            repository itself
+    """
+
+    workspace: str
+    repo_slug: Optional[str] = None
+    environment_uuid: Optional[str] = None
+
+    def __str__(self) -> str:
+        return "/".join(part for part in (self.workspace, self.repo_slug, self.environment_uuid) if part is not None)
+
+    def _get_endpoints(self) -> Tuple[ModuleType, ModuleType, ModuleType, ModuleType]:
+        if self.repo_slug is None:
+            return _WORKSPACE_ENDPOINTS
+        if self.environment_uuid is None:
+            return _REPOSITORY_ENDPOINTS
+        return _DEPLOYMENT_ENDPOINTS
+
+    def _get_args(self) -> Tuple[str, ...]:
+        return tuple(part for part in (self.workspace, self.repo_slug, self.environment_uuid) if part is not None)
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class DesiredVariable:
+    """The value a variable should have
+
+    Attributes:
+        value: The value of the variable
+        secured: Whether the variable is secured. The API never returns the value of a secured variable, so an existing
+            secured variable is only rewritten when its key is rotated
+    """
+
+    value: str
+    secured: bool = False
+
+
+# the variables each scope should have by key, a plain string standing for a variable which is not secured
+DesiredState = Mapping[VariableScope, Mapping[str, Union[str, DesiredVariable]]]
+
+
+@attr.s(auto_attribs=True)
+class VariableChange:
+    """A change needed to bring a scope to its desired variables
+
+    Attributes:
+        scope: The scope of the variable
+        action: ``CREATE``, ``UPDATE`` or ``DELETE``
+        key: The key of the variable
+        desired: The value the variable should have, None when it is deleted
+        current: The variable as it is, None when it is created
+        applied: Whether the change was applied, always False in a dry run
+        error: The error which kept the change from being applied, an ``UnexpectedStatus`` or an ``httpx.HTTPError``
+    """
+
+    scope: VariableScope
+    action: str
+    key: str
+    desired: Optional[DesiredVariable] = None
+    current: Optional[Variable] = None
+    applied: bool = False
+    error: Optional[Exception] = None
+
+
+@attr.s(auto_attribs=True)
+class ReconcileReport:
+    """What a reconciliation of pipeline variables found and changed
+
+    Attributes:
+        dry_run: Whether the changes were only computed, not applied
+        scopes: The number of scopes read
+        variables: The number of variables read
+        unchanged: The number of desired variables which already had their value
+        changes: The changes needed, ordered by scope and key
+    """
+
+    dry_run: bool
+    scopes: int = 0
+    variables: int = 0
+    unchanged: int = 0
+    changes: List[VariableChange] = attr.ib(factory=list)
+
+    @property
+    def applied(self) -> List[VariableChange]:
+        return [change for change in self.changes if change.applied]
+
+    @property
+    def failed(self) -> List[VariableChange]:
+        return [change for change in self.changes if change.error is not None]
+
+    def format_report(self) -> str:
+        """Format the changes as a plain text report, without the value of any secured variable"""
+        lines = []
+        for change in self.changes:
+            if change.error is not None:
+                status = "failed: " + str(change.error)
+            else:
+                status = "would " + change.action if self.dry_run else change.action + "d"
+            secured = " (secured)" if change.desired is not None and change.desired.secured else ""
+            lines.append(f"{str(change.scope):<50} {change.key:<30} {status}{secured}")
+        summary = (
+            f"{len(self.changes)} changes to {self.variables} variables in {self.scopes} scopes, "
+            f"{self.unchanged} variables unchanged"
+        )
+        if self.dry_run:
+            summary += " (dry run, nothing changed)"
+        else:
+            summary += f", {len(self.applied)} changes applied"
+        lines.append(summary)
+        if self.failed:
+            lines.append(f"{len(self.failed)} changes could not be applied")
+        return "\n".join(lines)
+
+
+def _differs(variable: Variable, desired: DesiredVariable, rotate: bool) -> bool:
+    if (variable.secured is True) is not desired.secured:
+        return True
+    if desired.secured:
+        return rotate
+    return ("" if isinstance(variable.value, Unset) else variable.value) != desired.value
+
+
+def _diff(
+    report: ReconcileReport,
+    scope: VariableScope,
+    variables: List[Variable],
+    desired: Mapping[str, Union[str, DesiredVariable]],
+    rotate: Collection[str],
+    delete_missing: bool,
+) -> List[VariableChange]:
+    report.scopes += 1
+    report.variables += len(variables)
+    current = {variable.key: variable for variable in variables if not isinstance(variable.key, Unset)}
+    changes = []
+    for key, wanted in desired.items():
+        if isinstance(wanted, str):
+            wanted = DesiredVariable(wanted)
+        variable = current.get(key)
+        if variable is None:
+            changes.append(VariableChange(scope, CREATE, key, desired=wanted))
+        elif _differs(variable, wanted, key in rotate):
+            changes.append(VariableChange(scope, UPDATE, key, desired=wanted, current=variable))
+        else:
+            report.unchanged += 1
+    if delete_missing:
+        for key, variable in current.items():
+            if key not in desired:
+                changes.append(VariableChange(scope, DELETE, key, current=variable))
+    report.changes.extend(changes)
+    return changes
+
+
+def _get_body(change: VariableChange) -> Variable:
+    assert change.desired is not None
+    if change.scope.environment_uuid is None:
+        model: Any = PipelineVariable
+        type = "pipeline_variable"
+    else:
+        model = DeploymentVariable
+        type = "deployment_variable"
+    return model(type=type, key=change.key, value=change.desired.value, secured=change.desired.secured)
+
+
+def _get_change_kwargs(change: VariableChange, client: Client) -> Dict[str, Any]:
+    _, create, update, delete = change.scope._get_endpoints()
+    args = change.scope._get_args()
+    if change.action != CREATE:
+        assert change.current is not None
+        args += (change.current.uuid,)
+    if change.action == DELETE:
+        return delete._get_kwargs(*args, client=client)
+    endpoint = create if change.action == CREATE else update
+    if change.scope.repo_slug is None:
+        # the schema gives the workspace endpoints no request body, though the API needs one
+        request_kwargs = endpoint._get_kwargs(*args, client=client)
+        request_kwargs["headers"]["Content-Type"] = "application/json"
+        request_kwargs["content"] = client.json_codec.dumps(_get_body(change).to_dict())
+        return request_kwargs
+    return endpoint._get_kwargs(*args, client=client, json_body=_get_body(change))
+
+
+def _record_change(change: VariableChange, response: httpx.Response) -> None:
+    if response.status_code in _APPLIED_STATUSES[change.action]:
+        change.applied = True
+    else:
+        change.error = UnexpectedStatus(response.status_code, response.content)
+
+
+def _apply(change: VariableChange, client: Client) -> None:
+    try:
+        response = client.get_httpx_client().request(**_get_change_kwargs(change, client))
+    except httpx.HTTPError as error:
+        # the change may or may not have reached the API, the next reconciliation will tell
+        change.error = error
+        return
+    _record_change(change, response)
+
+
+async def _aapply(change: VariableChange, client: Client, semaphore: asyncio.Semaphore) -> None:
+    try:
+        async with semaphore:
+            response = await client.get_async_httpx_client().request(**_get_change_kwargs(change, client))
+    except httpx.HTTPError as error:
+        change.error = error
+        return
+    _record_change(change, response)
+
+
+def _list_variables(scope: VariableScope, client: Client) -> List[Variable]:
+    endpoint = scope._get_endpoints()[0]
+    return list(iterate(endpoint, *scope._get_args(), client=client, prefetch=False))
+
+
+async def _alist_variables(scope: VariableScope, client: Client) -> List[Variable]:
+    endpoint = scope._get_endpoints()[0]
+    return [variable async for variable in aiterate(endpoint, *scope._get_args(), client=client)]
+
+
+def _sort_key(change: VariableChange) -> Tuple[str, str]:
+    return str(change.scope), change.key
+
+
+def reconcile_variables(
+    desired: DesiredState,
+    *,
+    client: Client,
+    dry_run: bool = True,
+    delete_missing: bool = False,
+    rotate: Collection[str] = (),
+    workers: int = 8,
+) -> ReconcileReport:
+    """Bring the pipeline variables of many scopes to their desired values, with one request per change needed
+
+    The variables of up to ``workers`` scopes are read concurrently, in threads, and compared with the desired ones:
+    a variable is created when it is missing and updated when its value or whether it is secured differ. The value of
+    a secured variable cannot be read back, so an existing secured variable is only rewritten when its key is in
+    ``rotate``. The changes are applied by the same threads as soon as their scope has been read. A change which
+    fails, for its status or for a transport error, is recorded in the report rather than raised, so the report always
+    tells which changes were applied.
+
+    Args:
+        desired: The variables each scope should have by key
+        client: The client used for every request
+        dry_run: Only compute the changes, without applying them
+        delete_missing: Also delete the variables of each scope which are not desired
+        rotate: The keys of the secured variables to rewrite even though they exist
+        workers: The maximum number of requests in flight at once
+
+    Raises:
+        UnexpectedStatus: If the variables of a scope are answered with an unexpected status
+
+    Returns:
+        The report of the changes needed and applied
+    """
+    report = ReconcileReport(dry_run=dry_run)
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+        reads: Dict["Future[List[Variable]]", VariableScope] = {
+            executor.submit(_list_variables, scope, client): scope for scope in desired
+        }
+        applies: List["Future[None]"] = []
+        for read in as_completed(reads):
+            scope = reads[read]
+            for change in _diff(report, scope, read.result(), desired[scope], rotate, delete_missing):
+                if not dry_run:
+                    applies.append(executor.submit(_apply, change, client))
+        for apply in applies:
+            apply.result()
+    report.changes.sort(key=_sort_key)
+    return report
+
+
+async def areconcile_variables(
+    desired: DesiredState,
+    *,
+    client: Client,
+    dry_run: bool = True,
+    delete_missing: bool = False,
+    rotate: Collection[str] = (),
+    workers: int = 8,
+) -> ReconcileReport:
+    """Like ``reconcile_variables`` but async, with up to ``workers`` requests in flight in tasks"""
+    report = ReconcileReport(dry_run=dry_run)
+    semaphore = asyncio.Semaphore(workers)
+
+    async def reconcile(scope: VariableScope) -> None:
+        async with semaphore:
+            variables = await _alist_variables(scope, client)
+        changes = _diff(report, scope, variables, desired[scope], rotate, delete_missing)
+        if not dry_run:
+            await asyncio.gather(*(_aapply(change, client, semaphore) for change in changes))
+
+    await asyncio.gather(*(reconcile(scope) for scope in desired))
+    report.changes.sort(key=_sort_key)
+    return report
+
+
+__all__ = [
+    "CREATE",
+    "DELETE",
+    "UPDATE",
+    "DesiredState",
+    "DesiredVariable",
+    "ReconcileReport",
+    "VariableChange",
+    "VariableScope",
+    "areconcile_variables",
+    "reconcile_variables",
+]
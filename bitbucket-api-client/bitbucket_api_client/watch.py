@@ -0,0 +1,370 @@
+""" Contains a watcher which follows the state of many pipelines at once from a single event loop """
+import asyncio
+import contextlib
+import datetime
+import heapq
+import inspect
+import itertools
+import time
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Set, Tuple
+
+import attr
+import httpx
+
+from .api.pipelines import get_pipeline_for_repository
+from .client import Client
+from .dates import parse_datetime
+from .errors import UnexpectedStatus
+from .models.pipeline_state import PipelineState
+from .models.pipeline_state_completed import PipelineStateCompleted
+from .models.pipeline_state_in_progress import PipelineStateInProgress
+from .types import UNSET, Unset
+
+PipelineKey = Tuple[str, str, str]
+
+PENDING = "PENDING"
+IN_PROGRESS = "IN_PROGRESS"
+COMPLETED = "COMPLETED"
+
+# everything needed to tell the state of a pipeline and how long it ran, without its target, trigger, creator...
+_FIELDS = "uuid,build_number,created_on,completed_on,duration_in_seconds,state"
+_TRANSIENT_STATUSES = (429, 500, 502, 503, 504)
+# the weight of the latest completed pipeline in the expected duration of the pipelines of its repository
+_DURATION_WEIGHT = 0.5
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class WatchPolling:
+    """How often ``PipelineWatcher`` polls each of its pipelines
+
+    Pending pipelines, which may stay queued for a long time, are polled every ``pending_interval`` seconds. Running
+    pipelines are polled more often as they near their expected duration: the delay is half the time left, and
+    ``min_interval`` once the pipeline is overdue. The expected duration is learnt from the pipelines of the same
+    repository seen completing, or is ``expected_duration`` until one has. Without either, the delay is a tenth of
+    the time the pipeline has already run, as a pipeline running for twenty minutes rarely completes within seconds.
+
+    Attributes:
+        min_interval: The minimum delay in seconds between two polls of a pipeline
+        max_interval: The maximum delay in seconds between two polls of a pipeline
+        pending_interval: The delay in seconds between two polls of a pending pipeline
+        expected_duration: The expected duration in seconds of a pipeline, from its creation to its completion
+    """
+
+    min_interval: float = 5.0
+    max_interval: float = 60.0
+    pending_interval: float = 30.0
+    expected_duration: Optional[float] = None
+
+    def next_interval(self, state: Optional[str], elapsed: float, expected_duration: Optional[float]) -> float:
+        if state == PENDING:
+            return self.pending_interval
+        if expected_duration is None:
+            expected_duration = self.expected_duration
+        if expected_duration is None:
+            interval = elapsed / 10
+        else:
+            interval = (expected_duration - elapsed) / 2
+        return min(self.max_interval, max(self.min_interval, interval))
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class PipelineEvent:
+    """A change in the state of a watched pipeline
+
+    Attributes:
+        workspace: The workspace of the repository
+        repo_slug: The slug of the repository
+        pipeline_uuid: The UUID of the pipeline
+        state: The name of the state of the pipeline: ``PENDING``, ``IN_PROGRESS`` or ``COMPLETED``, or None if the
+            pipeline could not be read
+        detail: The stage of a pipeline in progress (``RUNNING``, ``PAUSED``...) or the result of a completed one
+            (``SUCCESSFUL``, ``FAILED``, ``STOPPED``...), if any
+        pipeline: The pipeline as sent by the API, trimmed down to its state and timestamps
+        error: The error which stopped the pipeline from being watched, if any
+    """
+
+    workspace: str
+    repo_slug: str
+    pipeline_uuid: str
+    state: Optional[str]
+    detail: Optional[str] = None
+    pipeline: Dict[str, Any] = attr.ib(factory=dict, repr=False)
+    error: Optional[UnexpectedStatus] = None
+
+    @property
+    def final(self) -> bool:
+        """Whether the pipeline is no longer watched after this event"""
+        return self.state == COMPLETED or self.error is not None
+
+
+@attr.s(auto_attribs=True, eq=False)
+class _Watched:
+    key: PipelineKey
+    started: float
+    state: Optional[Tuple[Optional[str], Optional[str]]] = None
+
+
+def _get_name(model: Any, type_prefix: str) -> Optional[str]:
+    """Get the name of a state, stage or result, e.g. ``RUNNING``, from its type when a projection left it out"""
+    if isinstance(model, Unset):
+        return None
+    name = getattr(model, "name", UNSET)
+    if not isinstance(name, Unset):
+        return name.value
+    if "name" in model:
+        return model["name"]
+    if isinstance(model.type, str) and model.type.startswith(type_prefix):
+        return model.type[len(type_prefix) :].upper()
+    return None
+
+
+def _get_state(pipeline: Dict[str, Any]) -> Tuple[Optional[str], Optional[str]]:
+    if not pipeline.get("state"):
+        return None, None
+    state = PipelineState.from_dict_by_type(pipeline["state"])
+    name = _get_name(state, "pipeline_state_")
+    if isinstance(state, PipelineStateInProgress):
+        return name, _get_name(state.stage, "pipeline_state_in_progress_")
+    if isinstance(state, PipelineStateCompleted):
+        return name, _get_name(state.result, "pipeline_state_completed_")
+    return name, None
+
+
+def _get_elapsed(pipeline: Dict[str, Any]) -> Optional[float]:
+    if "created_on" not in pipeline:
+        return None
+    created_on = parse_datetime(pipeline["created_on"])
+    return (datetime.datetime.now(datetime.timezone.utc) - created_on).total_seconds()
+
+
+def _get_duration(pipeline: Dict[str, Any]) -> Optional[float]:
+    if "created_on" in pipeline and "completed_on" in pipeline:
+        return (parse_datetime(pipeline["completed_on"]) - parse_datetime(pipeline["created_on"])).total_seconds()
+    return pipeline.get("duration_in_seconds")
+
+
+class PipelineWatcher:
+    """Follow the state of many pipelines, possibly across repositories, from a single asyncio event loop
+
+    Each pipeline is polled at its own pace (see ``WatchPolling``), at most ``max_concurrency`` at a time, and only
+    for the attributes telling its state. Concurrent reads of the same pipeline share a single request. A
+    ``PipelineEvent`` is emitted to the callbacks and to ``events`` whenever the state of a pipeline changes; a
+    pipeline is no longer watched once it has completed.
+
+    Pipelines can be added with ``watch`` at any time, including while the watcher runs.
+
+    Args:
+        client: The client used for every request
+        polling: How often to poll each pipeline
+        max_concurrency: The maximum number of requests in flight at once
+        on_event: A callback called with every event, which may be a coroutine function
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        *,
+        polling: WatchPolling = WatchPolling(),
+        max_concurrency: int = 10,
+        on_event: Optional[Callable[[PipelineEvent], Any]] = None,
+    ) -> None:
+        self.client = client
+        self.polling = polling
+        self.max_concurrency = max_concurrency
+        self._callbacks: List[Callable[[PipelineEvent], Any]] = [] if on_event is None else [on_event]
+        self._watched: Dict[PipelineKey, _Watched] = {}
+        self._schedule: List[Tuple[float, int, _Watched]] = []
+        self._sequence = itertools.count()
+        self._in_flight: Dict[PipelineKey, "asyncio.Future[Dict[str, Any]]"] = {}
+        self._durations: Dict[Tuple[str, str], float] = {}
+        self._queue: Optional["asyncio.Queue[PipelineEvent]"] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._error: Optional[BaseException] = None
+
+    def add_callback(self, callback: Callable[[PipelineEvent], Any]) -> None:
+        """Call ``callback``, which may be a coroutine function, with every event"""
+        self._callbacks.append(callback)
+
+    def watch(self, workspace: str, repo_slug: str, pipeline_uuid: str) -> None:
+        """Start watching a pipeline, which is polled right away. Watching a pipeline twice has no effect."""
+        key = (workspace, repo_slug, pipeline_uuid)
+        if key in self._watched:
+            return
+        watched = _Watched(key=key, started=time.monotonic())
+        self._watched[key] = watched
+        self._schedule_poll(watched, 0)
+
+    def unwatch(self, workspace: str, repo_slug: str, pipeline_uuid: str) -> None:
+        """Stop watching a pipeline"""
+        self._watched.pop((workspace, repo_slug, pipeline_uuid), None)
+        self._wake()
+
+    @property
+    def watched(self) -> List[PipelineKey]:
+        """The (workspace, repo_slug, pipeline_uuid) of the pipelines watched"""
+        return list(self._watched)
+
+    async def get_pipeline(self, workspace: str, repo_slug: str, pipeline_uuid: str) -> Dict[str, Any]:
+        """Get the state and timestamps of a pipeline, sharing the request with any concurrent call for it
+
+        Raises:
+            UnexpectedStatus: If the pipeline is answered with another status than 200
+            httpx.HTTPError: If the request failed
+
+        Returns:
+            The pipeline as sent by the API, trimmed down to its state and timestamps
+        """
+        key = (workspace, repo_slug, pipeline_uuid)
+        future = self._in_flight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._fetch(key))
+            self._in_flight[key] = future
+            future.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        # a cancelled caller must not cancel the request shared with the others
+        return await asyncio.shield(future)
+
+    async def run(self) -> None:
+        """Poll the watched pipelines until all of them have completed, calling the callbacks with every event
+
+        Raises:
+            Exception: Any exception raised by a callback
+        """
+        loop = asyncio.get_running_loop()
+        self._wakeup = wakeup = asyncio.Event()
+        self._error = None
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        tasks: Set["asyncio.Future[None]"] = set()
+        try:
+            # also wait for the polls emitting the events of the last pipelines
+            while self._watched or tasks:
+                if self._error is not None:
+                    raise self._error
+                now = time.monotonic()
+                while self._schedule and self._schedule[0][0] <= now:
+                    watched = heapq.heappop(self._schedule)[2]
+                    # skip pipelines unwatched, or watched again, since they were scheduled
+                    if self._watched.get(watched.key) is watched:
+                        task = loop.create_task(self._poll(watched, semaphore))
+                        tasks.add(task)
+                        task.add_done_callback(self._on_poll_done)
+                        task.add_done_callback(tasks.discard)
+                timeout = self._schedule[0][0] - now if self._schedule else None
+                wakeup.clear()
+                try:
+                    await asyncio.wait_for(wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            for task in tasks:
+                task.cancel()
+            if self._wakeup is wakeup:
+                self._wakeup = None
+
+    async def events(self) -> AsyncIterator[PipelineEvent]:
+        """Run the watcher and yield its events, until all of the watched pipelines have completed
+
+        Raises:
+            Exception: Any exception raised by a callback
+
+        Yields:
+            The events, in the order they were emitted
+        """
+        queue: "asyncio.Queue[PipelineEvent]" = asyncio.Queue()
+        self._queue = queue
+        runner = asyncio.ensure_future(self.run())
+        try:
+            while True:
+                get = asyncio.ensure_future(queue.get())
+                done, _ = await asyncio.wait({get, runner}, return_when=asyncio.FIRST_COMPLETED)
+                if get in done:
+                    yield get.result()
+                    continue
+                get.cancel()
+                while not queue.empty():
+                    yield queue.get_nowait()
+                runner.result()
+                return
+        finally:
+            self._queue = None
+            if not runner.done():
+                runner.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await runner
+
+    def _wake(self) -> None:
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def _schedule_poll(self, watched: _Watched, interval: float) -> None:
+        heapq.heappush(self._schedule, (time.monotonic() + interval, next(self._sequence), watched))
+        self._wake()
+
+    def _on_poll_done(self, task: "asyncio.Future[None]") -> None:
+        if not task.cancelled() and task.exception() is not None:
+            self._error = task.exception()
+        self._wake()
+
+    async def _fetch(self, key: PipelineKey) -> Dict[str, Any]:
+        request_kwargs = get_pipeline_for_repository._get_kwargs(*key, client=self.client, fields=_FIELDS)
+        # read the body directly, as the endpoint only parses errors and a client may drop Response.content
+        response = await self.client.get_async_httpx_client().request(**request_kwargs)
+        if response.status_code != 200:
+            raise UnexpectedStatus(response.status_code, response.content)
+        return self.client.json_codec.loads(response.content)
+
+    async def _poll(self, watched: _Watched, semaphore: asyncio.Semaphore) -> None:
+        workspace, repo_slug, pipeline_uuid = watched.key
+        try:
+            async with semaphore:
+                pipeline = await self.get_pipeline(*watched.key)
+        except httpx.TransportError:
+            self._schedule_poll(watched, self.polling.max_interval)
+            return
+        except UnexpectedStatus as error:
+            if error.status_code in _TRANSIENT_STATUSES:
+                self._schedule_poll(watched, self.polling.max_interval)
+                return
+            self._unwatch(watched)
+            await self._emit(PipelineEvent(workspace, repo_slug, pipeline_uuid, state=None, error=error))
+            return
+        if self._watched.get(watched.key) is not watched:
+            return
+
+        state = _get_state(pipeline)
+        name, detail = state
+        if name == COMPLETED:
+            self._unwatch(watched)
+            duration = _get_duration(pipeline)
+            if duration is not None:
+                self._learn_duration(workspace, repo_slug, duration)
+        else:
+            elapsed = _get_elapsed(pipeline)
+            if elapsed is None:
+                elapsed = time.monotonic() - watched.started
+            expected_duration = self._durations.get((workspace, repo_slug))
+            self._schedule_poll(watched, self.polling.next_interval(name, elapsed, expected_duration))
+        if state != watched.state:
+            watched.state = state
+            await self._emit(PipelineEvent(workspace, repo_slug, pipeline_uuid, name, detail, pipeline))
+
+    def _unwatch(self, watched: _Watched) -> None:
+        if self._watched.get(watched.key) is watched:
+            del self._watched[watched.key]
+        self._wake()
+
+    def _learn_duration(self, workspace: str, repo_slug: str, duration: float) -> None:
+        previous = self._durations.get((workspace, repo_slug))
+        if previous is not None:
+            duration = previous + _DURATION_WEIGHT * (duration - previous)
+        self._durations[(workspace, repo_slug)] = duration
+
+    async def _emit(self, event: PipelineEvent) -> None:
+        for callback in self._callbacks:
+            result = callback(event)
+            if inspect.isawaitable(result):
+                await result
+        if self._queue is not None:
+            self._queue.put_nowait(event)
+
+
+__all__ = ["COMPLETED", "IN_PROGRESS", "PENDING", "PipelineEvent", "PipelineWatcher", "WatchPolling"]